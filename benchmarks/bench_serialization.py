@@ -0,0 +1,134 @@
+"""
+Serialization benchmark (응답 직렬화 벤치마크)
+
+Compares render time and payload size of the stdlib JSONResponse (json.dumps)
+against FastJSONResponse (orjson), with and without gzip, for synthetic option
+chain and history payloads. Both render the same jsonable_encoder output,
+prepared once outside the timing: FastAPI encodes a route's return value
+before handing it to either response class, so only rendering differs.
+
+Usage:
+    python -m benchmarks.bench_serialization
+    python -m benchmarks.bench_serialization --strikes 400 --years 10 --repeat 50
+"""
+import argparse
+import gzip
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from core.responses import FastJSONResponse
+from schemas.option import OptionChainResponse, OptionData
+
+
+def make_chain(strikes: int, seed: int = 0) -> Dict:
+    """Option chain payload as returned by /option/{symbol}/chain"""
+    rng = np.random.default_rng(seed)
+    strike_grid = np.round(np.linspace(50, 450, strikes), 1)
+
+    def side() -> List[OptionData]:
+        return [
+            OptionData(
+                strike=float(k),
+                last_price=round(float(rng.uniform(0.01, 100)), 2),
+                bid=round(float(rng.uniform(0.01, 100)), 2),
+                ask=round(float(rng.uniform(0.01, 100)), 2),
+                volume=int(rng.integers(0, 10_000)),
+                open_interest=int(rng.integers(0, 50_000)),
+                implied_volatility=float(rng.uniform(0.1, 1.5))
+            )
+            for k in strike_grid
+        ]
+
+    chain = OptionChainResponse(
+        symbol="BENCH", expiry_date="2026-01-16", current_price=250.0,
+        calls=side(), puts=side()
+    )
+    return chain.model_dump(mode="json")
+
+
+def make_history(years: int, seed: int = 0) -> Dict:
+    """History payload as returned by /stock/{symbol}/history"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end="2025-12-31", periods=years * 252)
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.01, len(dates)))
+
+    return {
+        "symbol": "BENCH",
+        "period": f"{years}y",
+        "data": [
+            {
+                "symbol": "BENCH",
+                "date": d.strftime("%Y-%m-%d"),
+                "open": round(c * 0.99, 2),
+                "high": round(c * 1.01, 2),
+                "low": round(c * 0.98, 2),
+                "close": round(c, 2),
+                "volume": int(v)
+            }
+            for d, c, v in zip(dates, close, rng.integers(1_000_000, 50_000_000, len(dates)))
+        ]
+    }
+
+
+def encoders() -> Dict[str, Callable[[Dict], bytes]]:
+    """Response renderers, each fed the same encoded payload"""
+    return {
+        "stdlib": lambda encoded: JSONResponse(encoded).body,
+        "orjson": lambda encoded: FastJSONResponse(encoded).body,
+    }
+
+
+def measure(encode: Callable[[Dict], bytes], payload: Dict, repeat: int, level: int) -> Dict:
+    """Best-of-repeat render time (ms), raw bytes and gzip bytes / time"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = encode(payload)
+        timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    compressed = gzip.compress(body, compresslevel=level)
+    gzip_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        "render_ms": min(timings) * 1000,
+        "bytes": len(body),
+        "gzip_bytes": len(compressed),
+        "gzip_ms": gzip_ms,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--strikes", type=int, default=300, help="Strikes per side of the option chain")
+    parser.add_argument("--years", type=int, default=10, help="Years of daily history")
+    parser.add_argument("--repeat", type=int, default=30, help="Renders per measurement (best is reported)")
+    parser.add_argument("--level", type=int, default=5, help="gzip compression level")
+    args = parser.parse_args()
+
+    payloads = {
+        f"chain ({args.strikes} strikes x 2)": jsonable_encoder(make_chain(args.strikes)),
+        f"history ({args.years}y daily)": jsonable_encoder(make_history(args.years)),
+    }
+
+    print(f"{'payload':<28}{'encoder':<9}{'render ms':>10}{'bytes':>11}{'gzip bytes':>12}{'gzip ms':>9}")
+    for name, payload in payloads.items():
+        baseline = None
+        for encoder_name, encode in encoders().items():
+            result = measure(encode, payload, args.repeat, args.level)
+            baseline = baseline or result
+            speedup = baseline["render_ms"] / result["render_ms"]
+            print(
+                f"{name:<28}{encoder_name:<9}{result['render_ms']:>10.2f}{result['bytes']:>11,}"
+                f"{result['gzip_bytes']:>12,}{result['gzip_ms']:>9.2f}"
+                + (f"   x{speedup:.1f}" if result is not baseline else "")
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Application startup benchmark (기동 시간 측정)
+
+Each run starts a fresh interpreter with `python -X importtime`, imports the
+app and serves one request in-process, then reports:
+
+- import time of `main` and time to the first response (median of runs)
+- the slowest modules by cumulative and self import time
+- which heavy libraries (pandas, numpy, yfinance, oracledb) were loaded by
+  the import alone (they should load on first use, see core/lazy.py)
+
+Usage:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --runs 10 --top 25
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
+
+from benchmarks.run import RESULTS_DIR, git_commit
+
+HEAVY_MODULES = ["pandas", "numpy", "yfinance", "oracledb"]
+
+# Runs inside the child interpreter; prints one JSON line on stdout
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+loaded = [m for m in {heavy!r} if m in sys.modules]
+from fastapi.testclient import TestClient
+with TestClient(main.app) as client:
+    status = client.get("/").status_code
+first_response = time.perf_counter()
+print(json.dumps({{"import_ms": (imported - start) * 1000, "first_response_ms": (first_response - start) * 1000,
+                  "status": status, "loaded": loaded}}))
+"""
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """(module, self_us, cumulative_us) from -X importtime output"""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def run_once(db_path: str) -> Tuple[Dict, List[Tuple[str, int, int]]]:
+    env = dict(os.environ, DB_URL=f"sqlite:///{db_path}", DEBUG="False")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD.format(heavy=HEAVY_MODULES)],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1]), parse_importtime(result.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to start")
+    parser.add_argument("--top", type=int, default=15, help="Modules listed per ranking")
+    parser.add_argument("--output", default=None, help="Result file (default: benchmarks/results/startup-...json)")
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(prefix="stock-startup-"), "startup.db")
+    runs, modules = [], []
+    for _ in range(args.runs):
+        timing, modules = run_once(db_path)
+        runs.append(timing)
+
+    import_ms = statistics.median(r["import_ms"] for r in runs)
+    first_response_ms = statistics.median(r["first_response_ms"] for r in runs)
+    by_cumulative = sorted(modules, key=lambda m: m[2], reverse=True)[:args.top]
+    by_self = sorted(modules, key=lambda m: m[1], reverse=True)[:args.top]
+
+    print(f"import main:    {import_ms:8.1f} ms (median of {args.runs})")
+    print(f"first response: {first_response_ms:8.1f} ms")
+    print(f"heavy modules loaded by import: {', '.join(runs[-1]['loaded']) or 'none'}")
+    print(f"\n{'cumulative (ms)':>16}  module")
+    for name, _, cumulative_us in by_cumulative:
+        print(f"{cumulative_us / 1000:16.1f}  {name}")
+    print(f"\n{'self (ms)':>16}  module")
+    for name, self_us, _ in by_self:
+        print(f"{self_us / 1000:16.1f}  {name}")
+
+    report = {
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "runs": args.runs,
+        "import_ms": round(import_ms, 1),
+        "first_response_ms": round(first_response_ms, 1),
+        "heavy_modules_loaded": runs[-1]["loaded"],
+        "top_cumulative": [{"module": n, "ms": round(c / 1000, 1)} for n, _, c in by_cumulative],
+        "top_self": [{"module": n, "ms": round(s / 1000, 1)} for n, s, _ in by_self],
+    }
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"startup-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{report['commit']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
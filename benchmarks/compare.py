@@ -0,0 +1,74 @@
+"""
+Compare two benchmark result files (벤치마크 결과 비교)
+
+Prints the p50 / p99 change of every case present in both runs and exits
+with status 1 when any case got slower than the threshold, so it can gate
+a CI job.
+
+Usage:
+    python -m benchmarks.compare benchmarks/results/base.json benchmarks/results/head.json
+    python -m benchmarks.compare base.json head.json --threshold 0.2 --metric p99_ms
+"""
+import argparse
+import json
+import sys
+from typing import Dict, List, Tuple
+
+Key = Tuple[str, str]
+
+
+def load(path: str) -> Dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def index(report: Dict) -> Dict[Key, Dict]:
+    return {(r["name"], r["mode"]): r for r in report["results"]}
+
+
+def compare(base: Dict, head: Dict, metric: str = "p50_ms", threshold: float = 0.1) -> List[Dict]:
+    """
+    Relative change of one metric for every case in both reports
+
+    Args:
+        metric: Result field compared (p50_ms, p99_ms, mean_ms)
+        threshold: Relative slowdown flagged as a regression (0.1 = 10%)
+    """
+    base_results, head_results = index(base), index(head)
+    rows = []
+    for key in sorted(base_results.keys() & head_results.keys()):
+        before, after = base_results[key][metric], head_results[key][metric]
+        change = (after - before) / before if before else 0.0
+        rows.append({
+            "name": key[0], "mode": key[1], "before": before, "after": after,
+            "change": change, "regression": change > threshold,
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--metric", default="p50_ms", choices=["p50_ms", "p90_ms", "p99_ms", "mean_ms"])
+    parser.add_argument("--threshold", type=float, default=0.1, help="Relative slowdown flagged as regression")
+    args = parser.parse_args()
+
+    base, head = load(args.base), load(args.head)
+    rows = compare(base, head, args.metric, args.threshold)
+
+    print(f"{base.get('commit', '?')} -> {head.get('commit', '?')} ({args.metric})")
+    print(f"{'case':<58}{'mode':<6}{'before':>10}{'after':>10}{'change':>9}")
+    for row in rows:
+        flag = "  <-- regression" if row["regression"] else ""
+        print(f"{row['name']:<58}{row['mode']:<6}{row['before']:>10.2f}{row['after']:>10.2f}"
+              f"{row['change']:>+9.1%}{flag}")
+
+    regressions = [row for row in rows if row["regression"]]
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Market data fixtures for benchmarks (벤치마크용 시세 데이터)
+
+Fixtures are market data recordings (services/market_data.py format): one
+JSON file per symbol with info, daily OHLCV bars, option chains per expiry
+and news. They are either generated (deterministic synthetic data) or
+recorded from live yfinance.
+
+install() switches the app to a ReplayProvider over the fixtures, so the
+whole API runs without network access.
+
+Usage:
+    python -m benchmarks.fixtures generate --symbols 30 --expiries 8 --strikes 200
+    python -m benchmarks.fixtures record AAPL MSFT SPY
+"""
+import argparse
+import os
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from services.market_data import (
+    MarketDataStore, RecordingProvider, ReplayProvider, YFinanceProvider, set_provider
+)
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+FIXTURE_TODAY = pd.Timestamp("2025-06-30")
+
+
+def open_store(directory: str = FIXTURE_DIR) -> MarketDataStore:
+    return MarketDataStore(directory)
+
+
+def install(store: Optional[MarketDataStore] = None, latency_ms: float = 0.0, jitter_ms: float = 0.0) -> MarketDataStore:
+    """Serve market data from fixtures (process-wide)"""
+    store = store or open_store()
+    set_provider(ReplayProvider(store, latency_ms, jitter_ms))
+    return store
+
+
+# ---------------------------------------------------------------------------
+# Fixture creation
+# ---------------------------------------------------------------------------
+
+def generate(symbols: List[str], expiries: int = 8, strikes: int = 200, years: int = 10,
+             store: Optional[MarketDataStore] = None, seed: int = 42) -> MarketDataStore:
+    """Write deterministic synthetic fixtures"""
+    store = store or open_store()
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end=FIXTURE_TODAY, periods=years * 252)
+    expiry_dates = [
+        (FIXTURE_TODAY + pd.offsets.Week(weekday=4) * (i + 1)).strftime("%Y-%m-%d")
+        for i in range(expiries)
+    ]
+
+    for n, symbol in enumerate(symbols):
+        close = 50 * (1 + n % 7) * np.cumprod(1 + rng.normal(0.0003, 0.015, len(dates)))
+        bars = pd.DataFrame({
+            "Open": close * (1 + rng.normal(0, 0.003, len(dates))),
+            "High": close * (1 + np.abs(rng.normal(0, 0.008, len(dates)))),
+            "Low": close * (1 - np.abs(rng.normal(0, 0.008, len(dates)))),
+            "Close": close,
+            "Volume": rng.integers(1_000_000, 50_000_000, len(dates)).astype(float),
+        }, index=dates).round(4)
+
+        spot = float(close[-1])
+        grid = np.round(np.linspace(spot * 0.5, spot * 1.5, strikes), 1)
+        options = {}
+        for i, expiry in enumerate(expiry_dates):
+            options[expiry] = tuple(
+                _synthetic_chain(rng, symbol, expiry, grid, spot, kind, i) for kind in ("C", "P")
+            )
+
+        info = {
+            "symbol": symbol, "longName": f"{symbol} Corp", "shortName": symbol,
+            "regularMarketPrice": round(spot, 2), "currentPrice": round(spot, 2),
+            "previousClose": round(float(close[-2]), 2), "regularMarketOpen": round(float(bars["Open"].iloc[-1]), 2),
+            "dayHigh": round(float(bars["High"].iloc[-1]), 2), "dayLow": round(float(bars["Low"].iloc[-1]), 2),
+            "volume": int(bars["Volume"].iloc[-1]), "marketCap": int(spot * 1e9),
+            "currency": "USD", "exchange": "NMS",
+        }
+        headlines = ["surges to record high", "falls after downgrade", "announces annual meeting",
+                     "beats earnings estimates", "faces lawsuit over recall"]
+        news = [
+            {"content": {
+                "title": f"{symbol} {headlines[(i + n) % len(headlines)]}",
+                "summary": f"Synthetic article {i} about {symbol}.",
+                "pubDate": (FIXTURE_TODAY - pd.Timedelta(hours=6 * i)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "provider": {"displayName": "Fixture Wire"},
+                "canonicalUrl": {"url": f"https://example.com/{symbol.lower()}/{i}"},
+            }}
+            for i in range(10)
+        ]
+        store.save(symbol, info, bars, options, news)
+
+    return store
+
+
+def _synthetic_chain(rng, symbol, expiry, grid, spot, kind, tenor_index) -> pd.DataFrame:
+    moneyness = grid / spot - 1.0
+    iv = 0.25 + 0.4 * moneyness ** 2 + 0.01 * tenor_index
+    intrinsic = np.maximum(grid - spot, 0) if kind == "C" else np.maximum(spot - grid, 0)
+    last = np.round(intrinsic + spot * iv * 0.05 * np.sqrt(tenor_index + 1), 2)
+    return pd.DataFrame({
+        "contractSymbol": [f"{symbol}{expiry.replace('-', '')[2:]}{kind}{int(k * 1000):08d}" for k in grid],
+        "strike": grid,
+        "lastPrice": last,
+        "bid": np.round(last * 0.98, 2),
+        "ask": np.round(last * 1.02, 2),
+        "change": 0.0,
+        "percentChange": 0.0,
+        "volume": rng.integers(0, 5_000, len(grid)).astype(float),
+        "openInterest": rng.integers(0, 40_000, len(grid)).astype(float),
+        "impliedVolatility": np.round(iv, 4),
+        "inTheMoney": intrinsic > 0,
+    })
+
+
+def record(symbols: List[str], expiries: int = 8, store: Optional[MarketDataStore] = None) -> MarketDataStore:
+    """Write fixtures from live yfinance responses"""
+    store = store or open_store()
+    provider = RecordingProvider(YFinanceProvider(), store)
+    for symbol in symbols:
+        provider.info(symbol)
+        bars = provider.history(symbol, period="10y")
+        provider.download([symbol], period="10y", auto_adjust=False)  # unadjusted bars for quotes
+        chosen = provider.expiries(symbol)[:expiries]
+        for expiry in chosen:
+            provider.option_chain(symbol, expiry)
+        provider.news(symbol)
+        print(f"recorded {symbol}: {len(bars)} bars, {len(chosen)} expiries")
+    return store
+
+
+DEFAULT_SYMBOLS = [f"SYM{i:02d}" for i in range(30)] + ["SPY"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    gen = sub.add_parser("generate", help="Write deterministic synthetic fixtures")
+    gen.add_argument("--symbols", type=int, default=len(DEFAULT_SYMBOLS) - 1, help="Number of synthetic symbols (plus SPY)")
+    gen.add_argument("--expiries", type=int, default=8)
+    gen.add_argument("--strikes", type=int, default=200, help="Strikes per side per expiry")
+    gen.add_argument("--years", type=int, default=10)
+
+    rec = sub.add_parser("record", help="Record fixtures from live yfinance")
+    rec.add_argument("symbols", nargs="+")
+    rec.add_argument("--expiries", type=int, default=8)
+
+    args = parser.parse_args()
+    if args.command == "generate":
+        symbols = [f"SYM{i:02d}" for i in range(args.symbols)] + ["SPY"]
+        generate(symbols, expiries=args.expiries, strikes=args.strikes, years=args.years)
+        print(f"generated {len(symbols)} symbols in {FIXTURE_DIR}")
+    else:
+        record([s.upper() for s in args.symbols], expiries=args.expiries)
+
+
+if __name__ == "__main__":
+    main()
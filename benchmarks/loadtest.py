@@ -0,0 +1,273 @@
+"""
+Load test with a realistic client mix (부하 테스트)
+
+Thousands of asyncio virtual users share one httpx client. Each user picks
+a scenario by weight, runs its requests, then waits an exponentially
+distributed think time:
+
+- quotes:       watchlist quote polling and single stock info
+- portfolio:    portfolio profit and statistics
+- options:      chain, max pain, PCR or IV of a random symbol
+- transactions: BUY / SELL writes
+
+Targets:
+- in-process (default): the app is driven through httpx.ASGITransport on a
+  throwaway SQLite database with replayed fixture market data
+- --target http://localhost:8000: a running server, e.g.
+  MARKET_DATA_PROVIDER=replay MARKET_DATA_DIR=benchmarks/fixtures uvicorn main:app
+
+Throughput, latency percentiles and error rates per route are printed and
+written to benchmarks/results/loadtest-<timestamp>-<commit>.json.
+
+Usage:
+    python -m benchmarks.loadtest --users 1000 --duration 60
+    python -m benchmarks.loadtest --mix quotes=70,portfolio=10,options=15,transactions=5 --latency-ms 80
+    python -m benchmarks.loadtest --target http://localhost:8000 --users 2000
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.run import RESULTS_DIR, configure_environment, git_commit, percentile
+
+DEFAULT_MIX = "quotes=50,portfolio=20,options=20,transactions=10"
+DEFAULT_SYMBOLS = ["AAPL", "MSFT", "NVDA", "TSLA", "SPY"]
+
+
+class RouteStats:
+    """Latencies and outcomes of one route"""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.statuses: Dict[str, int] = defaultdict(int)
+        self.errors = 0
+
+    def record(self, elapsed_ms: float, status: Optional[int]) -> None:
+        self.latencies.append(elapsed_ms)
+        if status is None:
+            self.statuses["exception"] += 1
+            self.errors += 1
+        else:
+            self.statuses[str(status)] += 1
+            if status >= 500 or status == 429:
+                self.errors += 1
+
+    def summary(self, duration_s: float) -> Dict:
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+        return {
+            "requests": count,
+            "throughput_rps": round(count / duration_s, 2),
+            "error_rate": round(self.errors / count, 4) if count else 0.0,
+            "p50_ms": round(percentile(latencies, 50), 2) if count else None,
+            "p90_ms": round(percentile(latencies, 90), 2) if count else None,
+            "p99_ms": round(percentile(latencies, 99), 2) if count else None,
+            "max_ms": round(latencies[-1], 2) if count else None,
+            "statuses": dict(self.statuses),
+        }
+
+
+class LoadTest:
+    """Virtual users driving one httpx client"""
+
+    def __init__(self, client: httpx.AsyncClient, symbols: List[str], mix: Dict[str, float], think_time_ms: float):
+        self.client = client
+        self.symbols = symbols
+        self.think_time_ms = think_time_ms
+        self.scenarios = list(mix)
+        self.weights = [mix[name] for name in self.scenarios]
+        self.stats: Dict[str, RouteStats] = defaultdict(RouteStats)
+        self.watchlist_id: Optional[int] = None
+
+    async def request(self, method: str, route: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        """One request, recorded under its route template"""
+        start = time.perf_counter()
+        response = None
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except Exception:
+            # Timeouts, connection errors (recorded as "exception")
+            pass
+        self.stats[f"{method} {route}"].record(
+            (time.perf_counter() - start) * 1000, response.status_code if response is not None else None
+        )
+        return response
+
+    async def setup(self) -> None:
+        """Watchlist polled by the quote scenario (reused when it exists)"""
+        response = await self.client.get("/watchlist/")
+        for watchlist in response.json() if response.status_code == 200 else []:
+            if watchlist["name"] == "loadtest":
+                self.watchlist_id = watchlist["id"]
+                return
+
+        response = await self.client.post("/watchlist/", json={"name": "loadtest", "symbols": self.symbols[:25]})
+        response.raise_for_status()
+        self.watchlist_id = response.json()["id"]
+
+    # Scenarios ---------------------------------------------------------------
+
+    async def quotes(self) -> None:
+        await self.request("GET", "/watchlist/{watchlist_id}/quotes", f"/watchlist/{self.watchlist_id}/quotes")
+        symbol = random.choice(self.symbols)
+        await self.request("GET", "/stock/{symbol}", f"/stock/{symbol}")
+
+    async def portfolio(self) -> None:
+        await self.request("GET", "/portfolio/profit", "/portfolio/profit")
+        await self.request("GET", "/portfolio/stats", "/portfolio/stats")
+
+    async def options(self) -> None:
+        symbol = random.choice(self.symbols)
+        endpoint = random.choice(["chain", "max-pain", "pcr", "iv"])
+        await self.request("GET", f"/option/{{symbol}}/{endpoint}", f"/option/{symbol}/{endpoint}")
+
+    async def transactions(self) -> None:
+        symbol = random.choice(self.symbols[:10])
+        kind = "BUY" if random.random() < 0.7 else "SELL"
+        await self.request("POST", "/transaction/", "/transaction/", json={
+            "symbol": symbol, "transaction_type": kind, "price": round(random.uniform(50, 500), 2),
+            "quantity": 1, "transaction_date": datetime.now().isoformat(timespec="seconds"),
+        })
+
+    # Users -------------------------------------------------------------------
+
+    async def user(self, start_delay: float, deadline: float) -> None:
+        await asyncio.sleep(start_delay)
+        while time.monotonic() < deadline:
+            scenario = random.choices(self.scenarios, self.weights)[0]
+            await getattr(self, scenario)()
+            if self.think_time_ms:
+                await asyncio.sleep(random.expovariate(1000 / self.think_time_ms))
+
+    async def run(self, users: int, duration_s: float, ramp_up_s: float) -> float:
+        """Run all users; returns the measured wall time (seconds)"""
+        started = time.monotonic()
+        deadline = started + duration_s
+        await asyncio.gather(*(self.user(ramp_up_s * i / users, deadline) for i in range(users)))
+        return time.monotonic() - started
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """'quotes=50,options=20' -> {'quotes': 50.0, 'options': 20.0}"""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ("quotes", "portfolio", "options", "transactions"):
+            raise ValueError(f"Unknown scenario: {name}")
+        mix[name] = float(weight or 1)
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+def in_process_app(latency_ms: float, jitter_ms: float) -> Tuple[object, List[str]]:
+    """The app on a throwaway SQLite database with replayed fixtures"""
+    configure_environment(os.path.join(tempfile.mkdtemp(prefix="stock-loadtest-"), "loadtest.db"))
+
+    from benchmarks import fixtures
+
+    store = fixtures.open_store()
+    if not store.symbols():
+        print("No fixtures found, generating synthetic fixtures...")
+        fixtures.generate(fixtures.DEFAULT_SYMBOLS, store=store)
+    fixtures.install(store, latency_ms, jitter_ms)
+
+    from database.db import Base, get_engine
+    from main import app
+
+    Base.metadata.create_all(get_engine())
+    return app, [s for s in store.symbols() if s != "SPY"]
+
+
+async def main_async(args) -> Dict:
+    mix = parse_mix(args.mix)
+    limits = httpx.Limits(max_connections=args.connections, max_keepalive_connections=args.connections)
+    timeout = httpx.Timeout(args.timeout)
+
+    if args.target:
+        client = httpx.AsyncClient(base_url=args.target, limits=limits, timeout=timeout)
+        symbols = args.symbols.split(",") if args.symbols else DEFAULT_SYMBOLS
+    else:
+        app, symbols = in_process_app(args.latency_ms, args.jitter_ms)
+        if args.symbols:
+            symbols = args.symbols.split(",")
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app, raise_app_exceptions=False), base_url="http://loadtest", limits=limits, timeout=timeout
+        )
+
+    async with client:
+        test = LoadTest(client, [s.upper() for s in symbols], mix, args.think_time_ms)
+        await test.setup()
+        print(f"{args.users} users, {args.duration:.0f}s, mix {mix}, target {args.target or 'in-process'}")
+        elapsed = await test.run(args.users, args.duration, args.ramp_up)
+
+    routes = {route: stats.summary(elapsed) for route, stats in sorted(test.stats.items())}
+    total = RouteStats()
+    for stats in test.stats.values():
+        total.latencies.extend(stats.latencies)
+        total.errors += stats.errors
+        for status, count in stats.statuses.items():
+            total.statuses[status] += count
+
+    return {
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "target": args.target or "in-process",
+        "users": args.users,
+        "duration_s": round(elapsed, 2),
+        "mix": mix,
+        "think_time_ms": args.think_time_ms,
+        "replay_latency_ms": None if args.target else args.latency_ms,
+        "total": total.summary(elapsed),
+        "routes": routes,
+    }
+
+
+def print_report(report: Dict) -> None:
+    print(f"\n{'route':<40}{'reqs':>8}{'rps':>9}{'err%':>7}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}")
+    rows = list(report["routes"].items()) + [("TOTAL", report["total"])]
+    for route, s in rows:
+        if not s["requests"]:
+            continue
+        print(f"{route:<40}{s['requests']:>8}{s['throughput_rps']:>9.1f}{s['error_rate'] * 100:>7.2f}"
+              f"{s['p50_ms']:>9.1f}{s['p90_ms']:>9.1f}{s['p99_ms']:>9.1f}{s['max_ms']:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", default=None, help="Base URL of a running server (default: in-process)")
+    parser.add_argument("--users", type=int, default=500, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30, help="Test duration (seconds)")
+    parser.add_argument("--ramp-up", type=float, default=5, help="Seconds until all users are started")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Scenario weights")
+    parser.add_argument("--think-time-ms", type=float, default=1000, help="Mean pause between scenarios per user")
+    parser.add_argument("--symbols", default=None, help="Comma-separated symbols (default: fixture symbols)")
+    parser.add_argument("--connections", type=int, default=200, help="Max HTTP connections (remote target)")
+    parser.add_argument("--timeout", type=float, default=30, help="Request timeout (seconds)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Synthetic upstream latency (in-process)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random extra upstream latency (in-process)")
+    parser.add_argument("--output", default=None, help="Result file (default: benchmarks/results/loadtest-...json)")
+    args = parser.parse_args()
+
+    report = asyncio.run(main_async(args))
+    print_report(report)
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"loadtest-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{report['commit']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""
+API hot path benchmarks (API 성능 측정)
+
+Runs every read endpoint in routers/ (in-process, through the full ASGI
+stack) and the service methods behind them against recorded fixtures
+(replay market data provider) and a throwaway SQLite database. No network
+or Oracle access is needed.
+
+Each case is measured twice:
+- cold: all in-process caches cleared before every call (full compute path)
+- warm: caches kept (steady state for repeated requests)
+
+Results (p50 / p90 / p99 / mean in ms, throughput in ops/s) are written to
+benchmarks/results/<timestamp>-<commit>.json; compare two runs with
+benchmarks/compare.py.
+
+Usage:
+    python -m benchmarks.run
+    python -m benchmarks.run --iterations 200 --filter option
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def configure_environment(db_path: str) -> None:
+    """Settings for an offline run (must happen before the app is imported)"""
+    os.environ["DB_URL"] = f"sqlite:///{db_path}"
+    os.environ["DEBUG"] = "False"
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    index = max(0, min(len(sorted_values) - 1, int(round(q / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def measure(call: Callable[[], object], iterations: int, warmup: int, before: Optional[Callable] = None) -> Dict:
+    """Latency distribution of call() (ms) and sequential throughput"""
+    for _ in range(warmup):
+        if before:
+            before()
+        call()
+
+    timings = []
+    for _ in range(iterations):
+        if before:
+            before()
+        start = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    total_s = sum(timings) / 1000
+    return {
+        "iterations": iterations,
+        "p50_ms": round(percentile(timings, 50), 4),
+        "p90_ms": round(percentile(timings, 90), 4),
+        "p99_ms": round(percentile(timings, 99), 4),
+        "mean_ms": round(statistics.fmean(timings), 4),
+        "min_ms": round(timings[0], 4),
+        "max_ms": round(timings[-1], 4),
+        "throughput_ops": round(iterations / total_s, 2) if total_s else None,
+    }
+
+
+def seed_database(client, symbols: List[str]) -> Dict[str, int]:
+    """Transactions, a watchlist and alerts through the API (as a user would)"""
+    for i, symbol in enumerate(symbols[:10]):
+        for day, (kind, quantity) in enumerate([("BUY", 20), ("BUY", 10), ("SELL", 5)]):
+            response = client.post("/transaction/", json={
+                "symbol": symbol, "transaction_type": kind, "price": 100 + i + day, "quantity": quantity,
+                "transaction_date": f"2025-0{1 + day}-1{i % 9}T15:00:00"
+            })
+            response.raise_for_status()
+
+    watchlist = client.post("/watchlist/", json={"name": "bench", "symbols": symbols[:25]})
+    watchlist.raise_for_status()
+
+    for i, symbol in enumerate(symbols[:20]):
+        client.post("/alert/", json={"symbol": symbol, "condition": "ABOVE", "target_price": 10_000 + i})
+
+    return {"watchlist_id": watchlist.json()["id"], "portfolio_id": client.get("/portfolio/").json()[0]["id"]}
+
+
+def endpoint_cases(symbols: List[str], ids: Dict[str, int]) -> List[Tuple[str, str]]:
+    """(name, path) of every GET endpoint in routers/"""
+    symbol, many = symbols[0], ",".join(symbols[:10])
+    return [
+        ("stock.info", f"/stock/{symbol}"),
+        ("stock.history_1y", f"/stock/{symbol}/history?period=1y"),
+        ("stock.history_10y", f"/stock/{symbol}/history?period=10y"),
+        ("stock.compare_10", f"/stock/compare?symbols={many}&period=1y"),
+        ("stock.news", f"/stock/{symbol}/news"),
+        ("portfolio.list", "/portfolio/"),
+        ("portfolio.profit", "/portfolio/profit"),
+        ("portfolio.stats", "/portfolio/stats"),
+        ("portfolio.history", "/portfolio/history?period=5y"),
+        ("portfolio.news", "/portfolio/news"),
+        ("portfolio.get", f"/portfolio/{ids['portfolio_id']}"),
+        ("portfolio.get_profit", f"/portfolio/{ids['portfolio_id']}/profit"),
+        ("transaction.list", "/transaction/"),
+        ("transaction.summary", f"/transaction/summary/{symbol}"),
+        ("transaction.realized", "/transaction/realized"),
+        ("transaction.realized_lifo", "/transaction/realized?method=LIFO"),
+        ("option.expiry", f"/option/{symbol}/expiry"),
+        ("option.max_pain", f"/option/{symbol}/max-pain"),
+        ("option.pcr", f"/option/{symbol}/pcr"),
+        ("option.iv", f"/option/{symbol}/iv"),
+        ("option.chain", f"/option/{symbol}/chain"),
+        ("option.chain_greeks", f"/option/{symbol}/chain?greeks=true"),
+        ("option.chain_near_money", f"/option/{symbol}/chain?moneyness=0.1&min_open_interest=100&fields=strike,bid,ask,open_interest"),
+        ("option.gex", f"/option/{symbol}/gex"),
+        ("option.iv_surface", f"/option/{symbol}/iv-surface"),
+        ("option.iv_skew", f"/option/{symbol}/iv-surface/skew"),
+        ("option.scan", f"/option/scan?symbols={many}&min_pcr=1.2"),
+        ("alert.list", "/alert/"),
+        ("alert.check", "/alert/check"),
+        ("alert.events", "/alert/events"),
+        ("watchlist.list", "/watchlist/"),
+        ("watchlist.get", f"/watchlist/{ids['watchlist_id']}"),
+        ("watchlist.quotes", f"/watchlist/{ids['watchlist_id']}/quotes"),
+        ("metrics", "/metrics"),
+    ]
+
+
+def service_cases(symbols: List[str], session_factory) -> List[Tuple[str, Callable[[], object]]]:
+    """(name, call) of the service methods behind the hot endpoints"""
+    from services.stock_service import StockService
+    from services.option_service import OptionService
+    from services.portfolio_service import PortfolioService
+    from services.transaction_service import TransactionService
+
+    symbol = symbols[0]
+
+    def with_db(method, *args, **kwargs):
+        def call():
+            db = session_factory()
+            try:
+                return method(db, *args, **kwargs)
+            finally:
+                db.close()
+        return call
+
+    return [
+        ("StockService.get_stock_info", lambda: StockService.get_stock_info(symbol)),
+        ("StockService.get_stock_history", lambda: StockService.get_stock_history(symbol, "10y")),
+        ("StockService.get_close_prices", lambda: StockService.get_close_prices(symbols[:10], "1y")),
+        ("StockService.get_quotes", lambda: StockService.get_quotes(symbols[:25])),
+        ("OptionService.get_option_chain", lambda: OptionService.get_option_chain(symbol)),
+        ("OptionService.get_option_chain_greeks", lambda: OptionService.get_option_chain(symbol, greeks=True)),
+        ("OptionService.get_gamma_exposure", lambda: OptionService.get_gamma_exposure(symbol)),
+        ("OptionService.get_iv_surface", lambda: OptionService.get_iv_surface(symbol)),
+        ("OptionService.get_max_pain", lambda: OptionService.get_max_pain(symbol)),
+        ("OptionService.get_iv", lambda: OptionService.get_iv(symbol)),
+        ("PortfolioService.get_all_portfolios_with_profit", with_db(PortfolioService.get_all_portfolios_with_profit)),
+        ("PortfolioService.get_portfolio_stats", with_db(PortfolioService.get_portfolio_stats)),
+        ("PortfolioService.get_portfolio_history", with_db(PortfolioService.get_portfolio_history, "5y")),
+        ("TransactionService.get_realized_pnl", with_db(TransactionService.get_realized_pnl)),
+    ]
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(os.path.dirname(__file__)),
+            stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=50, help="Measured calls per case and mode")
+    parser.add_argument("--warmup", type=int, default=3, help="Unmeasured calls before each case")
+    parser.add_argument("--filter", default="", help="Only run cases whose name contains this text")
+    parser.add_argument("--modes", default="cold,warm", help="Comma-separated: cold, warm")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Synthetic upstream latency per replayed call")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random extra upstream latency per replayed call")
+    parser.add_argument("--output", default=None, help="Result file (default: benchmarks/results/<time>-<commit>.json)")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="stock-bench-")
+    configure_environment(os.path.join(workdir, "bench.db"))
+
+    from benchmarks import fixtures
+
+    store = fixtures.open_store()
+    if not store.symbols():
+        print("No fixtures found, generating synthetic fixtures...")
+        fixtures.generate(fixtures.DEFAULT_SYMBOLS, store=store)
+    fixtures.install(store, args.latency_ms, args.jitter_ms)
+
+    from fastapi.testclient import TestClient
+    from core.cache import named_caches
+    from database.db import Base, SessionLocal, get_engine
+    from main import app
+
+    Base.metadata.create_all(get_engine())
+    client = TestClient(app)
+    symbols = [s for s in store.symbols() if s != "SPY"] or store.symbols()
+    ids = seed_database(client, symbols)
+
+    def clear_caches():
+        for cache in named_caches():
+            cache.clear()
+
+    def get(path):
+        def call():
+            response = client.get(path)
+            if response.status_code >= 400:
+                raise RuntimeError(f"GET {path} -> {response.status_code}: {response.text[:200]}")
+        return call
+
+    cases = [(f"GET {name}", get(path)) for name, path in endpoint_cases(symbols, ids)]
+    cases += [(f"service {name}", call) for name, call in service_cases(symbols, SessionLocal)]
+    cases = [(name, call) for name, call in cases if args.filter in name]
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+
+    results = []
+    print(f"{'case':<58}{'mode':<6}{'p50 ms':>9}{'p99 ms':>9}{'ops/s':>10}")
+    for name, call in cases:
+        for mode in modes:
+            stats = measure(call, args.iterations, args.warmup, clear_caches if mode == "cold" else None)
+            results.append({"name": name, "mode": mode, **stats})
+            print(f"{name:<58}{mode:<6}{stats['p50_ms']:>9.2f}{stats['p99_ms']:>9.2f}{stats['throughput_ops']:>10.1f}")
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "fixtures": store.directory,
+        "iterations": args.iterations,
+        "results": results,
+    }
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{commit}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,24 +9,100 @@ class Settings(BaseSettings):
     """
 
     # Database Configuration
-    # These values are loaded from .env file
-    DB_USER: str
-    DB_PASSWORD: str
-    DB_HOST: str
-    DB_PORT: int
-    DB_SERVICE_NAME: str
+    # These values are loaded from .env file (checked when the engine is created)
+    DB_USER: Optional[str] = None
+    DB_PASSWORD: Optional[str] = None
+    DB_HOST: Optional[str] = None
+    DB_PORT: Optional[int] = None
+    DB_SERVICE_NAME: Optional[str] = None
+    DB_URL: Optional[str] = None  # Full SQLAlchemy URL overriding Oracle (e.g., sqlite:///bench.db)
+    DB_POOL_SIZE: int = 5  # Connections kept open per worker
+    DB_MAX_OVERFLOW: int = 10  # Extra connections under load (request sessions are capped at size + overflow)
 
     # Application Configuration
     APP_NAME: str = "Stock API"
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = True
 
+    # Response Compression Configuration
+    GZIP_MIN_SIZE: int = 1024  # Responses smaller than this (bytes) are sent uncompressed
+    GZIP_COMPRESS_LEVEL: int = 5  # 1 (fastest) ~ 9 (smallest)
+
+    # Observability Configuration
+    METRICS_ENABLED: bool = True  # Record request metrics and expose /metrics
+    TRACE_SAMPLE_RATE: float = 0.0  # Fraction of requests traced (requests with "X-Trace: 1" always are)
+    TRACE_EXPORT_FILE: Optional[str] = None  # Append finished spans as JSON lines (e.g., traces.jsonl)
+    TRACE_ZIPKIN_URL: Optional[str] = None  # Zipkin v2 collector (e.g., http://localhost:9411/api/v2/spans)
+
+    # Admin Configuration
+    ADMIN_TOKEN: Optional[str] = None  # X-Admin-Token for /admin endpoints (disabled when unset)
+    PROFILING_ENABLED: bool = False  # Allow "X-Profile: 1" single-request profiling for admins
+
+    # Market Data Provider Configuration
+    MARKET_DATA_PROVIDER: str = "yfinance"  # "yfinance", "record" (live + save) or "replay" (offline)
+    MARKET_DATA_DIR: str = "market_data"  # Recordings directory (one JSON file per symbol)
+    MARKET_DATA_REPLAY_LATENCY_MS: float = 0.0  # Synthetic latency per replayed upstream call
+    MARKET_DATA_REPLAY_JITTER_MS: float = 0.0  # Random extra latency per replayed call (0 ~ jitter)
+
+    # Cache Backend Configuration
+    CACHE_BACKEND: str = "memory"  # "memory" (per worker), "sqlite" (shared on one host) or "redis" (shared)
+    CACHE_SQLITE_PATH: str = "cache.db"  # SQLite cache file (sqlite backend)
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"  # Redis server (redis backend, needs the redis package)
+    CACHE_LOCK_TIMEOUT_SECONDS: float = 30.0  # Max wait for another worker loading the same key
+    CACHE_REFRESH_WORKERS: int = 4  # Background threads refreshing stale entries
+
+    # Market Data Cache Configuration
+    HISTORY_CACHE_TTL_SECONDS: int = 900  # Cached close-price history (15 min)
+    QUOTE_CACHE_TTL_SECONDS: int = 15  # Cached quotes from the batched quote feed
+    QUOTE_CACHE_MAX_STALE_SECONDS: int = 60  # Expired quotes served while refreshing (hard expiry = TTL + this)
+    OPTION_CHAIN_CACHE_TTL_SECONDS: int = 60  # Cached option chains, spot prices and expiry lists
+    OPTION_CHAIN_CACHE_MAX_STALE_SECONDS: int = 300  # Expired chains served while refreshing (0 = always wait)
+    IV_SURFACE_CACHE_TTL_SECONDS: int = 300  # Cached IV surfaces (skew / term-structure queries reuse them)
+    OPTION_CHAIN_FETCH_WORKERS: int = 8  # Expiries fetched in parallel by multi-expiry endpoints (GEX)
+    HISTORY_FINAL_MAX_AGE: int = 86400  # HTTP max-age of history that ends before today (1 day)
+
+    # Option Snapshot Configuration
+    OPTION_SNAPSHOT_SYMBOLS: str = ""  # Comma-separated universe precomputed on a schedule (empty = disabled)
+    OPTION_SNAPSHOT_INTERVAL_MINUTES: int = 15  # Minutes between snapshot runs
+    OPTION_SNAPSHOT_MAX_AGE_SECONDS: int = 1800  # Older snapshots are ignored (computed live instead)
+
+    # Option History Configuration
+    OPTION_HISTORY_SYMBOLS: str = ""  # Comma-separated symbols collected into the time-series store (empty = disabled, needs a shared CACHE_BACKEND)
+    OPTION_HISTORY_INTERVAL_SECONDS: int = 60  # Seconds between collector runs
+    OPTION_HISTORY_WORKERS: int = 8  # Symbols collected in parallel per run
+    OPTION_HISTORY_DIR: str = "option_history"  # Store root (one directory per symbol and date)
+    OPTION_HISTORY_MAX_DAYS: int = 3660  # Longest range of a history query
+
+    # Option Scan Configuration
+    OPTION_SCAN_MAX_SYMBOLS: int = 500  # Largest universe of one /option/scan request
+    OPTION_SCAN_WORKERS: int = 8  # Symbols scanned in parallel (shared by concurrent scans)
+    OPTION_SCAN_RATE_PER_SECOND: float = 10.0  # New (uncached) symbols scanned per second per worker process (0 = unlimited)
+
+    # News Configuration
+    NEWS_REFRESH_SECONDS: int = 900  # Minimum interval between upstream news fetches per symbol
+    SENTIMENT_SCORER: str = "lexicon"  # "lexicon" or "package.module:ClassName"
+
+    # Portfolio Analytics Configuration
+    BENCHMARK_SYMBOL: str = "SPY"  # Benchmark for beta
+    RISK_FREE_RATE: float = 0.04  # Annual risk-free rate for Sharpe ratio
+    LOT_METHOD: str = "FIFO"  # Cost basis method for realized P&L (FIFO, LIFO, AVERAGE)
+
     @property
     def DATABASE_URL(self) -> str:
         """
         Oracle connection string for Autonomous Database
         Using TLS with SSL verification disabled in database/db.py
         """
+        if self.DB_URL:
+            return self.DB_URL
+
+        missing = [
+            name for name in ("DB_USER", "DB_PASSWORD", "DB_HOST", "DB_PORT", "DB_SERVICE_NAME")
+            if getattr(self, name) is None
+        ]
+        if missing:
+            raise ValueError(f"Database is not configured: set DB_URL or {', '.join(missing)}")
+
         # DSN format for Oracle Autonomous Database
         dsn = f"(description=(retry_count=20)(retry_delay=3)(address=(protocol=tcps)(port={self.DB_PORT})(host={self.DB_HOST}))(connect_data=(service_name={self.DB_SERVICE_NAME}))(security=(ssl_server_dn_match=yes)))"
         return f"oracle+oracledb://{self.DB_USER}:{self.DB_PASSWORD}@{dsn}"
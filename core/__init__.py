@@ -0,0 +1 @@
+# Core infrastructure package (cache, cross-cutting helpers)
@@ -0,0 +1,702 @@
+"""
+TTL cache with pluggable backends (캐시 백엔드)
+Similar to @Cacheable with a CacheManager in Spring (Caffeine / Redis)
+
+Backends:
+- memory: in-process LRU (default). Every uvicorn worker keeps its own copy.
+- sqlite: one SQLite file shared by all workers on a host
+- redis:  a Redis-compatible server shared by all hosts (optional `redis` package)
+
+Named caches use the backend configured by CACHE_BACKEND; unnamed caches are
+always in-process. get_or_set() is single-flight: concurrent misses for one
+key run the loader once per process (per-key lock) and, on a shared backend,
+once across workers (lease lock in the backend). Other callers wait for the
+value instead of calling the upstream themselves. Caches created with
+max_stale serve expired values while refreshing them in the background
+(stale-while-revalidate).
+"""
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# Named caches, exported as hit/miss metrics
+_named_caches: List["TTLCache"] = []
+
+
+class CacheBackend(ABC):
+    """
+    Storage behind a TTLCache
+    Similar to the Cache interface of Spring's cache abstraction
+    """
+
+    # Shared with other processes: values are pickled and loads take a lease lock
+    shared = False
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Any:
+        """Cached value, or _MISSING if missing or expired"""
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """Cached values of the keys that are present"""
+        found = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not _MISSING:
+                found[key] = value
+        return found
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store a value for ttl seconds"""
+
+    @abstractmethod
+    def delete(self, key: Hashable) -> None:
+        """Remove a single entry"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Entries currently stored"""
+
+    def acquire(self, key: Hashable, lease: float) -> Optional[str]:
+        """Take the loader lease of a key; a token, or None if another process holds it"""
+        return "local"
+
+    def release(self, key: Hashable, token: str) -> None:
+        """Give back a lease taken with acquire()"""
+
+
+class MemoryBackend(CacheBackend):
+    """In-process LRU; values are stored as is (callers must not modify them)"""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISSING
+
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return _MISSING
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        expires_at = time.monotonic() + ttl
+
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteBackend(CacheBackend):
+    """
+    Cache table in a SQLite file shared by the workers of one host
+
+    Each thread uses its own connection (WAL mode: readers never block the
+    writer). Expired rows are purged and the namespace is trimmed to maxsize
+    (oldest expiry first) every PURGE_EVERY writes.
+    """
+
+    shared = True
+    PURGE_EVERY = 64
+
+    def __init__(self, path: str, namespace: str, maxsize: int = 1024):
+        self.path = path
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self._local = threading.local()
+        self._writes = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        # A forked worker must not reuse its parent's connection
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, expires_at REAL NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_leases ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, token TEXT NOT NULL, expires_at REAL NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def get(self, key: Hashable) -> Any:
+        row = self._connection().execute(
+            "SELECT value FROM cache_entries WHERE namespace = ? AND key = ? AND expires_at > ?",
+            (self.namespace, repr(key), time.time())
+        ).fetchone()
+        return pickle.loads(row[0]) if row else _MISSING
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        by_text = {repr(key): key for key in keys}
+        if not by_text:
+            return {}
+
+        placeholders = ",".join("?" * len(by_text))
+        rows = self._connection().execute(
+            f"SELECT key, value FROM cache_entries WHERE namespace = ? AND key IN ({placeholders}) AND expires_at > ?",
+            (self.namespace, *by_text, time.time())
+        ).fetchall()
+        return {by_text[text]: pickle.loads(value) for text, value in rows}
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+            (self.namespace, repr(key), pickle.dumps(value, pickle.HIGHEST_PROTOCOL), time.time() + ttl)
+        )
+
+        self._writes += 1
+        if self._writes % self.PURGE_EVERY == 0:
+            self._purge(conn)
+
+    def _purge(self, conn: sqlite3.Connection) -> None:
+        conn.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND expires_at <= ?", (self.namespace, time.time())
+        )
+        conn.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND key IN ("
+            "SELECT key FROM cache_entries WHERE namespace = ? ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+            (self.namespace, self.namespace, self.maxsize)
+        )
+
+    def delete(self, key: Hashable) -> None:
+        self._connection().execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (self.namespace, repr(key))
+        )
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,))
+
+    def __len__(self) -> int:
+        return self._connection().execute(
+            "SELECT COUNT(*) FROM cache_entries WHERE namespace = ? AND expires_at > ?",
+            (self.namespace, time.time())
+        ).fetchone()[0]
+
+    def acquire(self, key: Hashable, lease: float) -> Optional[str]:
+        conn = self._connection()
+        token = uuid.uuid4().hex
+        now = time.time()
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "DELETE FROM cache_leases WHERE namespace = ? AND key = ? AND expires_at <= ?",
+                (self.namespace, repr(key), now)
+            )
+            inserted = conn.execute(
+                "INSERT OR IGNORE INTO cache_leases (namespace, key, token, expires_at) VALUES (?, ?, ?, ?)",
+                (self.namespace, repr(key), token, now + lease)
+            ).rowcount
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        return token if inserted else None
+
+    def release(self, key: Hashable, token: str) -> None:
+        self._connection().execute(
+            "DELETE FROM cache_leases WHERE namespace = ? AND key = ? AND token = ?",
+            (self.namespace, repr(key), token)
+        )
+
+
+class RedisBackend(CacheBackend):
+    """
+    Keys "<prefix>:<namespace>:<key>" on a Redis-compatible server
+
+    Only the commands get, mget, set (ex / px / nx), delete and scan_iter are
+    used, so any client object offering them works (e.g., a stand-in in tests).
+    Expiry is left to the server.
+    """
+
+    shared = True
+
+    def __init__(self, client: Any, namespace: str, prefix: str = "stock-api"):
+        self.client = client
+        self.namespace = namespace
+        self.prefix = f"{prefix}:{namespace}:"
+
+    def _key(self, key: Hashable) -> str:
+        return self.prefix + repr(key)
+
+    def get(self, key: Hashable) -> Any:
+        data = self.client.get(self._key(key))
+        return pickle.loads(data) if data is not None else _MISSING
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        values = self.client.mget([self._key(key) for key in keys])
+        return {key: pickle.loads(data) for key, data in zip(keys, values) if data is not None}
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        self.client.set(self._key(key), pickle.dumps(value, pickle.HIGHEST_PROTOCOL), px=max(1, int(ttl * 1000)))
+
+    def delete(self, key: Hashable) -> None:
+        self.client.delete(self._key(key))
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def __len__(self) -> int:
+        return sum(1 for key in self.client.scan_iter(match=self.prefix + "*") if not _is_lease(key))
+
+    def acquire(self, key: Hashable, lease: float) -> Optional[str]:
+        token = uuid.uuid4().hex
+        acquired = self.client.set(self._key(key) + _LEASE_SUFFIX, token, nx=True, px=max(1, int(lease * 1000)))
+        return token if acquired else None
+
+    def release(self, key: Hashable, token: str) -> None:
+        # get + delete is not atomic: a lease that expired in between may be
+        # dropped, which at worst lets one more worker load the same key
+        lease_key = self._key(key) + _LEASE_SUFFIX
+        current = self.client.get(lease_key)
+        if current is not None and (current.decode() if isinstance(current, bytes) else current) == token:
+            self.client.delete(lease_key)
+
+
+_LEASE_SUFFIX = ":lease"
+
+
+def _is_lease(key: Any) -> bool:
+    return (key.decode() if isinstance(key, bytes) else key).endswith(_LEASE_SUFFIX)
+
+
+class ServedAge:
+    """Age (seconds) of the oldest cached value served while handling a request"""
+
+    def __init__(self):
+        self.seconds: Optional[float] = None
+
+    def note(self, seconds: float) -> None:
+        if self.seconds is None or seconds > self.seconds:
+            self.seconds = seconds
+
+
+# Shared with threadpool endpoints (the holder object, not the variable, is updated)
+_served_age: ContextVar[Optional[ServedAge]] = ContextVar("served_age", default=None)
+
+
+def track_served_age() -> Tuple[ServedAge, Token]:
+    """Start recording the age of values served by stale-while-revalidate caches"""
+    served = ServedAge()
+    return served, _served_age.set(served)
+
+
+def reset_served_age(token: Token) -> None:
+    _served_age.reset(token)
+
+
+class TTLCache:
+    """
+    Thread-safe cache whose entries expire after a time-to-live
+
+    Usage:
+        cache = TTLCache(ttl=60, maxsize=256, name="quotes")
+        value = cache.get_or_set(("quote", "AAPL"), lambda: fetch("AAPL"))
+
+    With max_stale > 0 the cache serves stale-while-revalidate: for
+    max_stale seconds after the ttl, get_or_set() returns the stale value
+    at once and refreshes it on a background thread (single-flight); after
+    that (hard expiry) the entry is gone and the next caller loads it. The
+    age of the values served is recorded for the Age response header.
+
+    Hit / miss counters are per process. Keys of shared backends are stored
+    as repr(key): use strings, numbers, None and tuples of them.
+    """
+
+    # Poll interval while another worker holds the loader lease (seconds)
+    WAIT_INTERVAL = 0.05
+
+    def __init__(
+        self,
+        ttl: float,
+        maxsize: int = 1024,
+        name: Optional[str] = None,
+        backend: Optional[CacheBackend] = None,
+        max_stale: float = 0.0
+    ):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.name = name
+        self.max_stale = max_stale
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self._backend = backend
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, "_Flight"] = {}
+        self._refreshing: Set[Hashable] = set()
+
+        if name:
+            _named_caches.append(self)
+
+    @property
+    def backend(self) -> CacheBackend:
+        """Storage, created from settings on first use (named caches)"""
+        if self._backend is None:
+            with self._lock:
+                if self._backend is None:
+                    self._backend = create_backend(self.name, self.maxsize) if self.name else MemoryBackend(self.maxsize)
+        return self._backend
+
+    def _count(self, hits: int = 0, misses: int = 0, stale_hits: int = 0) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.stale_hits += stale_hits
+
+    def _served(self, entry: tuple, now: float) -> Any:
+        """Value of an entry, recording its age for stale-while-revalidate caches"""
+        value, stored_at, _ = entry
+        if self.max_stale:
+            served = _served_age.get()
+            if served is not None:
+                served.note(now - stored_at)
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or default if missing or expired (stale values count as expired)"""
+        entry = self.backend.get(key)
+        now = time.time()
+        if entry is _MISSING or entry[2] <= now:
+            self._count(misses=1)
+            return default
+
+        self._count(hits=1)
+        return self._served(entry, now)
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """Fresh cached values of the keys that are present (one backend round trip)"""
+        keys = list(dict.fromkeys(keys))
+        now = time.time()
+        found = {
+            key: self._served(entry, now)
+            for key, entry in self.backend.get_many(keys).items() if entry[2] > now
+        }
+        self._count(hits=len(found), misses=len(keys) - len(found))
+        return found
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        # (value, stored at, fresh until); kept max_stale longer for stale serving
+        self.backend.set(key, (value, now, now + ttl), ttl + self.max_stale)
+
+    def get_or_set(self, key: Hashable, loader: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """
+        Return the cached value or compute it with loader() and cache it
+
+        Concurrent misses for the same key share one loader() call. Stale
+        values are returned at once and refreshed in the background.
+        """
+        entry = self.backend.get(key)
+        now = time.time()
+        if entry is not _MISSING:
+            if entry[2] > now:
+                self._count(hits=1)
+            else:
+                self._count(stale_hits=1)
+                self._refresh([key], lambda keys: {key: loader()}, ttl)
+            return self._served(entry, now)
+
+        self._count(misses=1)
+        with self._flight(key):
+            # Loaded by the thread we waited for
+            entry = self.backend.get(key)
+            if entry is not _MISSING:
+                return self._served(entry, time.time())
+
+            return self._load_shared(key, loader, ttl)
+
+    def get_or_set_many(
+        self,
+        keys: Iterable[Hashable],
+        loader: Callable[[List[Hashable]], Dict[Hashable, Any]],
+        ttl: Optional[float] = None
+    ) -> Dict[Hashable, Any]:
+        """
+        Cached values of the keys, loading all missing ones in one batch
+
+        loader(missing_keys) returns a dict of the values it found; keys it
+        leaves out are not cached. On a shared backend, keys another worker is
+        loading are waited for instead of being loaded twice. Stale keys are
+        served and refreshed in one background batch.
+        """
+        keys = list(dict.fromkeys(keys))
+        now = time.time()
+        entries = self.backend.get_many(keys)
+        found = {key: self._served(entry, now) for key, entry in entries.items()}
+        stale = [key for key, entry in entries.items() if entry[2] <= now]
+        missing = [key for key in keys if key not in entries]
+        self._count(hits=len(entries) - len(stale), misses=len(missing), stale_hits=len(stale))
+
+        if stale:
+            self._refresh(stale, loader, ttl)
+        if not missing:
+            return found
+
+        lease = _lease_seconds()
+        tokens = {key: self.backend.acquire(key, lease) for key in missing}
+        mine = [key for key in missing if tokens[key] is not None]
+        try:
+            if mine:
+                loaded = loader(mine)
+                for key, value in loaded.items():
+                    self.set(key, value, ttl)
+                found.update(loaded)
+        finally:
+            for key in mine:
+                self.backend.release(key, tokens[key])
+
+        waiting = [key for key in missing if tokens[key] is None]
+        if waiting:
+            found.update(self._wait_many(waiting, lease))
+            late = [key for key in waiting if key not in found]
+            if late:
+                # The other worker failed or found nothing: try ourselves once
+                loaded = loader(late)
+                for key, value in loaded.items():
+                    self.set(key, value, ttl)
+                found.update(loaded)
+
+        return {key: found[key] for key in keys if key in found}
+
+    def _flight(self, key: Hashable) -> "_Flight":
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight(self, key)
+            flight.users += 1
+        return flight
+
+    def _load_shared(self, key: Hashable, loader: Callable[[], Any], ttl: Optional[float]) -> Any:
+        """loader() under the backend lease; waits for the holder if another worker has it"""
+        lease = _lease_seconds()
+        token = self.backend.acquire(key, lease)
+        if token is None:
+            value = self._wait_many([key], lease).get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            # Lease expired without a value (holder failed): load ourselves
+            token = self.backend.acquire(key, lease)
+
+        try:
+            value = loader()
+            self.set(key, value, ttl)
+            return value
+        finally:
+            if token is not None:
+                self.backend.release(key, token)
+
+    def _wait_many(self, keys: List[Hashable], lease: float) -> Dict[Hashable, Any]:
+        """Poll until the keys are cached or the lease runs out"""
+        deadline = time.monotonic() + lease
+        found: Dict[Hashable, Any] = {}
+        pending = list(keys)
+        while pending and time.monotonic() < deadline:
+            time.sleep(self.WAIT_INTERVAL)
+            now = time.time()
+            for key, entry in self.backend.get_many(pending).items():
+                if entry[2] > now:
+                    found[key] = self._served(entry, now)
+            pending = [key for key in pending if key not in found]
+        return found
+
+    def _refresh(
+        self,
+        keys: List[Hashable],
+        loader: Callable[[List[Hashable]], Dict[Hashable, Any]],
+        ttl: Optional[float]
+    ) -> None:
+        """Reload stale keys on a background thread (once per key at a time)"""
+        with self._lock:
+            keys = [key for key in keys if key not in self._refreshing]
+            self._refreshing.update(keys)
+
+        if keys:
+            _refresh_executor().submit(self._run_refresh, keys, loader, ttl)
+
+    def _run_refresh(
+        self,
+        keys: List[Hashable],
+        loader: Callable[[List[Hashable]], Dict[Hashable, Any]],
+        ttl: Optional[float]
+    ) -> None:
+        tokens: Dict[Hashable, str] = {}
+        try:
+            lease = _lease_seconds()
+            for key in keys:
+                token = self.backend.acquire(key, lease)
+                if token is not None:
+                    tokens[key] = token
+
+            # Skip keys another worker refreshed in the meantime
+            now = time.time()
+            fresh = {key for key, entry in self.backend.get_many(list(tokens)).items() if entry[2] > now}
+            stale = [key for key in tokens if key not in fresh]
+            if stale:
+                for key, value in loader(stale).items():
+                    self.set(key, value, ttl)
+        except Exception:
+            # The stale value stays until its hard expiry; the next stale hit retries
+            logger.exception("Background refresh of cache %s failed", self.name)
+        finally:
+            for key, token in tokens.items():
+                self.backend.release(key, token)
+            with self._lock:
+                self._refreshing.difference_update(keys)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a single entry"""
+        self.backend.delete(key)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self.backend.clear()
+
+    def __len__(self) -> int:
+        return len(self.backend)
+
+    def local_size(self) -> Optional[int]:
+        """
+        Entries of an in-process backend, or None
+
+        None for shared backends (counting scans the shared store) and for
+        backends not created yet: unlike len(), never creates or scans storage.
+        """
+        backend = self._backend
+        if backend is None or backend.shared:
+            return None
+        return len(backend)
+
+
+class _Flight:
+    """Per-key loader lock of one TTLCache (dropped when its last user leaves)"""
+
+    def __init__(self, cache: TTLCache, key: Hashable):
+        self.cache = cache
+        self.key = key
+        self.lock = threading.Lock()
+        self.users = 0
+
+    def __enter__(self):
+        self.lock.acquire()
+
+    def __exit__(self, *exc_info):
+        self.lock.release()
+        with self.cache._lock:
+            self.users -= 1
+            if not self.users:
+                del self.cache._flights[self.key]
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _refresh_executor() -> ThreadPoolExecutor:
+    """Background refresh threads (created on the first stale hit)"""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                from config import settings
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.CACHE_REFRESH_WORKERS, thread_name_prefix="cache-refresh"
+                )
+    return _executor
+
+
+def _lease_seconds() -> float:
+    from config import settings
+    return settings.CACHE_LOCK_TIMEOUT_SECONDS
+
+
+_redis_client: Any = None
+
+
+def create_backend(namespace: str, maxsize: int = 1024, kind: Optional[str] = None) -> CacheBackend:
+    """
+    Backend of a named cache
+
+    Args:
+        namespace: Cache name (separates the caches of one shared store)
+        maxsize: Entries kept (memory, sqlite)
+        kind: "memory", "sqlite" or "redis" (default: CACHE_BACKEND setting)
+    """
+    global _redis_client
+    from config import settings
+
+    kind = kind or settings.CACHE_BACKEND
+    if kind == "memory":
+        return MemoryBackend(maxsize)
+    if kind == "sqlite":
+        return SQLiteBackend(settings.CACHE_SQLITE_PATH, namespace, maxsize)
+    if kind == "redis":
+        if _redis_client is None:
+            try:
+                import redis
+            except ImportError:
+                raise ValueError("CACHE_BACKEND=redis requires the redis package (pip install redis)")
+            _redis_client = redis.Redis.from_url(settings.CACHE_REDIS_URL)
+        return RedisBackend(_redis_client, namespace)
+    raise ValueError(f"Unknown cache backend: {kind}")
+
+
+def named_caches() -> List[TTLCache]:
+    """Caches created with a name (for metrics)"""
+    return list(_named_caches)
@@ -0,0 +1,163 @@
+"""
+HTTP caching helpers (ETag, Cache-Control, conditional GET)
+Similar to ResponseEntity.ok().cacheControl(...).eTag(...) with ShallowEtagHeaderFilter in Spring
+
+Every cacheable read endpoint gets a CachePolicy. Responses carry a strong
+ETag (hash of the rendered body) and the policy's Cache-Control header.
+The last ETag served for a cache key is remembered for the policy's max-age,
+so a matching If-None-Match is answered with 304 before any upstream call
+or recomputation happens. Responses built from values a stale-while-revalidate
+cache served past their ttl carry an Age header (ServedAgeMiddleware).
+"""
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from config import settings
+from core.cache import TTLCache, reset_served_age, track_served_age
+from core.responses import FastJSONResponse
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Cache-Control policy of an endpoint"""
+    max_age: int
+    public: bool = True
+    immutable: bool = False
+    no_cache: bool = False  # Always revalidate (ETag only)
+
+    @property
+    def header(self) -> str:
+        if self.no_cache:
+            return f"{'public' if self.public else 'private'}, no-cache"
+
+        directives = ["public" if self.public else "private", f"max-age={self.max_age}"]
+        if self.immutable:
+            directives.append("immutable")
+        return ", ".join(directives)
+
+
+# Quotes move every few seconds: cache as long as the quote cache does
+QUOTE = CachePolicy(max_age=settings.QUOTE_CACHE_TTL_SECONDS)
+
+# Option chains and analytics derived from them
+OPTION_CHAIN = CachePolicy(max_age=settings.OPTION_CHAIN_CACHE_TTL_SECONDS)
+
+# Expiry dates change at most once a day
+OPTION_EXPIRY = CachePolicy(max_age=3600)
+
+# History that still includes today's (unfinished) bar
+HISTORY = CachePolicy(max_age=settings.QUOTE_CACHE_TTL_SECONDS * 4)
+
+# History that ends before today: bars are final (dividend adjustments aside)
+HISTORY_FINAL = CachePolicy(max_age=settings.HISTORY_FINAL_MAX_AGE)
+
+# Portfolio data: never shared, always revalidated against the data version
+PRIVATE = CachePolicy(max_age=0, public=False, no_cache=True)
+
+# Last ETag served per cache key
+_etags = TTLCache(ttl=settings.HISTORY_FINAL_MAX_AGE, maxsize=8192, name="http_etags")
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag from the rendered response body"""
+    return f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    If-None-Match check (weak comparison, as RFC 9110 requires for GET)
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    if header.strip() == "*":
+        return True
+
+    candidates = (tag.strip() for tag in header.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+def not_modified(etag: str, policy: CachePolicy) -> Response:
+    """304 response carrying the validators of the cached representation"""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": policy.header})
+
+
+def cached_response(
+    request: Request,
+    key: Hashable,
+    policy: CachePolicy,
+    loader: Callable[[], Any]
+) -> Optional[Response]:
+    """
+    Serve a read endpoint with ETag / Cache-Control and conditional GET
+
+    Args:
+        request: Incoming request (If-None-Match is read from it)
+        key: Identity of the representation, including any data version
+            (e.g., ("option-chain", "AAPL", "2025-12-19") or the ledger version)
+        policy: Cache policy of the endpoint
+        loader: Computes the content (pydantic model or plain data), None if not found
+
+    Returns:
+        304 or 200 response, or None when loader() found nothing
+    """
+    key = (request.url.path, key)
+
+    etag = _etags.get(key)
+    if etag and etag_matches(request, etag):
+        return not_modified(etag, policy)
+
+    content = loader()
+    if content is None:
+        return None
+
+    if isinstance(content, BaseModel):
+        content = content.model_dump(mode="json")
+
+    response = FastJSONResponse(content)
+    etag = make_etag(response.body)
+    _etags.set(key, etag, ttl=policy.max_age or settings.HISTORY_FINAL_MAX_AGE)
+
+    if etag_matches(request, etag):
+        return not_modified(etag, policy)
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = policy.header
+    return response
+
+
+class ServedAgeMiddleware:
+    """
+    Pure ASGI middleware adding an Age header to responses built from cached values
+
+    Age is the age in seconds of the oldest value a stale-while-revalidate
+    cache (quotes, option chains) served while handling the request, so
+    clients can tell a slightly stale value from a fresh one.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        served, token = track_served_age()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and served.seconds is not None:
+                headers = list(message.get("headers", []))
+                headers.append((b"age", str(int(served.seconds)).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            reset_served_age(token)
@@ -0,0 +1,32 @@
+"""
+Lazy module imports (지연 임포트)
+Similar to @Lazy beans in Spring: heavy libraries load on first use
+
+pandas, numpy and yfinance take several hundred milliseconds to import.
+Modules that only need them inside functions bind a proxy instead:
+
+    pd = lazy_import("pandas")
+
+The real module is imported on the first attribute access (pd.DataFrame),
+so importing the app (workers, tests, CLI tools) does not pay for it.
+Annotations using the proxy must not be evaluated at definition time:
+modules using it start with `from __future__ import annotations`.
+"""
+import importlib
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy importing the real module on first attribute access"""
+
+    def __getattr__(self, attr: str):
+        module = importlib.import_module(self.__name__)
+        # Copy the namespace so later lookups never reach __getattr__ again
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """The module if it is already imported, otherwise a LazyModule proxy"""
+    return sys.modules.get(name) or LazyModule(name)
@@ -0,0 +1,320 @@
+"""
+Prometheus-style metrics (메트릭 수집)
+Similar to Micrometer + /actuator/prometheus in Spring Boot
+
+Metrics are plain in-process counters guarded by one lock each; recording is
+a dict lookup and an addition, so it can stay on in production. The text
+exposition format is rendered only when /metrics is scraped.
+"""
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+from core.tracing import span
+
+LabelValues = Tuple[str, ...]
+
+# Latency buckets (seconds): sub-ms cache hits up to slow upstream calls
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    """Base class: name, help text and label names"""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def set(self, value: float, *labels: str) -> None:
+        """Mirror a count kept elsewhere (collectors); it only goes down when its source restarts"""
+        with self._lock:
+            self._values[labels] = value
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, k)} {v}" for k, v in items]
+
+
+class Gauge(_Metric):
+    """Value that goes up and down per label set"""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, value: float, *labels: str) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, k)} {v}" for k, v in items]
+
+
+class Histogram(_Metric):
+    """
+    Bucketed latency distribution per label set
+
+    Each observation increments one bucket (found by binary search); the
+    cumulative counts Prometheus expects are computed at render time.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts (+Inf last), sum]
+        self._values: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][i] += 1
+            entry[1] += value
+
+    def count(self, *labels: str) -> int:
+        entry = self._values.get(labels)
+        return sum(entry[0]) if entry else 0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, (list(v[0]), v[1])) for k, v in self._values.items())
+
+        lines = []
+        names = self.label_names + ("le",)
+        for labels, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{self.name}_bucket{_format_labels(names, labels + (le,))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, labels)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, labels)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """
+    Metric registry
+
+    Collectors are callbacks run at scrape time for values that are cheaper
+    to read than to track (cache counters, DB pool state). render() runs
+    them, so call it off the event loop.
+    """
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], None]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        for collector in self._collectors:
+            collector()
+
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.header())
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# HTTP
+HTTP_REQUESTS = REGISTRY.register(Counter(
+    "http_requests_total", "HTTP requests by route template and status", ("method", "route", "status")
+))
+HTTP_LATENCY = REGISTRY.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template", ("method", "route")
+))
+HTTP_IN_FLIGHT = REGISTRY.register(Gauge(
+    "http_requests_in_flight", "HTTP requests currently being served"
+))
+
+# Upstream market data
+UPSTREAM_REQUESTS = REGISTRY.register(Counter(
+    "upstream_requests_total", "Upstream market data calls by method and outcome", ("provider", "method", "outcome")
+))
+UPSTREAM_LATENCY = REGISTRY.register(Histogram(
+    "upstream_request_duration_seconds", "Upstream market data call latency", ("provider", "method")
+))
+
+# In-process caches (filled by collector)
+CACHE_HITS = REGISTRY.register(Counter("cache_hits_total", "Cache hits since start", ("cache",)))
+CACHE_MISSES = REGISTRY.register(Counter("cache_misses_total", "Cache misses since start", ("cache",)))
+CACHE_STALE_HITS = REGISTRY.register(Counter(
+    "cache_stale_hits_total", "Expired values served while refreshing in the background", ("cache",)
+))
+CACHE_HIT_RATIO = REGISTRY.register(Gauge("cache_hit_ratio", "Cache hits / lookups since start", ("cache",)))
+CACHE_ENTRIES = REGISTRY.register(Gauge(
+    "cache_entries", "Entries currently cached (in-process backends only)", ("cache",)
+))
+
+# Database connection pool (filled by collector)
+DB_POOL = REGISTRY.register(Gauge("db_pool_connections", "Database pool connections by state", ("state",)))
+
+
+@contextmanager
+def upstream_call(method: str, provider: str = "yfinance") -> Iterator[None]:
+    """
+    Record count, latency and errors of one upstream call (and a trace span)
+
+    Usage:
+        with upstream_call("download"):
+            data = yf.download(...)
+    """
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        with span(f"{provider}.{method}", "upstream"):
+            yield
+        outcome = "success"
+    finally:
+        UPSTREAM_LATENCY.observe(time.perf_counter() - start, provider, method)
+        UPSTREAM_REQUESTS.inc(provider, method, outcome)
+
+
+def _collect_caches() -> None:
+    from core.cache import named_caches
+
+    for cache in named_caches():
+        hits, misses = cache.hits, cache.misses
+        CACHE_HITS.set(hits, cache.name)
+        CACHE_MISSES.set(misses, cache.name)
+        CACHE_STALE_HITS.set(cache.stale_hits, cache.name)
+        CACHE_HIT_RATIO.set(round(hits / (hits + misses), 4) if hits + misses else 0.0, cache.name)
+
+        # Shared backends are not counted (a scan of the shared store per scrape)
+        size = cache.local_size()
+        if size is not None:
+            CACHE_ENTRIES.set(size, cache.name)
+
+
+def _collect_db_pool() -> None:
+    from database.db import current_engine
+
+    # Scrapes never create the engine (before startup or after shutdown)
+    engine = current_engine()
+    if engine is None:
+        return
+
+    pool = engine.pool
+    for state, reader in (
+        ("size", "size"), ("checked_in", "checkedin"), ("checked_out", "checkedout"), ("overflow", "overflow")
+    ):
+        if hasattr(pool, reader):
+            DB_POOL.set(getattr(pool, reader)(), state)
+
+
+REGISTRY.add_collector(_collect_caches)
+REGISTRY.add_collector(_collect_db_pool)
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording latency per route template
+
+    The route template (e.g. /stock/{symbol}) is read from the matched route
+    after the request is handled, so label cardinality stays bounded.
+    Unmatched paths are recorded as "<unmatched>".
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_IN_FLIGHT.dec()
+
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "<unmatched>"
+            method = scope["method"]
+            HTTP_LATENCY.observe(elapsed, method, template)
+            HTTP_REQUESTS.inc(method, template, str(status[0]))
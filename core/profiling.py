@@ -0,0 +1,245 @@
+"""
+On-demand profiling (운영 중 프로파일링)
+Similar to attaching async-profiler / JFR to a running JVM
+
+Two modes, both admin-only:
+- Single request: "X-Profile: 1" header or "?profile=1" runs that request
+  under cProfile and returns the stats instead of the normal body
+- Sampling: sample_stacks() snapshots every thread's stack at a fixed
+  interval and returns collapsed stacks ("a;b;c 42"), the input format of
+  flamegraph.pl and speedscope
+
+Nothing here runs unless PROFILING_ENABLED is set and ADMIN_TOKEN is
+configured: the middleware and the threadpool hook are not installed otherwise.
+"""
+import cProfile
+import functools
+import hmac
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Callable, List, Optional
+from urllib.parse import parse_qs
+
+import anyio.to_thread
+
+# cProfile and the sampler are process-wide: one session at a time
+_profile_lock = threading.Lock()
+
+# Profiles of the request being profiled: the event loop's plus one per
+# threadpool call (sync endpoints and dependencies run there)
+_request_profiles: ContextVar[Optional[List[cProfile.Profile]]] = ContextVar("request_profiles", default=None)
+
+# anyio.to_thread.run_sync replaced by install_threadpool_hook(), and its replacement
+_original_run_sync: Optional[Callable] = None
+_hook: Optional[Callable] = None
+_hook_lock = threading.Lock()
+
+# Innermost frames of threads that are just waiting
+_IDLE_FUNCTIONS = frozenset({"select", "poll", "wait", "accept", "_wait_for_tstate_lock"})
+
+
+def is_admin(token: Optional[str], admin_token: Optional[str]) -> bool:
+    """Constant-time admin token check (False when no admin token is configured)"""
+    if not admin_token or not token:
+        return False
+    return hmac.compare_digest(token.encode(), admin_token.encode())
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+def sample_stacks(seconds: float, interval: float = 0.005, include_idle: bool = False) -> str:
+    """
+    Sample the stacks of all other threads
+
+    Args:
+        seconds: Capture duration
+        interval: Time between samples (seconds)
+        include_idle: Keep stacks that end in a wait (selectors, locks, queues)
+
+    Returns:
+        Collapsed stacks, one "thread;outer;...;inner count" line per stack
+
+    Raises:
+        RuntimeError: another profiling session is running
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise RuntimeError("Another profiling session is running")
+
+    try:
+        me = threading.get_ident()
+        counts: Counter = Counter()
+        deadline = time.monotonic() + seconds
+
+        while time.monotonic() < deadline:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == me:
+                    continue
+
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame))
+                    frame = frame.f_back
+
+                if not include_idle and stack and stack[0].split(":")[-1] in _IDLE_FUNCTIONS:
+                    continue
+
+                stack.append(names.get(thread_id, str(thread_id)))
+                counts[";".join(reversed(stack))] += 1
+
+            time.sleep(interval)
+
+        return "".join(f"{stack} {count}\n" for stack, count in counts.most_common())
+    finally:
+        _profile_lock.release()
+
+
+def _profiled(func: Callable, profiles: List[cProfile.Profile]) -> Callable:
+    """Run func under its own profiler on the calling (threadpool) thread"""
+    @functools.wraps(func)
+    def call(*args, **kwargs):
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Python 3.12+: the request profiler already covers every thread
+            return func(*args, **kwargs)
+
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.disable()
+            profiles.append(profiler)
+
+    return call
+
+
+def install_threadpool_hook() -> None:
+    """
+    Profile the threadpool calls made on behalf of profiled requests
+
+    Starlette and FastAPI run sync endpoints and dependencies through
+    anyio.to_thread.run_sync, looked up on the module at call time, so the
+    hook replaces that function for the whole process. Called explicitly by
+    the app at startup (main.py, only when profiling is enabled) and undone
+    by uninstall_threadpool_hook() at shutdown.
+
+    Outside a profiled request the replacement is inert: it reads one
+    context variable and calls the original with the same arguments.
+    """
+    global _original_run_sync, _hook
+
+    with _hook_lock:
+        if _hook is not None:
+            return
+
+        run_sync = anyio.to_thread.run_sync
+
+        async def profiled_run_sync(func, *args, **kwargs):
+            profiles = _request_profiles.get()
+            if profiles is not None:
+                func = _profiled(func, profiles)
+            return await run_sync(func, *args, **kwargs)
+
+        _original_run_sync, _hook = run_sync, profiled_run_sync
+        anyio.to_thread.run_sync = profiled_run_sync
+
+
+def uninstall_threadpool_hook() -> None:
+    """Restore anyio.to_thread.run_sync (unless replaced again since)"""
+    global _original_run_sync, _hook
+
+    with _hook_lock:
+        if _hook is None:
+            return
+        if anyio.to_thread.run_sync is _hook:
+            anyio.to_thread.run_sync = _original_run_sync
+        _original_run_sync, _hook = None, None
+
+
+class ProfilingMiddleware:
+    """
+    Pure ASGI middleware profiling single admin requests with cProfile
+
+    The profiled response is replaced by the pstats report (text/plain),
+    sorted by cumulative time; the original status is kept in
+    X-Profiled-Status. The event loop is profiled, and so are the threadpool
+    threads running the request's sync handlers and dependencies while
+    install_threadpool_hook() is in effect. Concurrent requests on the event
+    loop are included in the profile, so profile on a quiet worker when possible.
+    """
+
+    def __init__(self, app, admin_token: Optional[str], limit: int = 60):
+        self.app = app
+        self.admin_token = admin_token
+        self.limit = limit
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        if not _profile_lock.acquire(blocking=False):
+            await self._send_text(send, 409, "Another profiling session is running\n")
+            return
+
+        status = [500]
+
+        async def discard(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+
+        profiler = cProfile.Profile()
+        profiles = [profiler]
+        token = _request_profiles.set(profiles)
+        try:
+            profiler.enable()
+            try:
+                await self.app(scope, receive, discard)
+            finally:
+                profiler.disable()
+        finally:
+            _request_profiles.reset(token)
+            _profile_lock.release()
+
+        report = io.StringIO()
+        stats = pstats.Stats(*profiles, stream=report)
+        stats.sort_stats("cumulative").print_stats(self.limit)
+
+        await self._send_text(send, 200, report.getvalue(), [(b"x-profiled-status", str(status[0]).encode())])
+
+    def _requested(self, scope) -> bool:
+        headers = dict(scope.get("headers", ()))
+        flagged = headers.get(b"x-profile") in (b"1", b"true")
+
+        if not flagged and scope.get("query_string"):
+            flagged = parse_qs(scope["query_string"].decode()).get("profile", [""])[0] in ("1", "true")
+
+        if not flagged:
+            return False
+
+        token = headers.get(b"x-admin-token", b"").decode() or None
+        return is_admin(token, self.admin_token)
+
+    @staticmethod
+    async def _send_text(send, status: int, body: str, extra_headers=()) -> None:
+        data = body.encode()
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", str(len(data)).encode()),
+                *extra_headers,
+            ],
+        })
+        await send({"type": "http.response.body", "body": data})
@@ -0,0 +1,50 @@
+"""
+Rate limiting of upstream calls
+Similar to Guava's RateLimiter
+
+A token bucket shared by the threads of one process: acquire() blocks until
+a token is available. Tokens refill continuously at `rate` per second, up to
+`burst`. Limits are per worker process (not shared through the cache backend).
+"""
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Blocking token bucket
+
+    Usage:
+        limiter = RateLimiter(rate=5, burst=10)
+        limiter.acquire()  # waits if more than 10 calls were made in the last 2s
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, waiting for it if needed (rate <= 0 = unlimited)
+
+        Returns:
+            Seconds waited
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            # Tokens go negative: later callers queue up behind this one
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait:
+            time.sleep(wait)
+        return wait
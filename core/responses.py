@@ -0,0 +1,76 @@
+"""
+Fast JSON response (orjson 기반 JSON 응답) and response compression
+Similar to swapping Jackson's ObjectMapper for a faster serializer in Spring
+"""
+import datetime
+import decimal
+import sys
+from typing import Any, Iterable
+
+import orjson
+from fastapi.responses import JSONResponse
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.tracing import span
+
+
+def _default(obj: Any) -> Any:
+    """Types orjson does not serialize natively"""
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, datetime.timedelta):
+        return obj.total_seconds()
+
+    # pandas / numpy objects can only exist once those modules are imported
+    pd, np = sys.modules.get("pandas"), sys.modules.get("numpy")
+    if pd is not None and isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    if np is not None and isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson
+
+    - NumPy arrays and scalars are serialized natively (OPT_SERIALIZE_NUMPY)
+    - Decimal, pandas Timestamp and sets go through _default
+    - NaN / Infinity become null instead of raising
+
+    Used as the app default response class. Endpoints returning large plain
+    dicts can return it directly to skip FastAPI's jsonable_encoder pass.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        with span("serialize", "serialize"):
+            return orjson.dumps(
+                content,
+                default=_default,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware that leaves the given paths uncompressed
+
+    For streamed responses (e.g. NDJSON) that must reach the client line by
+    line: the compressor would hold lines back until its buffer fills.
+    Similar to server.compression.excluded-paths in Spring Boot.
+    """
+
+    def __init__(self, app: ASGIApp, exclude_paths: Iterable[str] = (), **options: Any) -> None:
+        super().__init__(app, **options)
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
@@ -0,0 +1,78 @@
+"""
+Periodic background jobs
+Similar to @Scheduled(fixedRate = ...) in Spring
+
+A PeriodicJob runs its function on a daemon thread right after start() and
+then every interval seconds. With several workers each one starts the job,
+but a run first takes a lease on the shared cache backend (CACHE_BACKEND),
+so at most one worker runs it per interval. With the in-process backend
+every worker runs it.
+"""
+import logging
+import threading
+from typing import Callable, Optional
+
+from core.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Run leases of the jobs (only the backend's lease locks are used)
+_leases = TTLCache(ttl=60, maxsize=64, name="scheduler")
+
+
+class PeriodicJob:
+    """
+    Function run every interval seconds on a background thread
+
+    Usage:
+        job = PeriodicJob("option-snapshots", 900, capture)
+        job.start()
+        ...
+        job.stop()
+    """
+
+    def __init__(self, name: str, interval: float, func: Callable[[], None]):
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self.runs = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name=f"job-{self.name}", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop scheduling (a run in progress finishes first, up to timeout)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_once(self) -> bool:
+        """
+        Run the job now unless another worker ran it within the interval
+
+        Returns:
+            True if this call ran the job
+        """
+        # The lease is kept until it expires: it marks the interval as done
+        # (slightly shorter than the interval so timer drift never skips a run)
+        if _leases.backend.acquire(self.name, self.interval * 0.9) is None:
+            return False
+
+        try:
+            self.func()
+        except Exception:
+            # A failing run must not stop the schedule
+            logger.exception("Scheduled job %s failed", self.name)
+        self.runs += 1
+        return True
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            self.run_once()
+            self._stop.wait(self.interval)
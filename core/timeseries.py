@@ -0,0 +1,171 @@
+"""
+Append-only columnar time-series store (시계열 저장소)
+Similar to a date-partitioned Parquet dataset, without the dependency
+
+Rows belong to a series key (e.g., a symbol) and are partitioned by key and
+UTC date of their timestamp:
+
+    <root>/<key>/<YYYY-MM-DD>/<column>.col
+
+Every column is a raw little-endian array of a fixed dtype, so appends are
+plain file appends and reads are np.fromfile() of only the requested
+columns. A range query lists the key's date directories and opens only the
+ones inside the range: years of minute-level data never cost a full scan.
+
+Appends hold an exclusive file lock (flock) on their partition, so writers
+in several processes never interleave, and first cut every column back to
+the last complete row: a crash in the middle of an append leaves columns of
+different lengths, which reads ignore and the next append repairs instead of
+writing each column at its own end. Readers in any worker see complete rows.
+"""
+from __future__ import annotations
+
+import os
+import re
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional
+
+from core.lazy import lazy_import
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers are only serialized within the process
+    fcntl = None
+
+np = lazy_import("numpy")
+
+# Keys become directory names
+_KEY_PATTERN = re.compile(r"^[A-Za-z0-9_^=-][A-Za-z0-9._^=-]*$")
+
+TIMESTAMP = "ts"  # Epoch seconds (int64), present in every store
+LOCK_FILE = ".lock"  # Per-partition writer lock
+
+
+class ColumnarStore:
+    """
+    Date-partitioned columnar store of one schema
+
+    Usage:
+        store = ColumnarStore("option_history", {"pcr": "<f4", "call_oi": "<i8"})
+        store.append("AAPL", {"ts": [1760900000], "pcr": [0.91], "call_oi": [132281]})
+        columns = store.query("AAPL", date(2026, 1, 1), date(2026, 10, 19), ["pcr"])
+    """
+
+    def __init__(self, root: str, columns: Mapping[str, str]):
+        self.root = root
+        self.columns: Dict[str, str] = {TIMESTAMP: "<i8", **columns}
+        self._lock = threading.Lock()
+
+    def append(self, key: str, rows: Mapping[str, Iterable]) -> int:
+        """
+        Append rows given column-wise (every schema column is required)
+
+        Returns:
+            Number of appended rows
+        """
+        directory = self._key_dir(key)
+        arrays = {name: np.asarray(rows[name], dtype=dtype) for name, dtype in self.columns.items()}
+        if len({len(a) for a in arrays.values()}) > 1:
+            raise ValueError("All columns must have the same number of rows")
+
+        days = (arrays[TIMESTAMP] // 86400).astype("datetime64[D]")
+        with self._lock:
+            for day in np.unique(days):
+                mask = days == day
+                partition = os.path.join(directory, str(day))
+                os.makedirs(partition, exist_ok=True)
+                with _locked(partition):
+                    self._truncate_to_complete_rows(partition)
+                    for name, values in arrays.items():
+                        with open(os.path.join(partition, f"{name}.col"), "ab") as f:
+                            f.write(values[mask].tobytes())
+
+        return len(arrays[TIMESTAMP])
+
+    def query(
+        self,
+        key: str,
+        start: date,
+        end: date,
+        columns: Optional[List[str]] = None
+    ) -> Dict[str, "np.ndarray"]:
+        """
+        Rows of a key between two dates (both inclusive, UTC), in append order
+
+        Only partitions inside the range are opened, and only the requested
+        columns (plus the timestamp) are read.
+
+        Returns:
+            Column name -> array (empty arrays when there is no data)
+        """
+        names = [TIMESTAMP] + [c for c in (columns or self.columns) if c != TIMESTAMP]
+        unknown = [c for c in names if c not in self.columns]
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+
+        chunks: Dict[str, list] = {name: [] for name in names}
+        for partition in self.partitions(key, start, end):
+            arrays = {name: self._read(partition, name) for name in names}
+            rows = min(len(a) for a in arrays.values())
+            for name, values in arrays.items():
+                chunks[name].append(values[:rows])
+
+        return {
+            name: np.concatenate(parts) if parts else np.empty(0, dtype=self.columns[name])
+            for name, parts in chunks.items()
+        }
+
+    def partitions(self, key: str, start: date, end: date) -> List[str]:
+        """Partition directories of a key inside the date range (oldest first)"""
+        directory = self._key_dir(key)
+        if not os.path.isdir(directory):
+            return []
+
+        # YYYY-MM-DD names sort chronologically
+        first, last = start.isoformat(), end.isoformat()
+        return [
+            os.path.join(directory, name)
+            for name in sorted(os.listdir(directory))
+            if first <= name <= last
+        ]
+
+    def _truncate_to_complete_rows(self, partition: str) -> None:
+        """Drop the torn tail of an interrupted append (caller holds the partition lock)"""
+        sizes = {}
+        for name, dtype in self.columns.items():
+            path = os.path.join(partition, f"{name}.col")
+            sizes[path] = (os.path.getsize(path) if os.path.exists(path) else 0, np.dtype(dtype).itemsize)
+
+        rows = min(size // itemsize for size, itemsize in sizes.values())
+        for path, (size, itemsize) in sizes.items():
+            if size != rows * itemsize:
+                os.truncate(path, rows * itemsize)
+
+    def _read(self, partition: str, name: str) -> "np.ndarray":
+        path = os.path.join(partition, f"{name}.col")
+        if not os.path.exists(path):
+            return np.empty(0, dtype=self.columns[name])
+        return np.fromfile(path, dtype=self.columns[name])
+
+    def _key_dir(self, key: str) -> str:
+        if not _KEY_PATTERN.match(key):
+            raise ValueError(f"Invalid series key: {key!r}")
+        return os.path.join(self.root, key)
+
+
+@contextmanager
+def _locked(partition: str) -> Iterator[None]:
+    """Exclusive lock on a partition across processes (released on close)"""
+    with open(os.path.join(partition, LOCK_FILE), "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        yield
+
+
+def to_epoch(moment: datetime) -> int:
+    """Epoch seconds of a datetime (naive values are taken as UTC)"""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp())
@@ -0,0 +1,328 @@
+"""
+Request tracing (요청 단위 트레이싱)
+Similar to Micrometer Tracing / Spring Cloud Sleuth spans in Spring Boot
+
+A sampled request gets a root span; service calls, upstream fetches, SQL
+statements and serialization open child spans through span() / @traced.
+The current trace lives in a contextvar, so unsampled requests pay one
+contextvar lookup per instrumented call and nothing else.
+
+Finished traces are exported in the background (JSON lines file and/or a
+Zipkin v2 collector) and summarized in a Server-Timing response header.
+"""
+import functools
+import json
+import logging
+import queue
+import random
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+SERVER_TIMING_KINDS = ("db", "upstream", "serialize")
+
+
+@dataclass
+class Span:
+    """One timed operation of a trace"""
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    name: str
+    kind: str  # server, service, upstream, db, serialize
+    start_ns: int
+    duration_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_us": self.start_ns // 1000,
+            "duration_us": self.duration_ns // 1000,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+    def to_zipkin(self, service_name: str) -> Dict:
+        """Zipkin v2 JSON span"""
+        data = {
+            "traceId": self.trace_id,
+            "id": self.span_id,
+            "name": self.name,
+            "timestamp": self.start_ns // 1000,
+            "duration": max(self.duration_ns // 1000, 1),
+            "localEndpoint": {"serviceName": service_name},
+            "tags": {k: str(v) for k, v in self.attributes.items()},
+        }
+        if self.parent_id:
+            data["parentId"] = self.parent_id
+        if self.kind == "server":
+            data["kind"] = "SERVER"
+        elif self.kind in ("upstream", "db"):
+            data["kind"] = "CLIENT"
+        if self.error:
+            data["tags"]["error"] = self.error
+        return data
+
+
+class Trace:
+    """Spans of one request (list appends are thread-safe)"""
+
+    def __init__(self):
+        self.trace_id = uuid.uuid4().hex
+        self.spans: List[Span] = []
+
+    def totals(self) -> Dict[str, float]:
+        """Total milliseconds per span kind"""
+        totals: Dict[str, float] = {}
+        for s in self.spans:
+            totals[s.kind] = totals.get(s.kind, 0.0) + s.duration_ns / 1e6
+        return totals
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+@contextmanager
+def span(name: str, kind: str = "service", **attributes: Any) -> Iterator[Optional[Span]]:
+    """
+    Time a block as a child of the current span
+
+    Yields None (and records nothing) when the request is not sampled.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    parent = _current_span.get()
+    current = Span(
+        trace_id=trace.trace_id,
+        span_id=uuid.uuid4().hex[:16],
+        parent_id=parent.span_id if parent else None,
+        name=name,
+        kind=kind,
+        start_ns=time.time_ns(),
+        attributes=attributes
+    )
+    token = _current_span.set(current)
+    started = time.perf_counter_ns()
+    try:
+        yield current
+    except Exception as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.duration_ns = time.perf_counter_ns() - started
+        _current_span.reset(token)
+        trace.spans.append(current)
+
+
+def traced(name: Optional[str] = None, kind: str = "service") -> Callable:
+    """
+    Decorator opening a span around a service method
+
+    Usage:
+        @staticmethod
+        @traced()
+        def get_stock_info(symbol): ...
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_trace.get() is None:
+                return func(*args, **kwargs)
+            with span(span_name, kind):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# ---------------------------------------------------------------------------
+# SQL statements (SQLAlchemy cursor events)
+# ---------------------------------------------------------------------------
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_trace.get() is None:
+        return
+    manager = span("sql", "db", statement=" ".join(statement.split())[:200], executemany=executemany)
+    manager.__enter__()
+    conn.info.setdefault("_trace_spans", []).append(manager)
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    spans = conn.info.get("_trace_spans")
+    if spans:
+        spans.pop().__exit__(None, None, None)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    spans = exception_context.connection.info.get("_trace_spans") if exception_context.connection else None
+    if spans:
+        error = exception_context.original_exception
+        spans.pop().__exit__(type(error), error, None)
+
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+
+class TraceExporter:
+    """
+    Background exporter of finished traces
+
+    Requests only enqueue the trace; a daemon thread writes JSON lines and/or
+    posts Zipkin v2 batches, so slow disks or collectors never add latency.
+    """
+
+    def __init__(self, file_path: Optional[str] = None, zipkin_url: Optional[str] = None, service_name: str = "stock-api"):
+        self.file_path = file_path
+        self.zipkin_url = zipkin_url
+        self.service_name = service_name
+        self._queue: "queue.Queue[Trace]" = queue.Queue(maxsize=1000)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.file_path or self.zipkin_url)
+
+    def export(self, trace: Trace) -> None:
+        if not self.enabled:
+            return
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+            self._thread.start()
+
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            logger.warning("Trace export queue full, dropping trace %s", trace.trace_id)
+
+    def _run(self) -> None:
+        while True:
+            traces = [self._queue.get()]
+            while not self._queue.empty() and len(traces) < 100:
+                traces.append(self._queue.get_nowait())
+
+            try:
+                self._write(traces)
+            except Exception as e:
+                logger.warning("Trace export failed: %s", e)
+
+    def _write(self, traces: List[Trace]) -> None:
+        spans = [s for trace in traces for s in trace.spans]
+
+        if self.file_path:
+            with open(self.file_path, "a", encoding="utf-8") as f:
+                for s in spans:
+                    f.write(json.dumps(s.to_dict()) + "\n")
+
+        if self.zipkin_url:
+            import requests
+            requests.post(
+                self.zipkin_url,
+                json=[s.to_zipkin(self.service_name) for s in spans],
+                timeout=5
+            )
+
+
+# ---------------------------------------------------------------------------
+# Middleware
+# ---------------------------------------------------------------------------
+
+def server_timing(trace: Trace, total_ms: float) -> str:
+    """Server-Timing header value: db, upstream, serialize and app time"""
+    totals = trace.totals()
+    parts = [f"{kind};dur={totals[kind]:.1f}" for kind in SERVER_TIMING_KINDS if kind in totals]
+    spent = sum(totals.get(kind, 0.0) for kind in SERVER_TIMING_KINDS)
+    parts.append(f"app;dur={max(total_ms - spent, 0.0):.1f}")
+    parts.append(f"total;dur={total_ms:.1f}")
+    return ", ".join(parts)
+
+
+class TracingMiddleware:
+    """
+    Pure ASGI middleware opening the root span of sampled requests
+
+    - Sampled with probability sample_rate; "X-Trace: 1" forces sampling
+    - Adds Server-Timing and X-Trace-Id headers to sampled responses
+    """
+
+    def __init__(self, app, sample_rate: float = 0.0, exporter: Optional[TraceExporter] = None):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.exporter = exporter or TraceExporter()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._sampled(scope):
+            await self.app(scope, receive, send)
+            return
+
+        trace = Trace()
+        trace_token = _current_trace.set(trace)
+        root = Span(
+            trace_id=trace.trace_id,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=None,
+            name=f"{scope['method']} {scope['path']}",
+            kind="server",
+            start_ns=time.time_ns(),
+            attributes={"http.method": scope["method"], "http.path": scope["path"]}
+        )
+        span_token = _current_span.set(root)
+        started = time.perf_counter_ns()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                root.attributes["http.status_code"] = message["status"]
+                total_ms = (time.perf_counter_ns() - started) / 1e6
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", server_timing(trace, total_ms).encode()))
+                headers.append((b"x-trace-id", trace.trace_id.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            root.duration_ns = time.perf_counter_ns() - started
+            route = scope.get("route")
+            if getattr(route, "path", None):
+                root.name = f"{scope['method']} {route.path}"
+            _current_span.reset(span_token)
+            _current_trace.reset(trace_token)
+            trace.spans.append(root)
+            self.exporter.export(trace)
+
+    def _sampled(self, scope) -> bool:
+        for name, value in scope.get("headers", ()):
+            if name == b"x-trace" and value in (b"1", b"true"):
+                return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
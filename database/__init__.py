@@ -1,3 +1,10 @@
-from .db import engine, SessionLocal, Base, get_db
+from .db import get_engine, dispose_engine, SessionLocal, Base, get_db
 
-__all__ = ["engine", "SessionLocal", "Base", "get_db"]
+__all__ = ["get_engine", "dispose_engine", "SessionLocal", "Base", "get_db"]
+
+
+def __getattr__(name: str):
+    # `from database import engine` keeps working (creates the engine)
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,45 +1,133 @@
+import ssl
+import threading
+from typing import Optional
+
+import anyio
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from config import settings
-import ssl
 
-# Create database engine
-# Similar to DataSource in Spring Boot
-# For Oracle with TLS (mTLS disabled), disable SSL verification
-ssl_context = ssl.create_default_context()
-ssl_context.check_hostname = False
-ssl_context.verify_mode = ssl.CERT_NONE
-
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,  # Log SQL queries (like show-sql in Spring)
-    pool_pre_ping=True,   # Check connection health
-    pool_size=5,
-    max_overflow=10,
-    connect_args={
-        "ssl_context": ssl_context  # Disable SSL certificate verification
-    }
-)
+_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+
+
+def _create_engine() -> Engine:
+    if settings.DATABASE_URL.startswith("sqlite"):
+        # Local SQLite (benchmarks, offline runs): one file shared by all threads
+        return create_engine(
+            settings.DATABASE_URL,
+            echo=settings.DEBUG,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            connect_args={"check_same_thread": False}
+        )
+
+    # For Oracle with TLS (mTLS disabled), disable SSL verification
+    ssl_context = ssl.create_default_context()
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+
+    return create_engine(
+        settings.DATABASE_URL,
+        echo=settings.DEBUG,  # Log SQL queries (like show-sql in Spring)
+        pool_pre_ping=True,   # Check connection health
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        connect_args={
+            "ssl_context": ssl_context  # Disable SSL certificate verification
+        }
+    )
+
+
+def get_engine() -> Engine:
+    """
+    Database engine, created on first use
+    Similar to DataSource in Spring Boot
+
+    The app creates it in its lifespan (fail fast on a bad configuration);
+    scripts and tests get it on first use, so importing the app needs
+    neither a database driver nor database settings.
+    """
+    global _engine
+
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = _create_engine()
+
+    return _engine
+
+
+def current_engine() -> Optional[Engine]:
+    """Engine if it was created, without creating it (metrics, shutdown)"""
+    return _engine
+
+
+def dispose_engine() -> None:
+    """
+    Close pooled connections (app shutdown)
+
+    SessionLocal is unbound as well, so sessions created afterwards (e.g. by
+    a restarted lifespan in tests) bind to a new engine, not the disposed one.
+    """
+    global _engine
+
+    with _engine_lock:
+        if _engine is not None:
+            _engine.dispose()
+            _engine = None
+        SessionLocal.configure(bind=None)
+
+
+def __getattr__(name: str):
+    # `from database.db import engine` keeps working (creates the engine)
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _LazySessionmaker(sessionmaker):
+    """sessionmaker bound to the engine when the first session is created"""
+
+    def __call__(self, **local_kw):
+        if self.kw.get("bind") is None:
+            self.configure(bind=get_engine())
+        return super().__call__(**local_kw)
+
 
 # Create SessionLocal class
 # Similar to EntityManager in JPA
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = _LazySessionmaker(autocommit=False, autoflush=False)
 
 # Base class for models
 # Similar to @Entity base class
 Base = declarative_base()
 
 
+# Request sessions in use at once: never more than the pool can hand out
+# (Similar to a bounded connection pool wait in HikariCP)
+_session_slots = anyio.Semaphore(settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW)
+
+
 # Dependency injection for database session
 # Similar to @Autowired EntityManager in Spring
-def get_db():
+async def get_db():
     """
     Get database session for dependency injection
     Usage in FastAPI: def endpoint(db: Session = Depends(get_db))
+
+    Requests wait for a free slot on the event loop instead of blocking a
+    threadpool worker on the connection pool. Otherwise, under load, every
+    worker can end up waiting for a connection while the requests holding
+    connections wait for a worker to serialize their response and close
+    the session (deadlock until the pool timeout).
     """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    async with _session_slots:
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            await run_in_threadpool(db.close)
@@ -1,20 +1,114 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from config import settings
+from database.db import get_engine, dispose_engine
+from core.responses import FastJSONResponse, SelectiveGZipMiddleware
+from core.metrics import MetricsMiddleware
+from core.tracing import TracingMiddleware, TraceExporter
+from core.profiling import ProfilingMiddleware, install_threadpool_hook, uninstall_threadpool_hook
+from core.http_cache import ServedAgeMiddleware
+from services.alert_service import AlertService
 from routers import stock_router
 from routers.portfolio import router as portfolio_router
 from routers.transaction import router as transaction_router
 from routers.option import router as option_router
+from routers.alert import router as alert_router
+from routers.watchlist import router as watchlist_router
+from routers.metrics import router as metrics_router
+from routers.admin import router as admin_router
+
+
+# Admin profiling: middleware + threadpool hook (PROFILING_ENABLED with an ADMIN_TOKEN)
+PROFILING = bool(settings.PROFILING_ENABLED and settings.ADMIN_TOKEN)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Startup / shutdown hooks
+    Similar to @PostConstruct / @PreDestroy in Spring
+
+    The engine is created here rather than at import time, so importing the
+    app (tests, tools, worker boot) does not load the database driver.
+    Price alerts follow the quote feed while the app runs.
+    Scheduled option jobs only run when their symbol universe is configured.
+    Profiled requests also cover their threadpool calls when profiling is enabled.
+    """
+    get_engine()
+    AlertService.subscribe()
+    if PROFILING:
+        install_threadpool_hook()
+
+    jobs = []
+    if settings.OPTION_SNAPSHOT_SYMBOLS:
+        from services.option_snapshot_service import snapshot_job
+        jobs.append(snapshot_job())
+    if settings.OPTION_HISTORY_SYMBOLS:
+        from services.option_history_service import history_job
+        jobs.append(history_job())
+    for job in jobs:
+        job.start()
+
+    yield
+
+    for job in jobs:
+        job.stop()
+    if PROFILING:
+        uninstall_threadpool_hook()
+    AlertService.unsubscribe()
+    dispose_engine()
+
 
 app = FastAPI(
     title="Stock API",
     description="Real-time stock information and portfolio management API with transaction tracking",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan
+)
+
+# Compress large payloads (option chains, multi-year histories); the streamed
+# option scan is sent as is so each line reaches the client when evaluated
+# Similar to server.compression.enabled / min-response-size in Spring Boot
+app.add_middleware(
+    SelectiveGZipMiddleware,
+    exclude_paths=["/option/scan"],
+    minimum_size=settings.GZIP_MIN_SIZE,
+    compresslevel=settings.GZIP_COMPRESS_LEVEL
+)
+
+# Age header on responses served from stale-while-revalidate caches
+app.add_middleware(ServedAgeMiddleware)
+
+# Single-request cProfile for admins (not installed at all unless enabled)
+if PROFILING:
+    app.add_middleware(ProfilingMiddleware, admin_token=settings.ADMIN_TOKEN)
+
+# Per-request spans (router, service, upstream, SQL) + Server-Timing header
+app.add_middleware(
+    TracingMiddleware,
+    sample_rate=settings.TRACE_SAMPLE_RATE,
+    exporter=TraceExporter(
+        file_path=settings.TRACE_EXPORT_FILE,
+        zipkin_url=settings.TRACE_ZIPKIN_URL,
+        service_name=settings.APP_NAME
+    )
 )
 
+# Request latency / in-flight metrics (added last = outermost, so it times compression too)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Register routers (similar to Spring @ComponentScan)
 app.include_router(stock_router)
 app.include_router(portfolio_router)
 app.include_router(transaction_router)
 app.include_router(option_router)
+app.include_router(alert_router)
+app.include_router(watchlist_router)
+app.include_router(metrics_router)
+app.include_router(admin_router)
 
 
 @app.get("/")
@@ -25,15 +119,30 @@ async def root():
         "endpoints": {
             "/stock/{symbol}": "Get current stock information",
             "/stock/{symbol}/history": "Get historical stock data",
+            "/stock/compare?symbols=A,B,C": "Compare multiple stocks (returns, correlation)",
+            "/stock/{symbol}/news": "Stored news with sentiment (deduplicated, scored once)",
             "/transaction": "Buy/Sell stocks (NEW - recommended)",
             "/transaction/summary/{symbol}": "View transaction summary",
+            "/transaction/realized": "Realized profit/loss (FIFO, LIFO, average cost)",
             "/portfolio": "View portfolio summary (auto-calculated from transactions)",
             "/portfolio/profit": "View portfolio with profit/loss",
+            "/portfolio/stats": "Portfolio risk statistics (volatility, beta, Sharpe, VaR)",
+            "/portfolio/history": "Daily portfolio value, cost basis and P&L over time",
+            "/portfolio/news": "News sentiment across all holdings",
             "/option/{symbol}/expiry": "Get available option expiry dates (NEW)",
             "/option/{symbol}/max-pain": "Max Pain analysis - price prediction (NEW)",
             "/option/{symbol}/pcr": "Put-Call Ratio - market sentiment (NEW)",
             "/option/{symbol}/iv": "Implied Volatility - volatility expectations (NEW)",
             "/option/{symbol}/chain": "Full option chain data (NEW)",
+            "/option/{symbol}/gex": "Dealer gamma exposure and zero-gamma level, all expiries",
+            "/option/{symbol}/iv-surface": "IV surface (also /iv-surface/skew, /iv-surface/term-structure)",
+            "/option/scan?symbols=A,B,C": "Scan a symbol universe for unusual PCR, IV or OI concentration (streamed)",
+            "/option/{symbol}/pcr/history": "PCR over time (also /iv/history, /max-pain/history)",
+            "/alert": "Price alerts (ABOVE/BELOW target price)",
+            "/alert/check": "Check active alerts against current quotes",
+            "/watchlist": "Watchlists (관심 종목)",
+            "/watchlist/{id}/quotes": "Quotes for every symbol in a watchlist (ETag supported)",
+            "/metrics": "Prometheus metrics (latency, upstream calls, caches, DB pool)",
             "/docs": "API documentation"
         }
     }
@@ -0,0 +1,23 @@
+-- Migration: Add Materialized Portfolio History
+-- Date: 2026-10-19
+-- Description: Stores the daily equity curve replayed from the transaction ledger
+
+-- Step 1: Create portfolio_history table
+CREATE TABLE portfolio_history (
+    id INTEGER PRIMARY KEY,
+    history_date DATE NOT NULL,
+    market_value NUMBER(16, 2) NOT NULL,
+    cost_basis NUMBER(16, 2) NOT NULL,
+    realized_pnl NUMBER(16, 2) NOT NULL,
+    unrealized_pnl NUMBER(16, 2) NOT NULL,
+    ledger_version VARCHAR2(40) NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+-- One row per trading day
+CREATE UNIQUE INDEX idx_portfolio_history_date ON portfolio_history(history_date);
+
+-- Create sequence for portfolio_history table
+CREATE SEQUENCE portfolio_history_seq START WITH 1 INCREMENT BY 1;
+
+COMMIT;
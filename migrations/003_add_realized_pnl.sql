@@ -0,0 +1,53 @@
+-- Migration: Add Realized P&L Table
+-- Date: 2026-10-19
+-- Description: Records realized profit/loss per SELL transaction and the open lots (lot accounting)
+
+-- Step 1: Create realized_pnl table
+CREATE TABLE realized_pnl (
+    id INTEGER PRIMARY KEY,
+    transaction_id INTEGER NOT NULL,
+    symbol VARCHAR2(20) NOT NULL,
+    quantity INTEGER NOT NULL,
+    proceeds NUMBER(16, 2) NOT NULL,
+    cost_basis NUMBER(16, 2) NOT NULL,
+    realized_pnl NUMBER(16, 2) NOT NULL,
+    method VARCHAR2(10) NOT NULL CHECK (method IN ('FIFO', 'LIFO', 'AVERAGE')),
+    sale_date TIMESTAMP WITH TIME ZONE NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+-- One row per SELL transaction
+CREATE UNIQUE INDEX idx_realized_pnl_transaction ON realized_pnl(transaction_id);
+
+-- Create index on symbol for aggregation per symbol
+CREATE INDEX idx_realized_pnl_symbol ON realized_pnl(symbol);
+
+-- Create sequence for realized_pnl table
+CREATE SEQUENCE realized_pnl_seq START WITH 1 INCREMENT BY 1;
+
+-- Step 2: Create open_lots table (open lots per holding, ordered by id)
+CREATE TABLE open_lots (
+    id INTEGER PRIMARY KEY,
+    symbol VARCHAR2(20) NOT NULL,
+    transaction_id INTEGER,
+    acquired_date TIMESTAMP WITH TIME ZONE NOT NULL,
+    price BINARY_DOUBLE NOT NULL,
+    quantity INTEGER NOT NULL
+);
+
+CREATE INDEX idx_open_lots_symbol ON open_lots(symbol);
+
+CREATE SEQUENCE open_lots_seq START WITH 1 INCREMENT BY 1;
+
+-- Step 3: Create opening_lots table (shares held before a holding's first transaction)
+CREATE TABLE opening_lots (
+    symbol VARCHAR2(20) PRIMARY KEY,
+    price BINARY_DOUBLE NOT NULL,
+    quantity INTEGER NOT NULL,
+    recorded_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMIT;
+
+-- NOTE: Existing SELL transactions and open lots are backfilled by the application:
+--   POST /transaction/realized/rebuild
@@ -0,0 +1,39 @@
+-- Migration: Add Price Alerts
+-- Date: 2026-10-19
+-- Description: Creates price alert and fired alert event tables
+
+-- Step 1: Create price_alerts table
+CREATE TABLE price_alerts (
+    id INTEGER PRIMARY KEY,
+    symbol VARCHAR2(20) NOT NULL,
+    condition VARCHAR2(10) NOT NULL CHECK (condition IN ('ABOVE', 'BELOW')),
+    target_price NUMBER(10, 2) NOT NULL,
+    status VARCHAR2(10) DEFAULT 'ACTIVE' NOT NULL CHECK (status IN ('ACTIVE', 'TRIGGERED', 'CANCELLED')),
+    note VARCHAR2(200),
+    user_id INTEGER,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    triggered_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE INDEX idx_price_alerts_symbol ON price_alerts(symbol);
+CREATE INDEX idx_price_alerts_status ON price_alerts(status);
+CREATE INDEX idx_price_alerts_user_id ON price_alerts(user_id);
+
+CREATE SEQUENCE price_alerts_seq START WITH 1 INCREMENT BY 1;
+
+-- Step 2: Create alert_events table
+CREATE TABLE alert_events (
+    id INTEGER PRIMARY KEY,
+    alert_id INTEGER NOT NULL,
+    symbol VARCHAR2(20) NOT NULL,
+    condition VARCHAR2(10) NOT NULL CHECK (condition IN ('ABOVE', 'BELOW')),
+    target_price NUMBER(10, 2) NOT NULL,
+    triggered_price NUMBER(10, 2) NOT NULL,
+    triggered_at TIMESTAMP WITH TIME ZONE NOT NULL
+);
+
+CREATE INDEX idx_alert_events_alert_id ON alert_events(alert_id);
+
+CREATE SEQUENCE alert_events_seq START WITH 1 INCREMENT BY 1;
+
+COMMIT;
@@ -0,0 +1,32 @@
+-- Migration: Add Watchlists
+-- Date: 2026-10-19
+-- Description: Creates watchlist and watchlist item tables
+
+-- Step 1: Create watchlists table
+CREATE TABLE watchlists (
+    id INTEGER PRIMARY KEY,
+    name VARCHAR2(100) NOT NULL,
+    user_id INTEGER,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE INDEX idx_watchlists_user_id ON watchlists(user_id);
+
+CREATE SEQUENCE watchlists_seq START WITH 1 INCREMENT BY 1;
+
+-- Step 2: Create watchlist_items table
+CREATE TABLE watchlist_items (
+    id INTEGER PRIMARY KEY,
+    watchlist_id INTEGER NOT NULL REFERENCES watchlists(id) ON DELETE CASCADE,
+    symbol VARCHAR2(20) NOT NULL,
+    notes VARCHAR2(200),
+    added_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uk_watchlist_items_symbol UNIQUE (watchlist_id, symbol)
+);
+
+CREATE INDEX idx_watchlist_items_watchlist ON watchlist_items(watchlist_id);
+
+CREATE SEQUENCE watchlist_items_seq START WITH 1 INCREMENT BY 1;
+
+COMMIT;
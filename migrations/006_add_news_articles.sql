@@ -0,0 +1,45 @@
+-- Migration: Add News Articles and Sentiment
+-- Date: 2026-10-19
+-- Description: Stores deduplicated news articles with sentiment and per-symbol aggregates
+
+-- Step 1: Create news_articles table
+CREATE TABLE news_articles (
+    id INTEGER PRIMARY KEY,
+    url_hash VARCHAR2(64) NOT NULL,
+    url VARCHAR2(1000),
+    title VARCHAR2(500) NOT NULL,
+    summary VARCHAR2(4000),
+    publisher VARCHAR2(200),
+    published_at TIMESTAMP WITH TIME ZONE,
+    sentiment_score BINARY_DOUBLE NOT NULL,
+    sentiment_label VARCHAR2(10) NOT NULL,
+    scorer VARCHAR2(50) NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uk_news_articles_url UNIQUE (url_hash)
+);
+
+CREATE INDEX idx_news_articles_published ON news_articles(published_at);
+
+CREATE SEQUENCE news_articles_seq START WITH 1 INCREMENT BY 1;
+
+-- Step 2: Create news_article_symbols table (article <-> symbol links)
+CREATE TABLE news_article_symbols (
+    article_id INTEGER NOT NULL REFERENCES news_articles(id) ON DELETE CASCADE,
+    symbol VARCHAR2(20) NOT NULL,
+    CONSTRAINT pk_news_article_symbols PRIMARY KEY (article_id, symbol)
+);
+
+CREATE INDEX idx_news_article_symbols_symbol ON news_article_symbols(symbol);
+
+-- Step 3: Create symbol_sentiment table (incremental aggregate)
+CREATE TABLE symbol_sentiment (
+    symbol VARCHAR2(20) PRIMARY KEY,
+    article_count INTEGER DEFAULT 0 NOT NULL,
+    score_sum BINARY_DOUBLE DEFAULT 0 NOT NULL,
+    positive_count INTEGER DEFAULT 0 NOT NULL,
+    negative_count INTEGER DEFAULT 0 NOT NULL,
+    neutral_count INTEGER DEFAULT 0 NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMIT;
@@ -0,0 +1,29 @@
+-- Migration: Add Option Analytics Snapshots
+-- Date: 2026-10-19
+-- Description: Max pain, PCR and ATM IV per expiry, precomputed on a schedule
+
+-- Step 1: Create option_snapshots table
+CREATE TABLE option_snapshots (
+    id INTEGER PRIMARY KEY,
+    symbol VARCHAR2(20) NOT NULL,
+    expiry_date VARCHAR2(10) NOT NULL,
+    captured_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    current_price BINARY_DOUBLE NOT NULL,
+    max_pain_price BINARY_DOUBLE NOT NULL,
+    price_difference_percent BINARY_DOUBLE NOT NULL,
+    top_strikes VARCHAR2(2000) NOT NULL,
+    total_call_open_interest INTEGER NOT NULL,
+    total_put_open_interest INTEGER NOT NULL,
+    put_call_ratio BINARY_DOUBLE NOT NULL,
+    atm_strike BINARY_DOUBLE NOT NULL,
+    atm_call_iv BINARY_DOUBLE NOT NULL,
+    atm_put_iv BINARY_DOUBLE NOT NULL,
+    average_iv BINARY_DOUBLE NOT NULL
+);
+
+-- Latest snapshot of a symbol / history range queries
+CREATE INDEX idx_option_snapshots_symbol ON option_snapshots(symbol, captured_at);
+
+CREATE SEQUENCE option_snapshots_seq START WITH 1 INCREMENT BY 1;
+
+COMMIT;
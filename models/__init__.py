@@ -1,3 +1,24 @@
 from .portfolio import Portfolio
+from .portfolio_history import PortfolioHistory
+from .realized_pnl import RealizedPnl
+from .lot import OpenLot, OpeningLot
+from .alert import PriceAlert, AlertEvent
+from .watchlist import Watchlist, WatchlistItem
+from .news import NewsArticle, NewsArticleSymbol, SymbolSentiment
+from .option_snapshot import OptionSnapshot
 
-__all__ = ["Portfolio"]
+__all__ = [
+    "Portfolio",
+    "PortfolioHistory",
+    "RealizedPnl",
+    "OpenLot",
+    "OpeningLot",
+    "PriceAlert",
+    "AlertEvent",
+    "Watchlist",
+    "WatchlistItem",
+    "NewsArticle",
+    "NewsArticleSymbol",
+    "SymbolSentiment",
+    "OptionSnapshot"
+]
@@ -0,0 +1,83 @@
+from sqlalchemy import Column, Integer, String, DateTime, Numeric, Enum as SQLEnum, Sequence
+from sqlalchemy.sql import func
+from database.db import Base
+import enum
+
+
+class AlertCondition(str, enum.Enum):
+    """알림 조건"""
+    ABOVE = "ABOVE"  # 목표가 이상
+    BELOW = "BELOW"  # 목표가 이하
+
+
+class AlertStatus(str, enum.Enum):
+    """알림 상태"""
+    ACTIVE = "ACTIVE"        # 감시 중
+    TRIGGERED = "TRIGGERED"  # 조건 충족
+    CANCELLED = "CANCELLED"  # 취소
+
+
+class PriceAlert(Base):
+    """
+    Price alert (가격 알림)
+    Fires once when the quote crosses target_price in the given direction
+    """
+    __tablename__ = "price_alerts"
+
+    # Primary Key (using Oracle sequence)
+    id = Column(Integer, Sequence('price_alerts_seq'), primary_key=True)
+
+    # Stock symbol
+    symbol = Column(String(20), nullable=False, index=True)
+
+    # Condition (ABOVE or BELOW)
+    condition = Column(SQLEnum(AlertCondition), nullable=False)
+
+    # Target price (목표가)
+    target_price = Column(Numeric(10, 2), nullable=False)
+
+    # Status (ACTIVE, TRIGGERED, CANCELLED)
+    status = Column(SQLEnum(AlertStatus), nullable=False, default=AlertStatus.ACTIVE, index=True)
+
+    # Optional memo
+    note = Column(String(200), nullable=True)
+
+    # User ID (for future user authentication)
+    user_id = Column(Integer, nullable=True, index=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    triggered_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<PriceAlert(id={self.id}, symbol={self.symbol}, condition={self.condition}, target_price={self.target_price}, status={self.status})>"
+
+
+class AlertEvent(Base):
+    """
+    Fired alert event (알림 발생 내역)
+    Written in batches by the alert evaluator
+    """
+    __tablename__ = "alert_events"
+
+    # Primary Key (using Oracle sequence)
+    id = Column(Integer, Sequence('alert_events_seq'), primary_key=True)
+
+    # Alert that fired
+    alert_id = Column(Integer, nullable=False, index=True)
+
+    # Stock symbol
+    symbol = Column(String(20), nullable=False)
+
+    # Condition and target price at the time of firing
+    condition = Column(SQLEnum(AlertCondition), nullable=False)
+    target_price = Column(Numeric(10, 2), nullable=False)
+
+    # Quote price that crossed the target (발생 시점 가격)
+    triggered_price = Column(Numeric(10, 2), nullable=False)
+
+    # Event timestamp
+    triggered_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<AlertEvent(id={self.id}, alert_id={self.alert_id}, symbol={self.symbol}, triggered_price={self.triggered_price})>"
@@ -0,0 +1,58 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float, Sequence
+from sqlalchemy.sql import func
+from database.db import Base
+
+
+class OpenLot(Base):
+    """
+    Open tax lot of a holding (미청산 매수 로트)
+    Kept current by every transaction write, so a sale consumes stored lots
+    instead of replaying the symbol's ledger. Lots are ordered by id (oldest first).
+    """
+    __tablename__ = "open_lots"
+
+    # Primary Key (using Oracle sequence); also the lot order
+    id = Column(Integer, Sequence('open_lots_seq'), primary_key=True)
+
+    # Stock symbol
+    symbol = Column(String(20), nullable=False, index=True)
+
+    # BUY transaction that opened the lot (NULL: the opening lot)
+    transaction_id = Column(Integer, nullable=True)
+
+    # Acquisition date (매수 일시)
+    acquired_date = Column(DateTime(timezone=True), nullable=False)
+
+    # Cost per share (AVERAGE: running average of the merged lot)
+    price = Column(Float, nullable=False)
+
+    # Shares still open
+    quantity = Column(Integer, nullable=False)
+
+    def __repr__(self):
+        return f"<OpenLot(symbol={self.symbol}, price={self.price}, quantity={self.quantity})>"
+
+
+class OpeningLot(Base):
+    """
+    Shares of a holding held before its first transaction (기초 보유분)
+    e.g. entered directly through /portfolio. Recorded once at the holding's
+    average price of that moment, so later BUYs moving the average do not
+    change the cost of these shares.
+    """
+    __tablename__ = "opening_lots"
+
+    # Stock symbol (one opening lot per holding)
+    symbol = Column(String(20), primary_key=True)
+
+    # Cost per share
+    price = Column(Float, nullable=False)
+
+    # Shares held before the ledger
+    quantity = Column(Integer, nullable=False)
+
+    # Record creation timestamp
+    recorded_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<OpeningLot(symbol={self.symbol}, price={self.price}, quantity={self.quantity})>"
@@ -0,0 +1,84 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, UniqueConstraint, Sequence
+from sqlalchemy.sql import func
+from database.db import Base
+
+
+class NewsArticle(Base):
+    """
+    Stored news article with its sentiment (뉴스 기사 및 감정 분석 결과)
+    One row per URL, scored once at ingestion (never per request); the
+    symbols it was fetched for are in NewsArticleSymbol
+    """
+    __tablename__ = "news_articles"
+    __table_args__ = (
+        UniqueConstraint('url_hash', name='uk_news_articles_url'),
+    )
+
+    # Primary Key (using Oracle sequence)
+    id = Column(Integer, Sequence('news_articles_seq'), primary_key=True)
+
+    # SHA-256 of the article URL (deduplication key)
+    url_hash = Column(String(64), nullable=False)
+
+    # Article data
+    url = Column(String(1000), nullable=True)
+    title = Column(String(500), nullable=False)
+    summary = Column(String(4000), nullable=True)
+    publisher = Column(String(200), nullable=True)
+    published_at = Column(DateTime(timezone=True), nullable=True, index=True)
+
+    # Sentiment score 0.0 (negative) ~ 1.0 (positive), label and scorer name
+    sentiment_score = Column(Float, nullable=False)
+    sentiment_label = Column(String(10), nullable=False)
+    scorer = Column(String(50), nullable=False)
+
+    # Record creation timestamp
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<NewsArticle(id={self.id}, url_hash={self.url_hash[:8]}, sentiment={self.sentiment_label})>"
+
+
+class NewsArticleSymbol(Base):
+    """
+    Symbol an article was fetched for (기사-종목 연결)
+    A story tagged for several tickers is stored once and linked to each
+    """
+    __tablename__ = "news_article_symbols"
+
+    # Article (Primary Key part 1)
+    article_id = Column(Integer, ForeignKey('news_articles.id', ondelete='CASCADE'), primary_key=True)
+
+    # Stock symbol (Primary Key part 2)
+    symbol = Column(String(20), primary_key=True, index=True)
+
+    def __repr__(self):
+        return f"<NewsArticleSymbol(article_id={self.article_id}, symbol={self.symbol})>"
+
+
+class SymbolSentiment(Base):
+    """
+    Aggregate news sentiment per symbol (종목별 감정 집계)
+    Updated incrementally as new articles are ingested
+    """
+    __tablename__ = "symbol_sentiment"
+
+    # Stock symbol (Primary Key)
+    symbol = Column(String(20), primary_key=True)
+
+    # Running totals
+    article_count = Column(Integer, nullable=False, default=0)
+    score_sum = Column(Float, nullable=False, default=0.0)
+    positive_count = Column(Integer, nullable=False, default=0)
+    negative_count = Column(Integer, nullable=False, default=0)
+    neutral_count = Column(Integer, nullable=False, default=0)
+
+    # Last ingestion timestamp
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    @property
+    def average_score(self) -> float:
+        return self.score_sum / self.article_count if self.article_count else 0.5
+
+    def __repr__(self):
+        return f"<SymbolSentiment(symbol={self.symbol}, article_count={self.article_count}, average_score={self.average_score:.2f})>"
@@ -0,0 +1,46 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float, Index, Sequence
+from database.db import Base
+
+
+class OptionSnapshot(Base):
+    """
+    Precomputed option analytics of one expiry (옵션 지표 스냅샷)
+    Written by the scheduled snapshot job; rows are never updated, so the
+    table doubles as a history of PCR / IV / max pain over time
+    """
+    __tablename__ = "option_snapshots"
+    __table_args__ = (
+        Index('idx_option_snapshots_symbol', 'symbol', 'captured_at'),
+    )
+
+    # Primary Key (using Oracle sequence)
+    id = Column(Integer, Sequence('option_snapshots_seq'), primary_key=True)
+
+    # Underlying symbol and expiry date (YYYY-MM-DD)
+    symbol = Column(String(20), nullable=False)
+    expiry_date = Column(String(10), nullable=False)
+
+    # Capture time (same for every expiry of one symbol in a run)
+    captured_at = Column(DateTime(timezone=True), nullable=False)
+
+    # Underlying price at capture
+    current_price = Column(Float, nullable=False)
+
+    # Max pain
+    max_pain_price = Column(Float, nullable=False)
+    price_difference_percent = Column(Float, nullable=False)
+    top_strikes = Column(String(2000), nullable=False)  # JSON list of {"strike", "open_interest"}
+
+    # Put-call ratio
+    total_call_open_interest = Column(Integer, nullable=False)
+    total_put_open_interest = Column(Integer, nullable=False)
+    put_call_ratio = Column(Float, nullable=False)
+
+    # ATM implied volatility
+    atm_strike = Column(Float, nullable=False)
+    atm_call_iv = Column(Float, nullable=False)
+    atm_put_iv = Column(Float, nullable=False)
+    average_iv = Column(Float, nullable=False)
+
+    def __repr__(self):
+        return f"<OptionSnapshot(symbol={self.symbol}, expiry={self.expiry_date}, captured_at={self.captured_at})>"
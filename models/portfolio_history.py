@@ -0,0 +1,39 @@
+from sqlalchemy import Column, Integer, String, Date, DateTime, Numeric, Sequence
+from sqlalchemy.sql import func
+from database.db import Base
+
+
+class PortfolioHistory(Base):
+    """
+    Materialized daily portfolio valuation (일별 포트폴리오 평가 내역)
+    Replayed from the transaction ledger and extended once per trading day
+    """
+    __tablename__ = "portfolio_history"
+
+    # Primary Key (using Oracle sequence)
+    id = Column(Integer, Sequence('portfolio_history_seq'), primary_key=True)
+
+    # Trading date (one row per closed trading day)
+    history_date = Column(Date, nullable=False, unique=True, index=True)
+
+    # Market value of all holdings at the close (평가금액)
+    market_value = Column(Numeric(16, 2), nullable=False)
+
+    # Remaining cost basis, average-cost method (매수원가)
+    cost_basis = Column(Numeric(16, 2), nullable=False)
+
+    # Cumulative realized profit/loss (실현손익 누계)
+    realized_pnl = Column(Numeric(16, 2), nullable=False)
+
+    # Unrealized profit/loss = market_value - cost_basis (평가손익)
+    unrealized_pnl = Column(Numeric(16, 2), nullable=False)
+
+    # Ledger version the row was computed from ("<count>:<max id>")
+    # Rows with an outdated version are discarded and rebuilt
+    ledger_version = Column(String(40), nullable=False)
+
+    # Record creation timestamp
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<PortfolioHistory(date={self.history_date}, market_value={self.market_value}, cost_basis={self.cost_basis})>"
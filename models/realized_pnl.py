@@ -0,0 +1,44 @@
+from sqlalchemy import Column, Integer, String, DateTime, Numeric, Sequence
+from sqlalchemy.sql import func
+from database.db import Base
+
+
+class RealizedPnl(Base):
+    """
+    Realized profit/loss per SELL transaction (매도 건별 실현손익)
+    Cost basis is determined by the configured lot method (FIFO, LIFO, AVERAGE)
+    """
+    __tablename__ = "realized_pnl"
+
+    # Primary Key (using Oracle sequence)
+    id = Column(Integer, Sequence('realized_pnl_seq'), primary_key=True)
+
+    # SELL transaction that realized the gain/loss
+    transaction_id = Column(Integer, nullable=False, unique=True, index=True)
+
+    # Stock symbol
+    symbol = Column(String(20), nullable=False, index=True)
+
+    # Shares sold (매도 수량)
+    quantity = Column(Integer, nullable=False)
+
+    # Sale proceeds = price * quantity (매도금액)
+    proceeds = Column(Numeric(16, 2), nullable=False)
+
+    # Cost of the lots consumed by the sale (매수원가)
+    cost_basis = Column(Numeric(16, 2), nullable=False)
+
+    # proceeds - cost_basis (실현손익)
+    realized_pnl = Column(Numeric(16, 2), nullable=False)
+
+    # Lot method used (FIFO, LIFO, AVERAGE)
+    method = Column(String(10), nullable=False)
+
+    # Sale date (매도 일시)
+    sale_date = Column(DateTime(timezone=True), nullable=False)
+
+    # Record creation timestamp
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<RealizedPnl(transaction_id={self.transaction_id}, symbol={self.symbol}, realized_pnl={self.realized_pnl})>"
@@ -0,0 +1,62 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint, Sequence
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from database.db import Base
+
+
+class Watchlist(Base):
+    """
+    Watchlist (관심 종목 목록)
+    Similar to @Entity with @OneToMany(cascade = ALL) in JPA
+    """
+    __tablename__ = "watchlists"
+
+    # Primary Key (using Oracle sequence)
+    id = Column(Integer, Sequence('watchlists_seq'), primary_key=True)
+
+    # Watchlist name
+    name = Column(String(100), nullable=False)
+
+    # User ID (for future user authentication)
+    user_id = Column(Integer, nullable=True, index=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    # Symbols in this watchlist
+    items = relationship(
+        "WatchlistItem",
+        cascade="all, delete-orphan",
+        order_by="WatchlistItem.id",
+        lazy="selectin"
+    )
+
+    def __repr__(self):
+        return f"<Watchlist(id={self.id}, name={self.name})>"
+
+
+class WatchlistItem(Base):
+    """Symbol in a watchlist (관심 종목)"""
+    __tablename__ = "watchlist_items"
+    __table_args__ = (
+        UniqueConstraint('watchlist_id', 'symbol', name='uk_watchlist_items_symbol'),
+    )
+
+    # Primary Key (using Oracle sequence)
+    id = Column(Integer, Sequence('watchlist_items_seq'), primary_key=True)
+
+    # Parent watchlist
+    watchlist_id = Column(Integer, ForeignKey('watchlists.id', ondelete='CASCADE'), nullable=False, index=True)
+
+    # Stock symbol
+    symbol = Column(String(20), nullable=False)
+
+    # Optional memo (메모)
+    notes = Column(String(200), nullable=True)
+
+    # Added timestamp
+    added_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<WatchlistItem(watchlist_id={self.watchlist_id}, symbol={self.symbol})>"
@@ -0,0 +1,63 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
+
+from config import settings
+from core.profiling import is_admin, sample_stacks
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """
+    Admin guard (X-Admin-Token header)
+    Similar to @PreAuthorize("hasRole('ADMIN')") in Spring Security
+    """
+    if not settings.ADMIN_TOKEN:
+        # Admin endpoints are disabled without a configured token
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    if not is_admin(x_admin_token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin)],
+)
+
+
+@router.get("/profile/sample", response_class=PlainTextResponse)
+async def sample_profile(
+    seconds: float = Query(10, gt=0, le=120, description="Capture duration in seconds"),
+    interval_ms: float = Query(5, ge=1, le=1000, description="Sampling interval in milliseconds"),
+    include_idle: bool = Query(False, description="Keep stacks of threads that are only waiting")
+):
+    """
+    Capture N seconds of this worker with a sampling profiler (샘플링 프로파일러)
+
+    Returns collapsed stacks (`thread;outer;...;inner count`), e.g.:
+    - `flamegraph.pl profile.collapsed > profile.svg`
+    - drag the file into https://www.speedscope.app
+
+    The sampler runs in a worker thread, so requests keep being served (and
+    profiled) during the capture.
+
+    Example:
+    - `curl -H "X-Admin-Token: $TOKEN" "/admin/profile/sample?seconds=30" -o profile.collapsed`
+
+    For a single request, send `X-Profile: 1` (or `?profile=1`) with the admin
+    token when PROFILING_ENABLED is set.
+    """
+    try:
+        collapsed = await run_in_threadpool(sample_stacks, seconds, interval_ms / 1000, include_idle)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    filename = f"profile-{datetime.now().strftime('%Y%m%d-%H%M%S')}.collapsed"
+    return PlainTextResponse(
+        collapsed,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
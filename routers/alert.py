@@ -0,0 +1,94 @@
+from fastapi import APIRouter, HTTPException, Depends, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from schemas.alert import AlertCreate, AlertResponse, AlertEventResponse, AlertCheckResult
+from models.alert import AlertStatus
+from services.alert_service import AlertService
+from database import get_db
+
+router = APIRouter(
+    prefix="/alert",
+    tags=["alert"],
+)
+
+
+@router.post("/", response_model=AlertResponse, status_code=201)
+def create_alert(alert: AlertCreate, db: Session = Depends(get_db)):
+    """
+    Create a price alert (가격 알림 생성)
+
+    Example:
+    ```json
+    {
+        "symbol": "GOOGL",
+        "condition": "BELOW",
+        "target_price": 300.00
+    }
+    ```
+    """
+    return AlertService.create_alert(db, alert)
+
+
+@router.get("/", response_model=List[AlertResponse])
+def get_alerts(
+    symbol: Optional[str] = Query(None, description="Filter by stock symbol"),
+    status: Optional[AlertStatus] = Query(None, description="Filter by status (ACTIVE, TRIGGERED, CANCELLED)"),
+    db: Session = Depends(get_db)
+):
+    """Get price alerts (내 알림 목록)"""
+    return AlertService.get_alerts(db, symbol=symbol, status=status)
+
+
+@router.get("/check", response_model=AlertCheckResult)
+def check_alerts(db: Session = Depends(get_db)):
+    """
+    Check active alerts against current quotes (알림 조건 충족 확인)
+
+    Quotes are served from the shared quote cache; expired symbols are
+    refreshed in one batched download. Alerts that fired are marked TRIGGERED.
+    """
+    return AlertService.check_alerts(db)
+
+
+@router.get("/events", response_model=List[AlertEventResponse])
+def get_alert_events(
+    alert_id: Optional[int] = Query(None, description="Filter by alert ID"),
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of events to return"),
+    db: Session = Depends(get_db)
+):
+    """Get fired alert events (알림 발생 내역), newest first"""
+    return AlertService.get_events(db, alert_id=alert_id, limit=limit)
+
+
+@router.get("/{alert_id}", response_model=AlertResponse)
+def get_alert(alert_id: int, db: Session = Depends(get_db)):
+    """Get alert by ID"""
+    alert = AlertService.get_alert_by_id(db, alert_id)
+
+    if not alert:
+        raise HTTPException(status_code=404, detail="Alert not found")
+
+    return alert
+
+
+@router.post("/{alert_id}/cancel", response_model=AlertResponse)
+def cancel_alert(alert_id: int, db: Session = Depends(get_db)):
+    """Cancel an active alert (알림 취소)"""
+    alert = AlertService.cancel_alert(db, alert_id)
+
+    if not alert:
+        raise HTTPException(status_code=404, detail="Alert not found")
+
+    return alert
+
+
+@router.delete("/{alert_id}")
+def delete_alert(alert_id: int, db: Session = Depends(get_db)):
+    """Delete an alert (알림 삭제)"""
+    success = AlertService.delete_alert(db, alert_id)
+
+    if not success:
+        raise HTTPException(status_code=404, detail="Alert not found")
+
+    return {"message": "Alert deleted successfully"}
@@ -0,0 +1,24 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from core.metrics import REGISTRY
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def get_metrics():
+    """
+    Prometheus metrics (text exposition format 0.0.4)
+
+    - http_request_duration_seconds: latency histogram per route template
+    - http_requests_total / http_requests_in_flight
+    - upstream_requests_total / upstream_request_duration_seconds: yfinance calls per method
+    - cache_hits_total / cache_misses_total / cache_hit_ratio: named caches
+    - cache_entries: named caches with an in-process backend
+    - db_pool_connections: SQLAlchemy connection pool state
+
+    A plain def: collectors may block (pool locks), so FastAPI renders
+    off the event loop, in its threadpool.
+    """
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,19 +1,108 @@
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional
+import uuid
+
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import Callable, Optional, TypeVar, Union
+from datetime import date, datetime, timedelta, timezone
 from schemas.option import (
     OptionExpiryList, MaxPainResponse, PCRResponse,
-    IVResponse, OptionChainResponse
+    IVResponse, OptionChainResponse, OptionChainGreeksResponse, OptionMetricHistory,
+    GammaExposureResponse, IVSurfaceResponse, IVSkewResponse, IVTermStructureResponse
 )
-from services.option_service import OptionService
+from services.option_service import ChainFilter, OptionService
+from services.option_snapshot_service import OptionSnapshotService
+from services.option_history_service import OptionHistoryService
+from services.option_scan_service import OptionScanService, ScanCriteria
+from core import http_cache
+from config import settings
 
 router = APIRouter(
     prefix="/option",
     tags=["option"],
 )
 
+T = TypeVar("T")
+
+LIVE_QUERY = Query(False, description="Recompute from the option chain instead of reading the latest precomputed snapshot")
+SMOOTH_QUERY = Query(False, description="Smooth each expiry's smile along moneyness (1-2-1 weights)")
+HISTORY_FROM_QUERY = Query(None, alias="from", description="First date (YYYY-MM-DD, inclusive, UTC). Default: 30 days before 'to'")
+HISTORY_TO_QUERY = Query(None, alias="to", description="Last date (YYYY-MM-DD, inclusive, UTC). Default: today")
+HISTORY_EXPIRY_QUERY = Query(None, description="Only this expiry (YYYY-MM-DD). Default: all expiries")
+
+
+def _snapshot_or_live(live: bool, snapshot: Callable[[], Optional[T]], compute: Callable[[], Optional[T]]) -> Optional[T]:
+    """Precomputed snapshot unless live=true; live computation when there is none"""
+    if not live:
+        result = snapshot()
+        if result is not None:
+            return result
+    return compute()
+
+
+@router.get("/scan")
+def scan_options(
+    symbols: str = Query(..., description="Comma-separated universe (e.g., AAPL,MSFT,TSLA)"),
+    expiry: Optional[str] = Query(None, description="Expiry to scan (YYYY-MM-DD). Default: nearest expiry of each symbol"),
+    min_pcr: Optional[float] = Query(None, ge=0, description="Minimum put-call ratio (open interest)"),
+    max_pcr: Optional[float] = Query(None, ge=0, description="Maximum put-call ratio"),
+    min_iv: Optional[float] = Query(None, ge=0, description="Minimum ATM implied volatility (0.5 = 50%)"),
+    max_iv: Optional[float] = Query(None, ge=0, description="Maximum ATM implied volatility"),
+    min_oi_concentration: Optional[float] = Query(
+        None, ge=0, le=1, description="Minimum share of open interest at the busiest strike"
+    ),
+    scan_id: Optional[str] = Query(
+        None, max_length=64, description="Resume an interrupted scan (its X-Scan-Id): delivered symbols are skipped"
+    )
+):
+    """
+    Scan a universe of symbols for unusual option positioning
+
+    Chains are fetched concurrently (OPTION_SCAN_WORKERS, rate limited to
+    OPTION_SCAN_RATE_PER_SECOND new symbols per second) and every symbol
+    meeting all given criteria is streamed back as soon as it is evaluated,
+    as newline-delimited JSON (one `match` object per line, then a `summary`).
+
+    The response carries an `X-Scan-Id` header. If the stream is
+    interrupted, repeating the request with `scan_id=<X-Scan-Id>` (same
+    symbols, expiry and criteria) within OPTION_CHAIN_CACHE_TTL_SECONDS
+    resumes it: symbols already delivered are skipped, the rest are answered
+    from the metrics cache where scanned (`"cached": true`), and the summary
+    covers the whole scan.
+
+    Examples:
+    - `/option/scan?symbols=AAPL,MSFT,NVDA,TSLA&min_pcr=1.2` - Bearish positioning
+    - `/option/scan?symbols=...&min_iv=0.8` - IV spikes
+    - `/option/scan?symbols=...&min_oi_concentration=0.2` - Open interest piled on one strike
+    """
+    symbol_list = [s.strip() for s in symbols.split(",") if s.strip()]
+
+    if not symbol_list:
+        raise HTTPException(status_code=400, detail="At least 1 symbol is required")
+
+    if len(symbol_list) > settings.OPTION_SCAN_MAX_SYMBOLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.OPTION_SCAN_MAX_SYMBOLS} symbols can be scanned at once"
+        )
+
+    criteria = ScanCriteria(min_pcr, max_pcr, min_iv, max_iv, min_oi_concentration)
+    scan_id = scan_id or uuid.uuid4().hex
+    lines = (
+        orjson.dumps(item) + b"\n"
+        for item in OptionScanService.scan(symbol_list, criteria, expiry, scan_id=scan_id)
+    )
+
+    # Not compressed (see main.py): lines are streamed as they are evaluated
+    return StreamingResponse(
+        lines,
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-store", "X-Scan-Id": scan_id}
+    )
+
 
 @router.get("/{symbol}/expiry", response_model=OptionExpiryList)
-async def get_option_expiry_dates(symbol: str):
+def get_option_expiry_dates(symbol: str, request: Request):
     """
     Get available option expiration dates for a stock
 
@@ -23,7 +112,10 @@ async def get_option_expiry_dates(symbol: str):
     Example:
     - `/option/GOOGL/expiry` - Get all available expiry dates for Google
     """
-    result = OptionService.get_expiry_dates(symbol)
+    result = http_cache.cached_response(
+        request, symbol.upper(), http_cache.OPTION_EXPIRY,
+        lambda: OptionService.get_expiry_dates(symbol)
+    )
 
     if not result:
         raise HTTPException(
@@ -35,9 +127,11 @@ async def get_option_expiry_dates(symbol: str):
 
 
 @router.get("/{symbol}/max-pain", response_model=MaxPainResponse)
-async def get_max_pain_analysis(
+def get_max_pain_analysis(
     symbol: str,
-    expiry: Optional[str] = Query(None, description="Option expiry date (YYYY-MM-DD). If not provided, uses nearest expiry.")
+    request: Request,
+    expiry: Optional[str] = Query(None, description="Option expiry date (YYYY-MM-DD). If not provided, uses nearest expiry."),
+    live: bool = LIVE_QUERY
 ):
     """
     Get Max Pain analysis for options
@@ -56,8 +150,16 @@ async def get_max_pain_analysis(
     Example:
     - `/option/GOOGL/max-pain` - Uses nearest expiry
     - `/option/GOOGL/max-pain?expiry=2025-12-05` - Specific expiry date
+    - `/option/GOOGL/max-pain?live=true` - Recompute now instead of using the snapshot
     """
-    result = OptionService.get_max_pain(symbol, expiry)
+    result = http_cache.cached_response(
+        request, (symbol.upper(), expiry, live), http_cache.OPTION_CHAIN,
+        lambda: _snapshot_or_live(
+            live,
+            lambda: OptionSnapshotService.get_max_pain(symbol, expiry),
+            lambda: OptionService.get_max_pain(symbol, expiry)
+        )
+    )
 
     if not result:
         raise HTTPException(
@@ -69,9 +171,11 @@ async def get_max_pain_analysis(
 
 
 @router.get("/{symbol}/pcr", response_model=PCRResponse)
-async def get_put_call_ratio(
+def get_put_call_ratio(
     symbol: str,
-    expiry: Optional[str] = Query(None, description="Option expiry date (YYYY-MM-DD)")
+    request: Request,
+    expiry: Optional[str] = Query(None, description="Option expiry date (YYYY-MM-DD)"),
+    live: bool = LIVE_QUERY
 ):
     """
     Get Put-Call Ratio (PCR) analysis
@@ -90,8 +194,16 @@ async def get_put_call_ratio(
     Example:
     - `/option/GOOGL/pcr` - Get PCR for nearest expiry
     - `/option/AAPL/pcr?expiry=2025-12-20` - Get PCR for specific date
+    - `/option/AAPL/pcr?live=true` - Recompute now instead of using the snapshot
     """
-    result = OptionService.get_pcr(symbol, expiry)
+    result = http_cache.cached_response(
+        request, (symbol.upper(), expiry, live), http_cache.OPTION_CHAIN,
+        lambda: _snapshot_or_live(
+            live,
+            lambda: OptionSnapshotService.get_pcr(symbol, expiry),
+            lambda: OptionService.get_pcr(symbol, expiry)
+        )
+    )
 
     if not result:
         raise HTTPException(
@@ -103,9 +215,11 @@ async def get_put_call_ratio(
 
 
 @router.get("/{symbol}/iv", response_model=IVResponse)
-async def get_implied_volatility(
+def get_implied_volatility(
     symbol: str,
-    expiry: Optional[str] = Query(None, description="Option expiry date (YYYY-MM-DD)")
+    request: Request,
+    expiry: Optional[str] = Query(None, description="Option expiry date (YYYY-MM-DD)"),
+    live: bool = LIVE_QUERY
 ):
     """
     Get At-The-Money (ATM) Implied Volatility analysis
@@ -127,8 +241,16 @@ async def get_implied_volatility(
     Example:
     - `/option/TSLA/iv` - Check if Tesla expects volatility
     - `/option/AAPL/iv?expiry=2026-01-16` - Check IV for specific date
+    - `/option/AAPL/iv?live=true` - Recompute now instead of using the snapshot
     """
-    result = OptionService.get_iv(symbol, expiry)
+    result = http_cache.cached_response(
+        request, (symbol.upper(), expiry, live), http_cache.OPTION_CHAIN,
+        lambda: _snapshot_or_live(
+            live,
+            lambda: OptionSnapshotService.get_iv(symbol, expiry),
+            lambda: OptionService.get_iv(symbol, expiry)
+        )
+    )
 
     if not result:
         raise HTTPException(
@@ -139,10 +261,18 @@ async def get_implied_volatility(
     return result
 
 
-@router.get("/{symbol}/chain", response_model=OptionChainResponse)
-async def get_option_chain(
+@router.get("/{symbol}/chain", response_model=Union[OptionChainGreeksResponse, OptionChainResponse])
+def get_option_chain(
     symbol: str,
-    expiry: Optional[str] = Query(None, description="Option expiry date (YYYY-MM-DD)")
+    request: Request,
+    expiry: Optional[str] = Query(None, description="Option expiry date (YYYY-MM-DD)"),
+    greeks: bool = Query(False, description="Add Black-Scholes delta, gamma, theta, vega and rho per contract"),
+    min_strike: Optional[float] = Query(None, ge=0, description="Lowest strike"),
+    max_strike: Optional[float] = Query(None, ge=0, description="Highest strike"),
+    moneyness: Optional[float] = Query(None, gt=0, le=1, description="Only strikes within this fraction of spot (0.1 = +/-10%)"),
+    min_open_interest: int = Query(0, ge=0, description="Minimum open interest"),
+    min_volume: int = Query(0, ge=0, description="Minimum volume"),
+    fields: Optional[str] = Query(None, description="Comma-separated contract fields, e.g. strike,bid,ask,open_interest")
 ):
     """
     Get full option chain (all calls and puts)
@@ -154,6 +284,17 @@ async def get_option_chain(
     - Volume
     - Open Interest
     - Implied Volatility
+    - With `greeks=true`: delta, gamma, theta (per day), vega and rho (per 1%)
+      from Black-Scholes; IVs missing or stale in the feed are solved from
+      the bid/ask mid (`iv_solved`)
+
+    **Filtering / projection** (applied before pricing and serialization):
+    - `min_strike`, `max_strike`: strike range
+    - `moneyness`: strikes within a band around the current price
+    - `min_open_interest`, `min_volume`: drop illiquid contracts
+    - `fields`: only these fields per contract (`strike`, `last_price`, `bid`,
+      `ask`, `volume`, `open_interest`, `implied_volatility`; with
+      `greeks=true` also `iv_solved`, `delta`, `gamma`, `theta`, `vega`, `rho`)
 
     This is raw option data. For interpreted analysis, use:
     - `/option/{symbol}/max-pain` - Price prediction
@@ -163,8 +304,148 @@ async def get_option_chain(
     Example:
     - `/option/GOOGL/chain` - Get all options for nearest expiry
     - `/option/SPY/chain?expiry=2025-12-31` - Get options for year-end
+    - `/option/SPY/chain?greeks=true` - With greeks
+    - `/option/SPY/chain?moneyness=0.05&min_open_interest=100&fields=strike,bid,ask` - Liquid near-the-money quotes
+    """
+    try:
+        projection = OptionService.parse_fields(fields, greeks)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    chain_filter = ChainFilter(min_strike, max_strike, moneyness, min_open_interest, min_volume)
+    result = http_cache.cached_response(
+        request, (symbol.upper(), expiry, greeks, chain_filter, projection), http_cache.OPTION_CHAIN,
+        lambda: OptionService.get_option_chain(
+            symbol, expiry, greeks, chain_filter if chain_filter != ChainFilter() else None, projection
+        )
+    )
+
+    if not result:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No options data found for '{symbol}'"
+        )
+
+    return result
+
+
+@router.get("/{symbol}/gex", response_model=GammaExposureResponse)
+def get_gamma_exposure(symbol: str, request: Request):
+    """
+    Get dealer gamma exposure (GEX) across all expiries
+
+    **Gamma exposure**: how much delta dealers must hedge per 1% move of the
+    stock, assuming they are long the calls and short the puts customers trade
+    (gamma x open interest x 100 x spot^2 x 1%).
+
+    **Interpretation**:
+    - Positive total: dealers buy dips and sell rallies - moves tend to be dampened
+    - Negative total: dealers hedge with the move - moves tend to be amplified
+    - `zero_gamma_level`: spot where the total changes sign (gamma flip)
+    - Strikes with large exposure often act as support / resistance
+
+    Example:
+    - `/option/SPY/gex`
+    """
+    result = http_cache.cached_response(
+        request, symbol.upper(), http_cache.OPTION_CHAIN,
+        lambda: OptionService.get_gamma_exposure(symbol)
+    )
+
+    if not result:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No options data found for '{symbol}'"
+        )
+
+    return result
+
+
+@router.get("/{symbol}/iv-surface", response_model=IVSurfaceResponse)
+def get_iv_surface(symbol: str, request: Request, smooth: bool = SMOOTH_QUERY):
+    """
+    Get the implied volatility surface (all expiries x moneyness)
+
+    IVs of the out-of-the-money contracts of every expiry, interpolated onto
+    a fixed moneyness grid (strike / spot, 0.70 to 1.30). Returned as a
+    compact grid: `iv[i][j]` is the IV of `expiry_dates[i]` at `moneyness[j]`,
+    null outside the strikes quoted for that expiry.
+
+    The surface is cached per symbol (IV_SURFACE_CACHE_TTL_SECONDS) and shared
+    with `/iv-surface/skew` and `/iv-surface/term-structure`.
+
+    Example:
+    - `/option/SPY/iv-surface`
+    - `/option/SPY/iv-surface?smooth=true`
+    """
+    result = http_cache.cached_response(
+        request, (symbol.upper(), smooth), http_cache.OPTION_CHAIN,
+        lambda: OptionService.get_iv_surface(symbol, smooth)
+    )
+
+    if not result:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No options data found for '{symbol}'"
+        )
+
+    return result
+
+
+@router.get("/{symbol}/iv-surface/skew", response_model=IVSkewResponse)
+def get_iv_skew(
+    symbol: str,
+    request: Request,
+    days: float = Query(30.0, gt=0, description="Tenor in calendar days (interpolated between expiries)"),
+    smooth: bool = SMOOTH_QUERY
+):
+    """
+    Get the volatility skew (IV across moneyness) at one tenor
+
+    **Interpretation**:
+    - `put_call_skew` > 0: downside puts are priced richer than upside calls
+      (demand for crash protection - the usual state of equity indexes)
+    - Steepening skew: rising fear of a sell-off
+
+    Example:
+    - `/option/SPY/iv-surface/skew?days=30`
+    """
+    result = http_cache.cached_response(
+        request, (symbol.upper(), days, smooth), http_cache.OPTION_CHAIN,
+        lambda: OptionService.get_iv_skew(symbol, days, smooth)
+    )
+
+    if not result:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No options data found for '{symbol}'"
+        )
+
+    return result
+
+
+@router.get("/{symbol}/iv-surface/term-structure", response_model=IVTermStructureResponse)
+def get_iv_term_structure(
+    symbol: str,
+    request: Request,
+    moneyness: float = Query(1.0, ge=0.7, le=1.3, description="Strike / spot (1.0 = at the money)"),
+    smooth: bool = SMOOTH_QUERY
+):
     """
-    result = OptionService.get_option_chain(symbol, expiry)
+    Get the volatility term structure (IV of every expiry) at one moneyness
+
+    **Interpretation**:
+    - IV rising with tenor (contango): calm market
+    - Near-term IV above long-term (backwardation): event or stress priced in
+
+    Example:
+    - `/option/TSLA/iv-surface/term-structure`
+    - `/option/TSLA/iv-surface/term-structure?moneyness=0.9`
+    """
+    result = http_cache.cached_response(
+        request, (symbol.upper(), moneyness, smooth), http_cache.OPTION_CHAIN,
+        lambda: OptionService.get_iv_term_structure(symbol, moneyness, smooth)
+    )
 
     if not result:
         raise HTTPException(
@@ -173,3 +454,88 @@ async def get_option_chain(
         )
 
     return result
+
+
+def _metric_history(
+    request: Request,
+    symbol: str,
+    metric: str,
+    start: Optional[date],
+    end: Optional[date],
+    expiry: Optional[str]
+) -> OptionMetricHistory:
+    """Shared implementation of the /{metric}/history endpoints"""
+    end = end or datetime.now(timezone.utc).date()
+    start = start or end - timedelta(days=30)
+
+    try:
+        result = http_cache.cached_response(
+            request, (symbol.upper(), metric, start, end, expiry), http_cache.OPTION_CHAIN,
+            lambda: OptionHistoryService.get_history(symbol, metric, start, end, expiry)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if not result:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No {metric} history recorded for '{symbol}' between {start} and {end}"
+        )
+
+    return result
+
+
+@router.get("/{symbol}/pcr/history", response_model=OptionMetricHistory)
+def get_put_call_ratio_history(
+    symbol: str,
+    request: Request,
+    start: Optional[date] = HISTORY_FROM_QUERY,
+    end: Optional[date] = HISTORY_TO_QUERY,
+    expiry: Optional[str] = HISTORY_EXPIRY_QUERY
+):
+    """
+    Get Put-Call Ratio over time
+
+    Recorded by the option history collector (OPTION_HISTORY_SYMBOLS) every
+    OPTION_HISTORY_INTERVAL_SECONDS for every expiry. Values are returned as
+    parallel arrays: timestamps[i], expiry_dates[i], values[i].
+
+    Example:
+    - `/option/SPY/pcr/history` - Last 30 days, all expiries
+    - `/option/SPY/pcr/history?from=2025-01-01&to=2025-06-30&expiry=2025-12-19`
+    """
+    return _metric_history(request, symbol, "pcr", start, end, expiry)
+
+
+@router.get("/{symbol}/iv/history", response_model=OptionMetricHistory)
+def get_implied_volatility_history(
+    symbol: str,
+    request: Request,
+    start: Optional[date] = HISTORY_FROM_QUERY,
+    end: Optional[date] = HISTORY_TO_QUERY,
+    expiry: Optional[str] = HISTORY_EXPIRY_QUERY
+):
+    """
+    Get ATM Implied Volatility (call/put average) over time
+
+    Example:
+    - `/option/TSLA/iv/history?from=2025-10-01`
+    """
+    return _metric_history(request, symbol, "iv", start, end, expiry)
+
+
+@router.get("/{symbol}/max-pain/history", response_model=OptionMetricHistory)
+def get_max_pain_history(
+    symbol: str,
+    request: Request,
+    start: Optional[date] = HISTORY_FROM_QUERY,
+    end: Optional[date] = HISTORY_TO_QUERY,
+    expiry: Optional[str] = HISTORY_EXPIRY_QUERY
+):
+    """
+    Get Max Pain price over time
+
+    Example:
+    - `/option/GOOGL/max-pain/history?expiry=2025-12-05`
+    """
+    return _metric_history(request, symbol, "max-pain", start, end, expiry)
@@ -1,14 +1,18 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from schemas.portfolio import (
     PortfolioCreate,
     PortfolioUpdate,
     PortfolioResponse,
-    PortfolioWithProfit
+    PortfolioWithProfit,
+    PortfolioStats,
+    PortfolioHistoryResponse
 )
+from schemas.news import PortfolioNews
 from services.portfolio_service import PortfolioService
+from services.news_service import NewsService
 from database import get_db
 
 router = APIRouter(
@@ -18,7 +22,7 @@ router = APIRouter(
 
 
 @router.post("/", response_model=PortfolioResponse, status_code=201)
-async def create_portfolio(
+def create_portfolio(
     portfolio: PortfolioCreate,
     db: Session = Depends(get_db)
 ):
@@ -41,13 +45,13 @@ async def create_portfolio(
 
 
 @router.get("/", response_model=List[PortfolioResponse])
-async def get_all_portfolios(db: Session = Depends(get_db)):
+def get_all_portfolios(db: Session = Depends(get_db)):
     """Get all portfolio entries (내 모든 주식 조회)"""
     return PortfolioService.get_all_portfolios(db)
 
 
 @router.get("/profit", response_model=List[PortfolioWithProfit])
-async def get_all_portfolios_with_profit(db: Session = Depends(get_db)):
+def get_all_portfolios_with_profit(db: Session = Depends(get_db)):
     """
     Get all portfolios with current price and profit/loss
     (실시간 손익 계산 포함)
@@ -55,8 +59,96 @@ async def get_all_portfolios_with_profit(db: Session = Depends(get_db)):
     return PortfolioService.get_all_portfolios_with_profit(db)
 
 
+@router.get("/stats", response_model=PortfolioStats)
+def get_portfolio_stats(
+    period: str = Query("1y", description="Lookback period (3mo, 6mo, 1y, 2y, 5y)"),
+    benchmark: Optional[str] = Query(None, description="Benchmark symbol for beta (default: SPY)"),
+    risk_free_rate: Optional[float] = Query(None, ge=0, le=1, description="Annual risk-free rate (e.g., 0.04)"),
+    confidence: float = Query(0.95, gt=0.5, lt=1, description="VaR confidence level"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get portfolio risk statistics (포트폴리오 위험 지표)
+
+    Based on current holdings weighted by market value:
+    - Annualized return and volatility
+    - Beta against the benchmark
+    - Sharpe ratio
+    - Maximum drawdown
+    - 1-day Value at Risk (historical and parametric)
+
+    Example:
+    - /portfolio/stats
+    - /portfolio/stats?period=2y&benchmark=QQQ&confidence=0.99
+    """
+    stats = PortfolioService.get_portfolio_stats(
+        db,
+        period=period,
+        benchmark=benchmark,
+        risk_free_rate=risk_free_rate,
+        confidence=confidence
+    )
+
+    if not stats:
+        raise HTTPException(status_code=404, detail="No priced holdings found in portfolio")
+
+    return stats
+
+
+@router.get("/history", response_model=PortfolioHistoryResponse)
+def get_portfolio_history(
+    period: str = Query("1y", description="Time period (1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get daily portfolio value over time (포트폴리오 평가금액 추이)
+
+    Replays all transactions against daily closes:
+    - market_value: value of holdings at the close
+    - cost_basis: remaining cost (average-cost method)
+    - realized_pnl: cumulative realized profit/loss
+    - unrealized_pnl: market_value - cost_basis
+
+    Example:
+    - /portfolio/history
+    - /portfolio/history?period=ytd
+    """
+    try:
+        history = PortfolioService.get_portfolio_history(db, period)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if not history:
+        raise HTTPException(status_code=404, detail="No portfolio history found")
+
+    return history
+
+
+@router.get("/news", response_model=PortfolioNews)
+def get_portfolio_news(
+    limit: int = Query(20, ge=1, le=100, description="Number of latest articles to return"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get news sentiment across all holdings (보유 종목 뉴스 감정 분석)
+
+    Reuses stored articles and per-symbol sentiment aggregates; only symbols
+    whose refresh interval has expired are fetched again.
+
+    Example:
+    - /portfolio/news
+    - /portfolio/news?limit=50
+    """
+    news = NewsService.get_portfolio_news(db, limit)
+
+    if not news:
+        raise HTTPException(status_code=404, detail="No holdings found in portfolio")
+
+    return news
+
+
 @router.get("/{portfolio_id}", response_model=PortfolioResponse)
-async def get_portfolio(portfolio_id: int, db: Session = Depends(get_db)):
+def get_portfolio(portfolio_id: int, db: Session = Depends(get_db)):
     """Get portfolio by ID"""
     portfolio = PortfolioService.get_portfolio_by_id(db, portfolio_id)
 
@@ -67,7 +159,7 @@ async def get_portfolio(portfolio_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/{portfolio_id}/profit", response_model=PortfolioWithProfit)
-async def get_portfolio_with_profit(portfolio_id: int, db: Session = Depends(get_db)):
+def get_portfolio_with_profit(portfolio_id: int, db: Session = Depends(get_db)):
     """
     Get portfolio with current price and profit/loss
     (개별 주식 손익 조회)
@@ -81,7 +173,7 @@ async def get_portfolio_with_profit(portfolio_id: int, db: Session = Depends(get
 
 
 @router.put("/{portfolio_id}", response_model=PortfolioResponse)
-async def update_portfolio(
+def update_portfolio(
     portfolio_id: int,
     portfolio_data: PortfolioUpdate,
     db: Session = Depends(get_db)
@@ -96,7 +188,7 @@ async def update_portfolio(
 
 
 @router.delete("/{portfolio_id}")
-async def delete_portfolio(portfolio_id: int, db: Session = Depends(get_db)):
+def delete_portfolio(portfolio_id: int, db: Session = Depends(get_db)):
     """Delete portfolio entry (보유 주식 삭제)"""
     success = PortfolioService.delete_portfolio(db, portfolio_id)
 
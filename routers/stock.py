@@ -1,15 +1,71 @@
-from fastapi import APIRouter, HTTPException
-from schemas.stock import StockInfo
+from datetime import date
+from fastapi import APIRouter, HTTPException, Query, Depends, Request
+from sqlalchemy.orm import Session
+from typing import Optional
+from schemas.stock import StockInfo, StockComparison
+from schemas.news import SymbolNews
+from core import http_cache
 from services.stock_service import StockService
+from services.news_service import NewsService
+from database import get_db
 
 router = APIRouter(
     prefix="/stock",
     tags=["stock"],
 )
 
+MAX_COMPARE_SYMBOLS = 100
+
+
+# NOTE: Must be registered before "/{symbol}" so "compare" is not taken as a symbol
+@router.get("/compare", response_model=StockComparison)
+def compare_stocks(
+    request: Request,
+    symbols: str = Query(..., description="Comma-separated ticker symbols (e.g., AAPL,MSFT,GOOGL)"),
+    period: str = Query("1y", description="Time period (1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)")
+):
+    """
+    Compare multiple stocks over a period (종목 비교)
+
+    All histories are downloaded in one batch and aligned on shared trading dates.
+
+    Returns:
+    - Normalized returns (%) since the first shared date
+    - Correlation matrix of daily returns
+    - Total return, volatility and performance relative to the equal-weighted basket
+
+    Examples:
+    - /stock/compare?symbols=AAPL,MSFT,GOOGL
+    - /stock/compare?symbols=SPY,QQQ,IWM&period=5y
+    """
+    # Deduplicated first: "AAPL,aapl" is a single symbol
+    symbol_list = list(dict.fromkeys(s.strip().upper() for s in symbols.split(",") if s.strip()))
+
+    if len(symbol_list) < 2:
+        raise HTTPException(status_code=400, detail="At least 2 symbols are required")
+
+    if len(symbol_list) > MAX_COMPARE_SYMBOLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_COMPARE_SYMBOLS} symbols can be compared at once"
+        )
+
+    response = http_cache.cached_response(
+        request, (tuple(symbol_list), period), http_cache.HISTORY,
+        lambda: StockService.compare_stocks(symbol_list, period)
+    )
+
+    if not response:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No overlapping historical data found for '{symbols}'"
+        )
+
+    return response
+
 
 @router.get("/{symbol}", response_model=StockInfo)
-async def get_stock_info(symbol: str):
+def get_stock_info(symbol: str, request: Request):
     """
     Get real-time stock information for a given symbol.
 
@@ -20,36 +76,93 @@ async def get_stock_info(symbol: str):
     - MSFT (Microsoft)
     - 005930.KS (Samsung - Korean stock)
     """
-    stock_info = StockService.get_stock_info(symbol)
+    response = http_cache.cached_response(
+        request, symbol.upper(), http_cache.QUOTE,
+        lambda: StockService.get_stock_info(symbol)
+    )
 
-    if not stock_info:
+    if not response:
         raise HTTPException(
             status_code=404,
             detail=f"Stock symbol '{symbol}' not found"
         )
 
-    return stock_info
+    return response
 
 
 @router.get("/{symbol}/history")
-async def get_stock_history(symbol: str, period: str = "1mo"):
+def get_stock_history(
+    symbol: str,
+    request: Request,
+    period: str = "1mo",
+    start: Optional[date] = Query(None, description="Start date (YYYY-MM-DD, inclusive). Overrides period."),
+    end: Optional[date] = Query(None, description="End date (YYYY-MM-DD, exclusive)")
+):
     """
     Get historical stock data.
 
     Parameters:
     - symbol: Stock ticker symbol
     - period: Time period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
+    - start / end: Explicit date range instead of period
+
+    Caching:
+    - Ranges ending on or before today contain only finalized bars and are
+      cacheable for a day (HISTORY_FINAL_MAX_AGE)
+    - Ranges including today are cacheable for a minute
 
     Examples:
     - /stock/AAPL/history?period=1mo
     - /stock/TSLA/history?period=1y
+    - /stock/SPY/history?start=2020-01-01&end=2025-01-01
     """
-    history = StockService.get_stock_history(symbol, period)
+    if start and end and start >= end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+
+    finalized = end is not None and end <= date.today()
+    policy = http_cache.HISTORY_FINAL if finalized else http_cache.HISTORY
+
+    response = http_cache.cached_response(
+        request, (symbol.upper(), period, start, end), policy,
+        lambda: StockService.get_stock_history(
+            symbol, period,
+            start=start.isoformat() if start else None,
+            end=end.isoformat() if end else None
+        )
+    )
 
-    if not history:
+    if not response:
         raise HTTPException(
             status_code=404,
             detail=f"No historical data found for '{symbol}'"
         )
 
-    return history
+    return response
+
+
+@router.get("/{symbol}/news", response_model=SymbolNews)
+def get_stock_news(
+    symbol: str,
+    limit: int = Query(20, ge=1, le=100, description="Number of articles to return"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get stored news with sentiment for a symbol (종목 뉴스 감정 분석)
+
+    New articles are fetched at most once per refresh interval, deduplicated
+    by URL and scored once when stored. The aggregate sentiment covers every
+    stored article of the symbol.
+
+    Examples:
+    - /stock/AAPL/news
+    - /stock/TSLA/news?limit=5
+    """
+    news = NewsService.get_symbol_news(db, symbol, limit)
+
+    if not news:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No news found for '{symbol}'"
+        )
+
+    return news
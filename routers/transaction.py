@@ -1,11 +1,13 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
-from schemas.transaction import TransactionCreate, TransactionResponse, TransactionSummary
+from schemas.transaction import TransactionCreate, TransactionResponse, TransactionSummary, RealizedPnlReport
 from models.transaction import TransactionType
 from services.transaction_service import TransactionService
+from services.lot_engine import LotMethod
 from database import get_db
+from core import http_cache
 
 router = APIRouter(
     prefix="/transaction",
@@ -14,7 +16,7 @@ router = APIRouter(
 
 
 @router.post("/", response_model=TransactionResponse, status_code=201)
-async def create_transaction(
+def create_transaction(
     transaction: TransactionCreate,
     db: Session = Depends(get_db)
 ):
@@ -60,7 +62,7 @@ async def create_transaction(
 
 
 @router.get("/", response_model=List[TransactionResponse])
-async def get_all_transactions(
+def get_all_transactions(
     symbol: Optional[str] = Query(None, description="Filter by stock symbol"),
     transaction_type: Optional[TransactionType] = Query(None, description="Filter by transaction type (BUY/SELL)"),
     limit: int = Query(100, ge=1, le=500, description="Maximum number of transactions to return"),
@@ -85,7 +87,7 @@ async def get_all_transactions(
 
 
 @router.get("/summary/{symbol}", response_model=TransactionSummary)
-async def get_transaction_summary(symbol: str, db: Session = Depends(get_db)):
+def get_transaction_summary(symbol: str, db: Session = Depends(get_db)):
     """
     Get transaction summary for a specific symbol
 
@@ -109,8 +111,49 @@ async def get_transaction_summary(symbol: str, db: Session = Depends(get_db)):
     return summary
 
 
+@router.get("/realized", response_model=RealizedPnlReport)
+def get_realized_pnl(
+    request: Request,
+    symbol: Optional[str] = Query(None, description="Filter by stock symbol"),
+    method: Optional[LotMethod] = Query(None, description="Lot method: FIFO, LIFO or AVERAGE (default: LOT_METHOD)"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get realized profit/loss per symbol (실현손익 조회)
+
+    Each SELL consumes open lots according to the lot method:
+    - **FIFO**: oldest lots first (default)
+    - **LIFO**: newest lots first
+    - **AVERAGE**: average cost of all open shares
+
+    Example:
+    - /transaction/realized
+    - /transaction/realized?symbol=AAPL&method=LIFO
+
+    The `ETag` follows the ledger version, so `If-None-Match` is answered
+    with `304 Not Modified` until a transaction is added or deleted.
+    """
+    version = TransactionService.get_ledger_version(db)
+
+    return http_cache.cached_response(
+        request, (symbol and symbol.upper(), method, version), http_cache.PRIVATE,
+        lambda: TransactionService.get_realized_pnl(db, symbol=symbol, method=method)
+    )
+
+
+@router.post("/realized/rebuild")
+def rebuild_realized_pnl(db: Session = Depends(get_db)):
+    """
+    Rebuild lots and realized P&L from the full transaction ledger
+
+    Use after migration 003 or after correcting transactions.
+    """
+    sales = TransactionService.rebuild_lots(db)
+    return {"message": "Realized P&L rebuilt successfully", "sales": sales}
+
+
 @router.get("/{transaction_id}", response_model=TransactionResponse)
-async def get_transaction(transaction_id: int, db: Session = Depends(get_db)):
+def get_transaction(transaction_id: int, db: Session = Depends(get_db)):
     """Get a single transaction by ID"""
     transaction = TransactionService.get_transaction_by_id(db, transaction_id)
 
@@ -121,7 +164,7 @@ async def get_transaction(transaction_id: int, db: Session = Depends(get_db)):
 
 
 @router.delete("/{transaction_id}")
-async def delete_transaction(transaction_id: int, db: Session = Depends(get_db)):
+def delete_transaction(transaction_id: int, db: Session = Depends(get_db)):
     """
     Delete a transaction
 
@@ -0,0 +1,118 @@
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from sqlalchemy.orm import Session
+from typing import List
+
+from schemas.watchlist import WatchlistCreate, WatchlistItemCreate, WatchlistResponse, WatchlistQuotes
+from services.watchlist_service import WatchlistService
+from database import get_db
+from core import http_cache
+
+router = APIRouter(
+    prefix="/watchlist",
+    tags=["watchlist"],
+)
+
+
+@router.post("/", response_model=WatchlistResponse, status_code=201)
+def create_watchlist(watchlist: WatchlistCreate, db: Session = Depends(get_db)):
+    """
+    Create a watchlist (관심 종목 목록 생성)
+
+    Example:
+    ```json
+    {
+        "name": "Big Tech",
+        "symbols": ["AAPL", "MSFT", "GOOGL"]
+    }
+    ```
+    """
+    try:
+        return WatchlistService.create_watchlist(db, watchlist)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/", response_model=List[WatchlistResponse])
+def get_all_watchlists(db: Session = Depends(get_db)):
+    """Get all watchlists (관심 종목 목록 조회)"""
+    return WatchlistService.get_all_watchlists(db)
+
+
+@router.get("/{watchlist_id}", response_model=WatchlistResponse)
+def get_watchlist(watchlist_id: int, db: Session = Depends(get_db)):
+    """Get watchlist by ID"""
+    watchlist = WatchlistService.get_watchlist_by_id(db, watchlist_id)
+
+    if not watchlist:
+        raise HTTPException(status_code=404, detail="Watchlist not found")
+
+    return watchlist
+
+
+@router.delete("/{watchlist_id}")
+def delete_watchlist(watchlist_id: int, db: Session = Depends(get_db)):
+    """Delete a watchlist (관심 종목 목록 삭제)"""
+    success = WatchlistService.delete_watchlist(db, watchlist_id)
+
+    if not success:
+        raise HTTPException(status_code=404, detail="Watchlist not found")
+
+    return {"message": "Watchlist deleted successfully"}
+
+
+@router.post("/{watchlist_id}/symbols", response_model=WatchlistResponse, status_code=201)
+def add_watchlist_symbol(
+    watchlist_id: int,
+    item: WatchlistItemCreate,
+    db: Session = Depends(get_db)
+):
+    """Add a symbol to a watchlist (관심 종목 추가)"""
+    try:
+        watchlist = WatchlistService.add_symbol(db, watchlist_id, item)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if not watchlist:
+        raise HTTPException(status_code=404, detail="Watchlist not found")
+
+    return watchlist
+
+
+@router.delete("/{watchlist_id}/symbols/{symbol}")
+def remove_watchlist_symbol(watchlist_id: int, symbol: str, db: Session = Depends(get_db)):
+    """Remove a symbol from a watchlist (관심 종목 삭제)"""
+    success = WatchlistService.remove_symbol(db, watchlist_id, symbol)
+
+    if not success:
+        raise HTTPException(status_code=404, detail=f"'{symbol}' not found in watchlist")
+
+    return {"message": "Symbol removed successfully"}
+
+
+@router.get("/{watchlist_id}/quotes", response_model=WatchlistQuotes)
+def get_watchlist_quotes(
+    watchlist_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db)
+):
+    """
+    Get current quotes for every symbol in a watchlist (관심 종목 현재가 한번에 조회)
+
+    - Quotes are shared with the quote cache; expired symbols are fetched in one batch
+    - Send the returned `ETag` as `If-None-Match` to get `304 Not Modified`
+      while nothing changed
+    """
+    result = WatchlistService.get_watchlist_quotes(db, watchlist_id)
+
+    if not result:
+        raise HTTPException(status_code=404, detail="Watchlist not found")
+
+    snapshot, etag = result
+
+    if http_cache.etag_matches(request, etag):
+        return http_cache.not_modified(etag, http_cache.PRIVATE)
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = http_cache.PRIVATE.header
+    return snapshot
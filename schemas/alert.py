@@ -0,0 +1,48 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+from models.alert import AlertCondition, AlertStatus
+
+
+class AlertCreate(BaseModel):
+    """Price alert creation request DTO"""
+    symbol: str = Field(..., description="Stock symbol (e.g., AAPL, TSLA)")
+    condition: AlertCondition = Field(..., description="ABOVE or BELOW")
+    target_price: float = Field(..., gt=0, description="Target price")
+    note: Optional[str] = Field(None, max_length=200, description="Optional memo")
+
+
+class AlertResponse(BaseModel):
+    """Price alert response DTO"""
+    id: int
+    symbol: str
+    condition: AlertCondition
+    target_price: float
+    status: AlertStatus
+    note: Optional[str]
+    created_at: datetime
+    triggered_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
+
+class AlertEventResponse(BaseModel):
+    """Fired alert event DTO"""
+    id: int
+    alert_id: int
+    symbol: str
+    condition: AlertCondition
+    target_price: float
+    triggered_price: float
+    triggered_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class AlertCheckResult(BaseModel):
+    """Result of an alert check"""
+    checked_symbols: List[str]  # 시세를 확인한 종목
+    active_alerts: int  # 남은 활성 알림 수
+    triggered: List[AlertEventResponse]  # 이번에 기록된 알림 발생 내역
@@ -0,0 +1,43 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import datetime
+
+
+class NewsArticleResponse(BaseModel):
+    """Stored news article with sentiment DTO"""
+    symbols: List[str]  # 기사가 연결된 종목 (요청한 종목 중)
+    title: str
+    summary: Optional[str]
+    publisher: Optional[str]
+    url: Optional[str]
+    published_at: Optional[datetime]
+    sentiment_score: float  # 0.0 (부정) ~ 1.0 (긍정)
+    sentiment_label: str    # POSITIVE, NEGATIVE, NEUTRAL
+
+
+class SentimentSummary(BaseModel):
+    """Aggregate sentiment of one symbol"""
+    symbol: str
+    article_count: int
+    average_score: float
+    label: str
+    positive_count: int
+    negative_count: int
+    neutral_count: int
+    updated_at: Optional[datetime]
+
+
+class SymbolNews(BaseModel):
+    """News and sentiment of one symbol"""
+    symbol: str
+    sentiment: SentimentSummary
+    new_articles: int  # 이번 요청에서 새로 수집된 기사 수
+    articles: List[NewsArticleResponse]
+
+
+class PortfolioNews(BaseModel):
+    """News sentiment across all holdings"""
+    overall_score: Optional[float]  # 기사 수 가중 평균
+    overall_label: Optional[str]
+    symbols: List[SentimentSummary]
+    articles: List[NewsArticleResponse]  # 보유 종목 최신 기사
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from typing import List, Optional
-from datetime import date
+from datetime import date, datetime
 
 
 class OptionData(BaseModel):
@@ -14,6 +14,16 @@ class OptionData(BaseModel):
     implied_volatility: Optional[float]
 
 
+class OptionGreeksData(OptionData):
+    """Option data with Black-Scholes greeks (theta per day, vega / rho per 1%)"""
+    iv_solved: bool  # implied_volatility solved from the bid/ask mid (market IV missing or stale)
+    delta: Optional[float]
+    gamma: Optional[float]
+    theta: Optional[float]
+    vega: Optional[float]
+    rho: Optional[float]
+
+
 class OptionExpiryList(BaseModel):
     """Available option expiration dates"""
     symbol: str
@@ -29,6 +39,7 @@ class MaxPainResponse(BaseModel):
     max_pain_price: float
     price_difference_percent: float
     top_strikes: List[dict]  # [{"strike": 280.0, "open_interest": 22306}, ...]
+    snapshot_at: Optional[datetime] = None  # Set when served from a precomputed snapshot
 
     class Config:
         json_schema_extra = {
@@ -54,6 +65,7 @@ class PCRResponse(BaseModel):
     total_put_open_interest: int
     put_call_ratio: float
     interpretation: str  # "Bullish", "Bearish", "Neutral"
+    snapshot_at: Optional[datetime] = None  # Set when served from a precomputed snapshot
 
     class Config:
         json_schema_extra = {
@@ -78,6 +90,7 @@ class IVResponse(BaseModel):
     atm_put_iv: float
     average_iv: float
     interpretation: str  # "High volatility expected", "Low volatility expected"
+    snapshot_at: Optional[datetime] = None  # Set when served from a precomputed snapshot
 
     class Config:
         json_schema_extra = {
@@ -101,3 +114,117 @@ class OptionChainResponse(BaseModel):
     current_price: float
     calls: List[OptionData]
     puts: List[OptionData]
+
+
+class OptionChainGreeksResponse(OptionChainResponse):
+    """Option chain with greeks (greeks=true)"""
+    years_to_expiry: float
+    risk_free_rate: float
+    calls: List[OptionGreeksData]
+    puts: List[OptionGreeksData]
+
+
+class GammaExposureResponse(BaseModel):
+    """
+    Dealer gamma exposure across all expiries, in dollars of delta per 1% move
+    (dealers long calls / short puts: positive = dealers dampen moves)
+    """
+    symbol: str
+    current_price: float
+    expiry_dates: List[str]
+    total_gamma_exposure: float
+    call_gamma_exposure: float
+    put_gamma_exposure: float
+    zero_gamma_level: Optional[float]  # Spot where total exposure changes sign, None if not within +/-20%
+    strikes: List[float]
+    gamma_exposure: List[float]  # Net exposure of strikes[i]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "symbol": "SPY",
+                "current_price": 600.0,
+                "expiry_dates": ["2025-12-05", "2025-12-12"],
+                "total_gamma_exposure": 2150000000.0,
+                "call_gamma_exposure": 5400000000.0,
+                "put_gamma_exposure": -3250000000.0,
+                "zero_gamma_level": 588.4,
+                "strikes": [590.0, 600.0, 610.0],
+                "gamma_exposure": [-410000000.0, 1900000000.0, 660000000.0]
+            }
+        }
+
+
+class IVSurfaceResponse(BaseModel):
+    """
+    Implied volatility surface, column-oriented: iv[i][j] is the IV of
+    expiry_dates[i] at moneyness[j] (strike / spot), None where not quoted
+    """
+    symbol: str
+    current_price: float
+    smoothed: bool
+    moneyness: List[float]
+    expiry_dates: List[str]
+    days_to_expiry: List[float]
+    iv: List[List[Optional[float]]]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "symbol": "SPY",
+                "current_price": 600.0,
+                "smoothed": False,
+                "moneyness": [0.9, 0.95, 1.0, 1.05, 1.1],
+                "expiry_dates": ["2025-12-05", "2026-01-16"],
+                "days_to_expiry": [7.3, 49.3],
+                "iv": [[0.24, 0.19, 0.15, 0.13, None], [0.22, 0.18, 0.16, 0.14, 0.14]]
+            }
+        }
+
+
+class IVSkewResponse(BaseModel):
+    """IV across moneyness at one tenor (interpolated between expiries)"""
+    symbol: str
+    current_price: float
+    days_to_expiry: float
+    smoothed: bool
+    moneyness: List[float]
+    iv: List[Optional[float]]
+    put_call_skew: Optional[float]  # IV at moneyness 0.9 minus IV at 1.1
+
+
+class IVTermStructureResponse(BaseModel):
+    """IV of every expiry at one moneyness level"""
+    symbol: str
+    current_price: float
+    moneyness: float
+    smoothed: bool
+    expiry_dates: List[str]
+    days_to_expiry: List[float]
+    iv: List[Optional[float]]
+
+
+class OptionMetricHistory(BaseModel):
+    """Option metric over time, column-oriented (one entry per timestamp and expiry)"""
+    symbol: str
+    metric: str  # "pcr", "iv" or "max-pain"
+    expiry_date: Optional[str]  # Requested expiry, None = all expiries
+    start_date: str
+    end_date: str
+    timestamps: List[datetime]
+    expiry_dates: List[str]
+    values: List[float]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "symbol": "GOOGL",
+                "metric": "pcr",
+                "expiry_date": "2025-12-05",
+                "start_date": "2025-11-01",
+                "end_date": "2025-11-30",
+                "timestamps": ["2025-11-03T14:30:00Z", "2025-11-03T14:31:00Z"],
+                "expiry_dates": ["2025-12-05", "2025-12-05"],
+                "values": [0.96, 0.97]
+            }
+        }
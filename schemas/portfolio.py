@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from decimal import Decimal
 
@@ -51,3 +51,54 @@ class PortfolioWithProfit(BaseModel):
     profit_loss: Optional[float]  # 손익 = current_value - total_cost
     profit_loss_percent: Optional[float]  # 수익률 (%)
     created_at: datetime
+
+
+class HoldingRisk(BaseModel):
+    """Per-holding risk breakdown"""
+    symbol: str
+    quantity: int
+    market_value: float  # 평가금액
+    weight: float  # 비중 (0 ~ 1)
+    beta: float  # 벤치마크 대비 베타
+    annualized_volatility: float  # 연환산 변동성
+    risk_contribution: float  # 포트폴리오 분산 기여도 (합계 = 1)
+
+
+class PortfolioStats(BaseModel):
+    """Portfolio risk statistics (포트폴리오 위험 지표)"""
+    period: str
+    benchmark: str
+    start_date: str
+    end_date: str
+    observations: int  # 일간 수익률 개수
+    total_value: float  # 현재 평가금액
+    cumulative_return: float  # 기간 누적 수익률 (현재 비중 기준)
+    annualized_return: float
+    annualized_volatility: float
+    beta: float
+    sharpe_ratio: Optional[float]
+    max_drawdown: float  # 최대 낙폭 (음수)
+    var_confidence: float
+    historical_var: float  # 1일 VaR (과거 수익률 분위수)
+    parametric_var: float  # 1일 VaR (정규분포 가정)
+    holdings: List[HoldingRisk]
+    missing_symbols: List[str]  # 가격 데이터가 없어 제외된 종목
+
+
+class PortfolioHistoryPoint(BaseModel):
+    """Daily portfolio valuation"""
+    date: str
+    market_value: float  # 평가금액
+    cost_basis: float  # 매수원가 (평균단가 기준)
+    realized_pnl: float  # 실현손익 누계
+    unrealized_pnl: float  # 평가손익
+    total_pnl: float  # realized_pnl + unrealized_pnl
+
+
+class PortfolioHistoryResponse(BaseModel):
+    """Portfolio equity curve (포트폴리오 평가금액 추이)"""
+    period: str
+    start_date: str
+    end_date: str
+    data: List[PortfolioHistoryPoint]
+    missing_symbols: List[str]  # 가격 데이터가 없어 제외된 종목
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 class StockInfo(BaseModel):
@@ -26,3 +26,40 @@ class StockHistory(BaseModel):
     low: float
     close: float
     volume: int
+
+
+class ComparisonPerformance(BaseModel):
+    """Per-symbol performance in a comparison"""
+    symbol: str
+    start_price: float
+    end_price: float
+    total_return_percent: float  # 기간 수익률 (%)
+    annualized_volatility_percent: float  # 연환산 변동성 (%)
+    relative_performance_percent: float  # 동일가중 평균 대비 초과 수익률 (%)
+    rank: int  # 수익률 순위 (1 = best)
+
+
+class StockComparison(BaseModel):
+    """Multi-symbol comparison response (종목 비교)"""
+    symbols: List[str]
+    period: str
+    start_date: str
+    end_date: str
+    dates: List[str]
+    normalized_returns: Dict[str, List[float]]  # symbol -> cumulative return (%) per date
+    correlation: List[List[float]]  # daily return correlation matrix, same order as symbols
+    performance: List[ComparisonPerformance]
+    missing_symbols: List[str]  # symbols without any data for the period
+
+
+class StockQuote(BaseModel):
+    """Lightweight quote from the batched quote feed"""
+    symbol: str
+    price: float  # 최근 종가 (장중에는 현재가)
+    previous_close: Optional[float]
+    change: Optional[float]
+    change_percent: Optional[float]
+    day_high: Optional[float]
+    day_low: Optional[float]
+    volume: Optional[int]
+    as_of: str  # Bar date (YYYY-MM-DD)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from models.transaction import TransactionType
 
@@ -35,3 +35,23 @@ class TransactionSummary(BaseModel):
     current_quantity: int  # 현재 보유 수량
     average_buy_price: Optional[float]  # 평균 매수가
     total_transactions: int  # 총 거래 횟수
+
+
+class RealizedPnlSummary(BaseModel):
+    """Realized profit/loss aggregated for a symbol"""
+    symbol: str
+    quantity_sold: int  # 총 매도 수량
+    proceeds: float  # 총 매도금액
+    cost_basis: float  # 매도분 매수원가
+    realized_pnl: float  # 실현손익
+    realized_pnl_percent: Optional[float]  # 실현 수익률 (%)
+    sales: int  # 매도 횟수
+
+
+class RealizedPnlReport(BaseModel):
+    """Realized profit/loss report (실현손익 리포트)"""
+    method: str  # FIFO, LIFO, AVERAGE
+    total_proceeds: float
+    total_cost_basis: float
+    total_realized_pnl: float
+    symbols: List[RealizedPnlSummary]
@@ -0,0 +1,46 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+from schemas.stock import StockQuote
+
+
+class WatchlistCreate(BaseModel):
+    """Watchlist creation request DTO"""
+    name: str = Field(..., min_length=1, max_length=100, description="Watchlist name")
+    symbols: List[str] = Field(default_factory=list, description="Initial symbols (optional)")
+
+
+class WatchlistItemCreate(BaseModel):
+    """Add symbol request DTO"""
+    symbol: str = Field(..., description="Stock symbol (e.g., AAPL, TSLA)")
+    notes: Optional[str] = Field(None, max_length=200, description="Optional memo")
+
+
+class WatchlistItemResponse(BaseModel):
+    """Watchlist item DTO"""
+    symbol: str
+    notes: Optional[str]
+    added_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
+
+class WatchlistResponse(BaseModel):
+    """Watchlist response DTO"""
+    id: int
+    name: str
+    items: List[WatchlistItemResponse]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
+
+class WatchlistQuotes(BaseModel):
+    """Quote snapshot for every symbol in a watchlist"""
+    watchlist_id: int
+    name: str
+    quotes: List[StockQuote]
+    missing_symbols: List[str]  # 시세를 찾을 수 없는 종목
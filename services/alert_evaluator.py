@@ -0,0 +1,106 @@
+"""
+Price alert evaluator (가격 알림 판정)
+
+Keeps per-symbol sorted threshold arrays so a quote only touches the alerts
+it actually crosses: O(log n) binary search plus the number of fired alerts,
+instead of scanning every alert on every quote. Pure Python, no database access.
+"""
+import bisect
+import threading
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Tuple
+
+from models.alert import AlertCondition
+
+
+class FiredAlert(NamedTuple):
+    """Alert crossed by a quote"""
+    alert_id: int
+    symbol: str
+    condition: AlertCondition
+    target_price: float
+    triggered_price: float
+
+
+class AlertIndex:
+    """
+    Sorted thresholds per symbol and condition
+
+    - ABOVE alerts fire when price >= target: a prefix of the ascending array
+    - BELOW alerts fire when price <= target: a suffix of the ascending array
+
+    Fired alerts are removed from the index (alerts fire once).
+    """
+
+    def __init__(self):
+        # symbol -> ascending list of (target_price, alert_id)
+        self._above: Dict[str, List[Tuple[float, int]]] = defaultdict(list)
+        self._below: Dict[str, List[Tuple[float, int]]] = defaultdict(list)
+        # alert_id -> (symbol, condition, target_price) for O(log n) removal
+        self._alerts: Dict[int, Tuple[str, AlertCondition, float]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, alert_id: int, symbol: str, condition: AlertCondition, target_price: float) -> None:
+        """Add (or replace) an active alert"""
+        with self._lock:
+            self._remove(alert_id)
+            entry = (float(target_price), alert_id)
+            bisect.insort(self._side(condition)[symbol], entry)
+            self._alerts[alert_id] = (symbol, condition, float(target_price))
+
+    def remove(self, alert_id: int) -> None:
+        """Remove an alert if it is indexed"""
+        with self._lock:
+            self._remove(alert_id)
+
+    def evaluate(self, symbol: str, price: float) -> List[FiredAlert]:
+        """
+        Return and remove all alerts of a symbol crossed by price
+        """
+        fired = []
+
+        with self._lock:
+            above = self._above.get(symbol)
+            if above:
+                cut = bisect.bisect_right(above, (price, float("inf")))
+                fired.extend((alert_id, AlertCondition.ABOVE, target) for target, alert_id in above[:cut])
+                del above[:cut]
+
+            below = self._below.get(symbol)
+            if below:
+                cut = bisect.bisect_left(below, (price, float("-inf")))
+                fired.extend((alert_id, AlertCondition.BELOW, target) for target, alert_id in below[cut:])
+                del below[cut:]
+
+            for alert_id, _, _ in fired:
+                self._alerts.pop(alert_id, None)
+
+        return [
+            FiredAlert(alert_id, symbol, condition, target, price)
+            for alert_id, condition, target in fired
+        ]
+
+    def symbols(self) -> List[str]:
+        """Symbols with at least one active alert"""
+        with self._lock:
+            return sorted({symbol for symbol, _, _ in self._alerts.values()})
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    def __contains__(self, alert_id: int) -> bool:
+        return alert_id in self._alerts
+
+    def _side(self, condition: AlertCondition) -> Dict[str, List[Tuple[float, int]]]:
+        return self._above if condition == AlertCondition.ABOVE else self._below
+
+    def _remove(self, alert_id: int) -> None:
+        entry = self._alerts.pop(alert_id, None)
+        if entry is None:
+            return
+
+        symbol, condition, target = entry
+        thresholds = self._side(condition)[symbol]
+        i = bisect.bisect_left(thresholds, (target, alert_id))
+        if i < len(thresholds) and thresholds[i] == (target, alert_id):
+            del thresholds[i]
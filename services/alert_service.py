@@ -0,0 +1,282 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from database.db import SessionLocal
+from models.alert import PriceAlert, AlertEvent, AlertStatus
+from schemas.alert import AlertCreate, AlertCheckResult, AlertEventResponse
+from schemas.stock import StockQuote
+from services.alert_evaluator import AlertIndex, FiredAlert
+from services.stock_service import StockService
+from core.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+
+class _AlertState:
+    """In-process alert index and the version of the active alerts it was loaded from"""
+    lock = threading.Lock()
+    index: Optional[AlertIndex] = None
+    version: Optional[str] = None
+
+
+# Evaluates quotes delivered by the feed on its own thread and DB session,
+# so quote requests never wait on (or nest a session inside) alert writes
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+class AlertService:
+    """
+    Price alert service layer
+
+    Alerts are evaluated against the cached quote feed: every batch of fresh
+    quotes fetched by StockService.get_quotes() is handed to a background
+    evaluator, so evaluation never makes its own upstream calls and never runs
+    on the request that loaded the quotes. Fired alerts are marked TRIGGERED
+    and their events inserted in the same DB transaction.
+    """
+
+    @staticmethod
+    def create_alert(db: Session, alert_data: AlertCreate) -> PriceAlert:
+        """Create a price alert and evaluate it against the cached quote, if any"""
+        alert = PriceAlert(
+            symbol=alert_data.symbol.upper(),
+            condition=alert_data.condition,
+            target_price=Decimal(str(alert_data.target_price)),
+            status=AlertStatus.ACTIVE,
+            note=alert_data.note
+        )
+
+        db.add(alert)
+        db.commit()
+        db.refresh(alert)
+
+        quote = StockService.peek_quote(alert.symbol)
+        if quote and AlertService.evaluate_quotes(db, {alert.symbol: quote}):
+            db.refresh(alert)
+
+        return alert
+
+    @staticmethod
+    def get_alerts(
+        db: Session,
+        symbol: Optional[str] = None,
+        status: Optional[AlertStatus] = None
+    ) -> List[PriceAlert]:
+        """Get alerts with optional filters"""
+        query = db.query(PriceAlert)
+
+        if symbol:
+            query = query.filter(PriceAlert.symbol == symbol.upper())
+
+        if status:
+            query = query.filter(PriceAlert.status == status)
+
+        return query.order_by(PriceAlert.created_at.desc()).all()
+
+    @staticmethod
+    def get_alert_by_id(db: Session, alert_id: int) -> Optional[PriceAlert]:
+        """Get alert by ID"""
+        return db.query(PriceAlert).filter(PriceAlert.id == alert_id).first()
+
+    @staticmethod
+    def cancel_alert(db: Session, alert_id: int) -> Optional[PriceAlert]:
+        """Cancel an active alert (kept for history)"""
+        alert = db.query(PriceAlert).filter(PriceAlert.id == alert_id).first()
+
+        if not alert:
+            return None
+
+        if alert.status == AlertStatus.ACTIVE:
+            alert.status = AlertStatus.CANCELLED
+            db.commit()
+            db.refresh(alert)
+
+        return alert
+
+    @staticmethod
+    def delete_alert(db: Session, alert_id: int) -> bool:
+        """Delete an alert"""
+        alert = db.query(PriceAlert).filter(PriceAlert.id == alert_id).first()
+
+        if not alert:
+            return False
+
+        db.delete(alert)
+        db.commit()
+        return True
+
+    @staticmethod
+    @traced()
+    def check_alerts(db: Session) -> AlertCheckResult:
+        """
+        Check all active alerts against the quote feed
+
+        Quotes come from StockService.get_quotes(): symbols whose cached quote
+        expired are refreshed in one batched download. The returned quotes are
+        then evaluated here, on the request's own session.
+        """
+        index = AlertService._get_index(db)
+        symbols = index.symbols()
+
+        events = []
+        if symbols:
+            events = AlertService.evaluate_quotes(db, StockService.get_quotes(symbols))
+
+        return AlertCheckResult(
+            checked_symbols=symbols,
+            active_alerts=len(index),
+            triggered=events
+        )
+
+    @staticmethod
+    def get_events(db: Session, alert_id: Optional[int] = None, limit: int = 100) -> List[AlertEvent]:
+        """Get fired alert events, newest first"""
+        query = db.query(AlertEvent)
+
+        if alert_id:
+            query = query.filter(AlertEvent.alert_id == alert_id)
+
+        return query.order_by(AlertEvent.triggered_at.desc()).limit(limit).all()
+
+    @staticmethod
+    @traced()
+    def evaluate_quotes(db: Session, quotes: Dict[str, StockQuote]) -> List[AlertEventResponse]:
+        """
+        Fire the alerts crossed by quotes
+
+        Crossed alerts that are still ACTIVE are locked, marked TRIGGERED and
+        their events inserted in one commit; alerts already triggered or
+        cancelled elsewhere (e.g., by another worker) are skipped.
+        """
+        index = AlertService._get_index(db)
+
+        fired: List[FiredAlert] = []
+        for symbol, quote in quotes.items():
+            fired.extend(index.evaluate(symbol, quote.price))
+
+        if not fired:
+            return []
+
+        try:
+            active_ids = {
+                row.id for row in
+                db.query(PriceAlert.id)
+                .filter(PriceAlert.id.in_([alert.alert_id for alert in fired]), PriceAlert.status == AlertStatus.ACTIVE)
+                .with_for_update()
+                .all()
+            }
+
+            now = datetime.now(timezone.utc)
+            events = [
+                AlertEvent(
+                    alert_id=alert.alert_id,
+                    symbol=alert.symbol,
+                    condition=alert.condition,
+                    target_price=Decimal(str(alert.target_price)),
+                    triggered_price=Decimal(str(alert.triggered_price)),
+                    triggered_at=now
+                )
+                for alert in fired if alert.alert_id in active_ids
+            ]
+
+            if events:
+                db.add_all(events)
+                db.query(PriceAlert).filter(PriceAlert.id.in_(active_ids)).update(
+                    {PriceAlert.status: AlertStatus.TRIGGERED, PriceAlert.triggered_at: now},
+                    synchronize_session=False
+                )
+                db.flush()
+
+            triggered = [AlertEventResponse.model_validate(event) for event in events]
+            db.commit()
+        except Exception:
+            db.rollback()
+            # Fired alerts already left the index: reload it from the database
+            with _AlertState.lock:
+                _AlertState.version = None
+            raise
+
+        return triggered
+
+    @staticmethod
+    def subscribe() -> None:
+        """Start evaluating the quote feed (application startup)"""
+        StockService.subscribe_quotes(AlertService._on_quotes)
+
+    @staticmethod
+    def unsubscribe() -> None:
+        """Stop evaluating the quote feed and wait for queued evaluations (shutdown)"""
+        global _executor
+
+        StockService.unsubscribe_quotes(AlertService._on_quotes)
+        with _executor_lock:
+            executor, _executor = _executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    @staticmethod
+    def _on_quotes(quotes: Dict[str, StockQuote]) -> None:
+        """Quote feed listener: queue fresh quotes for the background evaluator"""
+        _evaluation_executor().submit(AlertService._evaluate_in_background, quotes)
+
+    @staticmethod
+    def _evaluate_in_background(quotes: Dict[str, StockQuote]) -> None:
+        """Evaluate a quote batch on the evaluator thread with its own session"""
+        session = SessionLocal()
+        try:
+            AlertService.evaluate_quotes(session, quotes)
+        except Exception:
+            logger.exception("Alert evaluation failed")
+        finally:
+            session.close()
+
+    @staticmethod
+    def _get_index(db: Session) -> AlertIndex:
+        """
+        Alert index, (re)loaded whenever the active alerts changed
+
+        The version is "<active count>:<max active id>": alert ids only grow,
+        so any alert created, triggered, cancelled or deleted - by this or
+        another worker - changes it.
+        """
+        count, max_id = (
+            db.query(func.count(PriceAlert.id), func.max(PriceAlert.id))
+            .filter(PriceAlert.status == AlertStatus.ACTIVE)
+            .one()
+        )
+        version = f"{count}:{max_id or 0}"
+
+        with _AlertState.lock:
+            if _AlertState.index is not None and _AlertState.version == version:
+                return _AlertState.index
+
+            index = AlertIndex()
+            active = (
+                db.query(PriceAlert.id, PriceAlert.symbol, PriceAlert.condition, PriceAlert.target_price)
+                .filter(PriceAlert.status == AlertStatus.ACTIVE)
+                .all()
+            )
+            for alert_id, symbol, condition, target_price in active:
+                index.add(alert_id, symbol, condition, float(target_price))
+
+            _AlertState.index, _AlertState.version = index, version
+            return index
+
+
+def _evaluation_executor() -> ThreadPoolExecutor:
+    """Single evaluator thread: quote batches are evaluated in arrival order"""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="alert-evaluator")
+    return _executor
@@ -0,0 +1,282 @@
+"""
+Vectorized analytics helpers (시계열 분석 유틸리티)
+
+Pure functions over price frames (index = dates, columns = symbols).
+They never call yfinance, so they can be unit tested with synthetic data.
+"""
+from __future__ import annotations
+
+from statistics import NormalDist
+from typing import Dict, Optional
+
+from core.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+def align_closes(closes: pd.DataFrame) -> pd.DataFrame:
+    """
+    Align close prices of several symbols on a shared date index
+
+    - Symbols without any data are dropped
+    - Gaps (holidays on one exchange, late listings) are forward filled
+    - Leading rows where any symbol has no price yet are dropped
+
+    Args:
+        closes: DataFrame of close prices (index = dates, columns = symbols)
+
+    Returns:
+        DataFrame with no missing values
+    """
+    closes = closes.dropna(axis=1, how='all').sort_index()
+    return closes.ffill().dropna(how='any')
+
+
+def compare_closes(closes: pd.DataFrame) -> Dict:
+    """
+    Compare aligned close prices as matrix operations
+
+    Args:
+        closes: Aligned close prices (see align_closes), at least 2 rows
+
+    Returns:
+        Dictionary with normalized returns, correlation matrix and per-symbol performance
+    """
+    symbols = list(closes.columns)
+    prices = closes.to_numpy(dtype=float)
+
+    # Normalized returns: cumulative return (%) since the first shared date
+    normalized = (prices / prices[0] - 1.0) * 100
+
+    # Daily returns and correlation matrix (N x N) in one shot
+    daily_returns = prices[1:] / prices[:-1] - 1.0
+    if len(symbols) > 1 and len(daily_returns) > 1:
+        correlation = np.corrcoef(daily_returns, rowvar=False)
+    else:
+        correlation = np.ones((len(symbols), len(symbols)))
+    correlation = np.nan_to_num(correlation, nan=0.0)
+
+    total_return = normalized[-1]
+    volatility = daily_returns.std(axis=0, ddof=1) * np.sqrt(TRADING_DAYS_PER_YEAR) * 100 \
+        if len(daily_returns) > 1 else np.zeros(len(symbols))
+
+    # Relative performance against the equal-weighted basket of all symbols
+    relative = total_return - total_return.mean()
+    ranks = (-total_return).argsort().argsort() + 1
+
+    performance = [
+        {
+            "symbol": symbol,
+            "start_price": round(float(prices[0, i]), 2),
+            "end_price": round(float(prices[-1, i]), 2),
+            "total_return_percent": round(float(total_return[i]), 2),
+            "annualized_volatility_percent": round(float(volatility[i]), 2),
+            "relative_performance_percent": round(float(relative[i]), 2),
+            "rank": int(ranks[i])
+        }
+        for i, symbol in enumerate(symbols)
+    ]
+
+    return {
+        "dates": [d.strftime("%Y-%m-%d") for d in closes.index],
+        "normalized_returns": {
+            symbol: np.round(normalized[:, i], 2).tolist()
+            for i, symbol in enumerate(symbols)
+        },
+        "correlation": np.round(correlation, 4).tolist(),
+        "performance": performance
+    }
+
+
+def portfolio_risk(
+    closes: pd.DataFrame,
+    quantities: pd.Series,
+    benchmark: pd.Series,
+    risk_free_rate: float = 0.0,
+    confidence: float = 0.95
+) -> Dict:
+    """
+    Portfolio risk statistics from a returns matrix
+
+    The returns matrix R (T x N) is built once; portfolio returns are R @ w and
+    the covariance work is done on the joint covariance of [R, benchmark].
+
+    Args:
+        closes: Aligned close prices of the holdings (index = dates, columns = symbols)
+        quantities: Shares held per symbol (index = symbols)
+        benchmark: Close prices of the benchmark (index = dates)
+        risk_free_rate: Annual risk-free rate (e.g., 0.04)
+        confidence: VaR confidence level (e.g., 0.95)
+
+    Returns:
+        Dictionary of portfolio statistics and per-holding risk
+    """
+    frame = align_closes(pd.concat([closes, benchmark.rename("__benchmark__")], axis=1))
+    symbols = [c for c in frame.columns if c != "__benchmark__"]
+
+    prices = frame[symbols].to_numpy(dtype=float)
+    bench_prices = frame["__benchmark__"].to_numpy(dtype=float)
+
+    returns = prices[1:] / prices[:-1] - 1.0  # R: T x N
+    bench_returns = bench_prices[1:] / bench_prices[:-1] - 1.0
+
+    # Weights from current market value
+    shares = quantities.reindex(symbols).to_numpy(dtype=float)
+    values = shares * prices[-1]
+    total_value = values.sum()
+    weights = values / total_value
+
+    portfolio_returns = returns @ weights
+
+    # Joint covariance (N+1 x N+1): holdings + benchmark
+    joint_cov = np.atleast_2d(np.cov(np.column_stack([returns, bench_returns]), rowvar=False))
+    cov = joint_cov[:-1, :-1]
+    bench_var = joint_cov[-1, -1]
+    asset_betas = joint_cov[:-1, -1] / bench_var if bench_var > 0 else np.zeros(len(symbols))
+
+    daily_var = float(weights @ cov @ weights)
+    daily_vol = np.sqrt(daily_var)
+    daily_mean = float(portfolio_returns.mean())
+
+    annual_return = daily_mean * TRADING_DAYS_PER_YEAR
+    annual_vol = daily_vol * np.sqrt(TRADING_DAYS_PER_YEAR)
+    sharpe = (annual_return - risk_free_rate) / annual_vol if annual_vol > 0 else None
+
+    # Max drawdown of the cumulative wealth curve
+    wealth = np.cumprod(1.0 + portfolio_returns)
+    drawdown = wealth / np.maximum.accumulate(wealth) - 1.0
+
+    # 1-day Value at Risk (positive number = potential loss)
+    historical_var = -np.quantile(portfolio_returns, 1.0 - confidence) * total_value
+    z = NormalDist().inv_cdf(confidence)
+    parametric_var = (z * daily_vol - daily_mean) * total_value
+
+    # Risk contribution: w_i * (Σw)_i / σ²
+    marginal = cov @ weights
+    risk_contribution = weights * marginal / daily_var if daily_var > 0 else np.zeros(len(symbols))
+    asset_vol = np.sqrt(np.diag(cov) * TRADING_DAYS_PER_YEAR)
+
+    holdings = [
+        {
+            "symbol": symbol,
+            "quantity": int(shares[i]),
+            "market_value": round(float(values[i]), 2),
+            "weight": round(float(weights[i]), 4),
+            "beta": round(float(asset_betas[i]), 4),
+            "annualized_volatility": round(float(asset_vol[i]), 4),
+            "risk_contribution": round(float(risk_contribution[i]), 4)
+        }
+        for i, symbol in enumerate(symbols)
+    ]
+
+    return {
+        "start_date": frame.index[0].strftime("%Y-%m-%d"),
+        "end_date": frame.index[-1].strftime("%Y-%m-%d"),
+        "observations": len(portfolio_returns),
+        "total_value": round(float(total_value), 2),
+        "cumulative_return": round(float(wealth[-1] - 1.0), 4),
+        "annualized_return": round(annual_return, 4),
+        "annualized_volatility": round(float(annual_vol), 4),
+        "beta": round(float(weights @ asset_betas), 4),
+        "sharpe_ratio": round(float(sharpe), 4) if sharpe is not None else None,
+        "max_drawdown": round(float(drawdown.min()), 4),
+        "historical_var": round(float(historical_var), 2),
+        "parametric_var": round(float(parametric_var), 2),
+        "holdings": holdings
+    }
+
+
+# pd.DateOffset arguments per period (built on use, pandas is imported lazily)
+PERIOD_OFFSETS = {
+    "1d": {"days": 1},
+    "5d": {"days": 5},
+    "1mo": {"months": 1},
+    "3mo": {"months": 3},
+    "6mo": {"months": 6},
+    "1y": {"years": 1},
+    "2y": {"years": 2},
+    "5y": {"years": 5},
+    "10y": {"years": 10},
+}
+
+
+def period_start(period: str, today: pd.Timestamp) -> Optional[pd.Timestamp]:
+    """
+    First date covered by a yfinance-style period string
+
+    Returns None for "max" (no lower bound). Raises ValueError for unknown periods.
+    """
+    if period == "max":
+        return None
+    if period == "ytd":
+        return pd.Timestamp(year=today.year, month=1, day=1)
+    if period not in PERIOD_OFFSETS:
+        raise ValueError(f"Invalid period '{period}'")
+    return today.normalize() - pd.DateOffset(**PERIOD_OFFSETS[period])
+
+
+def replay_ledger(ledger: pd.DataFrame, closes: pd.DataFrame) -> pd.DataFrame:
+    """
+    Replay a transaction ledger against daily closes (average-cost method)
+
+    The ledger is walked once to derive cost-basis and realized P&L deltas per
+    trade (average cost is path dependent). Everything per day is vectorized:
+    positions are a cumulative sum per symbol, multiplied by the price matrix.
+
+    Args:
+        ledger: Transactions ordered by date, columns
+            date (normalized Timestamp), symbol, quantity (signed: SELL < 0), price
+        closes: Daily close prices (index = dates, columns = symbols)
+
+    Returns:
+        DataFrame indexed by the closes dates with columns
+        market_value, cost_basis, realized_pnl, unrealized_pnl
+    """
+    held: Dict[str, float] = {}
+    cost: Dict[str, float] = {}
+    cost_delta = np.zeros(len(ledger))
+    realized_delta = np.zeros(len(ledger))
+
+    for i, (symbol, quantity, price) in enumerate(
+        zip(ledger["symbol"], ledger["quantity"], ledger["price"])
+    ):
+        qty_held = held.get(symbol, 0.0)
+        if quantity > 0:
+            cost_delta[i] = quantity * price
+        elif qty_held > 0:
+            average_cost = cost.get(symbol, 0.0) / qty_held
+            cost_delta[i] = quantity * average_cost  # negative: cost of shares sold
+            realized_delta[i] = -quantity * (price - average_cost)
+        held[symbol] = qty_held + quantity
+        cost[symbol] = cost.get(symbol, 0.0) + cost_delta[i]
+
+    events = ledger.assign(cost=cost_delta, realized=realized_delta)
+    timeline = closes.index.union(pd.DatetimeIndex(events["date"].unique())).sort_values()
+
+    # Positions: cumulative signed quantity per symbol, carried to every price date
+    positions = (
+        events.pivot_table(index="date", columns="symbol", values="quantity", aggfunc="sum")
+        .reindex(index=timeline, columns=closes.columns)
+        .fillna(0.0)
+        .cumsum()
+        .reindex(closes.index)
+    )
+    totals = (
+        events.groupby("date")[["cost", "realized"]].sum()
+        .reindex(timeline)
+        .fillna(0.0)
+        .cumsum()
+        .reindex(closes.index)
+    )
+
+    market_value = (positions.to_numpy() * closes.ffill().fillna(0.0).to_numpy()).sum(axis=1)
+
+    return pd.DataFrame({
+        "market_value": market_value,
+        "cost_basis": totals["cost"].to_numpy(),
+        "realized_pnl": totals["realized"].to_numpy(),
+        "unrealized_pnl": market_value - totals["cost"].to_numpy(),
+    }, index=closes.index)
@@ -0,0 +1,165 @@
+"""
+Tax-lot accounting engine (매수 로트별 실현손익 계산)
+
+Keeps open lots per symbol in a deque so FIFO consumption (popleft) and
+LIFO consumption (pop) are O(1) per lot. Pure Python, no database access.
+"""
+import enum
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+
+class LotMethod(str, enum.Enum):
+    """Cost basis method"""
+    FIFO = "FIFO"        # 선입선출
+    LIFO = "LIFO"        # 후입선출
+    AVERAGE = "AVERAGE"  # 평균단가
+
+
+@dataclass
+class Lot:
+    """Open lot: shares acquired by one BUY transaction (None: held before the ledger)"""
+    transaction_id: Optional[int]
+    acquired_date: datetime
+    price: float
+    quantity: int
+
+
+@dataclass
+class RealizedSale:
+    """Realized result of one SELL transaction"""
+    transaction_id: Optional[int]
+    symbol: str
+    sale_date: datetime
+    quantity: int
+    proceeds: float
+    cost_basis: float
+    method: LotMethod
+
+    @property
+    def realized_pnl(self) -> float:
+        return self.proceeds - self.cost_basis
+
+
+class LotBook:
+    """
+    Open lots per symbol
+
+    Usage:
+        book = LotBook(LotMethod.FIFO)
+        book.buy("AAPL", 1, datetime(2025, 1, 2), 100.0, 10)
+        sale = book.sell("AAPL", 2, datetime(2025, 2, 3), 120.0, 5)
+        sale.realized_pnl  # 100.0
+    """
+
+    def __init__(self, method: LotMethod = LotMethod.FIFO):
+        self.method = LotMethod(method)
+        self.lots: Dict[str, Deque[Lot]] = defaultdict(deque)
+
+    def buy(self, symbol: str, transaction_id: Optional[int], date: datetime, price: float, quantity: int) -> None:
+        """Open a new lot (AVERAGE merges it into the single lot of the symbol)"""
+        lots = self.lots[symbol]
+
+        if self.method == LotMethod.AVERAGE and lots:
+            lot = lots[0]
+            total_quantity = lot.quantity + quantity
+            lot.price = (lot.price * lot.quantity + price * quantity) / total_quantity
+            lot.quantity = total_quantity
+            return
+
+        lots.append(Lot(transaction_id, date, price, quantity))
+
+    def sell(
+        self,
+        symbol: str,
+        transaction_id: Optional[int],
+        date: datetime,
+        price: float,
+        quantity: int,
+        fallback_price: Optional[float] = None
+    ) -> RealizedSale:
+        """
+        Close lots for a sale and return the realized result
+
+        Args:
+            fallback_price: Cost per share for shares not covered by open lots
+                (e.g., holdings created without transactions). If None, an
+                uncovered sale raises ValueError.
+        """
+        lots = self.lots[symbol]
+        remaining = quantity
+        cost_basis = 0.0
+
+        while remaining > 0 and lots:
+            # FIFO consumes the oldest lot, LIFO the newest; AVERAGE has a single lot
+            lot = lots[-1] if self.method == LotMethod.LIFO else lots[0]
+            used = min(remaining, lot.quantity)
+            cost_basis += used * lot.price
+            lot.quantity -= used
+            remaining -= used
+
+            if lot.quantity == 0:
+                if self.method == LotMethod.LIFO:
+                    lots.pop()
+                else:
+                    lots.popleft()
+
+        if remaining > 0:
+            if fallback_price is None:
+                raise ValueError(
+                    f"Cannot sell {quantity} shares of {symbol}: "
+                    f"Only {quantity - remaining} shares in open lots"
+                )
+            cost_basis += remaining * fallback_price
+
+        return RealizedSale(
+            transaction_id=transaction_id,
+            symbol=symbol,
+            sale_date=date,
+            quantity=quantity,
+            proceeds=price * quantity,
+            cost_basis=cost_basis,
+            method=self.method
+        )
+
+    def open_lots(self, symbol: str) -> List[Lot]:
+        """Open lots of a symbol, oldest first"""
+        return list(self.lots.get(symbol, ()))
+
+    @classmethod
+    def from_ledger(
+        cls,
+        transactions: Iterable[Tuple[Optional[int], str, str, datetime, float, int]],
+        method: LotMethod = LotMethod.FIFO,
+        openings: Optional[Dict[str, Lot]] = None
+    ) -> Tuple["LotBook", List[RealizedSale]]:
+        """
+        Rebuild lot state from the ledger in one pass
+
+        Args:
+            transactions: (id, symbol, "BUY"/"SELL", date, price, quantity), ordered by date
+            method: Cost basis method
+            openings: Per symbol, the lot of shares held before its first
+                transaction (opened first, so it is the oldest lot)
+
+        Returns:
+            (book with open lots, realized sales in ledger order)
+
+        Raises:
+            ValueError: a sale exceeds the open lots of its symbol
+        """
+        book = cls(method)
+        sales = []
+
+        for symbol, lot in (openings or {}).items():
+            book.buy(symbol, lot.transaction_id, lot.acquired_date, lot.price, lot.quantity)
+
+        for transaction_id, symbol, transaction_type, date, price, quantity in transactions:
+            if transaction_type == "BUY":
+                book.buy(symbol, transaction_id, date, price, quantity)
+            else:
+                sales.append(book.sell(symbol, transaction_id, date, price, quantity))
+
+        return book, sales
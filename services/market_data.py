@@ -0,0 +1,463 @@
+"""
+Market data providers (시세 데이터 공급자)
+
+Every upstream market data read of the services goes through a
+MarketDataProvider, chosen by the MARKET_DATA_PROVIDER setting:
+
+- yfinance: live Yahoo Finance (default)
+- record:   live yfinance, every response also saved to MARKET_DATA_DIR
+- replay:   serve MARKET_DATA_DIR only (no network), with optional
+            synthetic latency to mimic the upstream
+
+Recordings are one JSON file per symbol (info, adjusted and unadjusted daily
+bars, expiries, option chains per expiry, news), the same files
+benchmarks/fixtures.py generates, so a recorded session can be replayed by
+tests, benchmarks and load tests.
+"""
+from __future__ import annotations
+
+import json
+import os
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.lazy import lazy_import
+from services.analytics import period_start
+
+pd = lazy_import("pandas")
+yf = lazy_import("yfinance")
+
+BAR_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+CHAIN_COLUMNS = [
+    "contractSymbol", "strike", "lastPrice", "bid", "ask", "change", "percentChange",
+    "volume", "openInterest", "impliedVolatility", "inTheMoney",
+]
+
+Chain = Tuple["pd.DataFrame", "pd.DataFrame"]
+
+
+class MarketDataProvider(ABC):
+    """
+    Market data interface
+    Similar to a Strategy interface injected as a Spring bean
+
+    Frames follow the yfinance layout: history() has OHLCV columns on a date
+    index, download() has (Price, Ticker) MultiIndex columns.
+    """
+
+    name: str = "base"
+
+    @abstractmethod
+    def info(self, symbol: str) -> Dict:
+        """Quote summary (yfinance Ticker.info); empty when unknown"""
+
+    @abstractmethod
+    def history(
+        self,
+        symbol: str,
+        period: Optional[str] = "1mo",
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> pd.DataFrame:
+        """Daily OHLCV bars (start inclusive, end exclusive; period ignored when given)"""
+
+    @abstractmethod
+    def download(
+        self,
+        symbols: Sequence[str],
+        period: Optional[str] = None,
+        start: Optional[str] = None,
+        auto_adjust: bool = True
+    ) -> pd.DataFrame:
+        """Daily bars of many symbols in one batch"""
+
+    @abstractmethod
+    def expiries(self, symbol: str) -> Tuple[str, ...]:
+        """Option expiry dates (YYYY-MM-DD), nearest first"""
+
+    @abstractmethod
+    def option_chain(self, symbol: str, expiry: str) -> Chain:
+        """Calls and puts of one expiry"""
+
+    @abstractmethod
+    def news(self, symbol: str) -> List[Dict]:
+        """Raw news items (yfinance Ticker.news layout)"""
+
+
+class YFinanceProvider(MarketDataProvider):
+    """Live Yahoo Finance"""
+
+    name = "yfinance"
+
+    def info(self, symbol: str) -> Dict:
+        return yf.Ticker(symbol).info
+
+    def history(self, symbol, period="1mo", start=None, end=None) -> pd.DataFrame:
+        if start or end:
+            return yf.Ticker(symbol).history(start=start, end=end)
+        return yf.Ticker(symbol).history(period=period)
+
+    def download(self, symbols, period=None, start=None, auto_adjust=True) -> pd.DataFrame:
+        return yf.download(
+            list(symbols),
+            period=None if start else period,
+            start=start,
+            interval="1d",
+            auto_adjust=auto_adjust,
+            progress=False,
+            threads=True,
+            multi_level_index=True
+        )
+
+    def expiries(self, symbol: str) -> Tuple[str, ...]:
+        return tuple(yf.Ticker(symbol).options)
+
+    def option_chain(self, symbol: str, expiry: str) -> Chain:
+        chain = yf.Ticker(symbol).option_chain(expiry)
+        return chain.calls, chain.puts
+
+    def news(self, symbol: str) -> List[Dict]:
+        return yf.Ticker(symbol).news or []
+
+
+# ---------------------------------------------------------------------------
+# Recordings
+# ---------------------------------------------------------------------------
+
+def _naive_dates(index) -> pd.DatetimeIndex:
+    """Date index without timezone (wall-clock dates of the exchange)"""
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.normalize()
+
+
+def _frame_to_json(frame: pd.DataFrame) -> Dict:
+    frame = frame.copy()
+    if isinstance(frame.index, pd.DatetimeIndex):
+        frame.index = frame.index.strftime("%Y-%m-%d")
+    return json.loads(frame.to_json(orient="split"))
+
+
+def _frame_from_json(data: Dict, dates: bool = False) -> pd.DataFrame:
+    frame = pd.DataFrame(data["data"], index=data["index"], columns=data["columns"])
+    if dates:
+        frame.index = pd.DatetimeIndex(frame.index)
+    else:
+        frame = frame.reset_index(drop=True)
+    return frame
+
+
+def _empty_bars() -> pd.DataFrame:
+    return pd.DataFrame(columns=BAR_COLUMNS, index=pd.DatetimeIndex([]))
+
+
+def _empty_record() -> Dict:
+    return {"info": {}, "bars": _empty_bars(), "raw_bars": _empty_bars(),
+            "expiries": [], "options": {}, "news": []}
+
+
+def _merge_bars(recorded: pd.DataFrame, bars: pd.DataFrame) -> pd.DataFrame:
+    """Recorded bars plus new ones (newer bars replace older ones)"""
+    bars = bars.reindex(columns=BAR_COLUMNS)
+    bars.index = _naive_dates(bars.index)
+    if not recorded.empty:
+        bars = pd.concat([recorded, bars])
+    return bars[~bars.index.duplicated(keep="last")].sort_index()
+
+
+class MarketDataStore:
+    """
+    Recorded market data of one directory (one JSON file per symbol)
+
+    Files are loaded lazily and kept in memory; update() merges new data
+    into a symbol's record and rewrites its file. Adjusted bars (history(),
+    download(auto_adjust=True)) and unadjusted bars (quotes) are kept apart,
+    so one never overwrites the other.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._loaded: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def path(self, symbol: str) -> str:
+        return os.path.join(self.directory, f"{symbol.upper()}.json")
+
+    def symbols(self) -> List[str]:
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(f[:-5] for f in os.listdir(self.directory) if f.endswith(".json"))
+
+    def load(self, symbol: str) -> Optional[Dict]:
+        """Record of a symbol (info, bars, raw_bars, expiries, options, news) or None"""
+        symbol = symbol.upper()
+        if symbol not in self._loaded:
+            if not os.path.exists(self.path(symbol)):
+                return None
+            with open(self.path(symbol), encoding="utf-8") as f:
+                raw = json.load(f)
+            record = _empty_record()
+            record["info"] = raw.get("info") or {}
+            if raw.get("bars"):
+                record["bars"] = _frame_from_json(raw["bars"], dates=True)
+            if raw.get("raw_bars"):
+                record["raw_bars"] = _frame_from_json(raw["raw_bars"], dates=True)
+            elif "raw_bars" not in raw:
+                # Written before adjusted and unadjusted bars were split
+                record["raw_bars"] = record["bars"]
+            record["options"] = {
+                expiry: (_frame_from_json(chain["calls"]), _frame_from_json(chain["puts"]))
+                for expiry, chain in (raw.get("options") or {}).items()
+            }
+            record["expiries"] = raw.get("expiries") or sorted(record["options"])
+            record["news"] = raw.get("news") or []
+            self._loaded[symbol] = record
+        return self._loaded[symbol]
+
+    def save(
+        self,
+        symbol: str,
+        info: Dict,
+        bars: pd.DataFrame,
+        options: Dict[str, Chain],
+        news: List[Dict],
+        raw_bars: Optional[pd.DataFrame] = None
+    ) -> None:
+        """Write a complete record (raw_bars defaults to bars: no dividends or splits)"""
+        with self._lock:
+            self._write(symbol, {
+                "info": info, "bars": bars, "raw_bars": bars if raw_bars is None else raw_bars,
+                "expiries": sorted(options), "options": options, "news": news
+            })
+
+    def update(
+        self,
+        symbol: str,
+        info: Optional[Dict] = None,
+        bars: Optional[pd.DataFrame] = None,
+        raw_bars: Optional[pd.DataFrame] = None,
+        expiries: Optional[Sequence[str]] = None,
+        chain: Optional[Tuple[str, Chain]] = None,
+        news: Optional[List[Dict]] = None
+    ) -> None:
+        """
+        Merge new data into a symbol's record (newer bars replace older ones)
+
+        bars are dividend/split adjusted, raw_bars unadjusted.
+        """
+        with self._lock:
+            record = dict(self.load(symbol) or _empty_record())
+            if info:
+                record["info"] = {k: v for k, v in info.items() if isinstance(v, (str, int, float, bool, type(None)))}
+            if bars is not None and not bars.empty:
+                record["bars"] = _merge_bars(record["bars"], bars)
+            if raw_bars is not None and not raw_bars.empty:
+                record["raw_bars"] = _merge_bars(record["raw_bars"], raw_bars)
+            if expiries is not None:
+                record["expiries"] = list(expiries)
+            if chain is not None:
+                expiry, (calls, puts) = chain
+                record["options"] = {
+                    **record["options"],
+                    expiry: (calls.reindex(columns=CHAIN_COLUMNS), puts.reindex(columns=CHAIN_COLUMNS))
+                }
+            if news is not None:
+                record["news"] = news
+            self._write(symbol, record)
+
+    def _write(self, symbol: str, record: Dict) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        raw = {
+            "info": record["info"],
+            "bars": _frame_to_json(record["bars"][BAR_COLUMNS]),
+            "raw_bars": _frame_to_json(record["raw_bars"][BAR_COLUMNS]),
+            "expiries": list(record["expiries"]),
+            "options": {
+                expiry: {"calls": _frame_to_json(calls), "puts": _frame_to_json(puts)}
+                for expiry, (calls, puts) in record["options"].items()
+            },
+            "news": record["news"],
+        }
+        # Write then rename so a concurrent replay never reads half a file
+        temp_path = self.path(symbol) + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(raw, f)
+        os.replace(temp_path, self.path(symbol))
+        self._loaded.pop(symbol.upper(), None)
+
+
+class RecordingProvider(MarketDataProvider):
+    """Wraps another provider and saves every response to a store"""
+
+    name = "record"
+
+    def __init__(self, inner: MarketDataProvider, store: MarketDataStore):
+        self.inner = inner
+        self.store = store
+
+    def info(self, symbol: str) -> Dict:
+        info = self.inner.info(symbol)
+        self.store.update(symbol, info=info)
+        return info
+
+    def history(self, symbol, period="1mo", start=None, end=None) -> pd.DataFrame:
+        bars = self.inner.history(symbol, period, start, end)
+        self.store.update(symbol, bars=bars)
+        return bars
+
+    def download(self, symbols, period=None, start=None, auto_adjust=True) -> pd.DataFrame:
+        data = self.inner.download(symbols, period, start, auto_adjust)
+        if data is not None and not data.empty and isinstance(data.columns, pd.MultiIndex):
+            key = "bars" if auto_adjust else "raw_bars"
+            for symbol in data.columns.get_level_values(1).unique():
+                self.store.update(symbol, **{key: data.xs(symbol, axis=1, level=1).dropna(how="all")})
+        return data
+
+    def expiries(self, symbol: str) -> Tuple[str, ...]:
+        expiries = self.inner.expiries(symbol)
+        self.store.update(symbol, expiries=expiries)
+        return expiries
+
+    def option_chain(self, symbol: str, expiry: str) -> Chain:
+        chain = self.inner.option_chain(symbol, expiry)
+        self.store.update(symbol, chain=(expiry, chain))
+        return chain
+
+    def news(self, symbol: str) -> List[Dict]:
+        news = self.inner.news(symbol)
+        self.store.update(symbol, news=news)
+        return news
+
+
+class ReplayProvider(MarketDataProvider):
+    """
+    Serves recorded data only (never touches the network)
+
+    Periods are counted back from the last recorded bar of each symbol, so a
+    recording keeps answering "1y" with a year of data as it ages. Each call
+    sleeps latency_ms plus up to jitter_ms to mimic the upstream round trip.
+    """
+
+    name = "replay"
+
+    def __init__(self, store: MarketDataStore, latency_ms: float = 0.0, jitter_ms: float = 0.0):
+        self.store = store
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+
+    def _delay(self) -> None:
+        delay_ms = self.latency_ms + (random.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+    def _bars(self, symbol: str, period: Optional[str], start=None, end=None, adjusted: bool = True) -> pd.DataFrame:
+        record = self.store.load(symbol)
+        bars = record["bars" if adjusted else "raw_bars"] if record is not None else None
+        if bars is None or bars.empty:
+            return _empty_bars()
+
+        if start is not None or end is not None:
+            lower = pd.Timestamp(start) if start is not None else bars.index[0]
+            upper = pd.Timestamp(end) if end is not None else bars.index[-1] + pd.Timedelta(days=1)
+            return bars[(bars.index >= lower) & (bars.index < upper)]
+
+        lower = period_start(period or "1mo", bars.index[-1])
+        return bars if lower is None else bars[bars.index > lower]
+
+    def info(self, symbol: str) -> Dict:
+        self._delay()
+        record = self.store.load(symbol)
+        return dict(record["info"]) if record else {}
+
+    def history(self, symbol, period="1mo", start=None, end=None) -> pd.DataFrame:
+        self._delay()
+        return self._bars(symbol, period, start, end).copy()
+
+    def download(self, symbols, period=None, start=None, auto_adjust=True) -> pd.DataFrame:
+        self._delay()
+        frames = {}
+        for symbol in symbols:
+            bars = self._bars(symbol, period, start, adjusted=auto_adjust)
+            if not bars.empty:
+                frames[symbol.upper()] = bars
+
+        if not frames:
+            return pd.DataFrame()
+
+        combined = pd.concat(frames, axis=1)  # (Ticker, Price)
+        return combined.swaplevel(0, 1, axis=1).sort_index(axis=1)
+
+    def expiries(self, symbol: str) -> Tuple[str, ...]:
+        self._delay()
+        record = self.store.load(symbol)
+        return tuple(record["expiries"]) if record else ()
+
+    def option_chain(self, symbol: str, expiry: str) -> Chain:
+        self._delay()
+        record = self.store.load(symbol)
+        if not record or expiry not in record["options"]:
+            raise ValueError(f"Expiration `{expiry}` cannot be found")
+        calls, puts = record["options"][expiry]
+        return calls.copy(), puts.copy()
+
+    def news(self, symbol: str) -> List[Dict]:
+        self._delay()
+        record = self.store.load(symbol)
+        return list(record["news"]) if record else []
+
+
+# ---------------------------------------------------------------------------
+# Provider selection
+# ---------------------------------------------------------------------------
+
+_provider: Optional[MarketDataProvider] = None
+
+
+def create_provider(
+    kind: str = "yfinance",
+    directory: str = "market_data",
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0
+) -> MarketDataProvider:
+    """
+    Build a provider
+
+    Args:
+        kind: "yfinance", "record" or "replay"
+        directory: Recording directory (record / replay)
+        latency_ms: Synthetic latency per replayed call
+        jitter_ms: Random extra latency per replayed call (0 ~ jitter_ms)
+    """
+    if kind == "yfinance":
+        return YFinanceProvider()
+    if kind == "record":
+        return RecordingProvider(YFinanceProvider(), MarketDataStore(directory))
+    if kind == "replay":
+        return ReplayProvider(MarketDataStore(directory), latency_ms, jitter_ms)
+    raise ValueError(f"Unknown market data provider: {kind}")
+
+
+def get_provider() -> MarketDataProvider:
+    """Provider singleton (built from settings on first use)"""
+    global _provider
+
+    if _provider is None:
+        from config import settings
+        _provider = create_provider(
+            settings.MARKET_DATA_PROVIDER,
+            settings.MARKET_DATA_DIR,
+            settings.MARKET_DATA_REPLAY_LATENCY_MS,
+            settings.MARKET_DATA_REPLAY_JITTER_MS
+        )
+
+    return _provider
+
+
+def set_provider(provider: Optional[MarketDataProvider]) -> None:
+    """Replace the provider (benchmarks, tests); None rebuilds it from settings"""
+    global _provider
+    _provider = provider
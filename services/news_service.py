@@ -0,0 +1,341 @@
+import hashlib
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models import Portfolio, NewsArticle, NewsArticleSymbol, SymbolSentiment
+from schemas.news import NewsArticleResponse, SentimentSummary, SymbolNews, PortfolioNews
+from services.sentiment import get_scorer, label_for
+from services.market_data import get_provider
+from core.cache import TTLCache
+from core.metrics import upstream_call
+from core.tracing import traced
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Symbols fetched from upstream recently (value is unused, presence = fresh)
+_refreshed = TTLCache(ttl=settings.NEWS_REFRESH_SECONDS, maxsize=4096, name="news_refresh")
+
+# Ingest attempts when a concurrent ingest stores the same article or aggregate first
+_INGEST_ATTEMPTS = 3
+
+
+class NewsService:
+    """
+    News ingestion and sentiment service
+
+    Articles are fetched from yfinance, deduplicated by URL hash and scored
+    once at ingestion; a story tagged for several tickers is one article
+    linked to each symbol. Requests only read stored rows and aggregates.
+    """
+
+    @staticmethod
+    @traced()
+    def get_symbol_news(db: Session, symbol: str, limit: int = 20) -> Optional[SymbolNews]:
+        """
+        Stored news and aggregate sentiment of a symbol
+
+        Upstream is queried at most once per NEWS_REFRESH_SECONDS per symbol.
+
+        Returns:
+            SymbolNews or None if no article has ever been stored for the symbol
+        """
+        symbol = symbol.upper()
+        new_articles = NewsService.refresh(db, symbol)
+
+        aggregate = db.query(SymbolSentiment).filter(SymbolSentiment.symbol == symbol).first()
+        if not aggregate:
+            return None
+
+        articles = NewsService._latest_articles(db, [symbol], limit)
+
+        return SymbolNews(
+            symbol=symbol,
+            sentiment=NewsService._summary(aggregate),
+            new_articles=new_articles,
+            articles=NewsService._article_responses(db, articles, [symbol])
+        )
+
+    @staticmethod
+    @traced()
+    def get_portfolio_news(db: Session, limit: int = 20) -> Optional[PortfolioNews]:
+        """
+        News sentiment across all holdings
+
+        Reuses stored articles and per-symbol aggregates; only symbols whose
+        refresh interval has expired are fetched from upstream.
+
+        Returns:
+            PortfolioNews or None if there are no holdings
+        """
+        symbols = sorted(
+            row.symbol for row in db.query(Portfolio.symbol).filter(Portfolio.quantity > 0).all()
+        )
+        if not symbols:
+            return None
+
+        for symbol in symbols:
+            NewsService.refresh(db, symbol)
+
+        aggregates = (
+            db.query(SymbolSentiment)
+            .filter(SymbolSentiment.symbol.in_(symbols))
+            .order_by(SymbolSentiment.symbol)
+            .all()
+        )
+        articles = NewsService._latest_articles(db, symbols, limit)
+
+        # Average over distinct articles: a story about two holdings counts once
+        article_count, score_sum = (
+            db.query(func.count(NewsArticle.id), func.sum(NewsArticle.sentiment_score))
+            .filter(NewsArticle.id.in_(NewsService._linked_ids(db, symbols)))
+            .one()
+        )
+        overall_score = round(score_sum / article_count, 4) if article_count else None
+
+        return PortfolioNews(
+            overall_score=overall_score,
+            overall_label=label_for(overall_score) if overall_score is not None else None,
+            symbols=[NewsService._summary(a) for a in aggregates],
+            articles=NewsService._article_responses(db, articles, symbols)
+        )
+
+    @staticmethod
+    @traced()
+    def refresh(db: Session, symbol: str) -> int:
+        """
+        Ingest news of a symbol unless it was fetched within NEWS_REFRESH_SECONDS
+
+        Returns:
+            Number of newly stored articles
+        """
+        symbol = symbol.upper()
+
+        if _refreshed.get(symbol) is not None:
+            return 0
+
+        try:
+            articles = NewsService._fetch_news(symbol)
+        except Exception as e:
+            # Upstream failures fall back to stored articles
+            logger.warning("News fetch for %s failed: %s", symbol, e)
+            return 0
+
+        stored = NewsService.ingest(db, symbol, articles)
+
+        # Marked only once stored: a failed ingest is retried on the next request
+        _refreshed.set(symbol, True)
+        return stored
+
+    @staticmethod
+    @traced()
+    def ingest(db: Session, symbol: str, articles: List[Dict]) -> int:
+        """
+        Store new articles, link them to the symbol and update its aggregate
+
+        - Duplicates (same URL hash) within the batch and in the DB are found
+          with a single IN query; articles already stored for another symbol
+          are only linked, reusing their stored score
+        - Articles seen for the first time are scored in one score_batch() call
+        - The aggregate row is updated with SQL increments (no re-scan of old
+          articles, no lost update between concurrent ingests)
+        - A concurrent ingest storing the same rows first is retried, not dropped
+
+        Args:
+            db: Database session
+            symbol: Stock symbol
+            articles: Parsed articles (see _parse_article)
+
+        Returns:
+            Number of articles newly linked to the symbol
+        """
+        unique: Dict[str, Dict] = {}
+        for article in articles:
+            unique.setdefault(NewsService._url_hash(article), article)
+
+        if not unique:
+            return 0
+
+        for attempt in range(_INGEST_ATTEMPTS):
+            try:
+                return NewsService._ingest_once(db, symbol, unique)
+            except IntegrityError:
+                # A concurrent request stored the same article or aggregate first:
+                # the next attempt finds its rows and only links / increments
+                db.rollback()
+                if attempt == _INGEST_ATTEMPTS - 1:
+                    raise
+
+    @staticmethod
+    def _ingest_once(db: Session, symbol: str, unique: Dict[str, Dict]) -> int:
+        stored = {
+            row.url_hash: row for row in
+            db.query(NewsArticle.id, NewsArticle.url_hash, NewsArticle.sentiment_score, NewsArticle.sentiment_label)
+            .filter(NewsArticle.url_hash.in_(list(unique)))
+            .all()
+        }
+        linked = {
+            row.article_id for row in
+            db.query(NewsArticleSymbol.article_id)
+            .filter(
+                NewsArticleSymbol.symbol == symbol,
+                NewsArticleSymbol.article_id.in_([row.id for row in stored.values()])
+            )
+            .all()
+        } if stored else set()
+
+        # (article id, score, label) of every article to link to the symbol
+        links = [(row.id, row.sentiment_score, row.sentiment_label) for row in stored.values() if row.id not in linked]
+
+        new = {h: a for h, a in unique.items() if h not in stored}
+        if new:
+            scorer = get_scorer(settings.SENTIMENT_SCORER)
+            results = scorer.score_batch([
+                f"{a['title']}. {a['summary'] or ''}" for a in new.values()
+            ])
+            rows = [
+                NewsArticle(
+                    url_hash=url_hash,
+                    url=article['url'],
+                    title=article['title'][:500],
+                    summary=(article['summary'] or '')[:4000] or None,
+                    publisher=article['publisher'],
+                    published_at=article['published_at'],
+                    sentiment_score=result.score,
+                    sentiment_label=result.label,
+                    scorer=scorer.name
+                )
+                for (url_hash, article), result in zip(new.items(), results)
+            ]
+            db.add_all(rows)
+            db.flush()
+            links.extend((row.id, row.sentiment_score, row.sentiment_label) for row in rows)
+
+        if not links:
+            return 0
+
+        db.add_all(NewsArticleSymbol(article_id=article_id, symbol=symbol) for article_id, _, _ in links)
+
+        if db.query(SymbolSentiment.symbol).filter(SymbolSentiment.symbol == symbol).first() is None:
+            db.add(SymbolSentiment(
+                symbol=symbol, article_count=0, score_sum=0.0,
+                positive_count=0, negative_count=0, neutral_count=0
+            ))
+        db.flush()
+
+        labels = [label for _, _, label in links]
+        db.query(SymbolSentiment).filter(SymbolSentiment.symbol == symbol).update({
+            SymbolSentiment.article_count: SymbolSentiment.article_count + len(links),
+            SymbolSentiment.score_sum: SymbolSentiment.score_sum + sum(score for _, score, _ in links),
+            SymbolSentiment.positive_count: SymbolSentiment.positive_count + labels.count("POSITIVE"),
+            SymbolSentiment.negative_count: SymbolSentiment.negative_count + labels.count("NEGATIVE"),
+            SymbolSentiment.neutral_count: SymbolSentiment.neutral_count + labels.count("NEUTRAL"),
+        }, synchronize_session=False)
+
+        db.commit()
+        return len(links)
+
+    @staticmethod
+    def _fetch_news(symbol: str) -> List[Dict]:
+        """Fetch and parse ticker.news (same layout as test_news_sentiment.py)"""
+        provider = get_provider()
+        with upstream_call("news", provider.name):
+            news = provider.news(symbol) or []
+        parsed = [NewsService._parse_article(article) for article in news]
+        return [article for article in parsed if article['title']]
+
+    @staticmethod
+    def _parse_article(article: Dict) -> Dict:
+        content = article.get('content') or {}
+        url = (content.get('canonicalUrl') or {}).get('url') \
+            or (content.get('clickThroughUrl') or {}).get('url')
+
+        published_at = None
+        if content.get('pubDate'):
+            try:
+                published_at = datetime.fromisoformat(content['pubDate'].replace('Z', '+00:00'))
+            except ValueError:
+                published_at = None
+
+        return {
+            'title': (content.get('title') or '').strip(),
+            'summary': content.get('summary') or '',
+            'publisher': (content.get('provider') or {}).get('displayName'),
+            'published_at': published_at or datetime.now(timezone.utc),
+            'url': url
+        }
+
+    @staticmethod
+    def _url_hash(article: Dict) -> str:
+        """SHA-256 of the article URL (title when the URL is missing)"""
+        key = article['url'] or f"title:{article['title']}"
+        return hashlib.sha256(key.strip().encode()).hexdigest()
+
+    @staticmethod
+    def _linked_ids(db: Session, symbols: List[str]):
+        """Subquery of the ids of articles linked to any of the symbols"""
+        return (
+            db.query(NewsArticleSymbol.article_id)
+            .filter(NewsArticleSymbol.symbol.in_(symbols))
+            .scalar_subquery()
+        )
+
+    @staticmethod
+    def _latest_articles(db: Session, symbols: List[str], limit: int) -> List[NewsArticle]:
+        """Newest distinct articles linked to any of the symbols"""
+        return (
+            db.query(NewsArticle)
+            .filter(NewsArticle.id.in_(NewsService._linked_ids(db, symbols)))
+            .order_by(NewsArticle.published_at.desc(), NewsArticle.id.desc())
+            .limit(limit)
+            .all()
+        )
+
+    @staticmethod
+    def _article_responses(db: Session, articles: List[NewsArticle], symbols: List[str]) -> List[NewsArticleResponse]:
+        """Article DTOs with the requested symbols each article is linked to (one query)"""
+        linked: Dict[int, List[str]] = {}
+        if articles:
+            for row in (
+                db.query(NewsArticleSymbol)
+                .filter(
+                    NewsArticleSymbol.article_id.in_([a.id for a in articles]),
+                    NewsArticleSymbol.symbol.in_(symbols)
+                )
+                .order_by(NewsArticleSymbol.symbol)
+                .all()
+            ):
+                linked.setdefault(row.article_id, []).append(row.symbol)
+
+        return [
+            NewsArticleResponse(
+                symbols=linked.get(a.id, []),
+                title=a.title,
+                summary=a.summary,
+                publisher=a.publisher,
+                url=a.url,
+                published_at=a.published_at,
+                sentiment_score=a.sentiment_score,
+                sentiment_label=a.sentiment_label
+            )
+            for a in articles
+        ]
+
+    @staticmethod
+    def _summary(aggregate: SymbolSentiment) -> SentimentSummary:
+        average = round(aggregate.average_score, 4)
+        return SentimentSummary(
+            symbol=aggregate.symbol,
+            article_count=aggregate.article_count,
+            average_score=average,
+            label=label_for(average),
+            positive_count=aggregate.positive_count,
+            negative_count=aggregate.negative_count,
+            neutral_count=aggregate.neutral_count,
+            updated_at=aggregate.updated_at
+        )
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional
+
+from schemas.option import OptionMetricHistory
+from services.option_service import OptionService
+from core.lazy import lazy_import
+from core.scheduler import PeriodicJob
+from core.timeseries import ColumnarStore
+from core.tracing import traced
+from config import settings
+
+np = lazy_import("numpy")
+
+logger = logging.getLogger(__name__)
+
+# Per (symbol, expiry) metrics; expiry is stored as days since 1970-01-01
+HISTORY_COLUMNS = {
+    "expiry": "<i4",
+    "spot": "<f4",
+    "max_pain": "<f4",
+    "call_oi": "<i8",
+    "put_oi": "<i8",
+    "pcr": "<f4",
+    "atm_iv": "<f4",
+}
+
+# Endpoint metric -> stored column
+METRIC_COLUMNS = {
+    "pcr": "pcr",
+    "iv": "atm_iv",
+    "max-pain": "max_pain",
+}
+
+_store = ColumnarStore(settings.OPTION_HISTORY_DIR, HISTORY_COLUMNS)
+
+
+def history_symbols() -> List[str]:
+    """Symbols recorded by the collector (OPTION_HISTORY_SYMBOLS)"""
+    return [s.strip().upper() for s in settings.OPTION_HISTORY_SYMBOLS.split(",") if s.strip()]
+
+
+def history_job() -> PeriodicJob:
+    """
+    Collector run every OPTION_HISTORY_INTERVAL_SECONDS (started by main.py)
+
+    Raises:
+        ValueError: CACHE_BACKEND is the per-worker memory backend, whose run
+            lease never excludes other workers (each would append the samples)
+    """
+    if settings.CACHE_BACKEND == "memory":
+        raise ValueError(
+            "OPTION_HISTORY_SYMBOLS requires a shared CACHE_BACKEND (sqlite or redis) "
+            "so that one worker runs the collector"
+        )
+    return PeriodicJob("option-history", settings.OPTION_HISTORY_INTERVAL_SECONDS, OptionHistoryService.collect_all)
+
+
+class OptionHistoryService:
+    """
+    Option metric time series
+
+    The collector appends PCR, ATM IV and max pain of every expiry of the
+    configured symbols to a columnar store partitioned by symbol and date
+    (core.timeseries). Range queries read only the partitions and columns
+    they need.
+    """
+
+    @staticmethod
+    def collect_all() -> int:
+        """
+        Record one sample of every configured symbol (in parallel)
+
+        Returns:
+            Number of appended rows
+        """
+        symbols = history_symbols()
+        if not symbols:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=settings.OPTION_HISTORY_WORKERS, thread_name_prefix="option-history") as pool:
+            counts = list(pool.map(OptionHistoryService._collect_quietly, symbols))
+        return sum(counts)
+
+    @staticmethod
+    @traced()
+    def collect(symbol: str, timestamp: Optional[float] = None) -> int:
+        """
+        Append the current metrics of every expiry of a symbol
+
+        Returns:
+            Number of appended rows (expiries)
+        """
+        symbol = symbol.upper()
+        ts = int(time.time() if timestamp is None else timestamp)
+        results = OptionService.analyze_expiries(symbol)
+        if not results:
+            return 0
+
+        rows: Dict[str, list] = {name: [] for name in ("ts", *HISTORY_COLUMNS)}
+        for max_pain, pcr, iv in results:
+            rows["ts"].append(ts)
+            rows["expiry"].append(_expiry_days(max_pain.expiry_date))
+            rows["spot"].append(max_pain.current_price)
+            rows["max_pain"].append(max_pain.max_pain_price)
+            rows["call_oi"].append(pcr.total_call_open_interest)
+            rows["put_oi"].append(pcr.total_put_open_interest)
+            rows["pcr"].append(pcr.put_call_ratio)
+            rows["atm_iv"].append(iv.average_iv)
+
+        return _store.append(symbol, rows)
+
+    @staticmethod
+    @traced()
+    def get_history(
+        symbol: str,
+        metric: str,
+        start: date,
+        end: date,
+        expiry: Optional[str] = None
+    ) -> Optional[OptionMetricHistory]:
+        """
+        One metric of a symbol between two dates (inclusive, UTC)
+
+        Args:
+            symbol: Stock ticker symbol
+            metric: "pcr", "iv" or "max-pain"
+            start: First date
+            end: Last date
+            expiry: Only this expiry (YYYY-MM-DD); None = all expiries
+
+        Returns:
+            OptionMetricHistory, or None if nothing was recorded in the range
+
+        Raises:
+            ValueError: Unknown metric or invalid range
+        """
+        if metric not in METRIC_COLUMNS:
+            raise ValueError(f"Unknown metric '{metric}' (use {', '.join(METRIC_COLUMNS)})")
+        if start > end:
+            raise ValueError("'from' must not be after 'to'")
+        if (end - start).days > settings.OPTION_HISTORY_MAX_DAYS:
+            raise ValueError(f"Range must not exceed {settings.OPTION_HISTORY_MAX_DAYS} days")
+
+        symbol = symbol.upper()
+        column = METRIC_COLUMNS[metric]
+        data = _store.query(symbol, start, end, ["expiry", column])
+
+        if expiry:
+            mask = data["expiry"] == _expiry_days(expiry)
+            data = {name: values[mask] for name, values in data.items()}
+
+        if not len(data["ts"]):
+            return None
+
+        return OptionMetricHistory(
+            symbol=symbol,
+            metric=metric,
+            expiry_date=expiry,
+            start_date=start.isoformat(),
+            end_date=end.isoformat(),
+            timestamps=[datetime.fromtimestamp(int(ts), timezone.utc) for ts in data["ts"]],
+            expiry_dates=np.datetime_as_string(data["expiry"].astype("datetime64[D]")).tolist(),
+            values=np.round(data[column].astype(float), 4).tolist()
+        )
+
+    @staticmethod
+    def _collect_quietly(symbol: str) -> int:
+        try:
+            return OptionHistoryService.collect(symbol)
+        except Exception:
+            # One failing symbol must not stop the others
+            logger.exception("Option history collection of %s failed", symbol)
+            return 0
+
+
+def _expiry_days(expiry: str) -> int:
+    """YYYY-MM-DD -> days since 1970-01-01"""
+    return int(np.datetime64(expiry, "D").astype(int))
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+from services.option_service import OptionService
+from core.cache import TTLCache
+from core.lazy import lazy_import
+from core.ratelimit import RateLimiter
+from core.tracing import traced
+from config import settings
+
+np = lazy_import("numpy")
+
+logger = logging.getLogger(__name__)
+
+# Scan metrics per (symbol, expiry) - None: no options. Rescanning replays
+# these without upstream calls.
+_metrics_cache = TTLCache(ttl=settings.OPTION_CHAIN_CACHE_TTL_SECONDS, maxsize=4096, name="option_scan")
+
+# Symbols delivered per (scan id, universe, expiry, criteria) -> outcome, so
+# resuming an interrupted scan skips them
+_progress_cache = TTLCache(ttl=settings.OPTION_CHAIN_CACHE_TTL_SECONDS, maxsize=256, name="option_scan_progress")
+
+# Symbols scanned per second across all scans of this worker (upstream protection)
+_limiter = RateLimiter(settings.OPTION_SCAN_RATE_PER_SECOND, burst=settings.OPTION_SCAN_WORKERS)
+
+_MISSING = object()
+
+# Scan threads (created on first use)
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ScanCriteria:
+    """
+    Thresholds a symbol must meet to match (None = not checked)
+
+    oi_concentration is the share of the expiry's open interest (calls +
+    puts) at its single busiest strike.
+    """
+    min_pcr: Optional[float] = None
+    max_pcr: Optional[float] = None
+    min_iv: Optional[float] = None
+    max_iv: Optional[float] = None
+    min_oi_concentration: Optional[float] = None
+
+    def matches(self, metrics: Dict[str, Any]) -> bool:
+        checks = (
+            (metrics["put_call_ratio"], self.min_pcr, self.max_pcr),
+            (metrics["atm_iv"], self.min_iv, self.max_iv),
+            (metrics["oi_concentration"], self.min_oi_concentration, None),
+        )
+        return all(
+            (low is None or value >= low) and (high is None or value <= high)
+            for value, low, high in checks
+        )
+
+
+class OptionScanService:
+    """
+    Market-wide option screener
+
+    Symbols are scanned concurrently (OPTION_SCAN_WORKERS threads, at most
+    OPTION_SCAN_RATE_PER_SECOND new symbols per second) and matches are
+    yielded as soon as each chain has been evaluated, in completion order.
+    """
+
+    @staticmethod
+    def scan(
+        symbols: List[str],
+        criteria: ScanCriteria,
+        expiry: Optional[str] = None,
+        scan_id: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Scan a universe, yielding one dict per match, then a summary
+
+        Closing the iterator early (client gone) cancels the symbols not
+        started yet. With a scan_id, every symbol whose result was delivered
+        (the consumer asked for the next item) is recorded for
+        OPTION_CHAIN_CACHE_TTL_SECONDS: repeating the scan with the same id,
+        universe, expiry and criteria skips those symbols, and its summary
+        covers the whole scan. Symbols scanned but not delivered are
+        answered from the metrics cache.
+
+        Yields:
+            {"type": "match", ...metrics, "cached"} per matching symbol, then
+            {"type": "summary", "scanned", "matched", "no_options", "failed"}
+        """
+        symbols = list(dict.fromkeys(s.upper() for s in symbols))
+        progress_key = (scan_id, tuple(symbols), expiry, criteria)
+        delivered: Dict[str, str] = dict(_progress_cache.get(progress_key) or {}) if scan_id else {}
+        pending = [symbol for symbol in symbols if symbol not in delivered]
+        cached = _metrics_cache.get_many([(symbol, expiry) for symbol in pending])
+        failed: List[str] = []
+
+        def evaluate(metrics: Optional[Dict[str, Any]], symbol: str, from_cache: bool) -> Optional[Dict[str, Any]]:
+            if metrics is None:
+                delivered[symbol] = "no_options"
+            elif criteria.matches(metrics):
+                delivered[symbol] = "match"
+                return {"type": "match", **metrics, "cached": from_cache}
+            else:
+                delivered[symbol] = "no_match"
+            return None
+
+        def record() -> None:
+            if scan_id:
+                _progress_cache.set(progress_key, dict(delivered))
+
+        # Symbols already scanned are answered first, without upstream calls
+        for symbol in pending:
+            if (symbol, expiry) in cached:
+                match = evaluate(cached[(symbol, expiry)], symbol, True)
+                if match:
+                    yield match
+                record()
+
+        executor = _scan_executor()
+        futures: Dict[Future, str] = {
+            executor.submit(contextvars.copy_context().run, OptionScanService.metrics, symbol, expiry): symbol
+            for symbol in pending if (symbol, expiry) not in cached
+        }
+        try:
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    metrics = future.result()
+                except Exception:
+                    logger.exception("Option scan of %s failed", symbol)
+                    failed.append(symbol)
+                    continue
+
+                match = evaluate(metrics, symbol, False)
+                if match:
+                    yield match
+                record()
+        finally:
+            for future in futures:
+                future.cancel()
+
+        yield {
+            "type": "summary",
+            "scanned": len(delivered),
+            "matched": sum(1 for outcome in delivered.values() if outcome == "match"),
+            "no_options": sorted(symbol for symbol, outcome in delivered.items() if outcome == "no_options"),
+            "failed": sorted(failed),
+        }
+
+    @staticmethod
+    @traced()
+    def metrics(symbol: str, expiry: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        PCR, ATM IV and OI concentration of one expiry (nearest if None), cached
+
+        Returns:
+            Metrics dict, or None if the symbol has no options (or not that expiry)
+        """
+        symbol = symbol.upper()
+        key = (symbol, expiry)
+
+        cached = _metrics_cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
+        _limiter.acquire()
+        return _metrics_cache.get_or_set(key, lambda: OptionScanService._compute(symbol, expiry))
+
+    @staticmethod
+    def _compute(symbol: str, expiry: Optional[str]) -> Optional[Dict[str, Any]]:
+        expiry = OptionService._resolve_expiry(symbol, expiry)
+
+        if not expiry:
+            return None
+
+        current_price = OptionService._get_spot(symbol)
+        calls, puts = OptionService._get_chain(symbol, expiry)
+        if calls.empty or puts.empty:
+            return None
+
+        pcr = OptionService.pcr_from_chain(symbol, expiry, calls, puts)
+        iv = OptionService.iv_from_chain(symbol, expiry, current_price, calls, puts)
+
+        # Open interest per strike, calls and puts together, in one bincount
+        strike = np.concatenate([calls['strike'].to_numpy(dtype=float), puts['strike'].to_numpy(dtype=float)])
+        open_interest = np.concatenate([
+            calls['openInterest'].fillna(0).to_numpy(dtype=float),
+            puts['openInterest'].fillna(0).to_numpy(dtype=float)
+        ])
+        strikes, position = np.unique(strike, return_inverse=True)
+        per_strike = np.bincount(position, weights=open_interest, minlength=len(strikes))
+        total = per_strike.sum()
+        busiest = int(per_strike.argmax())
+
+        return {
+            "symbol": symbol,
+            "expiry_date": expiry,
+            "current_price": round(current_price, 2),
+            "put_call_ratio": pcr.put_call_ratio,
+            "total_call_open_interest": pcr.total_call_open_interest,
+            "total_put_open_interest": pcr.total_put_open_interest,
+            "atm_iv": iv.average_iv,
+            "max_oi_strike": float(strikes[busiest]),
+            "oi_concentration": round(float(per_strike[busiest] / total), 4) if total > 0 else 0.0,
+        }
+
+
+def _scan_executor() -> ThreadPoolExecutor:
+    """Scan threads (OPTION_SCAN_WORKERS), shared by concurrent scans"""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.OPTION_SCAN_WORKERS, thread_name_prefix="option-scan"
+                )
+    return _executor
@@ -1,11 +1,98 @@
-import yfinance as yf
-import pandas as pd
-from typing import Optional, List
+from __future__ import annotations
+
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, List, Tuple, Union
 from schemas.option import (
     OptionExpiryList, MaxPainResponse, PCRResponse,
-    IVResponse, OptionChainResponse, OptionData
+    IVResponse, OptionChainResponse, OptionData,
+    OptionChainGreeksResponse, OptionGreeksData, GammaExposureResponse,
+    IVSurfaceResponse, IVSkewResponse, IVTermStructureResponse
+)
+from services.market_data import get_provider
+from services import option_pricing, volatility_surface
+from services.volatility_surface import IVSurface
+from core.cache import TTLCache
+from core.lazy import lazy_import
+from core.metrics import upstream_call
+from core.tracing import traced
+from config import settings
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+# Rounding of greeks in responses
+_GREEK_DECIMALS = {"impliedVolatility": 4, "delta": 4, "gamma": 6, "theta": 4, "vega": 4, "rho": 4}
+
+# Chain fields selectable with fields= -> frame column (greek columns need greeks=True)
+CHAIN_FIELDS = {
+    "strike": "strike",
+    "last_price": "lastPrice",
+    "bid": "bid",
+    "ask": "ask",
+    "volume": "volume",
+    "open_interest": "openInterest",
+    "implied_volatility": "impliedVolatility",
+}
+GREEK_FIELDS = {
+    "iv_solved": "ivSolved",
+    "delta": "delta",
+    "gamma": "gamma",
+    "theta": "theta",
+    "vega": "vega",
+    "rho": "rho",
+}
+_INT_FIELDS = {"volume", "open_interest"}
+
+
+@dataclass(frozen=True)
+class ChainFilter:
+    """
+    Contract filter of the option chain endpoint (hashable: part of cache keys)
+
+    moneyness is a band around spot: 0.1 keeps strikes within +/-10%.
+    Missing volume / open interest counts as 0.
+    """
+    min_strike: Optional[float] = None
+    max_strike: Optional[float] = None
+    moneyness: Optional[float] = None
+    min_open_interest: int = 0
+    min_volume: int = 0
+
+    def mask(self, frame: pd.DataFrame, spot: float) -> np.ndarray:
+        """Boolean mask of the contracts of frame passing the filter"""
+        strike = frame['strike'].to_numpy(dtype=float)
+        keep = np.ones(len(frame), dtype=bool)
+        if self.min_strike is not None:
+            keep &= strike >= self.min_strike
+        if self.max_strike is not None:
+            keep &= strike <= self.max_strike
+        if self.moneyness is not None:
+            keep &= np.abs(strike / spot - 1.0) <= self.moneyness
+        if self.min_open_interest:
+            keep &= frame['openInterest'].fillna(0).to_numpy(dtype=float) >= self.min_open_interest
+        if self.min_volume:
+            keep &= frame['volume'].fillna(0).to_numpy(dtype=float) >= self.min_volume
+        return keep
+
+
+# Upstream option data shared by all option endpoints:
+# ("expiries", symbol), ("spot", symbol) and ("chain", symbol, expiry)
+_chain_cache = TTLCache(
+    ttl=settings.OPTION_CHAIN_CACHE_TTL_SECONDS, maxsize=512, name="option_chain",
+    max_stale=settings.OPTION_CHAIN_CACHE_MAX_STALE_SECONDS
 )
 
+# IV surfaces built from all expiries of a symbol, shared by the surface,
+# skew and term-structure endpoints: symbol -> IVSurface (None: no options)
+_surface_cache = TTLCache(ttl=settings.IV_SURFACE_CACHE_TTL_SECONDS, maxsize=256, name="iv_surface")
+
+# Threads fetching the chains of several expiries at once (created on first use)
+_fetch_executor: Optional[ThreadPoolExecutor] = None
+_fetch_executor_lock = threading.Lock()
+
 
 class OptionService:
     """
@@ -13,6 +100,7 @@ class OptionService:
     """
 
     @staticmethod
+    @traced()
     def get_expiry_dates(symbol: str) -> Optional[OptionExpiryList]:
         """
         Get available option expiration dates for a symbol
@@ -24,21 +112,21 @@ class OptionService:
             OptionExpiryList object with available expiry dates
         """
         try:
-            ticker = yf.Ticker(symbol)
-            current_price = ticker.history(period='1d')['Close'].iloc[-1]
+            expiry_dates = OptionService._get_expiries(symbol)
 
-            if not ticker.options:
+            if not expiry_dates:
                 return None
 
             return OptionExpiryList(
                 symbol=symbol.upper(),
-                current_price=round(current_price, 2),
-                expiry_dates=list(ticker.options)
+                current_price=round(OptionService._get_spot(symbol), 2),
+                expiry_dates=list(expiry_dates)
             )
         except Exception as e:
             raise Exception(f"Error fetching expiry dates: {str(e)}")
 
     @staticmethod
+    @traced()
     def get_max_pain(symbol: str, expiry: Optional[str] = None) -> Optional[MaxPainResponse]:
         """
         Calculate Max Pain price for options
@@ -54,50 +142,22 @@ class OptionService:
             MaxPainResponse with max pain analysis
         """
         try:
-            ticker = yf.Ticker(symbol)
-            current_price = ticker.history(period='1d')['Close'].iloc[-1]
-
-            if not ticker.options:
-                return None
-
             # Use nearest expiry if not specified
+            expiry = OptionService._resolve_expiry(symbol, expiry)
+
             if not expiry:
-                expiry = ticker.options[0]
+                return None
 
             # Get option chain
-            option_chain = ticker.option_chain(expiry)
-            calls = option_chain.calls
-            puts = option_chain.puts
-
-            # Calculate total open interest per strike
-            strikes = pd.concat(
-                [calls[['strike', 'openInterest']], puts[['strike', 'openInterest']]],
-                keys=['call', 'put']
-            )
-            strike_oi = strikes.groupby('strike')['openInterest'].sum().sort_values(ascending=False)
-
-            # Get top 5 strikes
-            top_strikes = [
-                {"strike": float(strike), "open_interest": int(oi)}
-                for strike, oi in strike_oi.head(5).items()
-            ]
+            current_price = OptionService._get_spot(symbol)
+            calls, puts = OptionService._get_chain(symbol, expiry)
 
-            # Max pain is the strike with highest open interest
-            max_pain_price = float(strike_oi.idxmax())
-            price_diff_percent = ((max_pain_price / current_price - 1) * 100)
-
-            return MaxPainResponse(
-                symbol=symbol.upper(),
-                expiry_date=expiry,
-                current_price=round(current_price, 2),
-                max_pain_price=round(max_pain_price, 2),
-                price_difference_percent=round(price_diff_percent, 2),
-                top_strikes=top_strikes
-            )
+            return OptionService.max_pain_from_chain(symbol, expiry, current_price, calls, puts)
         except Exception as e:
             raise Exception(f"Error calculating max pain: {str(e)}")
 
     @staticmethod
+    @traced()
     def get_pcr(symbol: str, expiry: Optional[str] = None) -> Optional[PCRResponse]:
         """
         Calculate Put-Call Ratio
@@ -115,42 +175,19 @@ class OptionService:
             PCRResponse with put-call ratio analysis
         """
         try:
-            ticker = yf.Ticker(symbol)
-
-            if not ticker.options:
-                return None
+            expiry = OptionService._resolve_expiry(symbol, expiry)
 
             if not expiry:
-                expiry = ticker.options[0]
-
-            option_chain = ticker.option_chain(expiry)
-            calls = option_chain.calls
-            puts = option_chain.puts
-
-            total_call_oi = int(calls['openInterest'].sum())
-            total_put_oi = int(puts['openInterest'].sum())
-            pcr = total_put_oi / total_call_oi if total_call_oi > 0 else 0
+                return None
 
-            # Interpret PCR
-            if pcr > 1:
-                interpretation = "Bearish"
-            elif pcr < 0.7:
-                interpretation = "Bullish"
-            else:
-                interpretation = "Neutral"
+            calls, puts = OptionService._get_chain(symbol, expiry)
 
-            return PCRResponse(
-                symbol=symbol.upper(),
-                expiry_date=expiry,
-                total_call_open_interest=total_call_oi,
-                total_put_open_interest=total_put_oi,
-                put_call_ratio=round(pcr, 2),
-                interpretation=interpretation
-            )
+            return OptionService.pcr_from_chain(symbol, expiry, calls, puts)
         except Exception as e:
             raise Exception(f"Error calculating PCR: {str(e)}")
 
     @staticmethod
+    @traced()
     def get_iv(symbol: str, expiry: Optional[str] = None) -> Optional[IVResponse]:
         """
         Get At-The-Money (ATM) Implied Volatility
@@ -167,110 +204,582 @@ class OptionService:
             IVResponse with implied volatility analysis
         """
         try:
-            ticker = yf.Ticker(symbol)
-            current_price = ticker.history(period='1d')['Close'].iloc[-1]
+            expiry = OptionService._resolve_expiry(symbol, expiry)
 
-            if not ticker.options:
+            if not expiry:
                 return None
 
+            current_price = OptionService._get_spot(symbol)
+            calls, puts = OptionService._get_chain(symbol, expiry)
+
+            return OptionService.iv_from_chain(symbol, expiry, current_price, calls, puts)
+        except Exception as e:
+            raise Exception(f"Error calculating IV: {str(e)}")
+
+    @staticmethod
+    @traced()
+    def get_option_chain(
+        symbol: str,
+        expiry: Optional[str] = None,
+        greeks: bool = False,
+        chain_filter: Optional[ChainFilter] = None,
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Union[OptionChainResponse, Dict[str, Any], None]:
+        """
+        Get full option chain (calls and puts) for a symbol
+
+        Args:
+            symbol: Stock ticker symbol
+            expiry: Option expiry date. If None, uses nearest expiry.
+            greeks: Add Black-Scholes greeks of every contract (priced in one
+                vectorized pass; IVs solved from the mid when missing or stale)
+            chain_filter: Keep only the matching contracts (applied as masks
+                on the chain frames, before pricing and serialization)
+            fields: Only these contract fields (see parse_fields); the
+                response is then a plain dict with partial contract rows
+
+        Returns:
+            OptionChainResponse (OptionChainGreeksResponse with greeks) with calls and puts data
+        """
+        try:
+            expiry = OptionService._resolve_expiry(symbol, expiry)
+
             if not expiry:
-                expiry = ticker.options[0]
+                return None
 
-            option_chain = ticker.option_chain(expiry)
-            calls = option_chain.calls
-            puts = option_chain.puts
+            current_price = OptionService._get_spot(symbol)
+            calls, puts = OptionService._get_chain(symbol, expiry)
+
+            if chain_filter is not None:
+                calls = calls[chain_filter.mask(calls, current_price)]
+                puts = puts[chain_filter.mask(puts, current_price)]
+
+            call_greeks = put_greeks = None
+            header = dict(symbol=symbol.upper(), expiry_date=expiry, current_price=round(current_price, 2))
+            if greeks:
+                years = option_pricing.years_to_expiry(expiry)
+                rate = settings.RISK_FREE_RATE
+                call_greeks, put_greeks = option_pricing.chain_greeks(calls, puts, current_price, years, rate)
+                header.update(years_to_expiry=round(years, 6), risk_free_rate=rate)
+
+            if fields:
+                return dict(
+                    header,
+                    calls=OptionService._projected_rows(calls, call_greeks, fields),
+                    puts=OptionService._projected_rows(puts, put_greeks, fields)
+                )
 
-            # Find ATM options (closest to current price)
-            calls['strike_diff'] = abs(calls['strike'] - current_price)
-            atm_call = calls.loc[calls['strike_diff'].idxmin()]
+            response = OptionChainGreeksResponse if greeks else OptionChainResponse
+            return response(
+                **header,
+                calls=OptionService._option_rows(calls, call_greeks),
+                puts=OptionService._option_rows(puts, put_greeks)
+            )
+        except Exception as e:
+            raise Exception(f"Error fetching option chain: {str(e)}")
+
+    @staticmethod
+    def parse_fields(fields: Optional[str], greeks: bool = False) -> Optional[Tuple[str, ...]]:
+        """
+        fields= query value -> field names (None: all fields)
+
+        Raises:
+            ValueError: Unknown field, or a greek field without greeks
+        """
+        if not fields:
+            return None
+
+        names = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+        allowed = {**CHAIN_FIELDS, **GREEK_FIELDS} if greeks else CHAIN_FIELDS
+        unknown = [name for name in names if name not in allowed]
+        if unknown:
+            hint = " (greek fields need greeks=true)" if any(name in GREEK_FIELDS for name in unknown) else ""
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}{hint}. Available: {', '.join(allowed)}")
+        return names or None
+
+    @staticmethod
+    @traced()
+    def get_gamma_exposure(symbol: str) -> Optional[GammaExposureResponse]:
+        """
+        Dealer gamma exposure (GEX) across all expiries
+
+        The chains of every expiry are fetched concurrently through the chain
+        cache and concatenated into one contract frame; the per-contract
+        OI x gamma x spot^2 products, their per-strike sums and the zero-gamma
+        level are vectorized reductions over it. Contracts without open
+        interest or a usable market IV are left out.
+
+        Args:
+            symbol: Stock ticker symbol
+
+        Returns:
+            GammaExposureResponse with per-strike and total exposure
+        """
+        try:
+            expiries = OptionService._get_expiries(symbol)
+
+            if not expiries:
+                return None
 
-            puts['strike_diff'] = abs(puts['strike'] - current_price)
-            atm_put = puts.loc[puts['strike_diff'].idxmin()]
+            current_price = OptionService._get_spot(symbol)
+            frames = []
+            for expiry, calls, puts in OptionService._get_chains(symbol, expiries):
+                years = option_pricing.years_to_expiry(expiry)
+                for frame, is_call in ((calls, True), (puts, False)):
+                    if not frame.empty:
+                        frames.append(
+                            frame[['strike', 'openInterest', 'impliedVolatility']].assign(years=years, isCall=is_call)
+                        )
+
+            if not frames:
+                return None
 
-            atm_strike = float(atm_call['strike'])
-            atm_call_iv = float(atm_call['impliedVolatility'])
-            atm_put_iv = float(atm_put['impliedVolatility'])
-            avg_iv = (atm_call_iv + atm_put_iv) / 2
+            contracts = pd.concat(frames, ignore_index=True)
+            open_interest = contracts['openInterest'].fillna(0.0).to_numpy(dtype=float)
+            iv = contracts['impliedVolatility'].to_numpy(dtype=float)
+            usable = (open_interest > 0) & np.isfinite(iv) & (iv >= option_pricing.IV_FLOOR)
 
-            # Interpret IV
-            if avg_iv > 0.30:
-                interpretation = "High volatility expected"
-            elif avg_iv < 0.15:
-                interpretation = "Low volatility expected"
-            else:
-                interpretation = "Moderate volatility expected"
+            strike = contracts['strike'].to_numpy(dtype=float)[usable]
+            years = contracts['years'].to_numpy(dtype=float)[usable]
+            is_call = contracts['isCall'].to_numpy(dtype=bool)[usable]
+            iv, open_interest = iv[usable], open_interest[usable]
+            rate = settings.RISK_FREE_RATE
 
-            return IVResponse(
+            exposure = option_pricing.gamma_exposure(
+                current_price, strike, years, rate, iv, open_interest, is_call
+            )
+            strikes, position = np.unique(strike, return_inverse=True)
+            per_strike = np.bincount(position, weights=exposure, minlength=len(strikes))
+            flip = None
+            if strike.size and np.any(exposure):
+                # No usable contracts (or no exposure at all): there is nothing to flip
+                flip = option_pricing.zero_gamma_level(current_price, strike, years, rate, iv, open_interest, is_call)
+
+            return GammaExposureResponse(
                 symbol=symbol.upper(),
-                expiry_date=expiry,
                 current_price=round(current_price, 2),
-                atm_strike=round(atm_strike, 2),
-                atm_call_iv=round(atm_call_iv, 4),
-                atm_put_iv=round(atm_put_iv, 4),
-                average_iv=round(avg_iv, 4),
-                interpretation=interpretation
+                expiry_dates=list(expiries),
+                total_gamma_exposure=round(float(exposure.sum()), 2),
+                call_gamma_exposure=round(float(exposure[is_call].sum()), 2),
+                put_gamma_exposure=round(float(exposure[~is_call].sum()), 2),
+                zero_gamma_level=round(flip, 2) if flip is not None else None,
+                strikes=strikes.tolist(),
+                gamma_exposure=np.round(per_strike, 2).tolist()
             )
         except Exception as e:
-            raise Exception(f"Error calculating IV: {str(e)}")
+            raise Exception(f"Error calculating gamma exposure: {str(e)}")
 
     @staticmethod
-    def get_option_chain(symbol: str, expiry: Optional[str] = None) -> Optional[OptionChainResponse]:
+    @traced()
+    def get_iv_surface(symbol: str, smoothed: bool = False) -> Optional[IVSurfaceResponse]:
         """
-        Get full option chain (calls and puts) for a symbol
+        Implied volatility surface: every expiry x moneyness (strike / spot)
 
         Args:
             symbol: Stock ticker symbol
-            expiry: Option expiry date. If None, uses nearest expiry.
+            smoothed: Apply 1-2-1 smoothing along moneyness
 
         Returns:
-            OptionChainResponse with calls and puts data
+            IVSurfaceResponse with the grid as nested lists (None = not quoted)
         """
         try:
-            ticker = yf.Ticker(symbol)
-            current_price = ticker.history(period='1d')['Close'].iloc[-1]
+            surface = OptionService._get_surface(symbol)
 
-            if not ticker.options:
+            if not surface:
                 return None
 
-            if not expiry:
-                expiry = ticker.options[0]
-
-            option_chain = ticker.option_chain(expiry)
-
-            # Convert calls to OptionData list
-            calls_data = [
-                OptionData(
-                    strike=float(row['strike']),
-                    last_price=float(row['lastPrice']) if pd.notna(row['lastPrice']) else None,
-                    bid=float(row['bid']) if pd.notna(row['bid']) else None,
-                    ask=float(row['ask']) if pd.notna(row['ask']) else None,
-                    volume=int(row['volume']) if pd.notna(row['volume']) else None,
-                    open_interest=int(row['openInterest']) if pd.notna(row['openInterest']) else None,
-                    implied_volatility=float(row['impliedVolatility']) if pd.notna(row['impliedVolatility']) else None
-                )
-                for _, row in option_chain.calls.iterrows()
-            ]
-
-            # Convert puts to OptionData list
-            puts_data = [
-                OptionData(
-                    strike=float(row['strike']),
-                    last_price=float(row['lastPrice']) if pd.notna(row['lastPrice']) else None,
-                    bid=float(row['bid']) if pd.notna(row['bid']) else None,
-                    ask=float(row['ask']) if pd.notna(row['ask']) else None,
-                    volume=int(row['volume']) if pd.notna(row['volume']) else None,
-                    open_interest=int(row['openInterest']) if pd.notna(row['openInterest']) else None,
-                    implied_volatility=float(row['impliedVolatility']) if pd.notna(row['impliedVolatility']) else None
-                )
-                for _, row in option_chain.puts.iterrows()
-            ]
+            iv = volatility_surface.smooth(surface.iv) if smoothed else surface.iv
+            return IVSurfaceResponse(
+                symbol=symbol.upper(),
+                current_price=round(surface.spot, 2),
+                smoothed=smoothed,
+                moneyness=surface.grid.tolist(),
+                expiry_dates=list(surface.expiries),
+                days_to_expiry=OptionService._days(surface.years),
+                iv=OptionService._iv_values(iv)
+            )
+        except Exception as e:
+            raise Exception(f"Error building IV surface: {str(e)}")
 
-            return OptionChainResponse(
+    @staticmethod
+    @traced()
+    def get_iv_skew(symbol: str, days: float, smoothed: bool = False) -> Optional[IVSkewResponse]:
+        """
+        IV across moneyness at a tenor of `days`, from the cached surface
+
+        Returns:
+            IVSkewResponse; put_call_skew is the IV at 0.9 minus the IV at 1.1
+        """
+        try:
+            surface = OptionService._get_surface(symbol)
+
+            if not surface:
+                return None
+
+            iv = volatility_surface.smooth(surface.iv) if smoothed else surface.iv
+            smile = volatility_surface.skew(iv, surface.years, days / option_pricing.DAYS_PER_YEAR)
+            put_wing, call_wing = np.interp([0.9, 1.1], surface.grid, smile)
+
+            return IVSkewResponse(
                 symbol=symbol.upper(),
-                expiry_date=expiry,
-                current_price=round(current_price, 2),
-                calls=calls_data,
-                puts=puts_data
+                current_price=round(surface.spot, 2),
+                days_to_expiry=days,
+                smoothed=smoothed,
+                moneyness=surface.grid.tolist(),
+                iv=OptionService._iv_values(smile),
+                put_call_skew=OptionService._iv_values(np.array([put_wing - call_wing]))[0]
             )
         except Exception as e:
-            raise Exception(f"Error fetching option chain: {str(e)}")
+            raise Exception(f"Error calculating IV skew: {str(e)}")
+
+    @staticmethod
+    @traced()
+    def get_iv_term_structure(
+        symbol: str, moneyness: float = 1.0, smoothed: bool = False
+    ) -> Optional[IVTermStructureResponse]:
+        """
+        IV of every expiry at one moneyness level, from the cached surface
+
+        Returns:
+            IVTermStructureResponse (moneyness 1.0 = ATM term structure)
+        """
+        try:
+            surface = OptionService._get_surface(symbol)
+
+            if not surface:
+                return None
+
+            iv = volatility_surface.smooth(surface.iv) if smoothed else surface.iv
+            return IVTermStructureResponse(
+                symbol=symbol.upper(),
+                current_price=round(surface.spot, 2),
+                moneyness=moneyness,
+                smoothed=smoothed,
+                expiry_dates=list(surface.expiries),
+                days_to_expiry=OptionService._days(surface.years),
+                iv=OptionService._iv_values(volatility_surface.term_structure(iv, surface.grid, moneyness))
+            )
+        except Exception as e:
+            raise Exception(f"Error calculating IV term structure: {str(e)}")
+
+    @staticmethod
+    def _get_surface(symbol: str) -> Optional[IVSurface]:
+        """
+        IV surface of a symbol (cached for IV_SURFACE_CACHE_TTL_SECONDS)
+
+        Built from the out-of-the-money contracts of all expiries, fetched
+        concurrently; every expiry's smile is interpolated onto the moneyness
+        grid in one vectorized pass.
+        """
+        def build() -> Optional[IVSurface]:
+            expiries = OptionService._get_expiries(symbol)
+
+            if not expiries:
+                return None
+
+            spot = OptionService._get_spot(symbol)
+            frames = []
+            for row, (expiry, calls, puts) in enumerate(OptionService._get_chains(symbol, expiries)):
+                for frame, is_call in ((calls, True), (puts, False)):
+                    if not frame.empty:
+                        frames.append(frame[['strike', 'impliedVolatility']].assign(row=row, isCall=is_call))
+
+            if not frames:
+                return None
+
+            contracts = pd.concat(frames, ignore_index=True)
+            iv = contracts['impliedVolatility'].to_numpy(dtype=float)
+            usable, moneyness = volatility_surface.otm_contracts(
+                contracts['strike'].to_numpy(dtype=float), iv, contracts['isCall'].to_numpy(dtype=bool), spot
+            )
+            grid = volatility_surface.moneyness_grid()
+
+            return IVSurface(
+                spot=spot,
+                expiries=tuple(expiries),
+                years=np.array([option_pricing.years_to_expiry(expiry) for expiry in expiries]),
+                grid=grid,
+                iv=volatility_surface.surface_grid(
+                    contracts['row'].to_numpy()[usable], moneyness[usable], iv[usable], len(expiries), grid
+                )
+            )
+
+        return _surface_cache.get_or_set(symbol.upper(), build)
+
+    @staticmethod
+    def _days(years: np.ndarray) -> List[float]:
+        return np.round(years * option_pricing.DAYS_PER_YEAR, 2).tolist()
+
+    @staticmethod
+    def _iv_values(values: np.ndarray) -> Any:
+        """Rounded IVs with NaN -> None (same shape, as lists)"""
+        rounded = np.round(values, 4).astype(object)
+        rounded[~np.isfinite(values)] = None
+        return rounded.tolist()
+
+    @staticmethod
+    def _projected_rows(
+        frame: pd.DataFrame, greeks: Optional[pd.DataFrame], fields: Tuple[str, ...]
+    ) -> List[Dict[str, Any]]:
+        """Contract rows with only the requested fields, built column-wise; NaN -> None"""
+        if greeks is not None:
+            greeks = greeks.round(_GREEK_DECIMALS)
+            greeks[list(_GREEK_DECIMALS)] += 0.0  # -0.0 from rounding -> 0.0
+            frame = frame.reset_index(drop=True).drop(columns='impliedVolatility').join(greeks)
+
+        columns = {**CHAIN_FIELDS, **GREEK_FIELDS}
+        values = {}
+        for name in fields:
+            column = frame[columns[name]]
+            if name in _INT_FIELDS:
+                column = pd.to_numeric(column).round().astype('Int64')
+            values[name] = column.astype(object).where(column.notna(), None).tolist()
+
+        return [dict(zip(fields, row)) for row in zip(*(values[name] for name in fields))]
+
+    @staticmethod
+    def _option_rows(frame: pd.DataFrame, greeks: Optional[pd.DataFrame] = None) -> List[OptionData]:
+        """Chain rows as OptionData (OptionGreeksData when greeks are given); NaN -> None"""
+        columns = ['strike', 'lastPrice', 'bid', 'ask', 'volume', 'openInterest', 'impliedVolatility']
+        values = frame[columns].reset_index(drop=True)
+        if greeks is not None:
+            greeks = greeks.round(_GREEK_DECIMALS)
+            greeks[list(_GREEK_DECIMALS)] += 0.0  # -0.0 from rounding -> 0.0
+            values = values.drop(columns='impliedVolatility').join(greeks)
+        records = values.astype(object).where(values.notna(), None).to_dict('records')
+
+        def to_int(value):
+            return int(value) if value is not None else None
+
+        def to_float(value):
+            return float(value) if value is not None else None
+
+        base = [
+            dict(
+                strike=float(row['strike']),
+                last_price=to_float(row['lastPrice']),
+                bid=to_float(row['bid']),
+                ask=to_float(row['ask']),
+                volume=to_int(row['volume']),
+                open_interest=to_int(row['openInterest']),
+                implied_volatility=to_float(row['impliedVolatility'])
+            )
+            for row in records
+        ]
+        if greeks is None:
+            return [OptionData(**row) for row in base]
+
+        return [
+            OptionGreeksData(
+                **row,
+                iv_solved=bool(record['ivSolved']),
+                delta=to_float(record['delta']),
+                gamma=to_float(record['gamma']),
+                theta=to_float(record['theta']),
+                vega=to_float(record['vega']),
+                rho=to_float(record['rho'])
+            )
+            for row, record in zip(base, records)
+        ]
+
+    @staticmethod
+    @traced()
+    def analyze_expiries(symbol: str) -> List[Tuple[MaxPainResponse, PCRResponse, IVResponse]]:
+        """
+        Max pain, PCR and ATM IV of every expiry (scheduled jobs)
+
+        Chains are loaded fresh rather than served stale, and re-cached for
+        requests. Expiries without calls or puts are skipped.
+        """
+        current_price = OptionService._get_spot(symbol, refresh=True)
+        results = []
+
+        for expiry in OptionService._get_expiries(symbol, refresh=True):
+            calls, puts = OptionService._get_chain(symbol, expiry, refresh=True)
+            if calls.empty or puts.empty:
+                continue
+
+            results.append((
+                OptionService.max_pain_from_chain(symbol, expiry, current_price, calls, puts),
+                OptionService.pcr_from_chain(symbol, expiry, calls, puts),
+                OptionService.iv_from_chain(symbol, expiry, current_price, calls, puts)
+            ))
+
+        return results
+
+    @staticmethod
+    def max_pain_from_chain(
+        symbol: str, expiry: str, current_price: float, calls: pd.DataFrame, puts: pd.DataFrame
+    ) -> MaxPainResponse:
+        """Max pain of one expiry's chain (shared by live requests and snapshots)"""
+        # Calculate total open interest per strike
+        strikes = pd.concat(
+            [calls[['strike', 'openInterest']], puts[['strike', 'openInterest']]],
+            keys=['call', 'put']
+        )
+        strike_oi = strikes.groupby('strike')['openInterest'].sum().sort_values(ascending=False)
+
+        # Get top 5 strikes
+        top_strikes = [
+            {"strike": float(strike), "open_interest": int(oi)}
+            for strike, oi in strike_oi.head(5).items()
+        ]
+
+        # Max pain is the strike with highest open interest
+        max_pain_price = float(strike_oi.idxmax())
+        price_diff_percent = ((max_pain_price / current_price - 1) * 100)
+
+        return MaxPainResponse(
+            symbol=symbol.upper(),
+            expiry_date=expiry,
+            current_price=round(current_price, 2),
+            max_pain_price=round(max_pain_price, 2),
+            price_difference_percent=round(price_diff_percent, 2),
+            top_strikes=top_strikes
+        )
+
+    @staticmethod
+    def pcr_from_chain(symbol: str, expiry: str, calls: pd.DataFrame, puts: pd.DataFrame) -> PCRResponse:
+        """Put-call ratio of one expiry's chain"""
+        total_call_oi = int(calls['openInterest'].sum())
+        total_put_oi = int(puts['openInterest'].sum())
+        pcr = total_put_oi / total_call_oi if total_call_oi > 0 else 0
+
+        return PCRResponse(
+            symbol=symbol.upper(),
+            expiry_date=expiry,
+            total_call_open_interest=total_call_oi,
+            total_put_open_interest=total_put_oi,
+            put_call_ratio=round(pcr, 2),
+            interpretation=OptionService.pcr_interpretation(pcr)
+        )
+
+    @staticmethod
+    def iv_from_chain(
+        symbol: str, expiry: str, current_price: float, calls: pd.DataFrame, puts: pd.DataFrame
+    ) -> IVResponse:
+        """ATM implied volatility of one expiry's chain"""
+        # Find ATM options (closest to current price)
+        # NOTE: Cached frames are shared, so no helper columns are added
+        atm_call = calls.loc[(calls['strike'] - current_price).abs().idxmin()]
+        atm_put = puts.loc[(puts['strike'] - current_price).abs().idxmin()]
+
+        atm_strike = float(atm_call['strike'])
+        atm_call_iv = float(atm_call['impliedVolatility'])
+        atm_put_iv = float(atm_put['impliedVolatility'])
+        avg_iv = (atm_call_iv + atm_put_iv) / 2
+
+        return IVResponse(
+            symbol=symbol.upper(),
+            expiry_date=expiry,
+            current_price=round(current_price, 2),
+            atm_strike=round(atm_strike, 2),
+            atm_call_iv=round(atm_call_iv, 4),
+            atm_put_iv=round(atm_put_iv, 4),
+            average_iv=round(avg_iv, 4),
+            interpretation=OptionService.iv_interpretation(avg_iv)
+        )
+
+    @staticmethod
+    def pcr_interpretation(pcr: float) -> str:
+        if pcr > 1:
+            return "Bearish"
+        if pcr < 0.7:
+            return "Bullish"
+        return "Neutral"
+
+    @staticmethod
+    def iv_interpretation(avg_iv: float) -> str:
+        if avg_iv > 0.30:
+            return "High volatility expected"
+        if avg_iv < 0.15:
+            return "Low volatility expected"
+        return "Moderate volatility expected"
+
+    @staticmethod
+    def _get_expiries(symbol: str, refresh: bool = False) -> Tuple[str, ...]:
+        """Available expiry dates (cached)"""
+        def load() -> Tuple[str, ...]:
+            provider = get_provider()
+            with upstream_call("options", provider.name):
+                return tuple(provider.expiries(symbol))
+
+        return OptionService._cached(("expiries", symbol.upper()), load, refresh)
+
+    @staticmethod
+    def _get_spot(symbol: str, refresh: bool = False) -> float:
+        """Latest close of the underlying (cached)"""
+        def load() -> float:
+            provider = get_provider()
+            with upstream_call("history", provider.name):
+                return float(provider.history(symbol, period='1d')['Close'].iloc[-1])
+
+        return OptionService._cached(("spot", symbol.upper()), load, refresh)
+
+    @staticmethod
+    def _get_chain(symbol: str, expiry: str, refresh: bool = False) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Calls and puts of one expiry (cached)
+
+        The frames are shared between requests: callers must not modify them.
+        """
+        def load() -> Tuple[pd.DataFrame, pd.DataFrame]:
+            provider = get_provider()
+            with upstream_call("option_chain", provider.name):
+                return provider.option_chain(symbol, expiry)
+
+        return OptionService._cached(("chain", symbol.upper(), expiry), load, refresh)
+
+    @staticmethod
+    def _get_chains(symbol: str, expiries: Tuple[str, ...]) -> List[Tuple[str, pd.DataFrame, pd.DataFrame]]:
+        """
+        (expiry, calls, puts) of several expiries, fetched concurrently
+
+        Each fetch goes through the chain cache (single flight per expiry), so
+        loading N uncached expiries takes about as long as the slowest one.
+        Fetches run in a copy of the caller's context to stay in its trace.
+        """
+        executor = _chain_fetch_executor()
+        futures = [
+            executor.submit(contextvars.copy_context().run, OptionService._get_chain, symbol, expiry)
+            for expiry in expiries
+        ]
+        return [(expiry, *future.result()) for expiry, future in zip(expiries, futures)]
+
+    @staticmethod
+    def _cached(key: Tuple, load: Callable[[], Any], refresh: bool) -> Any:
+        """
+        Cached upstream value; refresh=True loads it now and re-caches it
+
+        Scheduled snapshots refresh so they never record a stale chain, and
+        warm the cache for requests at the same time.
+        """
+        if refresh:
+            value = load()
+            _chain_cache.set(key, value)
+            return value
+
+        return _chain_cache.get_or_set(key, load)
+
+    @staticmethod
+    def _resolve_expiry(symbol: str, expiry: Optional[str]) -> Optional[str]:
+        """Requested expiry, or the nearest one; None if the symbol has no options"""
+        expiries = OptionService._get_expiries(symbol)
+
+        if not expiries:
+            return None
+
+        return expiry or expiries[0]
+
+
+def _chain_fetch_executor() -> ThreadPoolExecutor:
+    """Chain fetch threads (OPTION_CHAIN_FETCH_WORKERS)"""
+    global _fetch_executor
+
+    if _fetch_executor is None:
+        with _fetch_executor_lock:
+            if _fetch_executor is None:
+                _fetch_executor = ThreadPoolExecutor(
+                    max_workers=settings.OPTION_CHAIN_FETCH_WORKERS, thread_name_prefix="option-chain"
+                )
+    return _fetch_executor
@@ -0,0 +1,186 @@
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from models import OptionSnapshot
+from schemas.option import MaxPainResponse, PCRResponse, IVResponse
+from services.option_service import OptionService
+from database import SessionLocal
+from core.scheduler import PeriodicJob
+from core.tracing import traced
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def snapshot_symbols() -> List[str]:
+    """Symbol universe of the snapshot job (OPTION_SNAPSHOT_SYMBOLS)"""
+    return [s.strip().upper() for s in settings.OPTION_SNAPSHOT_SYMBOLS.split(",") if s.strip()]
+
+
+def snapshot_job() -> PeriodicJob:
+    """Job capturing the universe every OPTION_SNAPSHOT_INTERVAL_MINUTES (started by main.py)"""
+    def run() -> None:
+        db = SessionLocal()
+        try:
+            stored = OptionSnapshotService.capture_all(db)
+            logger.info("Stored %d option snapshots", stored)
+        finally:
+            db.close()
+
+    return PeriodicJob("option-snapshots", settings.OPTION_SNAPSHOT_INTERVAL_MINUTES * 60, run)
+
+
+class OptionSnapshotService:
+    """
+    Precomputed option analytics
+
+    A scheduled job (see main.py) captures max pain, PCR and ATM IV of every
+    expiry of the configured symbols. The /option/* endpoints read the
+    latest capture instead of recomputing from the chain; symbols outside
+    the universe, or whose latest capture is too old, are computed live.
+    """
+
+    @staticmethod
+    def capture_all(db: Session) -> int:
+        """
+        Capture snapshots of the whole universe (one commit per symbol)
+
+        Returns:
+            Number of stored rows
+        """
+        stored = 0
+        for symbol in snapshot_symbols():
+            try:
+                stored += OptionSnapshotService.capture(db, symbol)
+            except Exception:
+                # One failing symbol must not stop the others
+                db.rollback()
+                logger.exception("Option snapshot of %s failed", symbol)
+        return stored
+
+    @staticmethod
+    @traced()
+    def capture(db: Session, symbol: str) -> int:
+        """
+        Compute and store the analytics of every expiry of a symbol
+
+        Returns:
+            Number of stored rows (expiries)
+        """
+        symbol = symbol.upper()
+        captured_at = datetime.now(timezone.utc)
+        rows = [
+            OptionSnapshot(
+                symbol=symbol,
+                expiry_date=max_pain.expiry_date,
+                captured_at=captured_at,
+                current_price=max_pain.current_price,
+                max_pain_price=max_pain.max_pain_price,
+                price_difference_percent=max_pain.price_difference_percent,
+                top_strikes=json.dumps(max_pain.top_strikes),
+                total_call_open_interest=pcr.total_call_open_interest,
+                total_put_open_interest=pcr.total_put_open_interest,
+                put_call_ratio=pcr.put_call_ratio,
+                atm_strike=iv.atm_strike,
+                atm_call_iv=iv.atm_call_iv,
+                atm_put_iv=iv.atm_put_iv,
+                average_iv=iv.average_iv
+            )
+            for max_pain, pcr, iv in OptionService.analyze_expiries(symbol)
+        ]
+
+        db.add_all(rows)
+        db.commit()
+        return len(rows)
+
+    @staticmethod
+    @traced()
+    def latest(symbol: str, expiry: Optional[str] = None) -> Optional[OptionSnapshot]:
+        """
+        Latest snapshot of a symbol's expiry (nearest expiry if None)
+
+        Only symbols of the universe are looked up, in a short session of
+        their own: other symbols (and apps without snapshots) never touch
+        the database.
+
+        Returns:
+            OptionSnapshot, or None if the symbol is not in the universe or
+            has no capture younger than OPTION_SNAPSHOT_MAX_AGE_SECONDS
+        """
+        symbol = symbol.upper()
+        if symbol not in snapshot_symbols():
+            return None
+
+        since = datetime.now(timezone.utc) - timedelta(seconds=settings.OPTION_SNAPSHOT_MAX_AGE_SECONDS)
+        db = SessionLocal()
+        try:
+            query = db.query(OptionSnapshot).filter(
+                OptionSnapshot.symbol == symbol,
+                OptionSnapshot.captured_at >= since
+            )
+            if expiry:
+                query = query.filter(OptionSnapshot.expiry_date == expiry)
+
+            # Latest capture first; within it, the nearest expiry
+            return query.order_by(OptionSnapshot.captured_at.desc(), OptionSnapshot.expiry_date).first()
+        except SQLAlchemyError as e:
+            # Snapshots are an optimization: fall back to live computation
+            logger.warning("Option snapshot lookup for %s failed: %s", symbol, e)
+            return None
+        finally:
+            db.close()
+
+    @staticmethod
+    def get_max_pain(symbol: str, expiry: Optional[str] = None) -> Optional[MaxPainResponse]:
+        snapshot = OptionSnapshotService.latest(symbol, expiry)
+        if not snapshot:
+            return None
+
+        return MaxPainResponse(
+            symbol=snapshot.symbol,
+            expiry_date=snapshot.expiry_date,
+            current_price=snapshot.current_price,
+            max_pain_price=snapshot.max_pain_price,
+            price_difference_percent=snapshot.price_difference_percent,
+            top_strikes=json.loads(snapshot.top_strikes),
+            snapshot_at=snapshot.captured_at
+        )
+
+    @staticmethod
+    def get_pcr(symbol: str, expiry: Optional[str] = None) -> Optional[PCRResponse]:
+        snapshot = OptionSnapshotService.latest(symbol, expiry)
+        if not snapshot:
+            return None
+
+        return PCRResponse(
+            symbol=snapshot.symbol,
+            expiry_date=snapshot.expiry_date,
+            total_call_open_interest=snapshot.total_call_open_interest,
+            total_put_open_interest=snapshot.total_put_open_interest,
+            put_call_ratio=snapshot.put_call_ratio,
+            interpretation=OptionService.pcr_interpretation(snapshot.put_call_ratio),
+            snapshot_at=snapshot.captured_at
+        )
+
+    @staticmethod
+    def get_iv(symbol: str, expiry: Optional[str] = None) -> Optional[IVResponse]:
+        snapshot = OptionSnapshotService.latest(symbol, expiry)
+        if not snapshot:
+            return None
+
+        return IVResponse(
+            symbol=snapshot.symbol,
+            expiry_date=snapshot.expiry_date,
+            current_price=snapshot.current_price,
+            atm_strike=snapshot.atm_strike,
+            atm_call_iv=snapshot.atm_call_iv,
+            atm_put_iv=snapshot.atm_put_iv,
+            average_iv=snapshot.average_iv,
+            interpretation=OptionService.iv_interpretation(snapshot.average_iv),
+            snapshot_at=snapshot.captured_at
+        )
@@ -1,9 +1,29 @@
+from __future__ import annotations
+
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from models import Portfolio
-from schemas.portfolio import PortfolioCreate, PortfolioUpdate, PortfolioWithProfit
+from models import Portfolio, PortfolioHistory
+from models.transaction import Transaction, TransactionType
+from schemas.portfolio import (
+    PortfolioCreate, PortfolioUpdate, PortfolioWithProfit, PortfolioStats,
+    PortfolioHistoryPoint, PortfolioHistoryResponse
+)
 from services.stock_service import StockService
+from services.transaction_service import TransactionService
+from services.analytics import portfolio_risk, period_start, replay_ledger
+from core.cache import TTLCache
+from core.lazy import lazy_import
+from core.tracing import traced
+from config import settings
 from typing import List, Optional
 
+pd = lazy_import("pandas")
+
+# Computed statistics keyed by (holdings, latest bar and its closes, parameters).
+# A new transaction, a new daily bar or an intraday move of the latest close changes
+# the key, so stale entries simply age out.
+_stats_cache = TTLCache(ttl=24 * 60 * 60, maxsize=128, name="portfolio_stats")
+
 
 class PortfolioService:
     """
@@ -82,6 +102,7 @@ class PortfolioService:
         return True
 
     @staticmethod
+    @traced()
     def get_portfolio_with_profit(db: Session, portfolio_id: int) -> Optional[PortfolioWithProfit]:
         """Get portfolio with current price and profit/loss calculation"""
         db_portfolio = db.query(Portfolio).filter(Portfolio.id == portfolio_id).first()
@@ -114,6 +135,7 @@ class PortfolioService:
         )
 
     @staticmethod
+    @traced()
     def get_all_portfolios_with_profit(db: Session) -> List[PortfolioWithProfit]:
         """Get all portfolios with profit/loss calculation"""
         portfolios = db.query(Portfolio).all()
@@ -145,3 +167,211 @@ class PortfolioService:
             ))
 
         return result
+
+    @staticmethod
+    @traced()
+    def get_portfolio_stats(
+        db: Session,
+        period: str = "1y",
+        benchmark: Optional[str] = None,
+        risk_free_rate: Optional[float] = None,
+        confidence: float = 0.95
+    ) -> Optional[PortfolioStats]:
+        """
+        Calculate portfolio risk statistics (volatility, beta, Sharpe, drawdown, VaR)
+
+        Close prices for all holdings and the benchmark come from one cached
+        batched download. Results are cached until holdings, the latest bar or
+        its closes (intraday) change.
+
+        Args:
+            db: Database session
+            period: Lookback period for returns (3mo, 6mo, 1y, 2y, 5y)
+            benchmark: Benchmark symbol for beta (defaults to BENCHMARK_SYMBOL)
+            risk_free_rate: Annual risk-free rate (defaults to RISK_FREE_RATE)
+            confidence: VaR confidence level
+
+        Returns:
+            PortfolioStats or None if there are no priced holdings
+        """
+        benchmark = (benchmark or settings.BENCHMARK_SYMBOL).upper()
+        risk_free_rate = settings.RISK_FREE_RATE if risk_free_rate is None else risk_free_rate
+
+        holdings = db.query(Portfolio.symbol, Portfolio.quantity).filter(Portfolio.quantity > 0).all()
+        if not holdings:
+            return None
+
+        quantities = pd.Series({h.symbol: h.quantity for h in holdings}, dtype=float)
+        symbols = sorted(quantities.index)
+
+        closes = StockService.get_close_prices(symbols + [benchmark], period)
+        if closes.empty:
+            return None
+
+        # Duplicate columns appear when the benchmark is also a holding
+        closes = closes.loc[:, ~closes.columns.duplicated()]
+        benchmark_closes = closes[benchmark]
+        holding_closes = closes[symbols].dropna(axis=1, how='all')
+        missing = [s for s in symbols if s not in holding_closes.columns]
+
+        if holding_closes.empty or benchmark_closes.dropna().empty:
+            return None
+
+        # The latest bar is live during the session: its closes are part of the key
+        last_bar = closes.index[-1]
+        last_closes = tuple(
+            (column, None if pd.isna(close) else float(close)) for column, close in closes.iloc[-1].items()
+        )
+        cache_key = (
+            tuple(quantities.sort_index().items()), last_bar, last_closes,
+            period, benchmark, risk_free_rate, confidence
+        )
+
+        def compute() -> Optional[PortfolioStats]:
+            stats = portfolio_risk(
+                holding_closes, quantities, benchmark_closes,
+                risk_free_rate=risk_free_rate, confidence=confidence
+            )
+            if stats["observations"] < 2:
+                return None
+
+            return PortfolioStats(
+                period=period,
+                benchmark=benchmark,
+                var_confidence=confidence,
+                missing_symbols=missing,
+                **stats
+            )
+
+        return _stats_cache.get_or_set(cache_key, compute)
+
+    @staticmethod
+    @traced()
+    def get_portfolio_history(db: Session, period: str = "1y") -> Optional[PortfolioHistoryResponse]:
+        """
+        Get the daily portfolio equity curve replayed from the transaction ledger
+
+        Closed trading days are materialized in portfolio_history. Each call only
+        computes the days after the last materialized row; the whole curve is
+        rebuilt when the ledger version changes (transaction added or deleted).
+        Today's bar is computed live and never stored.
+
+        Args:
+            db: Database session
+            period: Time period (1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
+
+        Returns:
+            PortfolioHistoryResponse or None if there are no transactions
+        """
+        today = pd.Timestamp.now().normalize()
+        window_start = period_start(period, today)
+
+        transactions = (
+            db.query(Transaction)
+            .order_by(Transaction.transaction_date, Transaction.id)
+            .all()
+        )
+        if not transactions:
+            return None
+
+        ledger = pd.DataFrame({
+            "date": [PortfolioService._to_day(t.transaction_date) for t in transactions],
+            "symbol": [t.symbol for t in transactions],
+            "quantity": [
+                t.quantity if t.transaction_type == TransactionType.BUY else -t.quantity
+                for t in transactions
+            ],
+            "price": [float(t.price) for t in transactions],
+        })
+        version = TransactionService.get_ledger_version(db)
+
+        rows = db.query(PortfolioHistory).order_by(PortfolioHistory.history_date).all()
+        if rows and rows[-1].ledger_version != version:
+            db.query(PortfolioHistory).delete()
+            db.commit()
+            rows = []
+
+        last_materialized = pd.Timestamp(rows[-1].history_date) if rows else None
+        fetch_start = last_materialized if rows else ledger["date"].min()
+
+        symbols = sorted(ledger["symbol"].unique())
+        closes = StockService.get_close_prices(symbols, start=fetch_start.strftime("%Y-%m-%d"))
+        closes = closes.dropna(axis=1, how='all')
+        missing = [s for s in symbols if s not in closes.columns]
+
+        points = [PortfolioService._history_point(r.history_date, r) for r in rows]
+
+        if not closes.empty:
+            curve = replay_ledger(ledger[ledger["symbol"].isin(closes.columns)], closes)
+            if last_materialized is not None:
+                curve = curve[curve.index > last_materialized]
+
+            closed = curve[curve.index < today]
+            PortfolioService._materialize_history(db, closed, version)
+
+            points.extend(
+                PortfolioService._history_point(date, row)
+                for date, row in zip(curve.index, curve.itertuples())
+            )
+
+        if window_start is not None:
+            window_start_str = window_start.strftime("%Y-%m-%d")
+            points = [p for p in points if p.date >= window_start_str]
+
+        if not points:
+            return None
+
+        return PortfolioHistoryResponse(
+            period=period,
+            start_date=points[0].date,
+            end_date=points[-1].date,
+            data=points,
+            missing_symbols=missing
+        )
+
+    @staticmethod
+    def _materialize_history(db: Session, curve: pd.DataFrame, version: str) -> None:
+        """Bulk insert closed trading days into portfolio_history"""
+        if curve.empty:
+            return
+
+        db.add_all([
+            PortfolioHistory(
+                history_date=date.date(),
+                market_value=round(row.market_value, 2),
+                cost_basis=round(row.cost_basis, 2),
+                realized_pnl=round(row.realized_pnl, 2),
+                unrealized_pnl=round(row.unrealized_pnl, 2),
+                ledger_version=version
+            )
+            for date, row in zip(curve.index, curve.itertuples())
+        ])
+
+        try:
+            db.commit()
+        except IntegrityError:
+            # Another request materialized the same days concurrently
+            db.rollback()
+
+    @staticmethod
+    def _history_point(date, row) -> PortfolioHistoryPoint:
+        """Convert a materialized row or a computed curve row into a response point"""
+        realized = float(row.realized_pnl)
+        unrealized = float(row.unrealized_pnl)
+
+        return PortfolioHistoryPoint(
+            date=date.strftime("%Y-%m-%d"),
+            market_value=round(float(row.market_value), 2),
+            cost_basis=round(float(row.cost_basis), 2),
+            realized_pnl=round(realized, 2),
+            unrealized_pnl=round(unrealized, 2),
+            total_pnl=round(realized + unrealized, 2)
+        )
+
+    @staticmethod
+    def _to_day(value) -> pd.Timestamp:
+        """Naive, normalized day for a (possibly timezone-aware) datetime"""
+        timestamp = pd.Timestamp(value)
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.tz_convert(None)
+        return timestamp.normalize()
@@ -0,0 +1,113 @@
+"""
+News sentiment scorers (뉴스 감정 분석)
+
+Scores follow the contract sketched in test_news_sentiment.py:
+    score 0.0 (very negative) ~ 1.0 (very positive), 0.5 = neutral
+
+A scorer only needs score_batch(); an LLM-backed scorer can be plugged in
+through the SENTIMENT_SCORER setting ("package.module:ClassName").
+"""
+import importlib
+import re
+from abc import ABC, abstractmethod
+from typing import List, NamedTuple, Optional
+
+
+class SentimentResult(NamedTuple):
+    """Sentiment of one article"""
+    score: float  # 0.0 ~ 1.0
+    label: str    # POSITIVE, NEGATIVE, NEUTRAL
+
+
+def label_for(score: float) -> str:
+    """Sentiment label for a 0.0 ~ 1.0 score"""
+    if score > 0.55:
+        return "POSITIVE"
+    if score < 0.45:
+        return "NEGATIVE"
+    return "NEUTRAL"
+
+
+class SentimentScorer(ABC):
+    """
+    Sentiment scorer interface
+    Similar to a Strategy interface injected as a Spring bean
+    """
+
+    name: str = "base"
+
+    @abstractmethod
+    def score_batch(self, texts: List[str]) -> List[SentimentResult]:
+        """Score many texts at once (one call per ingestion batch)"""
+
+
+class LexiconSentimentScorer(SentimentScorer):
+    """
+    Keyword lexicon scorer (offline default)
+
+    Counts positive/negative words; a negation word right before a keyword
+    flips it ("not profitable" counts as negative).
+    """
+
+    name = "lexicon"
+
+    POSITIVE = frozenset({
+        "surge", "surges", "soar", "soars", "gain", "gains", "rally", "rallies", "jump", "jumps",
+        "record", "high", "beat", "beats", "growth", "grow", "grows", "profit", "profitable",
+        "success", "upgrade", "upgraded", "outperform", "bullish", "strong", "raise", "raises",
+        "expand", "expands", "approval", "approved", "win", "wins", "boost", "boosts", "rebound",
+    })
+    NEGATIVE = frozenset({
+        "down", "drop", "drops", "fall", "falls", "plunge", "plunges", "slump", "loss", "losses",
+        "decline", "declines", "lawsuit", "sue", "sued", "fine", "fined", "cut", "cuts", "layoff",
+        "layoffs", "miss", "misses", "downgrade", "downgraded", "underperform", "bearish", "weak",
+        "recall", "probe", "investigation", "warning", "warns", "bankruptcy", "fraud", "crash",
+    })
+    NEGATIONS = frozenset({"not", "no", "never", "without", "isn't", "wasn't", "don't", "doesn't"})
+
+    _token = re.compile(r"[a-z']+")
+
+    def score_batch(self, texts: List[str]) -> List[SentimentResult]:
+        return [self._score(text) for text in texts]
+
+    def _score(self, text: str) -> SentimentResult:
+        positive = negative = 0
+        negate = False
+
+        for token in self._token.findall((text or "").lower()):
+            if token in self.NEGATIONS:
+                negate = True
+                continue
+
+            if token in self.POSITIVE:
+                negative, positive = (negative + 1, positive) if negate else (negative, positive + 1)
+            elif token in self.NEGATIVE:
+                positive, negative = (positive + 1, negative) if negate else (positive, negative + 1)
+            negate = False
+
+        total = positive + negative
+        score = 0.5 + 0.5 * (positive - negative) / total if total else 0.5
+        return SentimentResult(round(score, 4), label_for(score))
+
+
+_scorer: Optional[SentimentScorer] = None
+
+
+def get_scorer(spec: str = "lexicon") -> SentimentScorer:
+    """
+    Scorer singleton
+
+    Args:
+        spec: "lexicon" or "package.module:ClassName" of a SentimentScorer subclass
+    """
+    global _scorer
+
+    if _scorer is None:
+        if spec == "lexicon":
+            _scorer = LexiconSentimentScorer()
+        else:
+            module_name, _, class_name = spec.partition(":")
+            scorer_class = getattr(importlib.import_module(module_name), class_name)
+            _scorer = scorer_class()
+
+    return _scorer
@@ -1,6 +1,29 @@
-import yfinance as yf
-from typing import Dict, List, Optional
-from schemas.stock import StockInfo
+from __future__ import annotations
+
+import logging
+from typing import Callable, Dict, List, Optional
+from schemas.stock import StockInfo, StockComparison, StockQuote
+from services.analytics import align_closes, compare_closes
+from services.market_data import get_provider
+from core.cache import TTLCache
+from core.lazy import lazy_import
+from core.metrics import upstream_call
+from core.tracing import traced
+from config import settings
+
+pd = lazy_import("pandas")
+logger = logging.getLogger(__name__)
+
+# Close-price matrices keyed by (symbols, period), shared by comparison and portfolio analytics
+_close_cache = TTLCache(ttl=settings.HISTORY_CACHE_TTL_SECONDS, maxsize=256, name="close_prices")
+
+# Quote feed: latest quote per symbol, shared by alerts, watchlists, etc.
+# Expired quotes are served while a background refresh fetches new ones
+_quote_cache = TTLCache(
+    ttl=settings.QUOTE_CACHE_TTL_SECONDS, maxsize=8192, name="quotes",
+    max_stale=settings.QUOTE_CACHE_MAX_STALE_SECONDS
+)
+_quote_listeners: List[Callable[[Dict[str, StockQuote]], None]] = []
 
 
 class StockService:
@@ -10,6 +33,7 @@ class StockService:
     """
 
     @staticmethod
+    @traced()
     def get_stock_info(symbol: str) -> Optional[StockInfo]:
         """
         Fetch real-time stock information for a given symbol
@@ -21,8 +45,9 @@ class StockService:
             StockInfo object or None if not found
         """
         try:
-            stock = yf.Ticker(symbol)
-            info = stock.info
+            provider = get_provider()
+            with upstream_call("info", provider.name):
+                info = provider.info(symbol)
 
             if not info or 'regularMarketPrice' not in info:
                 return None
@@ -44,20 +69,29 @@ class StockService:
             raise Exception(f"Error fetching stock data: {str(e)}")
 
     @staticmethod
-    def get_stock_history(symbol: str, period: str = "1mo") -> Dict:
+    @traced()
+    def get_stock_history(
+        symbol: str,
+        period: str = "1mo",
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> Dict:
         """
         Fetch historical stock data
 
         Args:
             symbol: Stock ticker symbol
             period: Time period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
+            start: Start date (YYYY-MM-DD, inclusive). When given, period is ignored.
+            end: End date (YYYY-MM-DD, exclusive). Defaults to today.
 
         Returns:
             Dictionary containing symbol, period, and historical data
         """
         try:
-            stock = yf.Ticker(symbol)
-            hist = stock.history(period=period)
+            provider = get_provider()
+            with upstream_call("history", provider.name):
+                hist = provider.history(symbol, period, start, end)
 
             if hist.empty:
                 return None
@@ -81,3 +115,184 @@ class StockService:
             }
         except Exception as e:
             raise Exception(f"Error fetching historical data: {str(e)}")
+
+    @staticmethod
+    @traced()
+    def get_close_prices(symbols: List[str], period: str = "1mo", start: Optional[str] = None) -> pd.DataFrame:
+        """
+        Fetch close prices for many symbols in one batched download
+
+        Results are cached for HISTORY_CACHE_TTL_SECONDS. Callers must not
+        modify the returned frame.
+
+        Args:
+            symbols: Stock ticker symbols
+            period: Time period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
+            start: Start date (YYYY-MM-DD). When given, period is ignored.
+
+        Returns:
+            DataFrame of close prices (index = dates, columns = symbols).
+            Symbols without data are returned as all-NaN columns.
+        """
+        symbols = [s.upper() for s in symbols]
+        key_symbols = sorted(set(symbols))
+
+        closes = _close_cache.get_or_set(
+            (tuple(key_symbols), None if start else period, start),
+            lambda: StockService._download_close_prices(key_symbols, period, start)
+        )
+        return closes.reindex(columns=symbols)
+
+    @staticmethod
+    def _download_close_prices(symbols: List[str], period: str, start: Optional[str] = None) -> pd.DataFrame:
+        """Batched market data download (uncached)"""
+        try:
+            provider = get_provider()
+            with upstream_call("download", provider.name):
+                data = provider.download(symbols, period=period, start=start, auto_adjust=True)
+        except Exception as e:
+            raise Exception(f"Error fetching historical data: {str(e)}")
+
+        if data is None or data.empty:
+            return pd.DataFrame(columns=symbols, dtype=float)
+
+        closes = data['Close']
+        if isinstance(closes, pd.Series):
+            closes = closes.to_frame(name=symbols[0])
+
+        # Drop the timezone so frames from different exchanges share one index
+        closes.index = pd.DatetimeIndex(closes.index).tz_localize(None).normalize()
+        return closes.reindex(columns=symbols)
+
+    @staticmethod
+    @traced()
+    def compare_stocks(symbols: List[str], period: str = "1y") -> Optional[StockComparison]:
+        """
+        Compare several stocks over a period
+
+        All histories are fetched in a single batched download and aligned on a
+        shared date index before computing returns and correlations.
+
+        Args:
+            symbols: Stock ticker symbols (duplicates are ignored)
+            period: Time period (1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
+
+        Returns:
+            StockComparison object or None if no symbol has data
+        """
+        symbols = list(dict.fromkeys(s.strip().upper() for s in symbols if s.strip()))
+
+        closes = StockService.get_close_prices(symbols, period)
+        aligned = align_closes(closes)
+
+        if len(aligned) < 2:
+            return None
+
+        comparison = compare_closes(aligned)
+
+        return StockComparison(
+            symbols=list(aligned.columns),
+            period=period,
+            start_date=comparison["dates"][0],
+            end_date=comparison["dates"][-1],
+            missing_symbols=[s for s in symbols if s not in aligned.columns],
+            **comparison
+        )
+
+    @staticmethod
+    @traced()
+    def get_quotes(symbols: List[str]) -> Dict[str, StockQuote]:
+        """
+        Get quotes for many symbols from the cached quote feed
+
+        Cached quotes are returned as is; all missing symbols are fetched in a
+        single batched download. Expired quotes (up to QUOTE_CACHE_MAX_STALE_SECONDS)
+        are returned at once and refreshed in the background. With a shared
+        cache backend, symbols another worker is already fetching are waited
+        for instead of fetched again. Listeners registered with
+        subscribe_quotes() are notified with the freshly fetched quotes.
+
+        Args:
+            symbols: Stock ticker symbols
+
+        Returns:
+            Dictionary of symbol -> StockQuote (symbols without data are omitted)
+        """
+        symbols = list(dict.fromkeys(s.upper() for s in symbols))
+        quotes = _quote_cache.get_or_set_many(symbols, StockService._fetch_quotes)
+        return {symbol: quotes[symbol] for symbol in symbols if symbol in quotes}
+
+    @staticmethod
+    def peek_quote(symbol: str) -> Optional[StockQuote]:
+        """Cached quote for a symbol, without fetching"""
+        return _quote_cache.get(symbol.upper())
+
+    @staticmethod
+    def subscribe_quotes(listener: Callable[[Dict[str, StockQuote]], None]) -> None:
+        """
+        Register a callback for freshly fetched quotes
+        Similar to @EventListener in Spring
+        """
+        _quote_listeners.append(listener)
+
+    @staticmethod
+    def unsubscribe_quotes(listener: Callable[[Dict[str, StockQuote]], None]) -> None:
+        """Remove a quote callback (no-op if it is not registered)"""
+        if listener in _quote_listeners:
+            _quote_listeners.remove(listener)
+
+    @staticmethod
+    def _fetch_quotes(symbols: List[str]) -> Dict[str, StockQuote]:
+        """Download quotes and notify the listeners (request or background refresh)"""
+        fresh = StockService._download_quotes(symbols)
+
+        if fresh:
+            for listener in _quote_listeners:
+                try:
+                    listener(fresh)
+                except Exception:
+                    # A failing listener must not break quote requests
+                    logger.exception("Quote listener failed")
+
+        return fresh
+
+    @staticmethod
+    def _download_quotes(symbols: List[str]) -> Dict[str, StockQuote]:
+        """Batched market data download of the last daily bars (uncached)"""
+        try:
+            provider = get_provider()
+            with upstream_call("download", provider.name):
+                data = provider.download(symbols, period="5d", auto_adjust=False)
+        except Exception as e:
+            raise Exception(f"Error fetching quotes: {str(e)}")
+
+        if data is None or data.empty:
+            return {}
+
+        quotes = {}
+        for symbol in symbols:
+            if symbol not in data.columns.get_level_values(1):
+                continue
+
+            bars = data.xs(symbol, axis=1, level=1).dropna(subset=['Close'])
+            if bars.empty:
+                continue
+
+            last = bars.iloc[-1]
+            price = float(last['Close'])
+            previous_close = float(bars['Close'].iloc[-2]) if len(bars) > 1 else None
+            change = price - previous_close if previous_close else None
+
+            quotes[symbol] = StockQuote(
+                symbol=symbol,
+                price=round(price, 2),
+                previous_close=round(previous_close, 2) if previous_close else None,
+                change=round(change, 2) if change is not None else None,
+                change_percent=round(change / previous_close * 100, 2) if change is not None else None,
+                day_high=round(float(last['High']), 2) if pd.notna(last['High']) else None,
+                day_low=round(float(last['Low']), 2) if pd.notna(last['Low']) else None,
+                volume=int(last['Volume']) if pd.notna(last['Volume']) else None,
+                as_of=bars.index[-1].strftime("%Y-%m-%d")
+            )
+
+        return quotes
@@ -1,19 +1,26 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional
 from decimal import Decimal
 from datetime import datetime
 
 from models.transaction import Transaction, TransactionType
 from models.portfolio import Portfolio
-from schemas.transaction import TransactionCreate, TransactionSummary
+from models.realized_pnl import RealizedPnl
+from models.lot import OpenLot, OpeningLot
+from schemas.transaction import TransactionCreate, TransactionSummary, RealizedPnlSummary, RealizedPnlReport
 from services.stock_service import StockService
+from services.lot_engine import Lot, LotBook, LotMethod, RealizedSale
+from config import settings
+from core.tracing import traced
 
 
 class TransactionService:
     """Transaction service for managing buy/sell operations"""
 
     @staticmethod
+    @traced()
     def create_transaction(db: Session, transaction_data: TransactionCreate) -> Transaction:
         """
         Create a new transaction (buy or sell) and update portfolio accordingly
@@ -26,11 +33,19 @@ class TransactionService:
         - Validate: must have enough quantity to sell
         - Create transaction record
         - Update portfolio: decrease quantity
+        - Record realized P&L using the configured lot method (LOT_METHOD)
+
+        Shares held beyond the open lots (holdings entered directly through
+        /portfolio) are recorded once as the symbol's opening lot, at the
+        holding's average price of that moment.
         """
         symbol = transaction_data.symbol.upper()
 
         # Get or create portfolio for this symbol
-        portfolio = db.query(Portfolio).filter(Portfolio.symbol == symbol).first()
+        # (row lock: writes of one symbol are serialized across workers)
+        portfolio = db.query(Portfolio).filter(Portfolio.symbol == symbol).with_for_update().first()
+        held = portfolio.quantity if portfolio else 0
+        average_price = float(portfolio.average_price) if portfolio else 0.0
 
         if transaction_data.transaction_type == TransactionType.BUY:
             # Handle BUY transaction
@@ -85,7 +100,18 @@ class TransactionService:
         )
 
         db.add(transaction)
-        db.commit()
+
+        try:
+            db.flush()  # Assigns transaction.id
+
+            # Update the open lots and record realized P&L in the same database transaction
+            TransactionService._record_lots(db, transaction, held, average_price)
+
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
         db.refresh(transaction)
         db.refresh(portfolio)
 
@@ -114,6 +140,343 @@ class TransactionService:
         """Get a single transaction by ID"""
         return db.query(Transaction).filter(Transaction.id == transaction_id).first()
 
+    @staticmethod
+    @traced()
+    def get_realized_pnl(
+        db: Session,
+        symbol: Optional[str] = None,
+        method: Optional[LotMethod] = None
+    ) -> RealizedPnlReport:
+        """
+        Aggregate realized profit/loss per symbol
+
+        With the configured lot method the stored realized_pnl rows
+        (recorded by every write) are aggregated in SQL. Any other method is
+        computed from the ledger in one pass without storing the result.
+
+        Args:
+            db: Database session
+            symbol: Only this symbol (optional)
+            method: Lot method (defaults to LOT_METHOD)
+        """
+        configured = LotMethod(settings.LOT_METHOD.upper())
+        method = LotMethod(method or configured)
+
+        if method == configured:
+            query = db.query(
+                RealizedPnl.symbol,
+                func.sum(RealizedPnl.quantity),
+                func.sum(RealizedPnl.proceeds),
+                func.sum(RealizedPnl.cost_basis),
+                func.count(RealizedPnl.id)
+            )
+            if symbol:
+                query = query.filter(RealizedPnl.symbol == symbol.upper())
+
+            rows = [
+                (row[0], int(row[1]), float(row[2]), float(row[3]), int(row[4]))
+                for row in query.group_by(RealizedPnl.symbol).order_by(RealizedPnl.symbol).all()
+            ]
+        else:
+            ledger = TransactionService._ledger_rows(db)
+            _, sales = LotBook.from_ledger(
+                ledger, method, TransactionService._opening_lots(db, ledger, record=False)
+            )
+            totals = {}
+            for sale in sales:
+                if symbol and sale.symbol != symbol.upper():
+                    continue
+                quantity, proceeds, cost, count = totals.get(sale.symbol, (0, 0.0, 0.0, 0))
+                totals[sale.symbol] = (
+                    quantity + sale.quantity, proceeds + sale.proceeds,
+                    cost + sale.cost_basis, count + 1
+                )
+            rows = [(s, *totals[s]) for s in sorted(totals)]
+
+        summaries = [
+            RealizedPnlSummary(
+                symbol=row_symbol,
+                quantity_sold=quantity,
+                proceeds=round(proceeds, 2),
+                cost_basis=round(cost, 2),
+                realized_pnl=round(proceeds - cost, 2),
+                realized_pnl_percent=round((proceeds - cost) / cost * 100, 2) if cost > 0 else None,
+                sales=count
+            )
+            for row_symbol, quantity, proceeds, cost, count in rows
+        ]
+
+        return RealizedPnlReport(
+            method=method.value,
+            total_proceeds=round(sum(s.proceeds for s in summaries), 2),
+            total_cost_basis=round(sum(s.cost_basis for s in summaries), 2),
+            total_realized_pnl=round(sum(s.realized_pnl for s in summaries), 2),
+            symbols=summaries
+        )
+
+    @staticmethod
+    def rebuild_lots(db: Session) -> int:
+        """
+        Rewrite the realized_pnl and open_lots tables from the ledger in one pass
+
+        Only run explicitly (POST /transaction/realized/rebuild), e.g. after
+        migration 003 or a LOT_METHOD change: writes keep the tables current.
+        Holdings without a recorded opening lot get one for the shares held
+        beyond their ledger, at the current average price.
+
+        Returns:
+            Number of realized sales recorded
+        """
+        method = LotMethod(settings.LOT_METHOD.upper())
+        ledger = TransactionService._ledger_rows(db)
+
+        try:
+            openings = TransactionService._opening_lots(db, ledger, record=True)
+            book, sales = LotBook.from_ledger(ledger, method, openings)
+
+            db.query(RealizedPnl).delete()
+            db.query(OpenLot).delete()
+            db.add_all([TransactionService._to_realized_row(sale) for sale in sales])
+            for symbol in sorted(book.lots):
+                db.add_all(TransactionService._to_open_lot_rows(symbol, book.open_lots(symbol)))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return len(sales)
+
+    @staticmethod
+    def _record_lots(db: Session, transaction: Transaction, held: int, average_price: float) -> None:
+        """
+        Apply a new transaction to the symbol's open lots (not committed)
+
+        A BUY opens a lot and a SELL consumes the stored lots it covers, so a
+        write touches only those rows. A backdated trade, or shares held
+        beyond the open lots, replays the symbol's ledger instead (_replay).
+
+        Args:
+            held: Holding quantity before the transaction
+            average_price: Holding average price before the transaction
+        """
+        symbol = transaction.symbol
+        open_quantity = db.query(func.coalesce(func.sum(OpenLot.quantity), 0)).filter(OpenLot.symbol == symbol).scalar()
+        backdated = db.query(Transaction.id).filter(
+            Transaction.symbol == symbol,
+            Transaction.transaction_date > transaction.transaction_date
+        ).first() is not None
+
+        if held > open_quantity:
+            # A grown opening lot changes the cost of every sale of the symbol
+            TransactionService._add_opening(db, symbol, held - open_quantity, average_price)
+            TransactionService._replay(db, symbol, TransactionService._ledger_rows(db, symbol), 0)
+            return
+
+        if backdated:
+            ledger = TransactionService._ledger_rows(db, symbol)
+            position = next(i for i, row in enumerate(ledger) if row[0] == transaction.id)
+            TransactionService._replay(db, symbol, ledger, position)
+            return
+
+        method = LotMethod(settings.LOT_METHOD.upper())
+        price = float(transaction.price)
+
+        if transaction.transaction_type == TransactionType.BUY:
+            merged = None
+            if method == LotMethod.AVERAGE:
+                merged = db.query(OpenLot).filter(OpenLot.symbol == symbol).first()
+
+            if merged:
+                quantity = merged.quantity + transaction.quantity
+                merged.price = (merged.price * merged.quantity + price * transaction.quantity) / quantity
+                merged.quantity = quantity
+            else:
+                db.add(OpenLot(
+                    symbol=symbol, transaction_id=transaction.id, acquired_date=transaction.transaction_date,
+                    price=price, quantity=transaction.quantity
+                ))
+            return
+
+        # Load only the lots the sale consumes (the newest first for LIFO)
+        query = db.query(OpenLot).filter(OpenLot.symbol == symbol)
+        query = query.order_by(OpenLot.id.desc() if method == LotMethod.LIFO else OpenLot.id)
+        rows, covered = [], 0
+        for row in query.yield_per(32):
+            rows.append(row)
+            covered += row.quantity
+            if covered >= transaction.quantity:
+                break
+        if method == LotMethod.LIFO:
+            rows.reverse()
+
+        book = LotBook(method)
+        lots = [Lot(row.transaction_id, row.acquired_date, row.price, row.quantity) for row in rows]
+        book.lots[symbol].extend(lots)
+        sale = book.sell(symbol, transaction.id, transaction.transaction_date, price, transaction.quantity)
+
+        for lot, row in zip(lots, rows):
+            if lot.quantity:
+                row.quantity = lot.quantity
+            else:
+                db.delete(row)
+        db.add(TransactionService._to_realized_row(sale))
+
+    @staticmethod
+    def _replay(db: Session, symbol: str, ledger: List[tuple], start: int) -> None:
+        """
+        Replay a symbol's ledger after a backdated trade or a deletion (not committed)
+
+        The symbol's open lots are rewritten, but only the realized rows of
+        sales from the changed position on are replaced (all of them when the
+        opening lot had to grow).
+
+        Args:
+            ledger: The symbol's rows in replay order (_ledger_rows)
+            start: Position of the first changed transaction
+        """
+        method = LotMethod(settings.LOT_METHOD.upper())
+        opening = db.get(OpeningLot, symbol)
+        recorded = opening.quantity if opening else 0
+
+        openings = TransactionService._opening_lots(db, ledger, symbol, record=True)
+        if symbol in openings and openings[symbol].quantity != recorded:
+            start = 0
+        book, sales = LotBook.from_ledger(ledger, method, openings)
+
+        sale_ids = {row[0] for row in ledger[start:] if row[2] == TransactionType.SELL.value}
+        if sale_ids:
+            db.query(RealizedPnl).filter(RealizedPnl.transaction_id.in_(sale_ids)).delete(synchronize_session=False)
+            db.add_all([TransactionService._to_realized_row(sale) for sale in sales if sale.transaction_id in sale_ids])
+
+        db.query(OpenLot).filter(OpenLot.symbol == symbol).delete(synchronize_session=False)
+        db.add_all(TransactionService._to_open_lot_rows(symbol, book.open_lots(symbol)))
+
+    @staticmethod
+    def _add_opening(db: Session, symbol: str, quantity: int, price: float) -> OpeningLot:
+        """Record shares held beyond the open lots in the symbol's opening lot (not committed)"""
+        opening = db.get(OpeningLot, symbol)
+        if opening is None:
+            opening = OpeningLot(symbol=symbol, price=price, quantity=quantity, recorded_at=datetime.now())
+            db.add(opening)
+            db.flush()
+        else:
+            total = opening.quantity + quantity
+            opening.price = (opening.price * opening.quantity + price * quantity) / total
+            opening.quantity = total
+        return opening
+
+    @staticmethod
+    def _opening_lots(
+        db: Session,
+        ledger: List[tuple],
+        symbol: Optional[str] = None,
+        record: bool = False
+    ) -> Dict[str, Lot]:
+        """
+        Opening lot per symbol, covering every sale of the ledger
+
+        The recorded opening lots are used as they are. A symbol whose ledger
+        sells more than it bought beyond them (e.g. before the first rebuild
+        after migration 003) gets the missing shares at its recorded price,
+        else at the holding's average price - or, with no holding left, at the
+        price of the first uncovered sale. A symbol without a recorded opening
+        lot also gets the shares its holding has beyond the ledger.
+
+        Args:
+            ledger: Rows in replay order (_ledger_rows)
+            symbol: Only this symbol's opening lot (its ledger)
+            record: Store the missing shares (not committed); False keeps it read-only
+        """
+        openings = db.query(OpeningLot)
+        holdings = db.query(Portfolio)
+        if symbol:
+            openings = openings.filter(OpeningLot.symbol == symbol)
+            holdings = holdings.filter(Portfolio.symbol == symbol)
+        openings = {opening.symbol: opening for opening in openings.all()}
+        holdings = {portfolio.symbol: portfolio for portfolio in holdings.all()}
+
+        # Net position per symbol through the ledger, and its lowest point
+        net, lowest, first_uncovered = defaultdict(int), defaultdict(int), {}
+        for _, row_symbol, transaction_type, _, price, quantity in ledger:
+            net[row_symbol] += quantity if transaction_type == TransactionType.BUY.value else -quantity
+            if net[row_symbol] < lowest[row_symbol]:
+                lowest[row_symbol] = net[row_symbol]
+                first_uncovered.setdefault(row_symbol, price)
+
+        lots = {}
+        for row_symbol in set(openings) | set(net):
+            opening = openings.get(row_symbol)
+            portfolio = holdings.get(row_symbol)
+            quantity = opening.quantity if opening else 0
+            needed = -lowest[row_symbol]
+            if opening is None and portfolio:
+                needed = max(needed, portfolio.quantity - net[row_symbol])
+
+            if needed > quantity:
+                if opening:
+                    price = opening.price
+                elif portfolio:
+                    price = float(portfolio.average_price)
+                else:
+                    price = first_uncovered[row_symbol]
+
+                if record:
+                    opening = TransactionService._add_opening(db, row_symbol, needed - quantity, price)
+                else:
+                    opening = OpeningLot(symbol=row_symbol, price=price, quantity=needed, recorded_at=datetime.now())
+
+            if opening:
+                lots[row_symbol] = Lot(None, opening.recorded_at, opening.price, opening.quantity)
+        return lots
+
+    @staticmethod
+    def _to_open_lot_rows(symbol: str, lots: List[Lot]) -> List[OpenLot]:
+        """Convert engine lots (oldest first) to open_lots rows"""
+        return [
+            OpenLot(
+                symbol=symbol, transaction_id=lot.transaction_id, acquired_date=lot.acquired_date,
+                price=lot.price, quantity=lot.quantity
+            )
+            for lot in lots
+        ]
+
+    @staticmethod
+    def _ledger_rows(db: Session, symbol: Optional[str] = None) -> List[tuple]:
+        """Ledger rows (all symbols, or one) in replay order for LotBook.from_ledger"""
+        query = db.query(Transaction)
+        if symbol:
+            query = query.filter(Transaction.symbol == symbol)
+
+        transactions = query.order_by(Transaction.transaction_date, Transaction.id).all()
+        return [
+            (t.id, t.symbol, t.transaction_type.value, t.transaction_date, float(t.price), t.quantity)
+            for t in transactions
+        ]
+
+    @staticmethod
+    def _to_realized_row(sale: RealizedSale) -> RealizedPnl:
+        """Convert an engine result to a realized_pnl row"""
+        return RealizedPnl(
+            transaction_id=sale.transaction_id,
+            symbol=sale.symbol,
+            quantity=sale.quantity,
+            proceeds=Decimal(str(round(sale.proceeds, 2))),
+            cost_basis=Decimal(str(round(sale.cost_basis, 2))),
+            realized_pnl=Decimal(str(round(sale.realized_pnl, 2))),
+            method=sale.method.value,
+            sale_date=sale.sale_date
+        )
+
+    @staticmethod
+    def get_ledger_version(db: Session) -> str:
+        """
+        Version token of the transaction ledger ("<count>:<max id>")
+
+        Changes whenever a transaction is added or deleted, so derived data
+        (materialized history, lot state) can detect that it is outdated.
+        """
+        count, max_id = db.query(func.count(Transaction.id), func.max(Transaction.id)).one()
+        return f"{count}:{max_id or 0}"
+
     @staticmethod
     def get_transaction_summary(db: Session, symbol: str) -> Optional[TransactionSummary]:
         """Get transaction summary for a symbol"""
@@ -150,7 +513,7 @@ class TransactionService:
     @staticmethod
     def delete_transaction(db: Session, transaction_id: int) -> bool:
         """
-        Delete a transaction
+        Delete a transaction (and re-record the realized P&L it affected)
         WARNING: This will NOT recalculate portfolio. Use with caution.
         Consider implementing a recalculation mechanism if needed.
         """
@@ -159,6 +522,21 @@ class TransactionService:
         if not transaction:
             return False
 
-        db.delete(transaction)
-        db.commit()
+        symbol = transaction.symbol
+        db.query(Portfolio).filter(Portfolio.symbol == symbol).with_for_update().first()
+
+        try:
+            # The symbol's sales after the deleted trade are re-recorded without it
+            ledger = TransactionService._ledger_rows(db, symbol)
+            position = next(i for i, row in enumerate(ledger) if row[0] == transaction_id)
+
+            db.query(RealizedPnl).filter(RealizedPnl.transaction_id == transaction_id).delete(synchronize_session=False)
+            db.delete(transaction)
+            db.flush()
+            TransactionService._replay(db, symbol, ledger[:position] + ledger[position + 1:], position)
+
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
         return True
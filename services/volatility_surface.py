@@ -0,0 +1,135 @@
+"""
+Implied volatility surface (내재변동성 곡면)
+
+Pure NumPy functions turning the IVs of a multi-expiry chain into an
+expiry x moneyness grid, and slicing that grid into a skew (one tenor, all
+moneyness levels) or a term structure (one moneyness level, all expiries).
+
+Moneyness is strike / spot. Out-of-the-money contracts are used (puts below
+spot, calls at and above it), as their IVs are the most liquid. Grid points
+outside the strikes quoted for an expiry are NaN: the surface is never
+extrapolated along moneyness.
+"""
+from __future__ import annotations
+
+from typing import NamedTuple, Tuple
+
+from core.lazy import lazy_import
+from services.option_pricing import IV_FLOOR
+
+np = lazy_import("numpy")
+
+# Moneyness columns of the grid: 0.70, 0.725, ..., 1.30
+MONEYNESS_MIN = 0.7
+MONEYNESS_MAX = 1.3
+MONEYNESS_STEPS = 25
+
+
+class IVSurface(NamedTuple):
+    """Surface of one symbol: iv[i, j] = IV of expiries[i] at grid[j]"""
+    spot: float
+    expiries: Tuple[str, ...]
+    years: np.ndarray  # Time to each expiry (ascending)
+    grid: np.ndarray  # Moneyness columns
+    iv: np.ndarray
+
+
+def moneyness_grid() -> np.ndarray:
+    return np.round(np.linspace(MONEYNESS_MIN, MONEYNESS_MAX, MONEYNESS_STEPS), 4)
+
+
+def surface_grid(rows: np.ndarray, moneyness: np.ndarray, iv: np.ndarray, n_rows: int, grid: np.ndarray) -> np.ndarray:
+    """
+    Piecewise linear interpolation of every expiry's smile at the grid columns
+
+    All expiries are interpolated in one pass: contracts are sorted by
+    (row, moneyness) into one key array and the grid points of every row are
+    located in it with a single searchsorted.
+
+    Args:
+        rows: Expiry row (0 .. n_rows - 1) of each contract
+        moneyness: Strike / spot of each contract
+        iv: Implied volatility of each contract
+        n_rows: Number of expiries
+        grid: Moneyness columns (ascending)
+
+    Returns:
+        n_rows x len(grid) IVs, NaN outside the quoted strikes of a row
+    """
+    # Keys of different rows never overlap: each row gets its own interval
+    offset = max(float(moneyness.max(initial=0.0)), float(grid[-1])) + 1.0
+    keys = rows * offset + moneyness
+    order = np.argsort(keys, kind="stable")
+    keys, rows, iv = keys[order], rows[order], iv[order]
+
+    query_rows = np.repeat(np.arange(n_rows), len(grid))
+    query = query_rows * offset + np.tile(grid, n_rows)
+
+    right = np.searchsorted(keys, query, side="left")
+    left = right - 1
+    exact = (right < len(keys)) & (keys[np.minimum(right, len(keys) - 1)] == query)
+    right = np.minimum(right, len(keys) - 1)
+    left = np.maximum(left, 0)
+
+    # Both neighbours must be quotes of the query's own expiry
+    inside = (left < right) & (rows[left] == query_rows) & (rows[right] == query_rows) & (keys[left] <= query)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight = (query - keys[left]) / (keys[right] - keys[left])
+        values = iv[left] + weight * (iv[right] - iv[left])
+
+    result = np.where(exact, iv[right], np.where(inside, values, np.nan))
+    return result.reshape(n_rows, len(grid))
+
+
+def smooth(surface: np.ndarray) -> np.ndarray:
+    """
+    1-2-1 smoothing along moneyness, ignoring missing points
+
+    A normalized convolution: each point becomes the weighted mean of itself
+    and its available neighbours. Missing points stay missing.
+    """
+    present = np.isfinite(surface)
+    values = np.where(present, surface, 0.0)
+    weights = present.astype(float)
+
+    def convolve(a: np.ndarray) -> np.ndarray:
+        padded = np.pad(a, ((0, 0), (1, 1)))
+        return padded[:, :-2] + 2.0 * padded[:, 1:-1] + padded[:, 2:]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        smoothed = convolve(values) / convolve(weights)
+    return np.where(present, smoothed, np.nan)
+
+
+def skew(surface: np.ndarray, years: np.ndarray, target: float) -> np.ndarray:
+    """
+    Smile at an arbitrary tenor (all moneyness columns)
+
+    Total variance (IV^2 x T) is interpolated linearly between the expiries
+    around the target (the usual calendar interpolation). Targets
+    before the first or after the last expiry use that expiry's smile.
+    """
+    if target <= years[0]:
+        return surface[0]
+    if target >= years[-1]:
+        return surface[-1]
+
+    i = int(np.searchsorted(years, target))
+    t0, t1 = years[i - 1], years[i]
+    w0, w1 = np.square(surface[i - 1]) * t0, np.square(surface[i]) * t1
+    variance = w0 + (w1 - w0) * (target - t0) / (t1 - t0)
+    return np.sqrt(variance / target)
+
+
+def term_structure(surface: np.ndarray, grid: np.ndarray, moneyness: float) -> np.ndarray:
+    """IV of every expiry at one moneyness level (linear between grid columns)"""
+    j = int(np.clip(np.searchsorted(grid, moneyness), 1, len(grid) - 1))
+    weight = (moneyness - grid[j - 1]) / (grid[j] - grid[j - 1])
+    return surface[:, j - 1] + weight * (surface[:, j] - surface[:, j - 1])
+
+
+def otm_contracts(strike, iv, is_call, spot: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Mask of out-of-the-money contracts with a usable IV, and their moneyness"""
+    moneyness = strike / spot
+    otm = np.where(is_call, moneyness >= 1.0, moneyness < 1.0)
+    return otm & np.isfinite(iv) & (iv >= IV_FLOOR), moneyness
@@ -0,0 +1,137 @@
+import hashlib
+from typing import List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from models.watchlist import Watchlist, WatchlistItem
+from schemas.watchlist import WatchlistCreate, WatchlistItemCreate, WatchlistQuotes
+from services.stock_service import StockService
+from core.tracing import traced
+
+MAX_WATCHLIST_SYMBOLS = 200
+
+
+class WatchlistService:
+    """Watchlist service layer"""
+
+    @staticmethod
+    def create_watchlist(db: Session, watchlist_data: WatchlistCreate) -> Watchlist:
+        """Create a watchlist with optional initial symbols"""
+        symbols = list(dict.fromkeys(s.strip().upper() for s in watchlist_data.symbols if s.strip()))
+
+        if len(symbols) > MAX_WATCHLIST_SYMBOLS:
+            raise ValueError(f"A watchlist can hold at most {MAX_WATCHLIST_SYMBOLS} symbols")
+
+        watchlist = Watchlist(
+            name=watchlist_data.name,
+            items=[WatchlistItem(symbol=symbol) for symbol in symbols]
+        )
+
+        db.add(watchlist)
+        db.commit()
+        db.refresh(watchlist)
+        return watchlist
+
+    @staticmethod
+    def get_all_watchlists(db: Session) -> List[Watchlist]:
+        """Get all watchlists"""
+        return db.query(Watchlist).order_by(Watchlist.id).all()
+
+    @staticmethod
+    def get_watchlist_by_id(db: Session, watchlist_id: int) -> Optional[Watchlist]:
+        """Get watchlist by ID"""
+        return db.query(Watchlist).filter(Watchlist.id == watchlist_id).first()
+
+    @staticmethod
+    def delete_watchlist(db: Session, watchlist_id: int) -> bool:
+        """Delete a watchlist and its symbols"""
+        watchlist = db.query(Watchlist).filter(Watchlist.id == watchlist_id).first()
+
+        if not watchlist:
+            return False
+
+        db.delete(watchlist)
+        db.commit()
+        return True
+
+    @staticmethod
+    def add_symbol(db: Session, watchlist_id: int, item_data: WatchlistItemCreate) -> Optional[Watchlist]:
+        """
+        Add a symbol to a watchlist
+
+        Raises:
+            ValueError: symbol already in the watchlist, or watchlist is full
+        """
+        watchlist = db.query(Watchlist).filter(Watchlist.id == watchlist_id).first()
+
+        if not watchlist:
+            return None
+
+        symbol = item_data.symbol.strip().upper()
+
+        if any(item.symbol == symbol for item in watchlist.items):
+            raise ValueError(f"{symbol} is already in watchlist '{watchlist.name}'")
+
+        if len(watchlist.items) >= MAX_WATCHLIST_SYMBOLS:
+            raise ValueError(f"A watchlist can hold at most {MAX_WATCHLIST_SYMBOLS} symbols")
+
+        watchlist.items.append(WatchlistItem(symbol=symbol, notes=item_data.notes))
+        db.commit()
+        db.refresh(watchlist)
+        return watchlist
+
+    @staticmethod
+    def remove_symbol(db: Session, watchlist_id: int, symbol: str) -> bool:
+        """Remove a symbol from a watchlist"""
+        item = (
+            db.query(WatchlistItem)
+            .filter(WatchlistItem.watchlist_id == watchlist_id, WatchlistItem.symbol == symbol.upper())
+            .first()
+        )
+
+        if not item:
+            return False
+
+        db.delete(item)
+        db.commit()
+        return True
+
+    @staticmethod
+    @traced()
+    def get_watchlist_quotes(db: Session, watchlist_id: int) -> Optional[Tuple[WatchlistQuotes, str]]:
+        """
+        Quote snapshot for every symbol in a watchlist
+
+        All symbols go through StockService.get_quotes(), which serves cached
+        quotes and fetches the rest in one batched download.
+
+        Returns:
+            (snapshot, strong ETag) or None if the watchlist does not exist.
+            The ETag only depends on the quote values, so unchanged snapshots
+            can be answered with 304 Not Modified.
+        """
+        watchlist = db.query(Watchlist).filter(Watchlist.id == watchlist_id).first()
+
+        if not watchlist:
+            return None
+
+        symbols = [item.symbol for item in watchlist.items]
+        quotes = StockService.get_quotes(symbols) if symbols else {}
+
+        snapshot = WatchlistQuotes(
+            watchlist_id=watchlist.id,
+            name=watchlist.name,
+            quotes=[quotes[s] for s in symbols if s in quotes],
+            missing_symbols=[s for s in symbols if s not in quotes]
+        )
+
+        digest = hashlib.sha1()
+        digest.update(f"{watchlist.id}|{watchlist.name}".encode())
+        for quote in snapshot.quotes:
+            digest.update(
+                f"|{quote.symbol}:{quote.price}:{quote.change}:{quote.volume}:{quote.as_of}".encode()
+            )
+        for symbol in snapshot.missing_symbols:
+            digest.update(f"|{symbol}:-".encode())
+
+        return snapshot, f'"{digest.hexdigest()}"'
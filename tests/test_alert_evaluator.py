@@ -0,0 +1,57 @@
+"""
+Alert Evaluator Tests
+Sorted threshold index (no database or network required)
+"""
+from services.alert_evaluator import AlertIndex
+from models.alert import AlertCondition
+
+
+class TestAlertIndex:
+    """Per-symbol threshold index tests"""
+
+    def test_quote_fires_only_crossed_alerts(self):
+        """ABOVE fires at/under the price, BELOW fires at/over the price"""
+        # given
+        index = AlertIndex()
+        index.add(1, "AAPL", AlertCondition.ABOVE, 200.0)
+        index.add(2, "AAPL", AlertCondition.ABOVE, 210.0)
+        index.add(3, "AAPL", AlertCondition.BELOW, 180.0)
+        index.add(4, "AAPL", AlertCondition.BELOW, 205.0)
+        index.add(5, "MSFT", AlertCondition.ABOVE, 100.0)
+
+        # when
+        fired = index.evaluate("AAPL", 205.0)
+
+        # then
+        assert sorted(a.alert_id for a in fired) == [1, 4]
+        assert all(a.triggered_price == 205.0 for a in fired)
+        assert len(index) == 3
+
+    def test_alerts_fire_once(self):
+        """Fired alerts are removed from the index"""
+        # given
+        index = AlertIndex()
+        index.add(1, "AAPL", AlertCondition.BELOW, 150.0)
+
+        # when
+        first = index.evaluate("AAPL", 140.0)
+        second = index.evaluate("AAPL", 130.0)
+
+        # then
+        assert [a.alert_id for a in first] == [1]
+        assert second == []
+        assert index.symbols() == []
+
+    def test_remove(self):
+        """Removed alerts never fire"""
+        # given
+        index = AlertIndex()
+        index.add(1, "AAPL", AlertCondition.ABOVE, 100.0)
+        index.add(2, "AAPL", AlertCondition.ABOVE, 100.0)
+
+        # when
+        index.remove(1)
+        fired = index.evaluate("AAPL", 101.0)
+
+        # then
+        assert [a.alert_id for a in fired] == [2]
@@ -0,0 +1,93 @@
+"""
+Alert Service Tests
+Index versioning and trigger persistence (in-memory SQLite, no network required)
+"""
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import services.alert_service as alert_service
+import services.stock_service as stock_service
+from database.db import Base
+from models.alert import AlertCondition, AlertEvent, AlertStatus, PriceAlert
+from schemas.stock import StockQuote
+from services.alert_service import AlertService
+
+
+def quote(symbol, price):
+    return StockQuote(
+        symbol=symbol, price=price, previous_close=None, change=None, change_percent=None,
+        day_high=None, day_low=None, volume=None, as_of="2025-01-02"
+    )
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine, tables=[PriceAlert.__table__, AlertEvent.__table__])
+    factory = sessionmaker(bind=engine)
+
+    monkeypatch.setattr(alert_service, "SessionLocal", factory)
+    monkeypatch.setattr(alert_service._AlertState, "index", None)
+    monkeypatch.setattr(alert_service._AlertState, "version", None)
+    return factory
+
+
+def add_alert(db, symbol, condition, target):
+    alert = PriceAlert(symbol=symbol, condition=condition, target_price=Decimal(str(target)), status=AlertStatus.ACTIVE)
+    db.add(alert)
+    db.commit()
+    return alert.id
+
+
+class TestAlertEvaluation:
+    """Quote evaluation against the stored alerts"""
+
+    def test_trigger_and_event_are_committed_together(self, sessions):
+        # given
+        db = sessions()
+        alert_id = add_alert(db, "AAPL", AlertCondition.ABOVE, 200.0)
+
+        # when
+        events = AlertService.evaluate_quotes(db, {"AAPL": quote("AAPL", 205.0)})
+
+        # then - visible from another session (another worker / after a restart)
+        other = sessions()
+        assert [event.alert_id for event in events] == [alert_id]
+        assert other.get(PriceAlert, alert_id).status == AlertStatus.TRIGGERED
+        assert other.query(AlertEvent).count() == 1
+
+    def test_index_reloads_alerts_changed_by_another_worker(self, sessions):
+        # given - index loaded, then another worker adds one alert and cancels another
+        db = sessions()
+        cancelled = add_alert(db, "AAPL", AlertCondition.BELOW, 150.0)
+        AlertService.evaluate_quotes(db, {"AAPL": quote("AAPL", 160.0)})
+
+        other = sessions()
+        added = add_alert(other, "AAPL", AlertCondition.BELOW, 140.0)
+        other.get(PriceAlert, cancelled).status = AlertStatus.CANCELLED
+        other.commit()
+
+        # when
+        events = AlertService.evaluate_quotes(db, {"AAPL": quote("AAPL", 130.0)})
+
+        # then
+        assert [event.alert_id for event in events] == [added]
+
+    def test_feed_listener_evaluates_off_the_calling_thread(self, sessions):
+        # given
+        alert_id = add_alert(sessions(), "MSFT", AlertCondition.BELOW, 300.0)
+        AlertService.subscribe()
+
+        # when
+        try:
+            AlertService._on_quotes({"MSFT": quote("MSFT", 290.0)})
+        finally:
+            AlertService.unsubscribe()  # waits for queued evaluations
+
+        # then
+        assert sessions().get(PriceAlert, alert_id).status == AlertStatus.TRIGGERED
+        assert AlertService._on_quotes not in stock_service._quote_listeners
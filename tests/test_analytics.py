@@ -0,0 +1,167 @@
+"""
+Analytics Tests
+Pure computation tests with synthetic price data (no network required)
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import services.portfolio_service as portfolio_service
+from database.db import Base
+from models import Portfolio
+from services.analytics import align_closes, compare_closes, portfolio_risk, replay_ledger
+from services.portfolio_service import PortfolioService
+
+
+@pytest.fixture
+def closes():
+    """Fixture: 3 symbols, one with a missing day and one without any data"""
+    dates = pd.date_range("2025-01-01", periods=5, freq="D")
+    return pd.DataFrame({
+        "AAA": [100.0, 101.0, 102.0, 103.0, 110.0],
+        "BBB": [50.0, np.nan, 49.0, 48.0, 45.0],
+        "CCC": [np.nan] * 5,
+    }, index=dates)
+
+
+class TestCompareCloses:
+    """Multi-symbol comparison tests"""
+
+    def test_align_drops_empty_and_fills_gaps(self, closes):
+        """Symbols without data are dropped, gaps are forward filled"""
+        # when
+        aligned = align_closes(closes)
+
+        # then
+        assert list(aligned.columns) == ["AAA", "BBB"]
+        assert len(aligned) == 5
+        assert aligned["BBB"].iloc[1] == 50.0
+
+    def test_compare_returns_and_correlation(self, closes):
+        """Normalized returns, correlation matrix and ranks"""
+        # when
+        result = compare_closes(align_closes(closes))
+
+        # then
+        assert result["normalized_returns"]["AAA"][0] == 0.0
+        assert result["normalized_returns"]["AAA"][-1] == 10.0
+        assert result["normalized_returns"]["BBB"][-1] == -10.0
+
+        correlation = np.array(result["correlation"])
+        assert correlation.shape == (2, 2)
+        assert np.allclose(np.diag(correlation), 1.0)
+
+        performance = {p["symbol"]: p for p in result["performance"]}
+        assert performance["AAA"]["rank"] == 1
+        assert performance["AAA"]["relative_performance_percent"] == 10.0
+        assert performance["BBB"]["relative_performance_percent"] == -10.0
+
+
+class TestPortfolioRisk:
+    """Portfolio risk statistics tests"""
+
+    def test_portfolio_equal_to_benchmark(self):
+        """A portfolio holding only the benchmark has beta 1 and matching volatility"""
+        # given
+        rng = np.random.default_rng(42)
+        dates = pd.date_range("2025-01-01", periods=250, freq="B")
+        prices = pd.Series(100 * np.cumprod(1 + rng.normal(0, 0.01, 250)), index=dates)
+        closes = pd.DataFrame({"SPY": prices})
+        quantities = pd.Series({"SPY": 10.0})
+
+        # when
+        stats = portfolio_risk(closes, quantities, prices, risk_free_rate=0.0, confidence=0.95)
+
+        # then
+        expected_vol = np.diff(prices) / prices.to_numpy()[:-1]
+        assert stats["beta"] == pytest.approx(1.0)
+        assert stats["annualized_volatility"] == pytest.approx(expected_vol.std(ddof=1) * np.sqrt(252), abs=1e-4)
+        assert stats["total_value"] == pytest.approx(10 * prices.iloc[-1], abs=0.01)
+        assert stats["max_drawdown"] <= 0
+        assert stats["historical_var"] > 0
+        assert stats["parametric_var"] > 0
+        assert stats["holdings"][0]["weight"] == 1.0
+
+    def test_weights_and_risk_contribution(self):
+        """Weights follow market value and risk contributions sum to 1"""
+        # given
+        rng = np.random.default_rng(7)
+        dates = pd.date_range("2025-01-01", periods=120, freq="B")
+        closes = pd.DataFrame(
+            100 * np.cumprod(1 + rng.normal(0, 0.02, (120, 3)), axis=0),
+            index=dates, columns=["AAA", "BBB", "CCC"]
+        )
+        benchmark = closes.mean(axis=1)
+        quantities = pd.Series({"AAA": 1.0, "BBB": 2.0, "CCC": 3.0})
+
+        # when
+        stats = portfolio_risk(closes, quantities, benchmark)
+
+        # then
+        values = closes.iloc[-1] * quantities
+        weights = {h["symbol"]: h["weight"] for h in stats["holdings"]}
+        assert weights["CCC"] == pytest.approx(values["CCC"] / values.sum(), abs=1e-4)
+        assert sum(h["risk_contribution"] for h in stats["holdings"]) == pytest.approx(1.0, abs=1e-3)
+
+
+class TestReplayLedger:
+    """Ledger replay (equity curve) tests"""
+
+    def test_buy_then_partial_sell(self):
+        """Positions, average cost and realized P&L are carried across days"""
+        # given
+        dates = pd.date_range("2025-01-06", periods=4, freq="B")
+        closes = pd.DataFrame({"AAA": [100.0, 110.0, 120.0, 130.0]}, index=dates)
+        ledger = pd.DataFrame({
+            "date": [pd.Timestamp("2025-01-04"), pd.Timestamp("2025-01-07"), pd.Timestamp("2025-01-08")],
+            "symbol": ["AAA", "AAA", "AAA"],
+            "quantity": [10, 10, -5],
+            "price": [90.0, 110.0, 120.0],
+        })
+
+        # when
+        curve = replay_ledger(ledger, closes)
+
+        # then - bought before the first bar (weekend) is already held on day 1
+        assert curve["market_value"].tolist() == [1000.0, 2200.0, 1800.0, 1950.0]
+        # average cost = 100 after the second buy; selling 5 @ 120 realizes 100
+        assert curve["cost_basis"].tolist() == [900.0, 2000.0, 1500.0, 1500.0]
+        assert curve["realized_pnl"].tolist() == [0.0, 0.0, 100.0, 100.0]
+        assert curve["unrealized_pnl"].iloc[-1] == 450.0
+
+
+class TestPortfolioStatsCache:
+    """Cached portfolio statistics follow the live latest bar"""
+
+    def test_intraday_move_of_the_latest_close_is_not_served_stale(self, monkeypatch):
+        # given - one holding, the latest (today's) bar moving between two calls
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine, tables=[Portfolio.__table__])
+        db = sessionmaker(bind=engine)()
+        db.add(Portfolio(symbol="AAA", name="A", average_price=100, quantity=10))
+        db.commit()
+
+        rng = np.random.default_rng(3)
+        dates = pd.date_range("2025-01-01", periods=60, freq="B")
+        closes = pd.DataFrame(
+            100 * np.cumprod(1 + rng.normal(0, 0.01, (60, 2)), axis=0), index=dates, columns=["AAA", "SPY"]
+        )
+        served = [closes]
+        monkeypatch.setattr(
+            portfolio_service.StockService, "get_close_prices", staticmethod(lambda symbols, period: served[-1])
+        )
+        monkeypatch.setattr(portfolio_service, "_stats_cache", portfolio_service.TTLCache(ttl=3600, maxsize=8))
+        first = PortfolioService.get_portfolio_stats(db, benchmark="SPY")
+
+        moved = closes.copy()
+        moved.iloc[-1, 0] *= 1.05
+        served.append(moved)
+
+        # when
+        second = PortfolioService.get_portfolio_stats(db, benchmark="SPY")
+
+        # then
+        assert second.total_value == pytest.approx(10 * moved.iloc[-1, 0], abs=0.01)
+        assert second.total_value != first.total_value
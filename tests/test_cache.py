@@ -0,0 +1,277 @@
+"""
+Cache Tests
+"""
+import fnmatch
+import threading
+import time
+
+import pytest
+
+from core.cache import (
+    MemoryBackend, RedisBackend, SQLiteBackend, TTLCache, create_backend, reset_served_age, track_served_age
+)
+
+
+class TestTTLCache:
+    """In-process TTL cache tests"""
+
+    def test_get_or_set_calls_loader_once(self):
+        """Loader runs only on a miss"""
+        # given
+        cache = TTLCache(ttl=60)
+        calls = []
+
+        # when
+        first = cache.get_or_set("AAPL", lambda: calls.append(1) or 100)
+        second = cache.get_or_set("AAPL", lambda: calls.append(1) or 200)
+
+        # then
+        assert first == second == 100
+        assert len(calls) == 1
+
+    def test_entries_expire(self):
+        """Expired entries are treated as missing"""
+        # given
+        cache = TTLCache(ttl=0.01)
+        cache.set("AAPL", 100)
+
+        # when
+        time.sleep(0.02)
+
+        # then
+        assert cache.get("AAPL") is None
+
+    def test_lru_eviction(self):
+        """Least recently used entry is evicted when full"""
+        # given
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set("A", 1)
+        cache.set("B", 2)
+        cache.get("A")
+
+        # when
+        cache.set("C", 3)
+
+        # then
+        assert cache.get("A") == 1
+        assert cache.get("B") is None
+        assert cache.get("C") == 3
+
+
+class TestStaleWhileRevalidate:
+    """Stale values are served at once and refreshed in the background"""
+
+    def test_stale_value_served_and_refreshed(self):
+        # given
+        cache = TTLCache(ttl=0.05, max_stale=60)
+        cache.set("AAPL", 100)
+        time.sleep(0.06)
+        refreshed = threading.Event()
+
+        def loader():
+            refreshed.set()
+            return 200
+
+        # when
+        stale = cache.get_or_set("AAPL", loader)
+        refreshed.wait(1)
+        time.sleep(0.05)
+
+        # then
+        assert stale == 100
+        assert cache.stale_hits == 1
+        assert cache.get_or_set("AAPL", lambda: 300) == 200
+
+    def test_hard_expiry_waits_for_loader(self):
+        # given
+        cache = TTLCache(ttl=0.01, max_stale=0.01)
+        cache.set("AAPL", 100)
+
+        # when
+        time.sleep(0.03)
+
+        # then
+        assert cache.get_or_set("AAPL", lambda: 200) == 200
+
+    def test_served_age_is_recorded(self):
+        # given
+        cache = TTLCache(ttl=60, max_stale=60)
+        cache.set("AAPL", 100)
+        served, token = track_served_age()
+
+        # when
+        try:
+            cache.get_or_set("AAPL", lambda: 200)
+        finally:
+            reset_served_age(token)
+
+        # then
+        assert served.seconds is not None and served.seconds < 1
+
+
+class FakeRedis:
+    """Local stand-in for a Redis client (the commands RedisBackend uses)"""
+
+    def __init__(self):
+        self.data = {}
+        self.lock = threading.Lock()
+
+    def _live(self, key):
+        entry = self.data.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+            del self.data[key]
+            return None
+        return entry
+
+    def get(self, key):
+        with self.lock:
+            entry = self._live(key)
+            return entry[0] if entry else None
+
+    def mget(self, keys):
+        return [self.get(key) for key in keys]
+
+    def set(self, key, value, px=None, nx=False):
+        with self.lock:
+            if nx and self._live(key) is not None:
+                return None
+            self.data[key] = (value, time.monotonic() + px / 1000 if px else None)
+            return True
+
+    def delete(self, *keys):
+        with self.lock:
+            for key in keys:
+                self.data.pop(key, None)
+
+    def scan_iter(self, match="*"):
+        with self.lock:
+            return [key for key in list(self.data) if self._live(key) and fnmatch.fnmatch(key, match)]
+
+
+def shared_backends(tmp_path):
+    """Two backends on one store, standing in for two uvicorn workers"""
+    path = str(tmp_path / "cache.db")
+    redis = FakeRedis()
+    return {
+        "sqlite": (SQLiteBackend(path, "quotes"), SQLiteBackend(path, "quotes")),
+        "redis": (RedisBackend(redis, "quotes"), RedisBackend(redis, "quotes")),
+    }
+
+
+class TestSharedBackends:
+    """SQLite and Redis backends shared between workers"""
+
+    @pytest.mark.parametrize("kind", ["sqlite", "redis"])
+    def test_workers_share_entries(self, tmp_path, kind):
+        """A value cached by one worker is a hit in the other"""
+        # given
+        first, second = shared_backends(tmp_path)[kind]
+        worker_a, worker_b = TTLCache(ttl=60, backend=first), TTLCache(ttl=60, backend=second)
+
+        # when
+        worker_a.set(("chain", "AAPL", "2025-07-18"), {"calls": [1.5, 2.5]})
+
+        # then
+        assert worker_b.get(("chain", "AAPL", "2025-07-18")) == {"calls": [1.5, 2.5]}
+        assert worker_b.get_many(["X", ("chain", "AAPL", "2025-07-18")]) == {
+            ("chain", "AAPL", "2025-07-18"): {"calls": [1.5, 2.5]}
+        }
+        assert len(worker_b) == 1
+
+    @pytest.mark.parametrize("kind", ["sqlite", "redis"])
+    def test_entries_expire(self, tmp_path, kind):
+        # given
+        backend, _ = shared_backends(tmp_path)[kind]
+        cache = TTLCache(ttl=0.05, backend=backend)
+        cache.set("AAPL", 100)
+
+        # when
+        time.sleep(0.1)
+
+        # then
+        assert cache.get("AAPL") is None
+
+    @pytest.mark.parametrize("kind", ["sqlite", "redis"])
+    def test_one_fetch_across_workers(self, tmp_path, kind):
+        """Concurrent misses in two workers run the loader once"""
+        # given
+        first, second = shared_backends(tmp_path)[kind]
+        workers = [TTLCache(ttl=60, backend=first), TTLCache(ttl=60, backend=second)]
+        calls = []
+        results = []
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.2)
+            return 150.25
+
+        # when
+        threads = [
+            threading.Thread(target=lambda c=cache: results.append(c.get_or_set("AAPL", loader)))
+            for cache in workers for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # then
+        assert results == [150.25] * 8
+        assert len(calls) == 1
+
+    @pytest.mark.parametrize("kind", ["sqlite", "redis"])
+    def test_batch_load_waits_for_other_worker(self, tmp_path, kind):
+        """Symbols another worker is fetching are not fetched again"""
+        # given
+        first, second = shared_backends(tmp_path)[kind]
+        worker_a, worker_b = TTLCache(ttl=60, backend=first), TTLCache(ttl=60, backend=second)
+        batches = []
+
+        def loader(symbols):
+            batches.append(sorted(symbols))
+            time.sleep(0.2)
+            return {symbol: len(symbol) for symbol in symbols if symbol != "NOPE"}
+
+        # when
+        thread = threading.Thread(target=worker_a.get_or_set_many, args=(["AAPL", "MSFT"], loader))
+        thread.start()
+        time.sleep(0.05)
+        quotes = worker_b.get_or_set_many(["AAPL", "TSLA", "NOPE"], loader)
+        thread.join()
+
+        # then
+        assert quotes == {"AAPL": 4, "TSLA": 4}
+        assert ["AAPL", "MSFT"] in batches
+        assert ["NOPE", "TSLA"] in batches
+        assert len(batches) == 2
+
+
+class TestSingleFlight:
+    """In-process single-flight and backend selection"""
+
+    def test_concurrent_misses_call_loader_once(self):
+        # given
+        cache = TTLCache(ttl=60)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.1)
+            return 100
+
+        # when
+        threads = [threading.Thread(target=cache.get_or_set, args=("AAPL", loader)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # then
+        assert len(calls) == 1
+        assert cache.get("AAPL") == 100
+
+    def test_create_backend(self, tmp_path):
+        assert isinstance(create_backend("quotes", kind="memory"), MemoryBackend)
+        assert isinstance(create_backend("quotes", kind="sqlite"), SQLiteBackend)
+        with pytest.raises(ValueError):
+            create_backend("quotes", kind="memcached")
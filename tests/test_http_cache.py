@@ -0,0 +1,83 @@
+"""
+HTTP Cache Tests
+Cache-Control policies, ETag matching and conditional GET short-circuit (no network required)
+"""
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from core import http_cache
+
+
+def make_client(calls):
+    """App with one cached endpoint that counts loader calls"""
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int, request: Request):
+        def load():
+            calls.append(item_id)
+            return {"id": item_id, "name": "item"} if item_id > 0 else None
+
+        response = http_cache.cached_response(request, item_id, http_cache.OPTION_EXPIRY, load)
+        return response or {"missing": True}
+
+    return TestClient(app)
+
+
+class TestCachePolicy:
+    """Cache-Control header tests"""
+
+    def test_headers(self):
+        assert http_cache.CachePolicy(max_age=60).header == "public, max-age=60"
+        assert http_cache.CachePolicy(max_age=86400, immutable=True).header == "public, max-age=86400, immutable"
+        assert http_cache.PRIVATE.header == "private, no-cache"
+
+
+class TestConditionalGet:
+    """ETag / If-None-Match tests"""
+
+    def test_etag_and_304_without_recomputation(self):
+        """A matching If-None-Match is answered before the loader runs"""
+        # given
+        calls = []
+        client = make_client(calls)
+        first = client.get("/items/1")
+        etag = first.headers["etag"]
+
+        # when
+        second = client.get("/items/1", headers={"If-None-Match": f'W/"other", W/{etag}'})
+
+        # then
+        assert first.status_code == 200
+        assert first.headers["cache-control"] == "public, max-age=3600"
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+        assert calls == [1]
+
+    def test_stale_etag_gets_full_response(self):
+        """A non-matching ETag gets 200 with the current representation"""
+        # given
+        calls = []
+        client = make_client(calls)
+
+        # when
+        response = client.get("/items/2", headers={"If-None-Match": '"stale"'})
+
+        # then
+        assert response.status_code == 200
+        assert response.json() == {"id": 2, "name": "item"}
+
+    def test_not_found_is_not_cached(self):
+        """Loader returning None yields None (router decides the 404)"""
+        # given
+        calls = []
+        client = make_client(calls)
+
+        # when
+        client.get("/items/0")
+        response = client.get("/items/0")
+
+        # then
+        assert response.json() == {"missing": True}
+        assert "etag" not in response.headers
+        assert calls == [0, 0]
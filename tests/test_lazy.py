@@ -0,0 +1,78 @@
+"""
+Lazy Import Tests
+Deferred loading of heavy modules and of the database engine (no network required)
+"""
+import json
+import os
+import subprocess
+import sys
+
+from sqlalchemy import create_engine
+
+import database.db as db
+from core.lazy import LazyModule, lazy_import
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestLazyImport:
+    """LazyModule proxy tests"""
+
+    def test_imports_on_first_attribute_access(self):
+        """The proxy loads the module on first use and then behaves like it"""
+        # given
+        proxy = LazyModule("colorsys")
+
+        # when
+        r, g, b = proxy.hls_to_rgb(0.0, 0.5, 1.0)
+
+        # then
+        assert (r, g, b) == (1.0, 0.0, 0.0)
+        assert "hls_to_rgb" in proxy.__dict__  # later lookups skip __getattr__
+
+    def test_returns_loaded_module(self):
+        """Already imported modules are returned as they are"""
+        assert lazy_import("json") is json
+
+
+class TestStartupImports:
+    """Importing the app must not load data libraries or the database driver"""
+
+    def test_import_main_skips_heavy_modules(self):
+        # given
+        code = (
+            "import json, sys, main; "
+            "print(json.dumps([m for m in ('pandas', 'numpy', 'yfinance', 'oracledb') if m in sys.modules]))"
+        )
+        env = {k: v for k, v in os.environ.items() if not k.startswith("DB_")}
+
+        # when
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True)
+
+        # then
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout.strip().splitlines()[-1]) == []
+
+
+class TestEngineLifecycle:
+    """Engine creation and disposal"""
+
+    def test_sessions_bind_to_a_new_engine_after_dispose(self, monkeypatch):
+        # given
+        engines = []
+        monkeypatch.setattr(db, "_create_engine", lambda: engines.append(create_engine("sqlite://")) or engines[-1])
+        monkeypatch.setattr(db, "_engine", None)
+        db.SessionLocal().close()
+
+        # when
+        db.dispose_engine()
+        session = db.SessionLocal()
+
+        # then - not the disposed engine
+        try:
+            assert len(engines) == 2
+            assert session.get_bind() is engines[1]
+            assert db.current_engine() is engines[1]
+        finally:
+            session.close()
+            db.dispose_engine()
@@ -0,0 +1,58 @@
+"""
+Lot Engine Tests
+Realized P&L calculation with FIFO, LIFO and average cost (no database required)
+"""
+import pytest
+from datetime import datetime
+from services.lot_engine import LotBook, LotMethod
+
+LEDGER = [
+    (1, "AAPL", "BUY", datetime(2025, 1, 2), 100.0, 10),
+    (2, "AAPL", "BUY", datetime(2025, 2, 3), 150.0, 10),
+    (3, "AAPL", "SELL", datetime(2025, 3, 3), 160.0, 15),
+]
+
+
+@pytest.mark.parametrize("method,expected_cost,remaining", [
+    (LotMethod.FIFO, 10 * 100.0 + 5 * 150.0, [(2, 150.0, 5)]),
+    (LotMethod.LIFO, 10 * 150.0 + 5 * 100.0, [(1, 100.0, 5)]),
+    (LotMethod.AVERAGE, 15 * 125.0, [(1, 125.0, 5)]),
+])
+def test_from_ledger(method, expected_cost, remaining):
+    """Rebuilding from the ledger applies the lot method"""
+    # when
+    book, sales = LotBook.from_ledger(LEDGER, method)
+
+    # then
+    assert len(sales) == 1
+    assert sales[0].proceeds == 15 * 160.0
+    assert sales[0].cost_basis == expected_cost
+    assert sales[0].realized_pnl == 15 * 160.0 - expected_cost
+    assert [(lot.transaction_id, lot.price, lot.quantity) for lot in book.open_lots("AAPL")] == remaining
+
+
+class TestLotBook:
+    """Incremental lot updates"""
+
+    def test_sell_without_lots_raises(self):
+        """Selling more than the open lots fails without a fallback price"""
+        # given
+        book = LotBook(LotMethod.FIFO)
+        book.buy("TSLA", 1, datetime(2025, 1, 2), 200.0, 5)
+
+        # when / then
+        with pytest.raises(ValueError):
+            book.sell("TSLA", 2, datetime(2025, 1, 3), 210.0, 10)
+
+    def test_sell_uses_fallback_price_for_uncovered_shares(self):
+        """Uncovered shares are costed at the fallback price"""
+        # given
+        book = LotBook(LotMethod.FIFO)
+        book.buy("TSLA", 1, datetime(2025, 1, 2), 200.0, 5)
+
+        # when
+        sale = book.sell("TSLA", 2, datetime(2025, 1, 3), 210.0, 10, fallback_price=180.0)
+
+        # then
+        assert sale.cost_basis == 5 * 200.0 + 5 * 180.0
+        assert book.open_lots("TSLA") == []
@@ -0,0 +1,174 @@
+"""
+Market Data Provider Tests
+Recording and replay of market data (no network required)
+"""
+import pandas as pd
+import pytest
+
+from services.market_data import (
+    CHAIN_COLUMNS, MarketDataProvider, MarketDataStore, RecordingProvider, ReplayProvider,
+    YFinanceProvider, create_provider
+)
+
+
+def make_bars(days: int = 300, end: str = "2025-06-30", tz: str = None) -> pd.DataFrame:
+    dates = pd.bdate_range(end=end, periods=days, tz=tz)
+    close = pd.Series(range(days), index=dates, dtype=float) + 100
+    return pd.DataFrame({"Open": close, "High": close + 1, "Low": close - 1, "Close": close, "Volume": 1000.0})
+
+
+def make_chain(strikes=(90.0, 100.0, 110.0)) -> pd.DataFrame:
+    return pd.DataFrame({
+        "contractSymbol": [f"C{int(k)}" for k in strikes], "strike": list(strikes), "lastPrice": 1.0,
+        "bid": 0.9, "ask": 1.1, "change": 0.0, "percentChange": 0.0, "volume": 10.0,
+        "openInterest": 100.0, "impliedVolatility": 0.3, "inTheMoney": False,
+    })
+
+
+class StaticProvider(MarketDataProvider):
+    """In-memory upstream standing in for yfinance"""
+
+    name = "static"
+
+    def info(self, symbol):
+        return {"symbol": symbol, "regularMarketPrice": 123.0, "companyOfficers": [{"name": "x"}]}
+
+    def history(self, symbol, period="1mo", start=None, end=None):
+        return make_bars(tz="America/New_York")
+
+    def download(self, symbols, period=None, start=None, auto_adjust=True):
+        frames = {s: make_bars(days=5) for s in symbols}
+        return pd.concat(frames, axis=1).swaplevel(0, 1, axis=1).sort_index(axis=1)
+
+    def expiries(self, symbol):
+        return ("2025-07-18", "2025-08-15")
+
+    def option_chain(self, symbol, expiry):
+        return make_chain(), make_chain()
+
+    def news(self, symbol):
+        return [{"content": {"title": f"{symbol} news"}}]
+
+
+class TestRecordReplay:
+    """RecordingProvider -> MarketDataStore -> ReplayProvider round trip"""
+
+    def test_recorded_responses_are_replayed(self, tmp_path):
+        """Everything fetched through the recorder is served offline"""
+        # given
+        recorder = RecordingProvider(StaticProvider(), MarketDataStore(str(tmp_path)))
+
+        # when
+        recorder.info("AAPL")
+        recorder.history("AAPL", period="1y")
+        recorder.expiries("AAPL")
+        recorder.option_chain("AAPL", "2025-07-18")
+        recorder.news("AAPL")
+        replay = ReplayProvider(MarketDataStore(str(tmp_path)))
+
+        # then
+        assert replay.info("AAPL")["regularMarketPrice"] == 123.0
+        assert "companyOfficers" not in replay.info("AAPL")  # non-scalar fields are not recorded
+        assert len(replay.history("AAPL", period="max")) == 300
+        assert replay.expiries("AAPL") == ("2025-07-18", "2025-08-15")
+        calls, puts = replay.option_chain("AAPL", "2025-07-18")
+        assert list(calls.columns) == CHAIN_COLUMNS
+        assert calls["strike"].tolist() == [90.0, 100.0, 110.0]
+        assert replay.news("AAPL")[0]["content"]["title"] == "AAPL news"
+
+    def test_download_is_recorded_per_symbol(self, tmp_path):
+        """Batched downloads are split into per-symbol bars and merged"""
+        # given
+        store = MarketDataStore(str(tmp_path))
+        recorder = RecordingProvider(StaticProvider(), store)
+
+        # when
+        recorder.history("MSFT")
+        recorder.download(["MSFT", "TSLA"], period="5d")
+
+        # then
+        assert store.symbols() == ["MSFT", "TSLA"]
+        assert len(store.load("MSFT")["bars"]) == 300  # overlapping dates are not duplicated
+        assert len(store.load("TSLA")["bars"]) == 5
+
+    def test_adjusted_and_unadjusted_bars_are_kept_apart(self, tmp_path):
+        """Quote downloads (auto_adjust=False) never overwrite adjusted history"""
+        # given - unadjusted closes are 10 above the adjusted ones
+        class DividendProvider(StaticProvider):
+            def download(self, symbols, period=None, start=None, auto_adjust=True):
+                data = super().download(symbols, period, start, auto_adjust)
+                return data if auto_adjust else data + 10.0
+
+        recorder = RecordingProvider(DividendProvider(), MarketDataStore(str(tmp_path)))
+
+        # when
+        recorder.history("AAPL")
+        recorder.download(["AAPL"], period="5d", auto_adjust=False)
+        replay = ReplayProvider(MarketDataStore(str(tmp_path)))
+
+        # then
+        assert replay.history("AAPL", period="max")["Close"].iloc[-1] == 399.0
+        assert replay.download(["AAPL"], period="5d", auto_adjust=False)["Close"]["AAPL"].iloc[-1] == 114.0
+        assert replay.download(["AAPL"], period="5d")["Close"]["AAPL"].iloc[-1] == 399.0
+
+
+class TestReplayProvider:
+    """Replay slicing and unknown symbols"""
+
+    @pytest.fixture
+    def replay(self, tmp_path):
+        store = MarketDataStore(str(tmp_path))
+        store.save("AAPL", {"regularMarketPrice": 1.0}, make_bars(), {"2025-07-18": (make_chain(), make_chain())}, [])
+        return ReplayProvider(store)
+
+    def test_period_counts_back_from_last_bar(self, replay):
+        """'1mo' is the last month of the recording, not of today"""
+        # when
+        bars = replay.history("AAPL", period="1mo")
+
+        # then
+        assert bars.index[-1] == pd.Timestamp("2025-06-30")
+        assert bars.index[0] > pd.Timestamp("2025-05-30")
+
+    def test_start_end_range(self, replay):
+        """start inclusive, end exclusive (yfinance semantics)"""
+        # when
+        bars = replay.history("AAPL", start="2025-06-02", end="2025-06-06")
+
+        # then
+        assert [d.strftime("%Y-%m-%d") for d in bars.index] == ["2025-06-02", "2025-06-03", "2025-06-04", "2025-06-05"]
+
+    def test_download_layout(self, replay):
+        """(Price, Ticker) columns like yf.download; unknown symbols are left out"""
+        # when
+        data = replay.download(["AAPL", "NOPE"], period="5d")
+
+        # then
+        assert list(data["Close"].columns) == ["AAPL"]
+        assert data.index[-1] == pd.Timestamp("2025-06-30")
+        assert len(data) == 3  # 5 calendar days back from Monday
+
+    def test_unknown_symbol(self, replay):
+        """Empty answers, and a missing expiry raises like yfinance"""
+        assert replay.info("NOPE") == {}
+        assert replay.history("NOPE").empty
+        assert replay.expiries("NOPE") == ()
+        assert replay.news("NOPE") == []
+        with pytest.raises(ValueError):
+            replay.option_chain("AAPL", "2030-01-01")
+
+
+class TestCreateProvider:
+    """Provider selection by setting"""
+
+    def test_kinds(self, tmp_path):
+        assert isinstance(create_provider("yfinance"), YFinanceProvider)
+        assert isinstance(create_provider("record", str(tmp_path)), RecordingProvider)
+
+        replay = create_provider("replay", str(tmp_path), latency_ms=5)
+        assert isinstance(replay, ReplayProvider)
+        assert replay.latency_ms == 5
+
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError):
+            create_provider("bloomberg")
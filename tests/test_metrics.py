@@ -0,0 +1,125 @@
+"""
+Metrics Tests
+Metric types, text exposition format and request middleware (no network required)
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import core.metrics as metrics
+from core.cache import MemoryBackend, TTLCache
+from core.metrics import (
+    Counter, Histogram, Registry, MetricsMiddleware,
+    CACHE_ENTRIES, CACHE_HITS, HTTP_REQUESTS, UPSTREAM_REQUESTS, upstream_call
+)
+
+
+class TestMetricTypes:
+    """Counter / Histogram rendering tests"""
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Observations land in one bucket; rendering makes counts cumulative"""
+        # given
+        registry = Registry()
+        histogram = registry.register(Histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0)))
+
+        # when
+        for value in (0.05, 0.5, 0.5, 3.0):
+            histogram.observe(value, "/a")
+        text = registry.render()
+
+        # then
+        assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{route="/a",le="1.0"} 3' in text
+        assert 'latency_seconds_bucket{route="/a",le="+Inf"} 4' in text
+        assert 'latency_seconds_count{route="/a"} 4' in text
+        assert "# TYPE latency_seconds histogram" in text
+
+    def test_counter_label_escaping(self):
+        """Label values are escaped"""
+        # given
+        registry = Registry()
+        counter = registry.register(Counter("events_total", "Events", ("name",)))
+
+        # when
+        counter.inc('say "hi"', amount=2)
+
+        # then
+        assert 'events_total{name="say \\"hi\\""} 2.0' in registry.render()
+
+    def test_upstream_call_records_errors(self):
+        """Exceptions are counted as errors and re-raised"""
+        # when
+        with pytest.raises(RuntimeError):
+            with upstream_call("test_method", provider="test"):
+                raise RuntimeError("boom")
+
+        # then
+        assert UPSTREAM_REQUESTS.value("test", "test_method", "error") == 1
+
+
+class TestCacheCollector:
+    """Named cache metrics collected at scrape time"""
+
+    def test_hits_are_counters_and_memory_caches_are_sized(self):
+        # given
+        cache = TTLCache(ttl=60, maxsize=8, name="collector_memory")
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+
+        # when
+        metrics._collect_caches()
+
+        # then
+        assert CACHE_HITS.type_name == "counter"
+        assert CACHE_HITS.value("collector_memory") == 1
+        assert CACHE_ENTRIES.value("collector_memory") == 1
+
+    def test_scrape_never_creates_or_scans_a_backend(self, monkeypatch):
+        # given - a named cache never used yet, and one on a shared store
+        class SharedBackend(MemoryBackend):
+            shared = True
+
+            def __len__(self):
+                pytest.fail("shared store scanned by a scrape")
+
+        unused = TTLCache(ttl=60, maxsize=8, name="collector_unused")
+        TTLCache(ttl=60, maxsize=8, name="collector_shared", backend=SharedBackend(8))
+        monkeypatch.setattr(
+            "core.cache.create_backend", lambda *args, **kwargs: pytest.fail("backend created by a scrape")
+        )
+
+        # when
+        metrics._collect_caches()
+
+        # then
+        assert unused._backend is None
+        assert ("collector_unused",) not in CACHE_ENTRIES._values
+        assert ("collector_shared",) not in CACHE_ENTRIES._values
+
+
+class TestMetricsMiddleware:
+    """Route template labelling tests"""
+
+    def test_records_route_template(self):
+        """Requests are labelled with the route template, not the raw path"""
+        # given
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/things/{thing_id}")
+        async def get_thing(thing_id: int):
+            return {"id": thing_id}
+
+        client = TestClient(app)
+        before = HTTP_REQUESTS.value("GET", "/things/{thing_id}", "200")
+
+        # when
+        client.get("/things/1")
+        client.get("/things/2")
+        client.get("/nowhere")
+
+        # then
+        assert HTTP_REQUESTS.value("GET", "/things/{thing_id}", "200") == before + 2
+        assert HTTP_REQUESTS.value("GET", "<unmatched>", "404") >= 1
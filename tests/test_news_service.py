@@ -0,0 +1,112 @@
+"""
+News Service Tests
+URL-level deduplication, article <-> symbol links and aggregates (in-memory SQLite, no network required)
+"""
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import services.news_service as news_service
+from database.db import Base
+from models import NewsArticle, NewsArticleSymbol, Portfolio, SymbolSentiment
+from services.news_service import NewsService
+from services.sentiment import LexiconSentimentScorer
+
+
+def article(url, title="Apple beats earnings estimates"):
+    return {
+        "title": title, "summary": "", "publisher": "Reuters",
+        "published_at": datetime(2026, 1, 2, tzinfo=timezone.utc), "url": url
+    }
+
+
+class CountingScorer(LexiconSentimentScorer):
+    """Lexicon scorer recording every scored text"""
+
+    def __init__(self):
+        super().__init__()
+        self.scored = []
+
+    def score_batch(self, texts):
+        self.scored.extend(texts)
+        return super().score_batch(texts)
+
+
+@pytest.fixture
+def sessions():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(
+        engine, tables=[t.__table__ for t in (Portfolio, NewsArticle, NewsArticleSymbol, SymbolSentiment)]
+    )
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def scorer(monkeypatch):
+    scorer = CountingScorer()
+    monkeypatch.setattr(news_service, "get_scorer", lambda spec: scorer)
+    return scorer
+
+
+class TestNewsIngestion:
+    """Ingestion and aggregation tests"""
+
+    def test_story_tagged_for_two_symbols_is_stored_and_scored_once(self, sessions, scorer):
+        # given
+        db = sessions()
+
+        # when
+        aapl = NewsService.ingest(db, "AAPL", [article("https://example.com/a")])
+        msft = NewsService.ingest(db, "MSFT", [article("https://example.com/a")])
+        again = NewsService.ingest(db, "MSFT", [article("https://example.com/a")])
+
+        # then
+        assert (aapl, msft, again) == (1, 1, 0)
+        assert db.query(NewsArticle).count() == 1
+        assert len(scorer.scored) == 1
+        assert [a.article_count for a in db.query(SymbolSentiment).order_by(SymbolSentiment.symbol)] == [1, 1]
+
+    def test_portfolio_news_counts_shared_stories_once(self, sessions, scorer, monkeypatch):
+        # given - two holdings, one shared story and one AAPL-only story
+        db = sessions()
+        db.add_all([Portfolio(symbol="AAPL", name="Apple", average_price=1, quantity=1),
+                    Portfolio(symbol="MSFT", name="Microsoft", average_price=1, quantity=1)])
+        db.commit()
+        NewsService.ingest(db, "AAPL", [article("https://example.com/a"), article("https://example.com/b", "Apple falls")])
+        NewsService.ingest(db, "MSFT", [article("https://example.com/a")])
+        monkeypatch.setattr(NewsService, "refresh", staticmethod(lambda db, symbol: 0))
+
+        # when
+        news = NewsService.get_portfolio_news(db)
+
+        # then
+        scores = [a.sentiment_score for a in news.articles]
+        assert len(news.articles) == 2
+        assert news.overall_score == pytest.approx(sum(scores) / 2, abs=1e-4)
+        assert sorted(a.symbols for a in news.articles) == [["AAPL"], ["AAPL", "MSFT"]]
+
+    def test_concurrent_insert_of_the_same_article_is_retried(self, sessions, scorer, monkeypatch):
+        # given - another worker stores the article between our lookup and our insert
+        db = sessions()
+        scorer_for = news_service.get_scorer
+        raced = []
+
+        def racing_scorer(spec):
+            if not raced:
+                raced.append(True)
+                NewsService.ingest(sessions(), "MSFT", [article("https://example.com/a")])
+            return scorer_for(spec)
+
+        monkeypatch.setattr(news_service, "get_scorer", racing_scorer)
+
+        # when
+        stored = NewsService.ingest(db, "AAPL", [article("https://example.com/a")])
+
+        # then - linked to the stored article instead of dropping the batch
+        assert stored == 1
+        assert db.query(NewsArticle).count() == 1
+        assert db.query(NewsArticleSymbol).count() == 2
+        assert db.get(SymbolSentiment, "AAPL").article_count == 1
@@ -0,0 +1,70 @@
+"""
+Option Chain Tests
+Server-side filtering and field projection of /option/{symbol}/chain (no network required)
+"""
+import pytest
+
+import services.market_data as market_data
+from services.option_service import ChainFilter, OptionService
+from tests.test_market_data import StaticProvider, make_chain
+
+
+class WideChainProvider(StaticProvider):
+    """Strikes 300..500 around spot 399; liquidity grows with the strike"""
+
+    def option_chain(self, symbol, expiry):
+        calls, puts = make_chain(tuple(range(300, 501, 20))), make_chain(tuple(range(300, 501, 20)))
+        calls["openInterest"] = calls["strike"] - 300.0
+        puts["volume"] = None
+        return calls, puts
+
+
+@pytest.fixture(autouse=True)
+def provider(monkeypatch):
+    monkeypatch.setattr(market_data, "_provider", WideChainProvider())
+
+
+class TestChainFilter:
+    """Vectorized contract masks"""
+
+    def test_strike_range_and_moneyness_band(self):
+        result = OptionService.get_option_chain("CHAINTEST", chain_filter=ChainFilter(min_strike=380, moneyness=0.1))
+
+        # 399 +/- 10% = 359.1 .. 438.9, and at least 380
+        assert [row.strike for row in result.calls] == [380.0, 400.0, 420.0]
+        assert [row.strike for row in result.puts] == [380.0, 400.0, 420.0]
+
+    def test_liquidity_thresholds(self):
+        result = OptionService.get_option_chain("CHAINTEST", chain_filter=ChainFilter(min_open_interest=150, min_volume=1))
+
+        # calls: OI = strike - 300; puts: no volume reported
+        assert [row.strike for row in result.calls] == [460.0, 480.0, 500.0]
+        assert result.puts == []
+
+
+class TestProjection:
+    """fields= projection"""
+
+    def test_only_requested_fields_are_returned(self):
+        fields = OptionService.parse_fields("strike, open_interest,volume")
+
+        result = OptionService.get_option_chain("CHAINTEST", chain_filter=ChainFilter(max_strike=320), fields=fields)
+
+        assert result["calls"] == [
+            {"strike": 300.0, "open_interest": 0, "volume": 10},
+            {"strike": 320.0, "open_interest": 20, "volume": 10},
+        ]
+        assert result["puts"][0] == {"strike": 300.0, "open_interest": 100, "volume": None}
+
+    def test_greek_fields(self):
+        fields = OptionService.parse_fields("strike,delta", greeks=True)
+
+        result = OptionService.get_option_chain("CHAINTEST", greeks=True, fields=fields)
+
+        assert set(result["calls"][0]) == {"strike", "delta"}
+        assert "years_to_expiry" in result
+
+    @pytest.mark.parametrize("fields, greeks", [("strike,foo", False), ("strike,delta", False)])
+    def test_unknown_fields_are_rejected(self, fields, greeks):
+        with pytest.raises(ValueError):
+            OptionService.parse_fields(fields, greeks)
@@ -0,0 +1,68 @@
+"""
+Option History Tests
+Collector and range queries (temporary store, static market data)
+"""
+from datetime import date, datetime, timezone
+
+import pytest
+
+import services.market_data as market_data
+import services.option_history_service as option_history_service
+from core.timeseries import ColumnarStore
+from config import settings
+from services.option_history_service import HISTORY_COLUMNS, OptionHistoryService, history_job
+from tests.test_market_data import StaticProvider
+
+DAY_1 = datetime(2026, 1, 5, 15, tzinfo=timezone.utc).timestamp()
+DAY_2 = datetime(2026, 1, 6, 15, tzinfo=timezone.utc).timestamp()
+
+
+@pytest.fixture(autouse=True)
+def store(monkeypatch, tmp_path):
+    monkeypatch.setattr(market_data, "_provider", StaticProvider())
+    monkeypatch.setattr(option_history_service, "_store", ColumnarStore(str(tmp_path), HISTORY_COLUMNS))
+
+
+class TestOptionHistory:
+    """Collect / range query round trip"""
+
+    def test_collected_samples_are_queried_by_range(self):
+        # given - 2 expiries per sample
+        OptionHistoryService.collect("AAPL", DAY_1)
+        OptionHistoryService.collect("AAPL", DAY_2)
+
+        # when
+        history = OptionHistoryService.get_history("aapl", "pcr", date(2026, 1, 6), date(2026, 1, 31))
+
+        # then
+        assert history.symbol == "AAPL"
+        assert history.expiry_dates == ["2025-07-18", "2025-08-15"]
+        assert history.values == [1.0, 1.0]
+        assert all(t.date() == date(2026, 1, 6) for t in history.timestamps)
+
+    def test_expiry_filter(self):
+        # given
+        OptionHistoryService.collect("AAPL", DAY_1)
+
+        # when
+        history = OptionHistoryService.get_history("AAPL", "iv", date(2026, 1, 1), date(2026, 1, 31), "2025-08-15")
+
+        # then
+        assert history.expiry_dates == ["2025-08-15"]
+        assert history.values == [0.3]
+
+    def test_no_data_and_invalid_requests(self):
+        assert OptionHistoryService.get_history("AAPL", "pcr", date(2026, 1, 1), date(2026, 1, 31)) is None
+        with pytest.raises(ValueError):
+            OptionHistoryService.get_history("AAPL", "gamma", date(2026, 1, 1), date(2026, 1, 31))
+        with pytest.raises(ValueError):
+            OptionHistoryService.get_history("AAPL", "pcr", date(2026, 2, 1), date(2026, 1, 1))
+
+    def test_collector_requires_a_shared_backend(self, monkeypatch):
+        """With the per-worker memory backend every worker would collect"""
+        monkeypatch.setattr(settings, "CACHE_BACKEND", "memory")
+        with pytest.raises(ValueError):
+            history_job()
+
+        monkeypatch.setattr(settings, "CACHE_BACKEND", "sqlite")
+        assert history_job().name == "option-history"
@@ -0,0 +1,157 @@
+"""
+Option Pricing Tests
+Black-Scholes prices, greeks and implied volatility (no network required)
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+import services.market_data as market_data
+from services.option_pricing import (
+    bs_greeks, bs_price, chain_greeks, gamma_exposure, implied_volatility, years_to_expiry, zero_gamma_level
+)
+from services.option_service import OptionService
+from tests.test_market_data import StaticProvider, make_chain
+
+IS_CALL = np.array([True, False])
+STRIKES = np.array([100.0, 100.0])
+
+
+class TestBlackScholes:
+    """Reference values: S=100, K=100, T=1, r=5%, vol=20%"""
+
+    def test_prices(self):
+        prices = bs_price(100.0, STRIKES, 1.0, 0.05, 0.2, IS_CALL)
+
+        assert prices == pytest.approx([10.4506, 5.5735], abs=1e-4)
+
+    def test_greeks(self):
+        greeks = bs_greeks(100.0, STRIKES, 1.0, 0.05, 0.2, IS_CALL)
+
+        assert greeks["delta"] == pytest.approx([0.6368, -0.3632], abs=1e-4)
+        assert greeks["gamma"] == pytest.approx([0.01876, 0.01876], abs=1e-5)
+        assert greeks["theta"] == pytest.approx([-6.414 / 365, -1.658 / 365], abs=1e-4)
+        assert greeks["vega"] == pytest.approx([0.3752, 0.3752], abs=1e-4)
+        assert greeks["rho"] == pytest.approx([0.5323, -0.4189], abs=1e-4)
+
+
+class TestImpliedVolatility:
+    """Vectorized solver tests"""
+
+    def test_recovers_volatility_of_a_whole_chain(self):
+        # given - 400 contracts with different strikes and volatilities
+        strikes = np.linspace(85, 115, 400)
+        is_call = np.arange(400) % 2 == 0
+        vols = np.linspace(0.1, 1.2, 400)
+        prices = bs_price(100.0, strikes, 0.25, 0.04, vols, is_call)
+
+        # when
+        solved = implied_volatility(prices, 100.0, strikes, 0.25, 0.04, is_call)
+
+        # then
+        assert solved == pytest.approx(vols, abs=1e-4)
+
+    def test_prices_outside_bounds_have_no_solution(self):
+        # call below intrinsic value, put above the strike
+        solved = implied_volatility(np.array([5.0, 150.0]), 110.0, STRIKES, 0.5, 0.0, IS_CALL)
+
+        assert np.isnan(solved).all()
+
+
+class TestChainGreeks:
+    """Chain pricing tests"""
+
+    def test_missing_market_iv_is_solved_from_mid(self):
+        # given - the second call has no usable IV in the feed
+        strikes = [95.0, 105.0]
+        true_vol = 0.25
+        mids = bs_price(100.0, np.array(strikes), 0.5, 0.04, true_vol, np.array([True, True]))
+        calls = pd.DataFrame({
+            "strike": strikes, "bid": mids - 0.05, "ask": mids + 0.05, "impliedVolatility": [0.25, 0.00001]
+        })
+        puts = calls.iloc[:0]
+
+        # when
+        call_greeks, put_greeks = chain_greeks(calls, puts, 100.0, 0.5, 0.04)
+
+        # then
+        assert call_greeks["ivSolved"].tolist() == [False, True]
+        assert call_greeks["impliedVolatility"].tolist() == pytest.approx([0.25, 0.25], abs=1e-3)
+        assert (call_greeks["delta"] > 0).all()
+        assert put_greeks.empty
+
+    def test_years_to_expiry(self):
+        now = pd.Timestamp("2026-01-02 21:00", tz="UTC")  # 16:00 New York
+
+        assert years_to_expiry("2026-01-02", now) == pytest.approx(1 / (365 * 24))
+        assert years_to_expiry("2027-01-02", now) == pytest.approx(1.0)
+
+
+class GammaWallProvider(StaticProvider):
+    """Puts below spot, calls above it: the gamma flip sits between them"""
+
+    def expiries(self, symbol):
+        today = pd.Timestamp.now(tz="America/New_York").normalize()
+        return tuple((today + pd.Timedelta(days=days)).strftime("%Y-%m-%d") for days in (7, 14, 28))
+
+    def option_chain(self, symbol, expiry):
+        return make_chain((410.0, 420.0)), make_chain((380.0, 390.0))
+
+
+class TestGammaExposure:
+    """Dealer gamma exposure tests"""
+
+    def test_calls_are_positive_and_puts_negative(self):
+        gex = gamma_exposure(100.0, STRIKES, 1.0, 0.05, 0.2, np.array([10.0, 10.0]), IS_CALL)
+
+        # gamma x OI x 100 x spot^2 x 1%
+        assert gex == pytest.approx([0.01876 * 10 * 100 * 100.0 ** 2 * 0.01 * s for s in (1, -1)], rel=1e-3)
+
+    def test_zero_gamma_level_is_between_put_and_call_walls(self):
+        # given - puts at 90, calls at 110 with the same OI: exposure flips at about 100
+        strikes = np.array([90.0, 110.0])
+        level = zero_gamma_level(100.0, strikes, 0.25, 0.0, 0.2, np.array([100.0, 100.0]), np.array([False, True]))
+
+        assert 95.0 < level < 105.0
+
+    def test_no_flip_within_range(self):
+        level = zero_gamma_level(100.0, STRIKES, 0.25, 0.0, 0.2, np.array([100.0, 0.0]), IS_CALL)
+
+        assert level is None
+
+    def test_no_exposure_has_no_flip(self):
+        """Zero exposure everywhere is not a sign change at spot"""
+        empty = np.array([])
+        assert zero_gamma_level(100.0, empty, empty, 0.0, empty, empty, empty.astype(bool)) is None
+        assert zero_gamma_level(100.0, STRIKES, 0.25, 0.0, 0.2, np.array([0.0, 0.0]), IS_CALL) is None
+
+    def test_service_aggregates_all_expiries(self, monkeypatch):
+        # given
+        monkeypatch.setattr(market_data, "_provider", GammaWallProvider())
+
+        # when
+        result = OptionService.get_gamma_exposure("GEXTEST")
+
+        # then - one value per strike, summed over the three expiries
+        assert result.expiry_dates == list(GammaWallProvider().expiries("GEXTEST"))
+        assert result.strikes == [380.0, 390.0, 410.0, 420.0]
+        assert [v < 0 for v in result.gamma_exposure] == [True, True, False, False]
+        assert result.total_gamma_exposure == pytest.approx(sum(result.gamma_exposure), abs=0.1)
+        assert result.put_gamma_exposure < 0 < result.call_gamma_exposure
+        assert 390.0 < result.zero_gamma_level < 410.0
+
+    def test_service_without_open_interest_has_no_flip(self, monkeypatch):
+        # given
+        class NoOpenInterestProvider(GammaWallProvider):
+            def option_chain(self, symbol, expiry):
+                calls, puts = super().option_chain(symbol, expiry)
+                return calls.assign(openInterest=0.0), puts.assign(openInterest=0.0)
+
+        monkeypatch.setattr(market_data, "_provider", NoOpenInterestProvider())
+
+        # when
+        result = OptionService.get_gamma_exposure("NOGEXTEST")
+
+        # then
+        assert result.strikes == []
+        assert result.zero_gamma_level is None
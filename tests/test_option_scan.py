@@ -0,0 +1,127 @@
+"""
+Option Scan Tests
+Market-wide scanner over a static upstream (no network required)
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+import services.market_data as market_data
+import services.option_scan_service as option_scan_service
+from core.cache import TTLCache
+from main import app
+from services.option_scan_service import OptionScanService, ScanCriteria
+from tests.test_market_data import StaticProvider, make_chain
+
+
+class UniverseProvider(StaticProvider):
+    """BEAR: puts dominate; BULL: calls dominate; NOOPT: no options; BROKEN: upstream error"""
+
+    def __init__(self):
+        self.chain_calls = []
+
+    def expiries(self, symbol):
+        return () if symbol == "NOOPT" else super().expiries(symbol)
+
+    def option_chain(self, symbol, expiry):
+        self.chain_calls.append(symbol)
+        if symbol == "BROKEN":
+            raise RuntimeError("upstream down")
+
+        calls, puts = make_chain(), make_chain()
+        heavy = puts if symbol == "BEAR" else calls
+        heavy.loc[heavy["strike"] == 100.0, "openInterest"] = 500.0
+        return calls, puts
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    provider = UniverseProvider()
+    monkeypatch.setattr(market_data, "_provider", provider)
+    monkeypatch.setattr(option_scan_service, "_metrics_cache", TTLCache(ttl=60, maxsize=64, name="scan_test"))
+    monkeypatch.setattr(option_scan_service, "_progress_cache", TTLCache(ttl=60, maxsize=8, name="scan_progress_test"))
+    return provider
+
+
+class TestScanCriteria:
+    """Threshold checks"""
+
+    def test_all_given_thresholds_must_hold(self):
+        metrics = {"put_call_ratio": 1.5, "atm_iv": 0.4, "oi_concentration": 0.2}
+
+        assert ScanCriteria().matches(metrics)
+        assert ScanCriteria(min_pcr=1.2, max_iv=0.5).matches(metrics)
+        assert not ScanCriteria(min_pcr=1.2, min_oi_concentration=0.5).matches(metrics)
+
+
+class TestOptionScan:
+    """OptionScanService.scan tests"""
+
+    def test_matches_are_streamed_then_summarized(self, provider):
+        # when
+        results = list(OptionScanService.scan(["bear", "BULL", "NOOPT", "BROKEN"], ScanCriteria(min_pcr=1.2)))
+
+        # then
+        matches, summary = results[:-1], results[-1]
+        assert [m["symbol"] for m in matches] == ["BEAR"]
+        assert matches[0]["max_oi_strike"] == 100.0
+        assert matches[0]["oi_concentration"] == pytest.approx(600 / 1000, abs=1e-4)
+        assert summary == {
+            "type": "summary", "scanned": 3, "matched": 1, "no_options": ["NOOPT"], "failed": ["BROKEN"]
+        }
+
+    def test_rescan_resumes_from_cached_metrics(self, provider):
+        # given - a first scan that was cut after the first match
+        scan = OptionScanService.scan(["BEAR", "BULL"], ScanCriteria())
+        next(scan)
+        scan.close()
+
+        # when
+        provider.chain_calls.clear()
+        results = list(OptionScanService.scan(["BEAR", "BULL"], ScanCriteria()))
+
+        # then - nothing finished is fetched again
+        assert len(provider.chain_calls) <= 1
+        assert sorted(r["symbol"] for r in results[:-1]) == ["BEAR", "BULL"]
+        assert any(r["cached"] for r in results[:-1])
+
+    def test_resuming_with_the_scan_id_skips_delivered_symbols(self, provider):
+        # given - the first match was delivered before the stream was cut
+        scan = OptionScanService.scan(["BEAR", "BULL", "NOOPT"], ScanCriteria(), scan_id="s1")
+        first = next(scan)
+        next(scan)
+        scan.close()
+
+        # when
+        results = list(OptionScanService.scan(["BEAR", "BULL", "NOOPT"], ScanCriteria(), scan_id="s1"))
+
+        # then - not sent twice, yet the summary covers the whole scan
+        matches, summary = results[:-1], results[-1]
+        assert first["symbol"] not in [m["symbol"] for m in matches]
+        assert summary["scanned"] == 3
+        assert summary["matched"] == 2
+        assert summary["no_options"] == ["NOOPT"]
+
+    def test_other_criteria_do_not_reuse_the_progress(self, provider):
+        # given
+        list(OptionScanService.scan(["BEAR", "BULL"], ScanCriteria(), scan_id="s1"))
+
+        # when
+        results = list(OptionScanService.scan(["BEAR", "BULL"], ScanCriteria(min_pcr=1.2), scan_id="s1"))
+
+        # then
+        assert [r["symbol"] for r in results[:-1]] == ["BEAR"]
+
+
+class TestScanEndpoint:
+    """GET /option/scan"""
+
+    def test_stream_is_not_compressed_and_carries_a_scan_id(self, provider):
+        # when - a universe large enough to exceed GZIP_MIN_SIZE
+        symbols = ",".join(f"S{i}" for i in range(20))
+        response = TestClient(app).get(f"/option/scan?symbols={symbols}", headers={"Accept-Encoding": "gzip"})
+
+        # then
+        assert response.status_code == 200
+        assert len(response.content) > 1024
+        assert "content-encoding" not in response.headers
+        assert response.headers["x-scan-id"]
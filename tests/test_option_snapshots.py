@@ -0,0 +1,65 @@
+"""
+Option Snapshot Tests
+Scheduled capture and snapshot reads (in-memory SQLite, static market data)
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import services.market_data as market_data
+import services.option_snapshot_service as option_snapshot_service
+from config import settings
+from database.db import Base
+from models import OptionSnapshot
+from services.option_snapshot_service import OptionSnapshotService
+from tests.test_market_data import StaticProvider
+
+
+@pytest.fixture
+def db(monkeypatch):
+    monkeypatch.setattr(market_data, "_provider", StaticProvider())
+    monkeypatch.setattr(settings, "OPTION_SNAPSHOT_SYMBOLS", "AAPL, msft")
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[OptionSnapshot.__table__])
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    monkeypatch.setattr(option_snapshot_service, "SessionLocal", session_factory)
+    session = session_factory()
+    yield session
+    session.close()
+
+
+class TestOptionSnapshots:
+    """Capture / read round trip"""
+
+    def test_capture_all_stores_every_expiry(self, db):
+        # when
+        stored = OptionSnapshotService.capture_all(db)
+
+        # then - 2 symbols x 2 expiries
+        assert stored == 4
+        assert {(s.symbol, s.expiry_date) for s in db.query(OptionSnapshot).all()} == {
+            ("AAPL", "2025-07-18"), ("AAPL", "2025-08-15"), ("MSFT", "2025-07-18"), ("MSFT", "2025-08-15")
+        }
+
+    def test_reads_latest_snapshot_of_nearest_expiry(self, db):
+        # given
+        OptionSnapshotService.capture(db, "AAPL")
+
+        # when
+        pcr = OptionSnapshotService.get_pcr("aapl")
+        iv = OptionSnapshotService.get_iv("AAPL", "2025-08-15")
+
+        # then
+        assert pcr.expiry_date == "2025-07-18"
+        assert pcr.put_call_ratio == 1.0
+        assert pcr.snapshot_at is not None
+        assert iv.expiry_date == "2025-08-15"
+        assert iv.average_iv == 0.3
+
+    def test_symbols_outside_universe_are_not_read(self, db):
+        # given
+        OptionSnapshotService.capture(db, "TSLA")
+
+        # then - computed live by the endpoint instead
+        assert OptionSnapshotService.get_max_pain("TSLA") is None
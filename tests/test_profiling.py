@@ -0,0 +1,153 @@
+"""
+Profiling Tests
+Single-request cProfile middleware and sampling profiler (no network required)
+"""
+import threading
+
+import anyio
+import anyio.to_thread
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import core.profiling as profiling
+from core.profiling import (
+    ProfilingMiddleware, install_threadpool_hook, is_admin, sample_stacks, uninstall_threadpool_hook
+)
+
+
+def busy_work():
+    return sum(i * i for i in range(20000))
+
+
+def make_client():
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, admin_token="secret")
+
+    @app.get("/work")
+    def work():
+        return {"result": busy_work()}
+
+    return TestClient(app)
+
+
+@pytest.fixture
+def threadpool_hook():
+    install_threadpool_hook()
+    yield
+    uninstall_threadpool_hook()
+
+
+@pytest.fixture
+def recorded_run_sync(monkeypatch):
+    """anyio.to_thread.run_sync replaced by a recorder of the functions it receives"""
+    received = []
+
+    async def run_sync(func, *args, **kwargs):
+        received.append(func)
+        return func(*args)
+
+    monkeypatch.setattr(anyio.to_thread, "run_sync", run_sync)
+    return run_sync, received
+
+
+class TestProfilingMiddleware:
+    """Single request profiling tests"""
+
+    def test_admin_request_returns_profile(self, threadpool_hook):
+        """X-Profile with a valid admin token returns pstats output"""
+        # when
+        response = make_client().get("/work", headers={"X-Profile": "1", "X-Admin-Token": "secret"})
+
+        # then
+        assert response.status_code == 200
+        assert response.headers["x-profiled-status"] == "200"
+        assert "busy_work" in response.text
+
+    def test_query_flag_without_token_is_ignored(self):
+        """Without the admin token the request is served normally"""
+        # when
+        response = make_client().get("/work?profile=1")
+
+        # then
+        assert "result" in response.json()
+
+    def test_is_admin_requires_configured_token(self):
+        assert not is_admin("anything", None)
+        assert not is_admin(None, "secret")
+        assert is_admin("secret", "secret")
+
+
+class TestThreadpoolHook:
+    """install_threadpool_hook / uninstall_threadpool_hook"""
+
+    def test_hook_is_inert_outside_profiled_requests(self, recorded_run_sync):
+        # given
+        original, received = recorded_run_sync
+        install_threadpool_hook()
+
+        # when
+        try:
+            result = anyio.run(anyio.to_thread.run_sync, busy_work)
+        finally:
+            uninstall_threadpool_hook()
+
+        # then - the original got the very same function, and is back in place
+        assert result == busy_work()
+        assert received == [busy_work]
+        assert anyio.to_thread.run_sync is original
+
+    def test_hook_profiles_calls_of_a_profiled_request(self, recorded_run_sync):
+        # given
+        _, received = recorded_run_sync
+        profiles = []
+        install_threadpool_hook()
+        token = profiling._request_profiles.set(profiles)
+
+        # when
+        try:
+            anyio.run(anyio.to_thread.run_sync, busy_work)
+        finally:
+            profiling._request_profiles.reset(token)
+            uninstall_threadpool_hook()
+
+        # then
+        assert received[0] is not busy_work
+        assert len(profiles) == 1
+
+    def test_middleware_does_not_patch_the_threadpool(self):
+        # when - the middleware stack is built on the first request
+        before = anyio.to_thread.run_sync
+        make_client().get("/work")
+
+        # then
+        assert anyio.to_thread.run_sync is before
+
+
+class TestSamplingProfiler:
+    """Collapsed stack sampling tests"""
+
+    def test_collapsed_stacks_include_busy_thread(self):
+        """A busy thread shows up as thread;...;function count lines"""
+        # given
+        stop = threading.Event()
+
+        def spin():
+            while not stop.is_set():
+                busy_work()
+
+        worker = threading.Thread(target=spin, name="spinner")
+        worker.start()
+
+        # when
+        try:
+            collapsed = sample_stacks(0.2, interval=0.005)
+        finally:
+            stop.set()
+            worker.join()
+
+        # then
+        lines = [line for line in collapsed.splitlines() if line.startswith("spinner;")]
+        assert lines
+        assert any("busy_work" in line for line in lines)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
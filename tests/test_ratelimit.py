@@ -0,0 +1,30 @@
+"""
+Rate Limiter Tests
+Token bucket used to pace upstream fetches
+"""
+import time
+
+from core.ratelimit import RateLimiter
+
+
+class TestRateLimiter:
+    """RateLimiter tests"""
+
+    def test_burst_is_free_then_calls_are_paced(self):
+        # given - 2 tokens, refilled at 50 per second
+        limiter = RateLimiter(rate=50, burst=2)
+
+        # when
+        started = time.monotonic()
+        waits = [limiter.acquire() for _ in range(4)]
+        elapsed = time.monotonic() - started
+
+        # then - the 3rd and 4th calls wait 20 ms each
+        assert waits[:2] == [0.0, 0.0]
+        assert all(wait > 0 for wait in waits[2:])
+        assert elapsed >= 0.035
+
+    def test_zero_rate_is_unlimited(self):
+        limiter = RateLimiter(rate=0)
+
+        assert [limiter.acquire() for _ in range(100)] == [0.0] * 100
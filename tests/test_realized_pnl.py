@@ -0,0 +1,145 @@
+"""
+Realized P&L Tests
+Incremental recording on writes vs. a full rebuild (in-memory SQLite)
+"""
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from config import settings
+from database.db import Base
+from models import OpenLot, OpeningLot, Portfolio, RealizedPnl
+from models.transaction import Transaction
+from schemas.transaction import TransactionCreate
+from services.transaction_service import TransactionService
+
+
+@pytest.fixture
+def db(monkeypatch, request):
+    monkeypatch.setattr(settings, "LOT_METHOD", getattr(request, "param", "FIFO"))
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(
+        engine, tables=[t.__table__ for t in (Portfolio, Transaction, RealizedPnl, OpenLot, OpeningLot)]
+    )
+    session = sessionmaker(bind=engine)()
+    # Holding entered directly: 10 shares at 50 without any transaction (uncovered by lots)
+    session.add(Portfolio(symbol="AAPL", name="Apple", average_price=Decimal("50"), quantity=10))
+    session.commit()
+    yield session
+    session.close()
+
+
+def trade(db, kind, price, quantity, day=None):
+    return TransactionService.create_transaction(db, TransactionCreate(
+        symbol="AAPL", transaction_type=kind, price=price, quantity=quantity,
+        transaction_date=datetime(2025, 1, day) if day else None
+    ))
+
+
+def stored(db):
+    return sorted(
+        (row.transaction_id, float(row.cost_basis), float(row.proceeds))
+        for row in db.query(RealizedPnl).all()
+    )
+
+
+def open_lots(db):
+    return [
+        (row.transaction_id, round(row.price, 6), row.quantity)
+        for row in db.query(OpenLot).order_by(OpenLot.id).all()
+    ]
+
+
+class TestRealizedPnlRecording:
+    """Rows recorded by writes equal a rebuild from the ledger"""
+
+    @pytest.mark.parametrize("db", ["FIFO", "LIFO", "AVERAGE"], indirect=True)
+    def test_incremental_rows_match_rebuild(self, db):
+        # given - trades, a backdated buy that reorders the lots, and a deletion
+        trade(db, "BUY", 100.0, 10, day=2)
+        trade(db, "SELL", 120.0, 5, day=3)
+        trade(db, "SELL", 130.0, 10, day=4)
+        trade(db, "BUY", 80.0, 5, day=1)
+        deleted = trade(db, "SELL", 140.0, 2, day=5)
+        TransactionService.delete_transaction(db, deleted.id)
+        trade(db, "BUY", 90.0, 4, day=6)
+        trade(db, "SELL", 150.0, 6, day=7)
+        incremental, lots = stored(db), open_lots(db)
+
+        # when
+        TransactionService.rebuild_lots(db)
+
+        # then
+        assert stored(db) == incremental
+        assert open_lots(db) == lots
+        assert len(incremental) == 3
+
+    def test_opening_cost_is_not_moved_by_later_buys(self, db):
+        # given - 10 @ 50 held without lots; a sale, then a buy raising the average price
+        sale = trade(db, "SELL", 60.0, 5)
+        trade(db, "BUY", 200.0, 10)
+
+        # when
+        TransactionService.rebuild_lots(db)
+
+        # then - the 5 shares sold cost 5 x 50 on both paths
+        assert stored(db) == [(sale.id, 250.0, 300.0)]
+        assert db.get(OpeningLot, "AAPL").quantity == 10
+
+    def test_shares_entered_after_trading_join_the_opening_lot(self, db):
+        # given - trading, then 5 more shares entered directly through /portfolio
+        trade(db, "BUY", 100.0, 10, day=2)
+        trade(db, "SELL", 120.0, 12, day=3)
+        holding = db.query(Portfolio).filter(Portfolio.symbol == "AAPL").one()
+        holding.quantity += 5
+        db.commit()
+
+        # when
+        trade(db, "SELL", 130.0, 8, day=4)
+        incremental = stored(db)
+        TransactionService.rebuild_lots(db)
+
+        # then
+        assert stored(db) == incremental
+        assert db.get(OpeningLot, "AAPL").quantity == 15
+
+    def test_sale_consumes_stored_lots_without_replaying_the_ledger(self, db, monkeypatch):
+        # given
+        trade(db, "BUY", 100.0, 10, day=2)
+        trade(db, "BUY", 110.0, 10, day=3)
+
+        def replay(*args, **kwargs):
+            raise AssertionError("ledger replayed")
+
+        monkeypatch.setattr(TransactionService, "_ledger_rows", staticmethod(replay))
+
+        # when - 10 opening shares @ 50, then 5 of the first lot
+        sale = trade(db, "SELL", 120.0, 15, day=4)
+
+        # then
+        assert stored(db) == [(sale.id, 1000.0, 1800.0)]
+        assert [lot[2] for lot in open_lots(db)] == [5, 10]
+
+    def test_shares_held_before_the_ledger_are_costed_at_the_average_price(self, db):
+        # when - nothing was ever bought through a transaction
+        trade(db, "SELL", 60.0, 4)
+
+        # then - 4 x 50 (not the sale price, which would realize nothing)
+        assert stored(db)[0][1:] == (200.0, 240.0)
+
+    def test_get_realized_pnl_does_not_write(self, db):
+        # given
+        trade(db, "SELL", 60.0, 4)
+        db.query(RealizedPnl).delete()
+        db.commit()
+
+        # when
+        report = TransactionService.get_realized_pnl(db)
+
+        # then - read-only: stored rows are aggregated, never rebuilt
+        assert report.symbols == []
+        assert db.query(RealizedPnl).count() == 0
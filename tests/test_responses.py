@@ -0,0 +1,70 @@
+"""
+Response Serialization Tests
+FastJSONResponse rendering and gzip middleware (no network required)
+"""
+from decimal import Decimal
+
+import numpy as np
+import orjson
+import pandas as pd
+from fastapi.testclient import TestClient
+
+from core.responses import FastJSONResponse
+from main import app
+
+
+class TestFastJSONResponse:
+    """orjson response rendering tests"""
+
+    def test_renders_numpy_decimal_and_nan(self):
+        """NumPy, Decimal and Timestamp values are serialized without jsonable_encoder"""
+        # given
+        content = {
+            "price": Decimal("150.25"),
+            "volume": np.int64(1200),
+            "closes": np.array([1.5, 2.5]),
+            "date": pd.Timestamp("2025-01-02"),
+            "missing": float("nan"),
+        }
+
+        # when
+        body = orjson.loads(FastJSONResponse(content).body)
+
+        # then
+        assert body == {
+            "price": 150.25,
+            "volume": 1200,
+            "closes": [1.5, 2.5],
+            "date": "2025-01-02T00:00:00",
+            "missing": None,
+        }
+
+
+class TestCompression:
+    """GZip middleware tests"""
+
+    def test_large_response_is_gzipped(self):
+        """The OpenAPI document is larger than GZIP_MIN_SIZE"""
+        # when
+        response = TestClient(app).get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+
+        # then
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+
+    def test_small_response_is_not_gzipped(self):
+        """Responses below GZIP_MIN_SIZE are sent as is"""
+        # when
+        response = TestClient(app).get("/stock/compare?symbols=AAPL", headers={"Accept-Encoding": "gzip"})
+
+        # then
+        assert response.status_code == 400
+        assert "content-encoding" not in response.headers
+
+    def test_duplicate_compare_symbols_count_once(self):
+        """AAPL,aapl is a one-symbol comparison"""
+        # when
+        response = TestClient(app).get("/stock/compare?symbols=AAPL,aapl")
+
+        # then
+        assert response.status_code == 400
@@ -0,0 +1,41 @@
+"""
+Scheduler Tests
+Periodic background jobs (no database or network required)
+"""
+import threading
+
+from core.scheduler import PeriodicJob
+
+
+class TestPeriodicJob:
+    """PeriodicJob tests"""
+
+    def test_runs_on_start(self):
+        """The first run happens right after start()"""
+        # given
+        ran = threading.Event()
+        job = PeriodicJob("test-start", 60, ran.set)
+
+        # when
+        job.start()
+        ran.wait(1)
+        job.stop()
+
+        # then
+        assert ran.is_set()
+        assert job.runs == 1
+
+    def test_failing_run_is_counted(self):
+        """Exceptions are logged, not raised, so the schedule continues"""
+        # given
+        def fail():
+            raise RuntimeError("upstream down")
+
+        job = PeriodicJob("test-failure", 60, fail)
+
+        # when
+        ran = job.run_once()
+
+        # then
+        assert ran is True
+        assert job.runs == 1
@@ -0,0 +1,94 @@
+"""
+Sentiment Scorer Tests
+Lexicon scorer and news ingestion helpers (no network required)
+"""
+import pytest
+from services.sentiment import LexiconSentimentScorer, label_for
+from services.news_service import NewsService
+
+
+class TestLexiconSentimentScorer:
+    """Lexicon scorer tests"""
+
+    def test_batch_scores_and_labels(self):
+        """Positive, negative and neutral headlines"""
+        # given
+        scorer = LexiconSentimentScorer()
+        texts = [
+            "Apple shares surge to record high after earnings beat",
+            "Tesla stock falls as recall probe widens",
+            "Microsoft to hold annual shareholder meeting",
+        ]
+
+        # when
+        results = scorer.score_batch(texts)
+
+        # then
+        assert [r.label for r in results] == ["POSITIVE", "NEGATIVE", "NEUTRAL"]
+        assert results[0].score == 1.0
+        assert results[1].score == 0.0
+        assert results[2].score == 0.5
+
+    def test_negation_flips_keyword(self):
+        """'not profitable' counts as negative"""
+        # when
+        result = LexiconSentimentScorer().score_batch(["The unit was not profitable"])[0]
+
+        # then
+        assert result.label == "NEGATIVE"
+
+    @pytest.mark.parametrize("score,label", [(0.9, "POSITIVE"), (0.5, "NEUTRAL"), (0.1, "NEGATIVE")])
+    def test_label_thresholds(self, score, label):
+        assert label_for(score) == label
+
+
+class TestNewsParsing:
+    """yfinance news parsing and deduplication key tests"""
+
+    def test_parse_article_and_url_hash(self):
+        """Same URL gives the same hash regardless of title"""
+        # given
+        raw = {
+            "content": {
+                "title": "Apple beats estimates",
+                "summary": "Revenue grows",
+                "pubDate": "2025-01-02T13:00:00Z",
+                "provider": {"displayName": "Reuters"},
+                "canonicalUrl": {"url": "https://example.com/a"},
+            }
+        }
+
+        # when
+        article = NewsService._parse_article(raw)
+        duplicate = dict(article, title="Apple beats estimates (updated)")
+
+        # then
+        assert article["publisher"] == "Reuters"
+        assert article["published_at"].year == 2025
+        assert NewsService._url_hash(article) == NewsService._url_hash(duplicate)
+        assert len(NewsService._url_hash(article)) == 64
+
+
+class TestNewsRefresh:
+    """Refresh throttling tests"""
+
+    def test_failed_ingest_is_retried(self, monkeypatch):
+        """A symbol is only marked fresh once its articles are stored"""
+        # given
+        calls = []
+        monkeypatch.setattr(NewsService, "_fetch_news", staticmethod(lambda symbol: calls.append(symbol) or []))
+
+        def failing_ingest(db, symbol, articles):
+            raise RuntimeError("database unavailable")
+
+        monkeypatch.setattr(NewsService, "ingest", staticmethod(failing_ingest))
+
+        # when
+        with pytest.raises(RuntimeError):
+            NewsService.refresh(None, "RETRYTEST")
+        monkeypatch.setattr(NewsService, "ingest", staticmethod(lambda db, symbol, articles: 0))
+        NewsService.refresh(None, "RETRYTEST")
+        NewsService.refresh(None, "RETRYTEST")
+
+        # then - fetched again after the failure, then throttled
+        assert calls == ["RETRYTEST", "RETRYTEST"]
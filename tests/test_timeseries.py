@@ -0,0 +1,80 @@
+"""
+Columnar Time-Series Store Tests
+"""
+import os
+from datetime import date, datetime, timezone
+
+import pytest
+
+from core.timeseries import ColumnarStore, to_epoch
+
+
+def ts(day: int, hour: int = 15) -> int:
+    return to_epoch(datetime(2026, 1, day, hour, tzinfo=timezone.utc))
+
+
+class TestColumnarStore:
+    """Append / range query tests"""
+
+    def test_rows_are_partitioned_by_key_and_date(self, tmp_path):
+        # given
+        store = ColumnarStore(str(tmp_path), {"pcr": "<f4"})
+
+        # when
+        store.append("AAPL", {"ts": [ts(1), ts(1, 16), ts(2)], "pcr": [0.5, 0.6, 0.7]})
+
+        # then
+        assert sorted(os.listdir(tmp_path / "AAPL")) == ["2026-01-01", "2026-01-02"]
+
+    def test_query_reads_only_partitions_in_range(self, tmp_path):
+        # given
+        store = ColumnarStore(str(tmp_path), {"pcr": "<f4", "oi": "<i8"})
+        for day in range(1, 11):
+            store.append("AAPL", {"ts": [ts(day)], "pcr": [day / 10], "oi": [day]})
+
+        # when
+        partitions = store.partitions("AAPL", date(2026, 1, 3), date(2026, 1, 5))
+        result = store.query("AAPL", date(2026, 1, 3), date(2026, 1, 5), ["oi"])
+
+        # then
+        assert len(partitions) == 3
+        assert set(result) == {"ts", "oi"}
+        assert result["oi"].tolist() == [3, 4, 5]
+
+    def test_incomplete_trailing_row_is_ignored(self, tmp_path):
+        # given - a crash after writing only the first column of a row
+        store = ColumnarStore(str(tmp_path), {"pcr": "<f4"})
+        store.append("AAPL", {"ts": [ts(1)], "pcr": [0.5]})
+        with open(tmp_path / "AAPL" / "2026-01-01" / "ts.col", "ab") as f:
+            f.write(store.query("AAPL", date(2026, 1, 1), date(2026, 1, 1))["ts"].tobytes())
+
+        # when
+        result = store.query("AAPL", date(2026, 1, 1), date(2026, 1, 1))
+
+        # then
+        assert len(result["ts"]) == len(result["pcr"]) == 1
+
+    def test_append_after_torn_row_keeps_columns_aligned(self, tmp_path):
+        # given - a crash left a row in ts.col only, plus half a value in pcr.col
+        store = ColumnarStore(str(tmp_path), {"pcr": "<f4"})
+        store.append("AAPL", {"ts": [ts(1)], "pcr": [0.5]})
+        partition = tmp_path / "AAPL" / "2026-01-01"
+        with open(partition / "ts.col", "ab") as f:
+            f.write(store.query("AAPL", date(2026, 1, 1), date(2026, 1, 1))["ts"].tobytes())
+        with open(partition / "pcr.col", "ab") as f:
+            f.write(b"\x00\x00")
+
+        # when
+        store.append("AAPL", {"ts": [ts(1, 16)], "pcr": [0.75]})
+        result = store.query("AAPL", date(2026, 1, 1), date(2026, 1, 1))
+
+        # then - the torn row is dropped, the new one is whole
+        assert result["ts"].tolist() == [ts(1), ts(1, 16)]
+        assert result["pcr"].tolist() == [0.5, 0.75]
+
+    def test_empty_range_and_invalid_key(self, tmp_path):
+        store = ColumnarStore(str(tmp_path), {"pcr": "<f4"})
+
+        assert len(store.query("AAPL", date(2026, 1, 1), date(2026, 1, 31))["pcr"]) == 0
+        with pytest.raises(ValueError):
+            store.append("../etc", {"ts": [ts(1)], "pcr": [0.5]})
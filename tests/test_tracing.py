@@ -0,0 +1,100 @@
+"""
+Tracing Tests
+Span nesting, SQL spans and Server-Timing header (no network required)
+"""
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from core.tracing import TracingMiddleware, Trace, span, traced, _current_trace
+
+
+class RecordingExporter:
+    """Exporter keeping finished traces in memory"""
+
+    def __init__(self):
+        self.traces = []
+
+    def export(self, trace):
+        self.traces.append(trace)
+
+
+@traced()
+def load_data(engine):
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT 1")).scalar()
+
+
+class TestSpans:
+    """Span nesting tests"""
+
+    def test_nested_spans_and_sql(self):
+        """Service, SQL and nested spans share the trace and point to their parents"""
+        # given
+        engine = create_engine("sqlite://")
+        trace = Trace()
+        token = _current_trace.set(trace)
+
+        # when
+        try:
+            with span("outer") as outer:
+                load_data(engine)
+        finally:
+            _current_trace.reset(token)
+
+        # then
+        spans = {s.name: s for s in trace.spans}
+        assert spans["load_data"].parent_id == outer.span_id
+        assert spans["sql"].kind == "db"
+        assert spans["sql"].parent_id == spans["load_data"].span_id
+        assert spans["sql"].attributes["statement"] == "SELECT 1"
+
+    def test_no_trace_records_nothing(self):
+        """Outside a sampled request span() yields None"""
+        with span("ignored") as current:
+            assert current is None
+
+
+class TestTracingMiddleware:
+    """Sampling and Server-Timing tests"""
+
+    def make_client(self, exporter, sample_rate=0.0):
+        app = FastAPI()
+        app.add_middleware(TracingMiddleware, sample_rate=sample_rate, exporter=exporter)
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: int):
+            with span("lookup", "db"):
+                return {"id": item_id}
+
+        return TestClient(app)
+
+    def test_forced_trace_adds_server_timing(self):
+        """X-Trace: 1 samples the request and adds Server-Timing"""
+        # given
+        exporter = RecordingExporter()
+        client = self.make_client(exporter)
+
+        # when
+        response = client.get("/items/1", headers={"X-Trace": "1"})
+
+        # then
+        assert "db;dur=" in response.headers["server-timing"]
+        assert "total;dur=" in response.headers["server-timing"]
+        root = exporter.traces[0].spans[-1]
+        assert root.name == "GET /items/{item_id}"
+        assert root.attributes["http.status_code"] == 200
+        assert response.headers["x-trace-id"] == root.trace_id
+
+    def test_unsampled_request_is_untouched(self):
+        """Sample rate 0 without X-Trace records nothing"""
+        # given
+        exporter = RecordingExporter()
+        client = self.make_client(exporter)
+
+        # when
+        response = client.get("/items/1")
+
+        # then
+        assert "server-timing" not in response.headers
+        assert exporter.traces == []
@@ -0,0 +1,113 @@
+"""
+Volatility Surface Tests
+Grid interpolation, smoothing and slices of the IV surface (no network required)
+"""
+import numpy as np
+import pytest
+
+import services.market_data as market_data
+from services.option_service import OptionService
+from services.volatility_surface import otm_contracts, skew, smooth, surface_grid, term_structure
+from tests.test_market_data import StaticProvider, make_chain
+
+GRID = np.array([0.9, 1.0, 1.1])
+
+
+class SmileProvider(StaticProvider):
+    """Two expiries with a put skew around spot 399; the far one has higher IV"""
+
+    def expiries(self, symbol):
+        return ("2099-01-16", "2099-06-19")
+
+    def option_chain(self, symbol, expiry):
+        strikes = (340.0, 360.0, 380.0, 400.0, 420.0, 440.0)
+        calls, puts = make_chain(strikes), make_chain(strikes)
+        base = 0.3 if expiry == "2099-06-19" else 0.2
+        calls["impliedVolatility"] = base
+        puts["impliedVolatility"] = base + np.linspace(0.1, 0.0, len(strikes))
+        return calls, puts
+
+
+class TestSurfaceGrid:
+    """Vectorized smile interpolation tests"""
+
+    def test_rows_are_interpolated_independently(self):
+        # given - row 0 quotes 0.9..1.1, row 1 only 1.0..1.2
+        rows = np.array([0, 0, 1, 1])
+        moneyness = np.array([0.9, 1.1, 1.0, 1.2])
+        iv = np.array([0.30, 0.20, 0.50, 0.40])
+
+        # when
+        grid = surface_grid(rows, moneyness, iv, 2, GRID)
+
+        # then - nothing outside a row's quoted strikes, nothing borrowed from the other row
+        assert grid[0] == pytest.approx([0.30, 0.25, 0.20])
+        assert np.isnan(grid[1, 0])
+        assert grid[1, 1:] == pytest.approx([0.50, 0.45])
+
+    def test_expiry_without_quotes_is_empty(self):
+        grid = surface_grid(np.array([1, 1]), np.array([0.8, 1.2]), np.array([0.2, 0.2]), 2, GRID)
+
+        assert np.isnan(grid[0]).all()
+        assert grid[1] == pytest.approx([0.2, 0.2, 0.2])
+
+    def test_otm_contracts(self):
+        usable, moneyness = otm_contracts(
+            np.array([90.0, 90.0, 110.0, 110.0]), np.array([0.2, 0.2, 0.2, 0.00001]),
+            np.array([True, False, True, True]), 100.0
+        )
+
+        assert usable.tolist() == [False, True, True, False]
+        assert moneyness == pytest.approx([0.9, 0.9, 1.1, 1.1])
+
+
+class TestSurfaceSlices:
+    """Smoothing, skew and term-structure tests"""
+
+    def test_smoothing_keeps_missing_points(self):
+        surface = np.array([[0.4, 0.1, 0.4, np.nan]])
+
+        smoothed = smooth(surface)
+
+        assert smoothed[0, :3] == pytest.approx([0.3, 0.25, 0.3])
+        assert np.isnan(smoothed[0, 3])
+
+    def test_skew_interpolates_total_variance(self):
+        surface = np.array([[0.2, 0.2, 0.2], [0.4, 0.4, 0.4]])
+        years = np.array([0.1, 0.3])
+
+        smile = skew(surface, years, 0.2)
+
+        # (0.2^2 x 0.1 + 0.4^2 x 0.3) / 2 / 0.2 = 0.13
+        assert smile == pytest.approx(np.sqrt([0.13, 0.13, 0.13]))
+        assert skew(surface, years, 5.0) == pytest.approx([0.4, 0.4, 0.4])
+
+    def test_term_structure(self):
+        surface = np.array([[0.3, 0.2, 0.1], [0.5, 0.4, 0.3]])
+
+        assert term_structure(surface, GRID, 0.95) == pytest.approx([0.25, 0.45])
+
+
+class TestSurfaceService:
+    """OptionService surface endpoints over a static upstream"""
+
+    def test_surface_is_built_once_and_shared(self, monkeypatch):
+        # given
+        provider = SmileProvider()
+        calls = []
+        fetch = provider.option_chain
+        monkeypatch.setattr(provider, "option_chain", lambda s, e: calls.append(e) or fetch(s, e))
+        monkeypatch.setattr(market_data, "_provider", provider)
+
+        # when
+        surface = OptionService.get_iv_surface("SURFTEST")
+        skew_30 = OptionService.get_iv_skew("SURFTEST", 30.0)
+        term = OptionService.get_iv_term_structure("SURFTEST", 1.0)
+
+        # then - one chain fetch per expiry for all three
+        assert sorted(calls) == ["2099-01-16", "2099-06-19"]
+        assert surface.expiry_dates == ["2099-01-16", "2099-06-19"]
+        assert len(surface.iv) == 2 and len(surface.iv[0]) == len(surface.moneyness)
+        assert surface.iv[0][0] is None  # 0.70 is below the lowest strike (0.85)
+        assert skew_30.put_call_skew > 0
+        assert term.iv[0] < term.iv[1]
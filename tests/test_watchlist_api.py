@@ -0,0 +1,67 @@
+"""
+Watchlist API Tests
+"""
+import pytest
+import os
+import uuid
+from fastapi.testclient import TestClient
+from main import app
+
+client = TestClient(app)
+IS_CI = os.getenv("CI", "false").lower() == "true"
+
+
+@pytest.mark.skipif(IS_CI, reason="Skipping DB tests in CI environment")
+class TestWatchlistAPI:
+    """Watchlist API endpoint tests (requires database)"""
+
+    def create_watchlist(self, symbols):
+        response = client.post("/watchlist/", json={
+            "name": f"test-{uuid.uuid4().hex[:6]}",
+            "symbols": symbols
+        })
+        assert response.status_code == 201
+        return response.json()
+
+    def test_create_watchlist(self):
+        """Test creating a watchlist with initial symbols"""
+        # when
+        data = self.create_watchlist(["aapl", "MSFT", "AAPL"])
+
+        # then - symbols are upper-cased and de-duplicated
+        assert [item["symbol"] for item in data["items"]] == ["AAPL", "MSFT"]
+
+    def test_add_duplicate_symbol_fails(self):
+        """Test adding a symbol that is already in the watchlist"""
+        # given
+        watchlist = self.create_watchlist(["AAPL"])
+
+        # when
+        response = client.post(f"/watchlist/{watchlist['id']}/symbols", json={"symbol": "AAPL"})
+
+        # then
+        assert response.status_code == 400
+
+    def test_quotes_support_etag(self):
+        """Test that an unchanged quote snapshot returns 304"""
+        # given
+        watchlist = self.create_watchlist(["AAPL", "MSFT"])
+        first = client.get(f"/watchlist/{watchlist['id']}/quotes")
+        assert first.status_code == 200
+
+        # when
+        second = client.get(
+            f"/watchlist/{watchlist['id']}/quotes",
+            headers={"If-None-Match": first.headers["etag"]}
+        )
+
+        # then
+        assert second.status_code == 304
+
+    def test_get_watchlist_not_found(self):
+        """Test getting a non-existent watchlist"""
+        # when
+        response = client.get("/watchlist/999999999")
+
+        # then
+        assert response.status_code == 404